@@ -1,7 +1,7 @@
 """Set package version."""
 import sys
 
-from . import cfngin, variables
+from . import cfngin
 
 if sys.version_info.minor < 8:
     # importlib.metadata is standard lib for python>=3.8, use backport
@@ -10,7 +10,7 @@ else:
     from importlib.metadata import version, PackageNotFoundError  # pylint: disable=E
 
 sys.modules['stacker'] = cfngin  # shim to remove stacker dependency
-sys.modules['stacker.variables'] = variables  # shim to support standard variables
+# the 'stacker.variables' shim is added when runway.variables is imported
 
 try:
     __version__ = version(__name__)
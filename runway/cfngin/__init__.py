@@ -1,8 +1,24 @@
 """Import modules."""
-from .cfngin import CFNgin  # noqa: F401
+import sys
 
 __all__ = ['CFNgin']
 
 # added for stacker shim backward compatability.
 # use of __version__ is deprecated and will be removed in 2.0.0.
 __version__ = '1.7.0'
+
+if sys.version_info < (3, 7):
+    from .cfngin import CFNgin  # noqa: F401
+else:
+    def __getattr__(name):
+        """Import CFNgin when it is first used (PEP 562).
+
+        Importing it requires boto3, troposphere, and every lookup so it is
+        not imported by commands that don't use it.
+
+        """
+        if name == 'CFNgin':
+            from . import cfngin  # pylint: disable=import-outside-toplevel
+            return cfngin.CFNgin
+        raise AttributeError('module %r has no attribute %r' % (__name__,
+                                                                name))
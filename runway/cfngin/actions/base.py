@@ -1,17 +1,26 @@
 """CFNgin base action."""
 import logging
+import multiprocessing
 import os
 import sys
 import threading
 
 import botocore.exceptions
 
-from ..dag import ThreadedWalker, UnlimitedSemaphore, walk
+from runway.variables import prefetch_lookups
+
+from ..dag import (ReadyQueueWalker, ThreadedWalker, UnlimitedSemaphore,
+                   walk)
 from ..exceptions import PlanFailed
 from ..plan import Graph, Plan, Step, merge_graphs
-from ..status import COMPLETE
+from ..status import COMPLETE, PENDING
+from ..template_cache import (TemplateCache, blueprint_cache_key,
+                              render_blueprint)
 from ..util import ensure_s3_bucket, get_s3_endpoint, stack_template_key_name
 
+if sys.version_info[0] > 2:
+    import concurrent.futures
+
 LOGGER = logging.getLogger(__name__)
 
 # After submitting a stack update/create, this controls how long we'll wait
@@ -24,7 +33,10 @@ LOGGER = logging.getLogger(__name__)
 STACK_POLL_TIME = int(os.environ.get("CFNGIN_STACK_POLL_TIME", 30))
 
 
-def build_walker(concurrency):
+WALKER_ENGINES = ('threaded', 'queue')
+
+
+def build_walker(concurrency, engine=None):
     """Return a function for waling a graph.
 
     Passed to :class:`runway.cfngin.plan.Plan` for walking the graph.
@@ -38,16 +50,35 @@ def build_walker(concurrency):
     If concurrency is greater than 1, it will return a walker that will only
     execute a maximum of concurrency steps at any given time.
 
+    The ``engine`` determines how steps are executed in parallel. ``threaded``
+    uses :class:`runway.cfngin.dag.ThreadedWalker` which starts one thread per
+    step. ``queue`` uses :class:`runway.cfngin.dag.ReadyQueueWalker` which
+    dispatches steps to a pool of worker threads as their dependencies
+    complete.
+
     Args:
         concurrency (int): Number of threads to use while walking.
+        engine (Optional[str]): Name of the engine used to walk the graph
+            in parallel. (`default:` ``threaded``)
 
     Returns:
         Callable[..., Any]: Function to walk a :class:`runway.cfngin.dag.DAG`.
 
+    Raises:
+        ValueError: An unsupported engine was provided.
+
     """
+    engine = engine or 'threaded'
+    if engine not in WALKER_ENGINES:
+        raise ValueError('unsupported walker engine "%s"; must be one of %s'
+                         % (engine, ', '.join(WALKER_ENGINES)))
+
     if concurrency == 1:
         return walk
 
+    if engine == 'queue':
+        return ReadyQueueWalker(concurrency).walk
+
     semaphore = UnlimitedSemaphore()
     if concurrency > 1:
         semaphore = threading.Semaphore(concurrency)
@@ -116,6 +147,10 @@ class BaseAction(object):
         if not self.bucket_region and provider_builder:
             self.bucket_region = provider_builder.region
         self.s3_conn = self.context.s3_conn
+        # keys of the templates known to exist in the bucket; None if the
+        # bucket has not been listed
+        self._template_keys = None
+        self._template_keys_lock = threading.Lock()
 
     @property
     def _stack_action(self):
@@ -176,11 +211,161 @@ class BaseAction(object):
         """Abstract method for running the action."""
         raise NotImplementedError("Subclass must implement \"run\" method")
 
+    def get_provider_stack(self, provider, stack, status):
+        """Get the current state of a stack from a provider for a step.
+
+        The first time a step runs, the stack is described directly.
+        Subsequent runs wait for the status poller shared by all steps of the
+        provider to observe a change to the stack.
+
+        Args:
+            provider (:class:`runway.cfngin.providers.base.BaseProvider`):
+                Provider for the stack.
+            stack (:class:`runway.cfngin.stack.Stack`): Stack being acted on.
+            status (:class:`runway.cfngin.status.Status`): Current status of
+                the step.
+
+        Returns:
+            Dict[str, Any]: Stack data from the provider.
+
+        Raises:
+            StackDoesNotExist: The stack does not exist.
+
+        """
+        if status is PENDING:
+            return provider.get_stack(stack.fqn)
+        return provider.poll_stack(stack.fqn, cancel=self.cancel,
+                                   timeout=STACK_POLL_TIME)
+
+    def prefetch_lookups(self, plan):
+        """Retrieve the data needed by the lookups of a plan in batches.
+
+        Args:
+            plan (:class:`runway.cfngin.plan.Plan`): Plan containing the
+                stacks that will be resolved.
+
+        """
+        prefetch_lookups([variable for step in plan.steps
+                          for variable in getattr(step.stack, 'variables', [])],
+                         self.context)
+
+    def prerender_templates(self, plan):
+        """Render the templates of a plan before it is executed.
+
+        Stacks that don't depend on the outputs of other stacks are resolved
+        and their templates are rendered so steps don't have to render them.
+        Rendered templates are cached in ``cfngin_cache_dir`` and reused by
+        later runs for the same blueprint, variables and mappings. Templates
+        that are not cached are rendered in a pool of processes if possible.
+
+        Stacks that can't be resolved or rendered here are logged and left to
+        be rendered by their step.
+
+        Args:
+            plan (:class:`runway.cfngin.plan.Plan`): Plan containing the
+                stacks that will be rendered.
+
+        """
+        cache = TemplateCache(os.path.join(
+            self.context.config.cfngin_cache_dir or
+            os.path.expanduser('~/.runway_cache'), 'templates'
+        ))
+        pending = []
+        for step in plan.steps:
+            stack = step.stack
+            if (not stack.enabled or not stack.definition.class_path or
+                    any(variable.dependencies
+                        for variable in stack.variables)):
+                continue
+            try:
+                stack.resolve(self.context, self.build_provider(stack))
+                key = blueprint_cache_key(stack.blueprint)
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.debug('unable to pre-render stack %s: %s',
+                             stack.name, err)
+                continue
+            cached = cache.get(key)
+            if cached:
+                stack.blueprint.set_rendered(*cached)
+            else:
+                pending.append((key, stack.blueprint))
+
+        if len(pending) > 1 and sys.version_info[0] > 2:
+            self._render_in_processes([blueprint for _, blueprint in pending])
+        for key, blueprint in pending:
+            try:
+                cache.set(key, blueprint.version, blueprint.rendered)
+            except Exception as err:  # pylint: disable=broad-except
+                LOGGER.debug('unable to pre-render blueprint %s: %s',
+                             blueprint.name, err)
+                blueprint.reset_template()  # let the step render it again
+        LOGGER.debug('pre-rendered %s template(s); %s from the cache',
+                     cache.hits + len(pending), cache.hits)
+
+    @staticmethod
+    def _render_in_processes(blueprints):
+        """Render blueprints in a pool of processes.
+
+        Blueprints that fail to render in the pool (e.g. they can't be
+        pickled) are left unrendered.
+
+        Args:
+            blueprints (List[:class:`runway.cfngin.blueprints.base.Blueprint`]):
+                Blueprints with resolved variables.
+
+        """
+        try:
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(len(blueprints), multiprocessing.cpu_count())
+            )
+        except (NotImplementedError, OSError) as err:
+            LOGGER.debug('unable to start processes to render templates: %s',
+                         err)
+            return
+        with executor:
+            futures = {executor.submit(render_blueprint, blueprint): blueprint
+                       for blueprint in blueprints}
+            for future in concurrent.futures.as_completed(futures):
+                blueprint = futures[future]
+                try:
+                    blueprint.set_rendered(*future.result())
+                except Exception as err:  # pylint: disable=broad-except
+                    LOGGER.debug('unable to render blueprint %s in another '
+                                 'process: %s', blueprint.name, err)
+
+    def prefetch_template_keys(self):
+        """List the templates that already exist in the S3 bucket.
+
+        Template keys contain a hash of the template so, once listed,
+        :meth:`s3_stack_push` can tell if a template needs to be uploaded
+        without calling ``head_object`` for each stack. If the bucket can't
+        be listed, ``head_object`` is used.
+
+        """
+        if not self.bucket_name:
+            return
+        prefix = 'stack_templates/%s' % self.context.get_fqn()
+        keys = set()
+        try:
+            paginator = self.s3_conn.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.bucket_name,
+                                           Prefix=prefix):
+                keys.update(obj['Key'] for obj in page.get('Contents', []))
+        except botocore.exceptions.ClientError as err:
+            LOGGER.debug('unable to list templates in bucket %s; checking '
+                         'each template instead: %s', self.bucket_name, err)
+            return
+        LOGGER.debug('found %s existing template(s) in bucket %s',
+                     len(keys), self.bucket_name)
+        with self._template_keys_lock:
+            self._template_keys = keys
+
     def s3_stack_push(self, blueprint, force=False):
         """Push the rendered blueprint's template to S3.
 
         Verifies that the template doesn't already exist in S3 before
-        pushing.
+        pushing. Templates listed by :meth:`prefetch_template_keys` or
+        pushed by this action are not checked again.
 
         Returns:
             str: URL to the template in S3.
@@ -188,14 +373,19 @@ class BaseAction(object):
         """
         key_name = stack_template_key_name(blueprint)
         template_url = self.stack_template_url(blueprint)
-        try:
-            template_exists = self.s3_conn.head_object(
-                Bucket=self.bucket_name, Key=key_name) is not None
-        except botocore.exceptions.ClientError as err:
-            if err.response['Error']['Code'] == '404':
-                template_exists = False
-            else:
-                raise
+        with self._template_keys_lock:
+            template_keys = self._template_keys
+        if template_keys is not None:
+            template_exists = key_name in template_keys
+        else:
+            try:
+                template_exists = self.s3_conn.head_object(
+                    Bucket=self.bucket_name, Key=key_name) is not None
+            except botocore.exceptions.ClientError as err:
+                if err.response['Error']['Code'] == '404':
+                    template_exists = False
+                else:
+                    raise
 
         if template_exists and not force:
             LOGGER.debug("Cloudformation template %s already exists.",
@@ -206,6 +396,9 @@ class BaseAction(object):
                                 Body=blueprint.rendered,
                                 ServerSideEncryption='AES256',
                                 ACL='bucket-owner-full-control')
+        with self._template_keys_lock:
+            if self._template_keys is not None:
+                self._template_keys.add(key_name)
         LOGGER.debug("Blueprint %s pushed to %s.", blueprint.name,
                      template_url)
         return template_url
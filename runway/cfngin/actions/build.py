@@ -6,12 +6,12 @@ from ..exceptions import (CancelExecution, MissingParameterException,
 from ..hooks import utils
 from ..plan import Graph, Plan, Step
 from ..providers.base import Template
-from ..status import (COMPLETE, INTERRUPTED, PENDING, SUBMITTED, WAITING,
+from ..status import (COMPLETE, INTERRUPTED, SUBMITTED, WAITING,
                       CompleteStatus, DidNotChangeStatus, FailedStatus,
                       NotSubmittedStatus, NotUpdatedStatus, SkippedStatus)
 from ..status import StackDoesNotExist as StackDoesNotExistStatus
 from ..status import SubmittedStatus
-from .base import STACK_POLL_TIME, BaseAction, build_walker
+from .base import BaseAction, build_walker
 
 LOGGER = logging.getLogger(__name__)
 
@@ -246,19 +246,22 @@ class Action(BaseAction):
 
         """
         stack_status = kwargs.get("status")
-        wait_time = 0 if stack_status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
+        if self.cancel.wait(0):
             return INTERRUPTED
 
         provider = self.build_provider(stack)
 
         try:
-            stack_data = provider.get_stack(stack.fqn)
+            stack_data = self.get_provider_stack(provider, stack, stack_status)
         except StackDoesNotExist:
+            if self.cancel.wait(0):
+                return INTERRUPTED
             LOGGER.debug("Stack %s does not exist.", stack.fqn)
             if kwargs.get("status", None) == SUBMITTED:
                 return DESTROYED_STATUS
             return StackDoesNotExistStatus()
+        if self.cancel.wait(0):
+            return INTERRUPTED
 
         LOGGER.debug("Stack %s provider status: %s",
                      provider.get_stack_name(stack_data),
@@ -289,8 +292,7 @@ class Action(BaseAction):
 
         """
         old_status = kwargs.get("status")
-        wait_time = 0 if old_status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
+        if self.cancel.wait(0):
             return INTERRUPTED
 
         if not should_submit(stack):
@@ -299,9 +301,12 @@ class Action(BaseAction):
         provider = self.build_provider(stack)
 
         try:
-            provider_stack = provider.get_stack(stack.fqn)
+            provider_stack = self.get_provider_stack(provider, stack,
+                                                     old_status)
         except StackDoesNotExist:
             provider_stack = None
+        if self.cancel.wait(0):
+            return INTERRUPTED
 
         if provider_stack and not should_update(stack):
             stack.set_outputs(
@@ -500,6 +505,7 @@ class Action(BaseAction):
         outline = kwargs.get('outline', False)
         if should_ensure_cfn_bucket(outline, dump):
             self.ensure_cfn_bucket()
+            self.prefetch_template_keys()
         hooks = self.context.config.pre_build
         handle_hooks(
             "pre_build",
@@ -521,11 +527,16 @@ class Action(BaseAction):
         plan = self.__generate_plan(tail=kwargs.get('tail'))
         if not plan.keys():
             LOGGER.warning('WARNING: No stacks detected (error in config?)')
+        if not outline:
+            self.prefetch_lookups(plan)
+            if kwargs.get('prerender'):
+                self.prerender_templates(plan)
         if not outline and not dump:
             plan.outline(logging.DEBUG)
             self.context.lock_persistent_graph(plan.lock_code)
             LOGGER.debug("Launching stacks: %s", ", ".join(plan.keys()))
-            walker = build_walker(kwargs.get('concurrency', 0))
+            walker = build_walker(kwargs.get('concurrency', 0),
+                                  kwargs.get('walker_engine'))
             try:
                 plan.execute(walker)
             finally:
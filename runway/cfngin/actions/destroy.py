@@ -3,10 +3,10 @@ import logging
 
 from ..exceptions import StackDoesNotExist
 from ..hooks.utils import handle_hooks
-from ..status import INTERRUPTED, PENDING, SUBMITTED, CompleteStatus
+from ..status import INTERRUPTED, SUBMITTED, CompleteStatus
 from ..status import StackDoesNotExist as StackDoesNotExistStatus
 from ..status import SubmittedStatus
-from .base import STACK_POLL_TIME, BaseAction, build_walker
+from .base import BaseAction, build_walker
 
 LOGGER = logging.getLogger(__name__)
 
@@ -36,15 +36,17 @@ class Action(BaseAction):
 
     def _destroy_stack(self, stack, **kwargs):
         old_status = kwargs.get("status")
-        wait_time = 0 if old_status is PENDING else STACK_POLL_TIME
-        if self.cancel.wait(wait_time):
+        if self.cancel.wait(0):
             return INTERRUPTED
 
         provider = self.build_provider(stack)
 
         try:
-            provider_stack = provider.get_stack(stack.fqn)
+            provider_stack = self.get_provider_stack(provider, stack,
+                                                     old_status)
         except StackDoesNotExist:
+            if self.cancel.wait(0):
+                return INTERRUPTED
             LOGGER.debug("Stack %s does not exist.", stack.fqn)
             # Once the stack has been destroyed, it doesn't exist. If the
             # status of the step was SUBMITTED, we know we just deleted it,
@@ -52,6 +54,8 @@ class Action(BaseAction):
             if kwargs.get("status", None) == SUBMITTED:
                 return DESTROYED_STATUS
             return StackDoesNotExistStatus()
+        if self.cancel.wait(0):
+            return INTERRUPTED
 
         LOGGER.debug(
             "Stack %s provider status: %s",
@@ -87,7 +91,8 @@ class Action(BaseAction):
             # steps to COMPLETE in order to log them
             plan.outline(logging.DEBUG)
             self.context.lock_persistent_graph(plan.lock_code)
-            walker = build_walker(kwargs.get('concurrency', 0))
+            walker = build_walker(kwargs.get('concurrency', 0),
+                                  kwargs.get('walker_engine'))
             try:
                 plan.execute(walker)
             finally:
@@ -206,7 +206,11 @@ class Action(build.Action):
             LOGGER.info("Diffing stacks: %s", ", ".join(plan.keys()))
         else:
             LOGGER.warning('WARNING: No stacks detected (error in config?)')
-        walker = build_walker(kwargs.get('concurrency', 0))
+        self.prefetch_lookups(plan)
+        if kwargs.get('prerender'):
+            self.prerender_templates(plan)
+        walker = build_walker(kwargs.get('concurrency', 0),
+                              kwargs.get('walker_engine'))
         plan.execute(walker)
 
     def pre_run(self, **kwargs):
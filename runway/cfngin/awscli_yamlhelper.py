@@ -13,8 +13,8 @@
 # language governing permissions and limitations under the License.
 import json
 
+import six
 import yaml
-from botocore.compat import six
 from yaml.resolver import ScalarNode, SequenceNode
 
 
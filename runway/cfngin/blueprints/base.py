@@ -1,6 +1,7 @@
 """CFNgin blueprint base classes."""
 import copy
 import hashlib
+import json
 import logging
 import string
 
@@ -343,6 +344,8 @@ class Blueprint(object):
             output properties.
 
         """
+        if self._prerendered:
+            return json.loads(self._rendered).get('Outputs', {})
         return {k: output.to_dict() for k, output in
                 self.template.outputs.items()}
 
@@ -473,6 +476,7 @@ class Blueprint(object):
     def reset_template(self):
         """Reset template."""
         self.template = Template()
+        self._prerendered = False
         self._rendered = None
         self._version = None
 
@@ -487,6 +491,22 @@ class Blueprint(object):
         version = hashlib.md5(rendered.encode()).hexdigest()[:8]
         return version, rendered
 
+    def set_rendered(self, version, rendered):
+        """Use a template that was rendered outside of this object.
+
+        Used when the template was rendered by another process or retrieved
+        from a cache so it does not need to be rendered again.
+
+        Args:
+            version (str): Version of the template.
+            rendered (str): Rendered template.
+
+        """
+        self.reset_template()
+        self._prerendered = True
+        self._rendered = rendered
+        self._version = version
+
     def to_json(self, variables=None):
         """Render the blueprint and return the template in json form.
 
@@ -554,6 +574,8 @@ class Blueprint(object):
     @property
     def requires_change_set(self):
         """Return true if the underlying template has transforms."""
+        if self._prerendered:
+            return 'Transform' in json.loads(self._rendered)
         return self.template.transform is not None
 
     @property
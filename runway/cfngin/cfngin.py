@@ -3,20 +3,77 @@ import logging
 import os
 import re
 import sys
+import threading
 
+import six
 from yaml.constructor import ConstructorError
 
 from runway.util import MutableMap, argv, cached_property, environ
+from runway.variables import Variable
 
 from .actions import build, destroy, diff
 from .config import render_parse_load as load_config
 from .context import Context as CFNginContext
+from .dag import DAG, DAGValidationError, ReadyQueueWalker
 from .environment import parse_environment
 from .providers.aws.default import ProviderBuilder
 
 # explicitly name logger so its not redundant
 LOGGER = logging.getLogger('runway.cfngin')
 
+HOOK_STAGES = ['pre_build', 'post_build', 'pre_destroy', 'post_destroy']
+# built-in hooks that change the working directory of the process
+CHANGE_DIR_HOOKS = ('runway.hooks.staticsite.build_staticsite.',)
+
+
+class ConfigLogFilter(logging.Filter):
+    """Prefix log messages with the config file being processed.
+
+    The config file is tracked per thread so messages logged while config
+    files are processed concurrently can be told apart. Messages logged by
+    this module are not prefixed.
+
+    """
+
+    def __init__(self):
+        """Instantiate class."""
+        logging.Filter.__init__(self)
+        self._local = threading.local()
+
+    @property
+    def config_name(self):
+        """Name of the config file being processed by the current thread.
+
+        Returns:
+            Optional[str]
+
+        """
+        return getattr(self._local, 'config_name', None)
+
+    @config_name.setter
+    def config_name(self, value):
+        """Set the name of the config file for the current thread."""
+        self._local.config_name = value
+
+    def filter(self, record):
+        """Prefix the message of a record.
+
+        Args:
+            record (logging.LogRecord): Record being logged.
+
+        Returns:
+            bool: Always ``True``.
+
+        """
+        name = self.config_name
+        # messages of this module already include the config file and the
+        # same record is passed to every handler
+        if name and record.name != LOGGER.name and not getattr(
+                record, 'cfngin_config', None):
+            record.cfngin_config = name
+            record.msg = '%s: %s' % (name, record.msg)
+        return True
+
 
 class CFNgin(object):
     """Control CFNgin.
@@ -31,14 +88,20 @@ class CFNgin(object):
             the underlying graph.
         interactive (bool): Wether or not to prompt the user before taking
             action.
+        max_concurrent_configs (int): Max number of config files that can be
+            processed concurrently. If the value is ``1`` or less, config
+            files are processed one at a time in order.
         parameters (MutableMap): Combination of the parameters provided when
             initalizing the class and any environment files that are found.
+        prerender (bool): Render the templates of stacks that don't depend on
+            the outputs of other stacks before deploying or diffing.
         recreate_failed (bool): Destroy and re-create stacks that are stuck in
             a failed state from an initial deployment when updating.
         region (str): The AWS region where CFNgin is currently being executed.
         sys_path (str): Working directory.
         tail (bool): Wether or not to display all CloudFormation events in the
             terminal.
+        walker_engine (str): Engine used to walk the graph of stacks.
 
     """
 
@@ -58,11 +121,14 @@ class CFNgin(object):
         self._env_file_name = None
         self.concurrency = ctx.max_concurrent_cfngin_stacks
         self.interactive = ctx.is_interactive
+        self.max_concurrent_configs = ctx.max_concurrent_cfngin_configs
         self.parameters = MutableMap()
+        self.prerender = ctx.cfngin_prerender
         self.recreate_failed = ctx.is_noninteractive
         self.region = ctx.env_region
         self.sys_path = sys_path or os.getcwd()
         self.tail = ctx.debug
+        self.walker_engine = ctx.cfngin_walker
 
         self.parameters.update(self.env_file)
 
@@ -110,18 +176,28 @@ class CFNgin(object):
         config_files = self.find_config_files(sys_path=sys_path)
 
         with environ(self.__ctx.env_vars):
-            for config in config_files:
-                ctx = self.load(config)
-                LOGGER.info('%s: deploying...', os.path.basename(config))
-                with argv('stacker', 'build', ctx.config_path):
-                    action = build.Action(
-                        context=ctx,
-                        provider_builder=self._get_provider_builder(
-                            ctx.config.service_role
-                        )
-                    )
-                    action.execute(concurrency=self.concurrency,
-                                   tail=self.tail)
+            self._process_configs(config_files, 'build', self._deploy_config,
+                                  sys_path)
+
+    def _deploy_config(self, ctx):
+        """Run the CFNgin deploy action for a single config file.
+
+        Args:
+            ctx (:class:`runway.cfngin.context.Context`): Context of the
+                config file.
+
+        """
+        LOGGER.info('%s: deploying...', os.path.basename(ctx.config_path))
+        action = build.Action(
+            context=ctx,
+            provider_builder=self._get_provider_builder(
+                ctx.config.service_role, ctx.output_cache
+            )
+        )
+        action.execute(concurrency=self.concurrency,
+                       prerender=self.prerender,
+                       tail=self.tail,
+                       walker_engine=self.walker_engine)
 
     def destroy(self, force=False, sys_path=None):
         """Run the CFNgin destroy action.
@@ -138,23 +214,32 @@ class CFNgin(object):
         if not sys_path:
             sys_path = self.sys_path
         config_files = self.find_config_files(sys_path=sys_path)
-        # destroy should run in reverse to handle dependencies
-        config_files.reverse()
 
         with environ(self.__ctx.env_vars):
-            for config in config_files:
-                ctx = self.load(config)
-                LOGGER.info('%s: destroying...', os.path.basename(config))
-                with argv('stacker', 'destroy', ctx.config_path):
-                    action = destroy.Action(
-                        context=ctx,
-                        provider_builder=self._get_provider_builder(
-                            ctx.config.service_role
-                        )
-                    )
-                    action.execute(concurrency=self.concurrency,
-                                   force=True,
-                                   tail=self.tail)
+            # destroy should run in reverse to handle dependencies
+            self._process_configs(config_files, 'destroy',
+                                  self._destroy_config, sys_path,
+                                  reverse=True)
+
+    def _destroy_config(self, ctx):
+        """Run the CFNgin destroy action for a single config file.
+
+        Args:
+            ctx (:class:`runway.cfngin.context.Context`): Context of the
+                config file.
+
+        """
+        LOGGER.info('%s: destroying...', os.path.basename(ctx.config_path))
+        action = destroy.Action(
+            context=ctx,
+            provider_builder=self._get_provider_builder(
+                ctx.config.service_role, ctx.output_cache
+            )
+        )
+        action.execute(concurrency=self.concurrency,
+                       force=True,
+                       tail=self.tail,
+                       walker_engine=self.walker_engine)
 
     def load(self, config_path):
         """Load a CFNgin config into a context object.
@@ -199,18 +284,136 @@ class CFNgin(object):
             sys_path = self.sys_path
         config_files = self.find_config_files(sys_path=sys_path)
         with environ(self.__ctx.env_vars):
-            for config in config_files:
-                ctx = self.load(config)
-                LOGGER.info('%s: generating change sets...',
-                            os.path.basename(config))
-                with argv('stacker', 'diff', ctx.config_path):
-                    action = diff.Action(
-                        context=ctx,
-                        provider_builder=self._get_provider_builder(
-                            ctx.config.service_role
-                        )
-                    )
-                    action.execute()
+            self._process_configs(config_files, 'diff', self._plan_config,
+                                  sys_path)
+
+    def _plan_config(self, ctx):
+        """Run the CFNgin plan action for a single config file.
+
+        Args:
+            ctx (:class:`runway.cfngin.context.Context`): Context of the
+                config file.
+
+        """
+        LOGGER.info('%s: generating change sets...',
+                    os.path.basename(ctx.config_path))
+        action = diff.Action(
+            context=ctx,
+            provider_builder=self._get_provider_builder(
+                ctx.config.service_role, ctx.output_cache
+            )
+        )
+        action.execute(prerender=self.prerender)
+
+    def _process_configs(self, config_files, command, func, sys_path,
+                         reverse=False):
+        """Run an action for each config file.
+
+        Config files are processed one at a time in order unless
+        ``max_concurrent_configs`` is greater than ``1``. Then, config
+        files are processed concurrently in the order of the dependencies
+        between them (see :meth:`get_config_graph`). Config files are
+        processed in threads so they are still processed one at a time if
+        a hook may change the working directory (see
+        :func:`_changes_working_dir`).
+
+        Args:
+            config_files (List[str]): Paths of the config files.
+            command (str): Name of the CFNgin command being run.
+            func (Callable[[runway.cfngin.context.Context], None]): Runs the
+                action for the context of a config file.
+            sys_path (str): Working directory.
+            reverse (bool): Process config files in reverse order.
+
+        """
+        if self.max_concurrent_configs > 1 and len(config_files) > 1:
+            contexts = [self.load(config) for config in config_files]
+            unsafe = [os.path.basename(ctx.config_path) for ctx in contexts
+                      if _changes_working_dir(ctx)]
+            if unsafe:
+                LOGGER.warning('unable to process config files '
+                               'concurrently; hooks of %s may change the '
+                               'working directory', ', '.join(unsafe))
+            else:
+                try:
+                    dag = self.get_config_graph(contexts)
+                except DAGValidationError as err:
+                    LOGGER.warning('unable to process config files '
+                                   'concurrently; %s', err)
+                else:
+                    if reverse:
+                        dag = dag.transpose()
+                    # sys.argv is shared by the threads so it can't contain
+                    # the path of each config file; it is only read by
+                    # custom hooks which prevent concurrency
+                    with argv('stacker', command, sys_path):
+                        self._walk_configs(dag, contexts, func)
+                    return
+            if reverse:
+                contexts.reverse()
+            for ctx in contexts:
+                with argv('stacker', command, ctx.config_path):
+                    func(ctx)
+            return
+
+        if reverse:
+            config_files = list(reversed(config_files))
+        for config in config_files:
+            ctx = self.load(config)
+            with argv('stacker', command, ctx.config_path):
+                func(ctx)
+
+    def _walk_configs(self, dag, contexts, func):
+        """Run an action for config files concurrently.
+
+        A config file is skipped if a config file it depends on failed. The
+        first error raised is re-raised after every other config file has
+        been processed.
+
+        Args:
+            dag (:class:`runway.cfngin.dag.DAG`): Graph of config paths.
+            contexts (List[:class:`runway.cfngin.context.Context`]): Context
+                of each config file.
+            func (Callable[[runway.cfngin.context.Context], None]): Runs the
+                action for the context of a config file.
+
+        """
+        contexts = {ctx.config_path: ctx for ctx in contexts}
+        failed = {}
+        log_filter = ConfigLogFilter()
+        handlers = logging.getLogger().handlers[:]
+
+        def walk_func(config_path):
+            """Run the action for a config file."""
+            name = os.path.basename(config_path)
+            failed_deps = [dep for dep in dag.all_downstreams(config_path)
+                           if dep in failed]
+            if failed_deps:
+                LOGGER.error('%s: skipped; dependency failed: %s', name,
+                             ', '.join(os.path.basename(dep)
+                                       for dep in failed_deps))
+                failed[config_path] = None
+                return
+            log_filter.config_name = name
+            try:
+                func(contexts[config_path])
+            except BaseException as err:  # pylint: disable=broad-except
+                LOGGER.error('%s: failed; %s', name, err)
+                failed[config_path] = err
+            finally:
+                log_filter.config_name = None
+
+        for handler in handlers:
+            handler.addFilter(log_filter)
+        try:
+            ReadyQueueWalker(self.max_concurrent_configs).walk(dag, walk_func)
+        finally:
+            for handler in handlers:
+                handler.removeFilter(log_filter)
+
+        for config_path in dag.topological_sort()[::-1]:
+            if failed.get(config_path) is not None:
+                raise failed[config_path]
 
     def should_skip(self, force=False):
         """Determine if action should be taken or not.
@@ -257,19 +460,23 @@ class CFNgin(object):
         """
         return CFNginContext(
             boto3_credentials=self.__ctx.boto3_credentials,
+            client_cache=self.__ctx.client_cache,
             config=config,
             config_path=config_path,
             environment=self.parameters,
             force_stacks=[],  # placeholder
             region=self.region,
+            ssm_cache=self.__ctx.ssm_cache,
             stack_names=[]  # placeholder
         )
 
-    def _get_provider_builder(self, service_role=None):
+    def _get_provider_builder(self, service_role=None, output_cache=None):
         """Initialize provider builder.
 
         Args:
             service_role (Optional[str]): CloudFormation service role.
+            output_cache (Optional[:class:`runway.cfngin.output_cache.OutputCache`]):
+                Stack output cache shared by all providers.
 
         Returns:
             ProviderBuilder
@@ -281,6 +488,7 @@ class CFNgin(object):
             LOGGER.info('Using default AWS provider mode.')
         return ProviderBuilder(
             interactive=self.interactive,
+            output_cache=output_cache,
             recreate_failed=self.recreate_failed,
             region=self.region,
             service_role=service_role
@@ -310,6 +518,54 @@ class CFNgin(object):
         if not self.parameters.get('region'):
             self.parameters['region'] = self.region
 
+    @staticmethod
+    def get_config_graph(contexts):
+        """Build a graph of the dependencies between config files.
+
+        A config file depends on another if a stack variable or hook
+        argument of the config file uses an ``output``, ``rxref``, or
+        ``xref`` lookup of a stack defined in the other config file, or if
+        the other config file is listed in its ``requires``.
+
+        Args:
+            contexts (List[:class:`runway.cfngin.context.Context`]): Context
+                of each config file.
+
+        Returns:
+            :class:`runway.cfngin.dag.DAG`: Graph of config paths.
+
+        Raises:
+            DAGValidationError: Config files depend on each other.
+
+        """
+        config_paths = {}
+        stack_configs = {}
+        for ctx in contexts:
+            config_paths[os.path.normpath(ctx.config_path)] = ctx.config_path
+            for stack in ctx.get_stacks():
+                stack_configs[stack.fqn] = ctx.config_path
+
+        dag = DAG()
+        edges = set()
+        for ctx in contexts:
+            dag.add_node(ctx.config_path)
+            for fqn in _referenced_stacks(ctx):
+                dep = stack_configs.get(fqn)
+                if dep and dep != ctx.config_path:
+                    edges.add((ctx.config_path, dep))
+            for required in ctx.config.requires or []:
+                dep = config_paths.get(os.path.normpath(os.path.join(
+                    os.path.dirname(ctx.config_path), required
+                )))
+                if dep:
+                    edges.add((ctx.config_path, dep))
+                else:
+                    LOGGER.warning('%s: required config file not found: %s',
+                                   os.path.basename(ctx.config_path),
+                                   required)
+        dag.add_edges(sorted(edges))
+        return dag
+
     @classmethod
     def find_config_files(cls, exclude=None, sys_path=None):
         """Find CFNgin config files.
@@ -345,3 +601,58 @@ class CFNgin(object):
             break  # only need top level files
         result.sort()
         return result
+
+
+def _changes_working_dir(ctx):
+    """Determine if the hooks of a config file may change the working dir.
+
+    Custom hooks (not part of Runway) may change it, as well as the
+    built-in hooks in ``CHANGE_DIR_HOOKS``.
+
+    Args:
+        ctx (:class:`runway.cfngin.context.Context`): Context of the config
+            file.
+
+    Returns:
+        bool
+
+    """
+    for stage in HOOK_STAGES:
+        for hook in getattr(ctx.config, stage) or []:
+            if not hook.path.startswith('runway.') or \
+                    hook.path.startswith(CHANGE_DIR_HOOKS):
+                return True
+    return False
+
+
+def _referenced_stacks(ctx):
+    """Find the stacks referenced by lookups of a config file.
+
+    Args:
+        ctx (:class:`runway.cfngin.context.Context`): Context of the config
+            file.
+
+    Returns:
+        Set[str]: Fully qualified names of the referenced stacks.
+
+    """
+    variables = []
+    for stack in ctx.get_stacks():
+        variables.extend(stack.variables)
+    for stage in HOOK_STAGES:
+        for hook in getattr(ctx.config, stage) or []:
+            if hook.args:
+                variables.append(Variable(hook.path, hook.args, 'cfngin'))
+
+    result = set()
+    for variable in variables:
+        for lookup in variable.lookups:
+            name = lookup.lookup_name.value
+            query = lookup.lookup_data.value
+            if name not in ('output', 'rxref', 'xref') or (
+                    not isinstance(query, six.string_types) or '::' not in query):
+                continue
+            stack_name = query.split('::')[0].strip()
+            result.add(stack_name if name == 'xref'
+                       else ctx.get_fqn(stack_name))
+    return result
@@ -40,14 +40,6 @@ class Stacker(BaseCommand):
             validate=True,
         )
 
-        options.provider_builder = default.ProviderBuilder(
-            region=options.region,
-            interactive=options.interactive,
-            replacements_only=options.replacements_only,
-            recreate_failed=options.recreate_failed,
-            service_role=self.config.service_role,
-        )
-
         options.context = Context(
             environment=options.environment,
             config=self.config,
@@ -58,6 +50,15 @@ class Stacker(BaseCommand):
             **options.get_context_kwargs(options)
         )
 
+        options.provider_builder = default.ProviderBuilder(
+            region=options.region,
+            interactive=options.interactive,
+            output_cache=options.context.output_cache,
+            replacements_only=options.replacements_only,
+            recreate_failed=options.recreate_failed,
+            service_role=self.config.service_role,
+        )
+
         super(Stacker, self).configure(options)
         if options.interactive:
             LOGGER.info("Using interactive AWS provider mode.")
@@ -233,6 +233,8 @@ class GitPackageSource(Model):
         commit (StringType): Commit hash.
         configs (ListType): List of CFNgin config paths to execute.
         paths (ListType): List of paths to append to ``sys.path``.
+        sparse_checkout (BooleanType): Only check out ``paths`` and
+            ``configs``.
         tag (StringType): Git tag.
         uri (StringType): Remote git repo URI.
 
@@ -242,6 +244,7 @@ class GitPackageSource(Model):
     commit = StringType(serialize_when_none=False)
     configs = ListType(StringType, serialize_when_none=False)
     paths = ListType(StringType, serialize_when_none=False)
+    sparse_checkout = BooleanType(serialize_when_none=False)
     tag = StringType(serialize_when_none=False)
     uri = StringType(required=True)
 
@@ -444,6 +447,8 @@ class Config(Model):
         post_destroy (ListType): Hooks to run after a destroy action.
         pre_build (ListType): Hooks to run before a build action.
         pre_destroy (ListType): Hooks to run before a destroy action.
+        requires (ListType): Config files, relative to this one, that must
+            be processed first when config files are processed concurrently.
         service_role (StringType): IAM role for CloudFormation to use.
         stacker_bucket (StringType): [DEPRECATED] Replaced by
             ``cfngin_bucket``, support will be retained until the release
@@ -479,6 +484,7 @@ class Config(Model):
     post_destroy = ListType(ModelType(Hook), serialize_when_none=False)
     pre_build = ListType(ModelType(Hook), serialize_when_none=False)
     pre_destroy = ListType(ModelType(Hook), serialize_when_none=False)
+    requires = ListType(StringType, serialize_when_none=False)
     service_role = StringType(serialize_when_none=False)
     stacker_bucket = StringType(serialize_when_none=False)
     stacker_bucket_region = StringType(serialize_when_none=False)
@@ -3,13 +3,16 @@ import collections
 import json
 import logging
 
+from runway.lookups.handlers.ssm import SsmParameterCache
+
 from .config import Config
 from .exceptions import (PersistentGraphCannotLock,
                          PersistentGraphCannotUnlock,
                          PersistentGraphLockCodeMissmatch,
                          PersistentGraphLocked, PersistentGraphUnlocked)
+from .output_cache import OutputCache
 from .plan import Graph
-from .session_cache import get_session
+from .session_cache import ClientCache, get_session
 from .stack import Stack
 from .target import Target
 from .util import ensure_s3_bucket
@@ -49,7 +52,9 @@ class Context(object):
                  config=None,
                  config_path=None,
                  region=None,
-                 force_stacks=None):
+                 force_stacks=None,
+                 ssm_cache=None,
+                 client_cache=None):
         """Instantiate class.
 
         Args:
@@ -66,9 +71,15 @@ class Context(object):
             region (str): Name of an AWS region if provided as a CLI argument.
             force_stacks (list): A list of stacks to force work on. Used to
                 work on locked stacks.
+            ssm_cache (Optional[:class:`runway.lookups.handlers.ssm.SsmParameterCache`]):
+                Cache of SSM parameters shared with the Runway context.
+            client_cache (Optional[:class:`runway.cfngin.session_cache.ClientCache`]):
+                Cache of boto3 clients shared with the Runway context.
 
         """
         self.__boto3_credentials = boto3_credentials
+        # (region, name regex, describe_images args) -> image id
+        self.ami_cache = {}
         self._bucket_name = None
         self._persistent_graph = None
         self._persistent_graph_lock_code = None
@@ -85,11 +96,14 @@ class Context(object):
         # used is during tests.
         self.config_path = config_path or './'
         self.bucket_region = self.config.cfngin_bucket_region or region
+        self.client_cache = client_cache or ClientCache()
         self.environment = environment
         self.force_stacks = force_stacks or []
         self.hook_data = {}  # TODO change to MutableMap in next major release
+        self.output_cache = OutputCache(region=region)
         self.region = region
-        self.s3_conn = self.get_session(region=self.bucket_region).client('s3')
+        self.s3_conn = self.get_client('s3', region=self.bucket_region)
+        self.ssm_cache = ssm_cache or SsmParameterCache()
         self.stack_names = stack_names or []
 
     @property
@@ -114,6 +128,16 @@ class Context(object):
                          'could not get tags')
             return {}
 
+    @property
+    def boto3_credentials(self):
+        """Return credentials used when creating a boto3 session from context.
+
+        Returns:
+            Dict[str, str]
+
+        """
+        return self.__boto3_credentials or {}
+
     @property
     def bucket_name(self):
         """Return ``cfngin_bucket`` from config, calculated name, or None."""
@@ -317,6 +341,28 @@ class Context(object):
             self._targets = targets
         return self._targets
 
+    def get_client(self, service_name, profile=None, region=None):
+        """Get a boto3 client, reusing one created by this context if possible.
+
+        Args:
+            service_name (str): Name of the AWS service.
+            profile (Optional[str]): The profile for the client.
+            region (Optional[str]): The region for the client.
+
+        Returns:
+            boto3.client.Client: A thread-safe boto3 client.
+
+        """
+        region = region or self.region
+        creds = self.boto3_credentials
+        key = (service_name, region, profile,
+               creds.get('aws_access_key_id'),
+               creds.get('aws_secret_access_key'),
+               creds.get('aws_session_token'))
+        return self.client_cache.get(key, lambda: self.get_session(
+            profile=profile, region=region
+        ).client(service_name))
+
     def get_session(self, profile=None, region=None):
         """Create a thread-safe boto3 session.
 
@@ -460,7 +506,7 @@ class Context(object):
             )
 
         self.s3_conn.put_object(
-            Body=self.persistent_graph.dumps(4),
+            Body=self.persistent_graph.dumps(),
             ServerSideEncryption='AES256',
             ACL='bucket-owner-full-control',
             ContentType='application/json',
@@ -468,8 +514,9 @@ class Context(object):
                                    lock_code),
             **self.persistent_graph_location
         )
-        LOGGER.debug('Persistent graph updated:\n%s',
-                     self.persistent_graph.dumps(indent=4))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('Persistent graph updated:\n%s',
+                         self.persistent_graph.dumps(indent=4))
 
     def set_hook_data(self, key, data):
         """Set hook data for the given key.
@@ -542,3 +589,25 @@ class Context(object):
                 self.persistent_graph_lock_code
             )
         )
+
+    def __getstate__(self):
+        """Return the state of the object when pickled.
+
+        The config is pickled as primitive data. The S3 client, stacks and
+        persistent graph are not pickled so a context sent to another process
+        (e.g. to render blueprints) can't be used to interact with AWS
+        through them.
+
+        """
+        state = self.__dict__.copy()
+        state['config'] = self.config.to_primitive()
+        state['s3_conn'] = None
+        state['_persistent_graph'] = None
+        state['_stacks'] = None
+        state['_targets'] = None
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of the object when unpickled."""
+        self.__dict__.update(state)
+        self.config = Config(state['config'])
@@ -1,10 +1,12 @@
 """CFNgin directed acyclic graph (DAG) implementation."""
-import collections
 import logging
 from collections import OrderedDict, deque
-from copy import copy, deepcopy
+from copy import copy
 from threading import Thread
 
+from six.moves import queue as queue_mod
+from six.moves.collections_abc import Iterable  # pylint: disable=E
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -13,11 +15,119 @@ class DAGValidationError(Exception):
 
 
 class DAG(object):
-    """Directed acyclic graph implementation."""
+    """Directed acyclic graph implementation.
+
+    The topological order of the graph and the nodes reachable from each
+    node are computed when first needed and reused until the graph is
+    changed. Changes must be made using the methods of this class or by
+    assigning a new dict to :attr:`graph`.
+
+    """
 
     def __init__(self):
         """Instantiate a new DAG with no nodes or edges."""
-        self.graph = OrderedDict()
+        self._graph = OrderedDict()
+        self._reachability = None
+        self._sorted = None
+
+    @property
+    def graph(self):
+        """Edges of the graph.
+
+        Returns:
+            OrderedDict[str, Set[str]]: Maps each node to the nodes it has
+            edges towards.
+
+        """
+        return self._graph
+
+    @graph.setter
+    def graph(self, value):
+        """Replace the edges of the graph."""
+        self._graph = value
+        self._invalidate()
+
+    def _invalidate(self):
+        """Discard the results computed for the current graph."""
+        self._reachability = None
+        self._sorted = None
+
+    def _reach(self):
+        """Compute the nodes reachable from and that can reach each node.
+
+        Sets of nodes are stored as integers where each bit is a node at the
+        same index of the topological order. Descendants are computed in
+        reverse topological order and ancestors in topological order so each
+        edge is visited once.
+
+        Returns:
+            Tuple[List[str], Dict[str, int], Dict[str, int], Dict[str, int]]:
+            Topological order, index of each node, descendants and ancestors
+            of each node.
+
+        """
+        if self._reachability is None:
+            order = self.topological_sort()
+            index = {node: i for i, node in enumerate(order)}
+            descendants = {}
+            for node in reversed(order):
+                bits = 0
+                for edge in self.graph[node]:
+                    bits |= (1 << index[edge]) | descendants[edge]
+                descendants[node] = bits
+            ancestors = {node: 0 for node in order}
+            for node in order:
+                bits = (1 << index[node]) | ancestors[node]
+                for edge in self.graph[node]:
+                    ancestors[edge] |= bits
+            self._reachability = order, index, descendants, ancestors
+        return self._reachability
+
+    @staticmethod
+    def _nodes_from_bits(order, bits):
+        """Get the nodes in a set stored as an integer.
+
+        Args:
+            order (List[str]): Topological order of the graph.
+            bits (int): Set of nodes.
+
+        Returns:
+            List[str]: The nodes in topological order.
+
+        """
+        nodes = []
+        while bits:
+            lowest = bits & -bits
+            nodes.append(order[lowest.bit_length() - 1])
+            bits ^= lowest
+        return nodes
+
+    def _has_path(self, from_node, to_node):
+        """Check if there is a path between two nodes.
+
+        Args:
+            from_node (str): Node where the path starts.
+            to_node (str): Node where the path ends.
+
+        Returns:
+            bool
+
+        """
+        if from_node == to_node:
+            return True
+        if self._reachability is not None:
+            _order, index, descendants, _ancestors = self._reachability
+            return bool(descendants[from_node] >> index[to_node] & 1)
+        seen = {from_node}
+        stack = [from_node]
+        while stack:
+            for edge in self.graph[stack.pop()]:
+                if edge == to_node:
+                    return True
+                if edge not in seen:
+                    seen.add(edge)
+                    stack.append(edge)
+        return False
 
     def add_node(self, node_name):
         """Add a node if it does not exist yet, or error out.
@@ -34,6 +144,7 @@ class DAG(object):
         if node_name in graph:
             raise KeyError('node %s already exists' % node_name)
         graph[node_name] = set()
+        self._invalidate()
 
     def add_node_if_not_exists(self, node_name):
         """Add a node if it does not exist yet, ignoring duplicates.
@@ -65,6 +176,7 @@ class DAG(object):
         for _node, edges in graph.items():
             if node_name in edges:
                 edges.remove(node_name)
+        self._invalidate()
 
     def delete_node_if_exists(self, node_name):
         """Delete this node and all edges referencing it.
@@ -84,6 +196,10 @@ class DAG(object):
     def add_edge(self, ind_node, dep_node):
         """Add an edge (dependency) between the specified nodes.
 
+        The edge creates a cycle if there is already a path from the
+        dependent node to the independent node so only that path is searched
+        instead of validating the whole graph.
+
         Args:
             ind_node (str): The independent node to add an edge to.
             dep_node (str): The dependent node that has a dependency on the
@@ -99,15 +215,49 @@ class DAG(object):
             raise KeyError('independent node %s does not exist' % ind_node)
         if dep_node not in graph:
             raise KeyError('dependent node %s does not exist' % dep_node)
-        test_graph = deepcopy(graph)
-        test_graph[ind_node].add(dep_node)
-        test_dag = DAG()
-        test_dag.graph = test_graph
-        is_valid, message = test_dag.validate()
-        if is_valid:
+        if dep_node in graph[ind_node]:
+            return
+        if self._has_path(dep_node, ind_node):
+            raise DAGValidationError('graph is not acyclic')
+        graph[ind_node].add(dep_node)
+        self._invalidate()
+
+    def add_edges(self, edges):
+        """Add multiple edges, validating the graph once.
+
+        If any of the edges can't be added, none of them are.
+
+        Args:
+            edges (Iterable[Tuple[str, str]]): Pairs of independent and
+                dependent nodes.
+
+        Raises:
+            KeyError: A node of an edge does not exist.
+            DAGValidationError: Raised if the resulting graph is invalid.
+
+        """
+        graph = self.graph
+        new_edges = set()
+        for ind_node, dep_node in edges:
+            if ind_node not in graph:
+                raise KeyError('independent node %s does not exist' %
+                               ind_node)
+            if dep_node not in graph:
+                raise KeyError('dependent node %s does not exist' % dep_node)
+            if dep_node not in graph[ind_node]:
+                new_edges.add((ind_node, dep_node))
+        if not new_edges:
+            return
+        for ind_node, dep_node in new_edges:
             graph[ind_node].add(dep_node)
-        else:
-            raise DAGValidationError(message)
+        self._invalidate()
+        try:
+            self.topological_sort()
+        except ValueError as err:
+            for ind_node, dep_node in new_edges:
+                graph[ind_node].remove(dep_node)
+            self._invalidate()
+            raise DAGValidationError(str(err))
 
     def delete_edge(self, ind_node, dep_node):
         """Delete an edge from the graph.
@@ -127,6 +277,7 @@ class DAG(object):
                 "No edge exists between %s and %s." % (ind_node, dep_node)
             )
         graph[ind_node].remove(dep_node)
+        self._invalidate()
 
     def transpose(self):
         """Build a new graph with the edges reversed.
@@ -135,14 +286,14 @@ class DAG(object):
             :class:`runway.cfngin.dag.DAG`: The transposed graph.
 
         """
-        graph = self.graph
-        transposed = DAG()
-        for node, edges in graph.items():
-            transposed.add_node(node)
-        for node, edges in graph.items():
+        graph = OrderedDict((node, set()) for node in self.graph)
+        for node, edges in self.graph.items():
             # for each edge A -> B, transpose it so that B -> A
             for edge in edges:
-                transposed.add_edge(edge, node)
+                graph[edge].add(node)
+        transposed = DAG()
+        # reversing the edges of an acyclic graph can't create a cycle
+        transposed.graph = graph
         return transposed
 
     def walk(self, walk_func):
@@ -168,32 +319,21 @@ class DAG(object):
         """Perform a transitive reduction on the DAG.
 
         The transitive reduction of a graph is a graph with as few edges as
-        possible with the same reachability as the original graph.
+        possible with the same reachability as the original graph. An edge
+        is removed when its dependent node can be reached through another
+        edge of the same node.
 
         See https://en.wikipedia.org/wiki/Transitive_reduction
 
         """
-        combinations = []
-        for node, edges in self.graph.items():
-            combinations += [[node, edge] for edge in edges]
-
-        while True:
-            new_combinations = []
-            for comb1 in combinations:
-                for comb2 in combinations:
-                    if not comb1[-1] == comb2[0]:
-                        continue
-                    new_entry = comb1 + comb2[1:]
-                    if new_entry not in combinations:
-                        new_combinations.append(new_entry)
-            if not new_combinations:
-                break
-            combinations += new_combinations
-
-        constructed = {(c[0], c[-1]) for c in combinations if len(c) != 2}
+        _order, index, descendants, _ancestors = self._reach()
         for node, edges in self.graph.items():
-            bad_nodes = {e for n, e in constructed if node == n}
-            self.graph[node] = edges - bad_nodes
+            indirect = 0
+            for edge in edges:
+                indirect |= descendants[edge]
+            self.graph[node] = {edge for edge in edges
+                                if not indirect >> index[edge] & 1}
+        self._invalidate()
 
     def rename_edges(self, old_node_name, new_node_name):
         """Change references to a node in existing edges.
@@ -204,7 +344,7 @@ class DAG(object):
 
         """
         graph = self.graph
-        for node, edges in graph.items():
+        for node, edges in list(graph.items()):
             if node == old_node_name:
                 graph[new_node_name] = copy(edges)
                 del graph[old_node_name]
@@ -213,6 +353,7 @@ class DAG(object):
                 if old_node_name in edges:
                     edges.remove(old_node_name)
                     edges.add(new_node_name)
+        self._invalidate()
 
     def predecessors(self, node):
         """Return a list of all immediate predecessors of the given node.
@@ -253,19 +394,21 @@ class DAG(object):
             List[str]: A list of nodes that are downstream from the node.
 
         """
-        nodes = [node]
-        nodes_seen = set()
-        i = 0
-        while i < len(nodes):
-            downstreams = self.downstream(nodes[i])
-            for downstream_node in downstreams:
-                if downstream_node not in nodes_seen:
-                    nodes_seen.add(downstream_node)
-                    nodes.append(downstream_node)
-            i += 1
-        return [
-            node_ for node_ in self.topological_sort() if node_ in nodes_seen
-        ]
+        order, _index, descendants, _ancestors = self._reach()
+        return self._nodes_from_bits(order, descendants[node])
+
+    def all_upstreams(self, node):
+        """Return a list of all nodes upstream in topological order.
+
+        Args:
+             node (str): The node whose upstream nodes you want to find.
+
+        Returns:
+            List[str]: A list of nodes that have a path to the node.
+
+        """
+        order, _index, _descendants, ancestors = self._reach()
+        return self._nodes_from_bits(order, ancestors[node])
 
     def filter(self, nodes):
         """Return a new DAG with only the given nodes and their dependencies.
@@ -288,7 +431,8 @@ class DAG(object):
         # Now, rebuild the graph for each node that's present.
         for node, edges in self.graph.items():
             if node in filtered_dag.graph:
-                filtered_dag.graph[node] = edges
+                filtered_dag.graph[node] = set(edges)
+        filtered_dag._invalidate()  # pylint: disable=protected-access
 
         return filtered_dag
 
@@ -318,11 +462,12 @@ class DAG(object):
         self.reset_graph()
         for new_node in graph_dict:
             self.add_node(new_node)
+        edges = []
         for ind_node, dep_nodes in graph_dict.items():
-            if not isinstance(dep_nodes, collections.Iterable):
+            if not isinstance(dep_nodes, Iterable):
                 raise TypeError('%s: dict values must be lists' % ind_node)
-            for dep_node in dep_nodes:
-                self.add_edge(ind_node, dep_node)
+            edges.extend((ind_node, dep_node) for dep_node in dep_nodes)
+        self.add_edges(edges)
 
     def reset_graph(self):
         """Restore the graph to an empty state."""
@@ -367,6 +512,8 @@ class DAG(object):
             ValueError: Raised if the graph is not acyclic.
 
         """
+        if self._sorted is not None:
+            return list(self._sorted)
         graph = self.graph
 
         in_degree = {}
@@ -392,7 +539,8 @@ class DAG(object):
                     queue.appendleft(val)
 
         if len(sorted_graph) == len(graph):
-            return sorted_graph
+            self._sorted = sorted_graph
+            return list(sorted_graph)
         raise ValueError('graph is not acyclic')
 
     def size(self):
@@ -490,3 +638,99 @@ class ThreadedWalker(object):  # pylint: disable=too-few-public-methods
 
         # Wait for all threads to complete executing.
         wait_for(nodes)
+
+
+class ReadyQueueWalker(object):  # pylint: disable=too-few-public-methods
+    """Walk a DAG using in-degree counters and a queue of ready nodes.
+
+    Unlike :class:`ThreadedWalker`, a thread is not allocated for each node.
+    Nodes are dispatched to a pool of worker threads as soon as the last of
+    their dependencies has completed. The pool only grows as large as the
+    number of nodes that can be executed at the same time.
+
+    """
+
+    def __init__(self, max_workers=0):
+        """Instantiate class.
+
+        Args:
+            max_workers (int): Max number of nodes that can be executed in
+                parallel. If ``0``, it will only be constrained by the
+                topology of the graph.
+
+        """
+        self.max_workers = max_workers
+
+    def walk(self, dag, walk_func):
+        """Walk each node of the graph, in parallel if it can.
+
+        The walk_func is only called when the nodes dependencies have been
+        satisfied.
+
+        """
+        # raises ValueError if the graph is not acyclic
+        nodes = dag.topological_sort()
+        nodes.reverse()
+        if not nodes:
+            return
+
+        # number of dependencies that have not yet completed for each node
+        pending = {node: len(dag.graph[node]) for node in nodes}
+        # maps a node to the nodes that depend on it
+        dependants = {node: [] for node in nodes}
+        for node in nodes:
+            for dep in dag.graph[node]:
+                dependants[dep].append(node)
+
+        ready = queue_mod.Queue()
+        finished = queue_mod.Queue()
+        workers = []
+
+        def work():
+            """Execute nodes from the ready queue until told to stop."""
+            while True:
+                node = ready.get()
+                if node is None:
+                    return
+                LOGGER.debug("%s starting", node)
+                try:
+                    walk_func(node)
+                except Exception:  # pylint: disable=broad-except
+                    LOGGER.exception("%s raised an unhandled exception", node)
+                finally:
+                    finished.put(node)
+
+        # dispatching and the counters are only handled by this thread
+        in_flight = [0]
+
+        def dispatch(node):
+            """Add a node to the ready queue, growing the pool if needed."""
+            in_flight[0] += 1
+            if len(workers) < in_flight[0] and (
+                    not self.max_workers or len(workers) < self.max_workers):
+                worker = Thread(target=work,
+                                name='cfngin-walker-%s' % len(workers))
+                worker.daemon = True
+                workers.append(worker)
+                worker.start()
+            ready.put(node)
+
+        for node in nodes:
+            if not pending[node]:
+                dispatch(node)
+
+        remaining = len(nodes)
+        try:
+            while remaining:
+                node = finished.get()
+                in_flight[0] -= 1
+                remaining -= 1
+                for dependant in dependants[node]:
+                    pending[dependant] -= 1
+                    if not pending[dependant]:
+                        dispatch(dependant)
+        finally:
+            for _ in workers:
+                ready.put(None)
+            for worker in workers:
+                worker.join()
@@ -79,9 +79,8 @@ class Certificate(Hook):
         })
         self.blueprint = self._create_blueprint()
 
-        session = self.context.get_session()
-        self.acm_client = session.client('acm')
-        self.r53_client = session.client('route53')
+        self.acm_client = self.context.get_client('acm')
+        self.r53_client = self.context.get_client('route53')
         self.stack = self.generate_stack(
             variables={'ValidateRecordTTL': self.args.ttl,
                        'DomainName': self.args.domain}
@@ -2,23 +2,29 @@
 import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import stat
+import struct
 import subprocess
 import sys
+import zlib
 # https://github.com/PyCQA/pylint/issues/2955
 from distutils.util import strtobool  # pylint: disable=E
 from io import BytesIO as StringIO
+from multiprocessing.pool import ThreadPool
 from shutil import copyfile
-from types import GeneratorType
-from zipfile import ZIP_DEFLATED, ZipFile
+from tempfile import SpooledTemporaryFile
+from zipfile import ZIP_DEFLATED
 
 import botocore
 import docker
 import formic
-from six import string_types
+from six import binary_type, string_types
 from troposphere.awslambda import Code
 
+from runway.util import md5_of_files
+
 from ..exceptions import (InvalidDockerizePipConfiguration, PipenvError,
                           PipError)
 from ..session_cache import get_session
@@ -34,6 +40,14 @@ else:
 # mask to retrieve only UNIX file permissions from the external attributes
 # field of a ZIP entry.
 ZIP_PERMS_MASK = (stat.S_IRWXU | stat.S_IRWXG | stat.S_IRWXO) << 16
+# DOS date and time of every ZIP entry (1980-01-01 00:00:00) so archives of
+# the same files are identical.
+ZIP_DOS_DATE = (1 << 5) | 1
+ZIP_DOS_TIME = 0
+ZIP_MEMBER_SPOOL_SIZE = 1024 * 1024
+ZIP_READ_SIZE = 1024 * 1024
+ZIP_SPOOL_SIZE = 16 * 1024 * 1024
+ZIP_WORKERS = multiprocessing.cpu_count()
 
 LOGGER = logging.getLogger(__name__)
 
@@ -136,56 +150,142 @@ def should_use_docker(dockerize_pip=None):
     return False
 
 
+def _compress_file(path):
+    """Compress a file for a ZIP archive.
+
+    Args:
+        path (str): Path of the file.
+
+    Returns:
+        Tuple[IO[bytes], int, int, int, int]: Raw deflate data of the file,
+        CRC-32, compressed size, uncompressed size, and UNIX permissions.
+
+    """
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED,
+                                  -15)
+    data = SpooledTemporaryFile(ZIP_MEMBER_SPOOL_SIZE)
+    crc = 0
+    size = 0
+    with open(path, 'rb') as file_:
+        for chunk in iter(lambda: file_.read(ZIP_READ_SIZE), b''):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            data.write(compressor.compress(chunk))
+    data.write(compressor.flush())
+    compressed_size = data.tell()
+    data.seek(0)
+    # only care whether a file is executable or not, choosing between modes
+    # 755 and 644 accordingly.
+    perms = 0o755 if os.stat(path).st_mode & stat.S_IXUSR else 0o644
+    return data, crc & 0xffffffff, compressed_size, size, perms
+
+
+def _write_zip_member(archive, file_name, member, content_hash):
+    """Write a compressed file to a ZIP archive.
+
+    The data of the file is decompressed as it is written to update the
+    hash of the contents of the archive so the file is not read again.
+
+    Args:
+        archive (IO[bytes]): ZIP archive being written.
+        file_name (str): Name of the file relative to the root of the
+            archive.
+        member (Tuple[IO[bytes], int, int, int, int]): Compressed file
+            returned by :func:`_compress_file`.
+        content_hash (hashlib._Hash): Hash of the contents of the archive.
+
+    Returns:
+        bytes: Central directory entry of the file.
+
+    """
+    data, crc, compressed_size, size, perms = member
+    # normalized the same way as zipfile.ZipFile.write
+    name = os.path.normpath(os.path.splitdrive(file_name)[1])
+    name = name.lstrip(os.sep).replace(os.sep, '/').encode('utf-8')
+    flags = 0x800 if any(byte > 0x7f for byte in bytearray(name)) else 0
+    offset = archive.tell()
+    if max(offset, compressed_size, size) >= 0xffffffff:
+        raise ValueError('lambda: %s is too large for a ZIP archive without '
+                         'ZIP64 extensions' % file_name)
+    archive.write(struct.pack('<4s2B4HL2L2H', b'PK\003\004', 20, 0, flags,
+                              ZIP_DEFLATED, ZIP_DOS_TIME, ZIP_DOS_DATE, crc,
+                              compressed_size, size, len(name), 0) + name)
+
+    decompressor = zlib.decompressobj(-15)
+    content_hash.update((file_name + "\0").encode())
+    with data:
+        for chunk in iter(lambda: data.read(ZIP_READ_SIZE), b''):
+            archive.write(chunk)
+            while chunk:
+                content_hash.update(decompressor.decompress(chunk,
+                                                            ZIP_READ_SIZE))
+                chunk = decompressor.unconsumed_tail
+    content_hash.update(decompressor.flush())
+    content_hash.update("\0".encode())
+
+    return struct.pack('<4s4B4HL2L5H2L', b'PK\001\002', 20, 3, 20, 0, flags,
+                       ZIP_DEFLATED, ZIP_DOS_TIME, ZIP_DOS_DATE, crc,
+                       compressed_size, size, len(name), 0, 0, 0, 0,
+                       (stat.S_IFREG | perms) << 16, offset) + name
+
+
 def _zip_files(files, root):
-    """Generate a ZIP file in-memory from a list of files.
+    """Generate a ZIP file from a list of files.
 
     Files will be stored in the archive with relative names, and have their
     UNIX permissions forced to 755 or 644 (depending on whether they are
     user-executable in the source filesystem).
 
+    The archive is reproducible; files are stored in order of name with a
+    fixed timestamp. Files are read once, compressed by a pool of threads,
+    and written to a temporary file that is only kept in memory while it is
+    small.
+
     Args:
-        files (List[str]): file names to add to the archive, relative to
+        files (Iterable[str]): file names to add to the archive, relative to
             ``root``.
         root (str): base directory to retrieve files from.
 
     Returns:
-        Tuple[str, str]: Content of the ZIP file as a byte string and
+        Tuple[IO[bytes], str]: ZIP file positioned at its start and
         calculated hash of all the files
 
     """
-    zip_data = StringIO()
-    if isinstance(files, GeneratorType):
-        # if file list is a generator, save the contents so it can be reused
-        # since generators are empty after the first iteration and cannot be
-        # rewound.
-        LOGGER.debug('lambda: Converting file generater to list for reuse...')
-        files = list(files)
-    with ZipFile(zip_data, 'w', ZIP_DEFLATED) as zip_file:
-        for file_name in files:
-            zip_file.write(os.path.join(root, file_name), file_name)
-
-        # Fix file permissions to avoid any issues - only care whether a file
-        # is executable or not, choosing between modes 755 and 644 accordingly.
-        for zip_entry in zip_file.filelist:
-            perms = (zip_entry.external_attr & ZIP_PERMS_MASK) >> 16
-            if perms & stat.S_IXUSR != 0:
-                new_perms = 0o755
-            else:
-                new_perms = 0o644
-
-            if new_perms != perms:
-                LOGGER.debug("lambda: fixing perms: %s: %o => %o",
-                             zip_entry.filename, perms, new_perms)
-                new_attr = (
-                    (zip_entry.external_attr & ~ZIP_PERMS_MASK) | (new_perms << 16)
-                )
-                zip_entry.external_attr = new_attr
-
-    contents = zip_data.getvalue()
-    zip_data.close()
-    content_hash = _calculate_hash(files, root)
-
-    return contents, content_hash
+    files = sorted(files)
+    archive = SpooledTemporaryFile(ZIP_SPOOL_SIZE)
+    content_hash = hashlib.md5()
+    central_directory = []
+    pool = ThreadPool(ZIP_WORKERS)
+    try:
+        # compress a few files per worker at a time so the compressed
+        # files waiting to be written stay small
+        batch_size = ZIP_WORKERS * 4
+        for i in range(0, len(files), batch_size):
+            batch = files[i:i + batch_size]
+            members = pool.imap(_compress_file, [os.path.join(root, file_name)
+                                                 for file_name in batch])
+            for file_name, member in zip(batch, members):
+                central_directory.append(_write_zip_member(
+                    archive, file_name, member, content_hash
+                ))
+    except Exception:
+        archive.close()
+        raise
+    finally:
+        pool.terminate()
+
+    offset = archive.tell()
+    if len(central_directory) > 0xffff or offset >= 0xffffffff:
+        archive.close()
+        raise ValueError('lambda: too many files for a ZIP archive without '
+                         'ZIP64 extensions')
+    for entry in central_directory:
+        archive.write(entry)
+    archive.write(struct.pack('<4s4H2LH', b'PK\005\006', 0, 0,
+                              len(central_directory), len(central_directory),
+                              archive.tell() - offset, offset, 0))
+    archive.seek(0)
+    return archive, content_hash.hexdigest()
 
 
 def _calculate_hash(files, root):
@@ -200,18 +300,7 @@ def _calculate_hash(files, root):
         str: A hash of the hashes of the given files.
 
     """
-    file_hash = hashlib.md5()
-    for file_name in sorted(files):
-        file_path = os.path.join(root, file_name)
-        file_hash.update((file_name + "\0").encode())
-        with open(file_path, "rb") as file_:
-            for chunk in iter(lambda: file_.read(4096), ""):  # pylint: disable=W
-                if not chunk:
-                    break
-                file_hash.update(chunk)
-            file_hash.update("\0".encode())
-
-    return file_hash.hexdigest()
+    return md5_of_files(files, root)
 
 
 def _find_files(root, includes, excludes=None, follow_symlinks=False):
@@ -249,7 +338,7 @@ def _find_files(root, includes, excludes=None, follow_symlinks=False):
 
 
 def _zip_from_file_patterns(root, includes, excludes, follow_symlinks):
-    """Generate a ZIP file in-memory from file search patterns.
+    """Generate a ZIP file from file search patterns.
 
     Args:
         root (str): Base directory to list files from.
@@ -389,8 +478,7 @@ def dockerized_pip(work_dir, client=None, runtime=None, docker_file=None,
             determine what is supported.
 
     Returns:
-        Tuple[str, str]: Content of the ZIP file as a byte string and
-        calculated hash of all the files
+        Tuple[IO[bytes], str]: ZIP file and calculated hash of all the files
 
     """
     # TODO use kwargs to pass args to docker for advanced config
@@ -467,7 +555,7 @@ def dockerized_pip(work_dir, client=None, runtime=None, docker_file=None,
 def _zip_package(package_root, includes, excludes=None, dockerize_pip=False,
                  follow_symlinks=False, python_path=None,
                  requirements_files=None, use_pipenv=False, **kwargs):
-    """Create zip file in memory with package dependencies.
+    """Create zip file with package dependencies.
 
     Args:
         package_root (str): Base directory to copy files from.
@@ -490,8 +578,7 @@ def _zip_package(package_root, includes, excludes=None, dockerize_pip=False,
             code to determine what is supported.
 
     Returns:
-        Tuple[str, str]: Content of the ZIP file as a byte string and
-        calculated hash of all the files
+        Tuple[IO[bytes], str]: ZIP file and calculated hash of all the files
 
     """
     kwargs.setdefault('pipenv_timeout', 300)
@@ -591,7 +678,8 @@ def _upload_code(s3_conn, bucket, prefix, name, contents, content_hash,
             the uploaded file
         name (str): desired name of the Lambda function. Will be used to
             construct a key name for the uploaded file.
-        contents (str): byte string with the content of the file upload.
+        contents (Union[bytes, IO[bytes]]): content of the file to upload.
+            File objects are streamed to S3 and closed once uploaded.
         content_hash (str): md5 hash of the contents to be uploaded.
         payload_acl (str): The canned S3 object ACL to be applied to the
             uploaded payload
@@ -607,14 +695,19 @@ def _upload_code(s3_conn, bucket, prefix, name, contents, content_hash,
     """
     LOGGER.debug('lambda: ZIP hash: %s', content_hash)
     key = '{}lambda-{}-{}.zip'.format(prefix, name, content_hash)
+    if isinstance(contents, binary_type):
+        contents = StringIO(contents)
 
-    if _head_object(s3_conn, bucket, key):
-        LOGGER.info('lambda: object %s already exists, not uploading', key)
-    else:
-        LOGGER.info('lambda: uploading object %s', key)
-        s3_conn.put_object(Bucket=bucket, Key=key, Body=contents,
-                           ContentType='application/zip',
-                           ACL=payload_acl)
+    with contents:
+        if _head_object(s3_conn, bucket, key):
+            LOGGER.info('lambda: object %s already exists, not uploading',
+                        key)
+        else:
+            LOGGER.info('lambda: uploading object %s', key)
+            s3_conn.upload_fileobj(contents, bucket, key, ExtraArgs={
+                'ContentType': 'application/zip',
+                'ACL': payload_acl
+            })
 
     return Code(S3Bucket=bucket, S3Key=key)
 
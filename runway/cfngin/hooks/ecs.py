@@ -10,7 +10,6 @@ import logging
 
 from six import string_types
 
-from ..session_cache import get_session
 
 LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +31,7 @@ def create_clusters(provider, context, **kwargs):
         bool: Whether or not the hook succeeded.
 
     """
-    conn = get_session(provider.region).client('ecs')
+    conn = context.get_client('ecs', region=provider.region)
 
     try:
         clusters = kwargs["clusters"]
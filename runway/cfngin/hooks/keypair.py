@@ -6,7 +6,6 @@ import sys
 
 from botocore.exceptions import ClientError
 
-from ..session_cache import get_session
 from ..ui import get_raw_input
 from . import utils
 
@@ -236,9 +235,8 @@ def ensure_keypair_exists(provider, context, **kwargs):
                      "specified at the same time")
         return False
 
-    session = get_session(region=provider.region,
-                          profile=kwargs.get("profile"))
-    ec2 = session.client("ec2")
+    ec2 = context.get_client("ec2", profile=kwargs.get("profile"),
+                             region=provider.region)
 
     keypair = get_existing_key_pair(ec2, keypair_name)
     if keypair:
@@ -249,7 +247,8 @@ def ensure_keypair_exists(provider, context, **kwargs):
             ec2, keypair_name, public_key_path)
 
     elif ssm_parameter_name:
-        ssm = session.client('ssm')
+        ssm = context.get_client('ssm', profile=kwargs.get("profile"),
+                                 region=provider.region)
         keypair = create_key_pair_in_ssm(
             ec2, ssm, keypair_name, ssm_parameter_name, ssm_key_id)
     else:
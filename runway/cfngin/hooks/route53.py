@@ -2,7 +2,6 @@
 # pylint: disable=unused-argument
 import logging
 
-from ..session_cache import get_session
 from ..util import create_route53_zone
 
 LOGGER = logging.getLogger(__name__)
@@ -25,8 +24,7 @@ def create_domain(provider, context, **kwargs):
         Dict[str, str]: Dict containing ``domain`` and ``zone_id``.
 
     """
-    session = get_session(provider.region)
-    client = session.client("route53")
+    client = context.get_client("route53", region=provider.region)
     domain = kwargs.get("domain")
     if not domain:
         LOGGER.error("domain argument or BaseDomain variable not provided.")
@@ -1,6 +1,6 @@
 """AMI lookup."""
 # pylint: disable=unused-argument,line-too-long,arguments-differ
-import operator
+import json
 import re
 
 from runway.lookups.handlers.base import LookupHandler
@@ -9,6 +9,8 @@ from ...session_cache import get_session
 from ...util import read_value_from_path
 
 TYPE_NAME = "ami"
+# number of images retrieved per describe_images call when paginating
+PAGE_SIZE = 1000
 
 
 class ImageNotFound(Exception):
@@ -23,6 +25,40 @@ class ImageNotFound(Exception):
         super(ImageNotFound, self).__init__(message)
 
 
+def name_prefix(name_regex):
+    """Get the literal prefix of every name matched by a regex.
+
+    Args:
+        name_regex (str): Regex that must match the whole name of an image.
+
+    Returns:
+        str: Characters every matching name starts with. Empty if they
+        can't be determined (e.g. the regex uses alternation).
+
+    """
+    if '|' in name_regex:
+        return ''
+    prefix = ''
+    i = 0
+    while i < len(name_regex):
+        char = name_regex[i]
+        if char == '\\':
+            escaped = name_regex[i + 1:i + 2]
+            if not escaped or escaped.isalnum():  # class (e.g. \d) or ref
+                break
+            char = escaped
+            i += 1
+        elif char in '.^$*+?{}[]()':
+            break
+        if name_regex[i + 1:i + 2] in ('*', '?', '{'):  # char is optional
+            break
+        if char in '*?':  # wildcards of the name filter
+            break
+        prefix += char
+        i += 1
+    return prefix
+
+
 class AmiLookup(LookupHandler):
     """AMI lookup."""
 
@@ -73,7 +109,10 @@ class AmiLookup(LookupHandler):
         else:
             region = provider.region
 
-        ec2 = get_session(region).client('ec2')
+        if context:
+            ec2 = context.get_client('ec2', region=region)
+        else:
+            ec2 = get_session(region).client('ec2')
 
         values = {}
         describe_args = {}
@@ -100,16 +139,58 @@ class AmiLookup(LookupHandler):
         filters = []
         for k, v in values.items():
             filters.append({"Name": k, "Values": v.split(',')})
+        prefix = name_prefix(name_regex)
+        if prefix and 'name' not in values:
+            # let the api exclude images that can't match
+            filters.append({"Name": "name", "Values": [prefix + '*']})
         describe_args["Filters"] = filters
 
-        result = ec2.describe_images(**describe_args)
+        cache_key = (ec2.meta.region_name, name_regex,
+                     json.dumps(describe_args, sort_keys=True))
+        if context:
+            try:
+                return context.ami_cache[cache_key]
+            except KeyError:
+                pass
+
+        image_id = cls._find_image(ec2, describe_args, name_regex)
+        if not image_id:
+            raise ImageNotFound(value)
+        if context:
+            context.ami_cache[cache_key] = image_id
+        return image_id
+
+    @staticmethod
+    def _find_image(ec2, describe_args, name_regex):
+        """Find the most recent image with a name matching a regex.
 
-        images = sorted(result['Images'],
-                        key=operator.itemgetter('CreationDate'),
-                        reverse=True)
-        for image in images:
-            # sometimes we get ARI/AKI in response - these don't have a 'Name'
-            if re.match("^%s$" % name_regex, image.get('Name', '')):
-                return image['ImageId']
+        Images are retrieved one page at a time and only the most recent
+        match is kept.
 
-        raise ImageNotFound(value)
+        Args:
+            ec2 (boto3.client.Client): EC2 client.
+            describe_args (Dict[str, Any]): Arguments for ``describe_images``.
+            name_regex (str): Regex that must match the whole name.
+
+        Returns:
+            Optional[str]: ID of the image.
+
+        """
+        if ec2.can_paginate('describe_images'):
+            pages = ec2.get_paginator('describe_images').paginate(
+                PaginationConfig={'PageSize': PAGE_SIZE}, **describe_args
+            )
+        else:
+            pages = [ec2.describe_images(**describe_args)]
+        pattern = re.compile("^%s$" % name_regex)
+
+        latest = None
+        for page in pages:
+            for image in page['Images']:
+                if latest and image['CreationDate'] <= latest['CreationDate']:
+                    continue
+                # sometimes we get ARI/AKI in response - these don't have a
+                # 'Name'
+                if pattern.match(image.get('Name', '')):
+                    latest = image
+        return latest['ImageId'] if latest else None
@@ -7,7 +7,6 @@ import re
 import yaml
 from six import string_types
 from six.moves.collections_abc import Mapping, Sequence  # pylint: disable=E
-from troposphere import Base64, GenericHelperFn
 
 from runway.lookups.handlers.base import LookupHandler
 
@@ -173,6 +172,8 @@ def _parameterize_string(raw):
             found, and a composition of CloudFormation calls otherwise.
 
     """
+    from troposphere import GenericHelperFn  # noqa pylint: disable=import-outside-toplevel
+
     parts = []
     s_index = 0
 
@@ -202,6 +203,8 @@ def parameterized_codec(raw, b64):
         CloudFormation template.
 
     """
+    from troposphere import Base64  # noqa pylint: disable=import-outside-toplevel
+
     if isinstance(raw, bytes):
         raw = raw.decode('utf-8')
 
@@ -3,8 +3,6 @@
 import logging
 import warnings
 
-from troposphere import BaseAWSObject
-
 from runway.lookups.handlers.base import LookupHandler
 from runway.util import MutableMap  # abs to support import through shim
 
@@ -50,6 +48,8 @@ class HookDataLookup(LookupHandler):
         except ValueError:
             query, args = cls.legacy_parse(value)
 
+        from troposphere import BaseAWSObject  # noqa pylint: disable=import-outside-toplevel
+
         hook_data = MutableMap(**context.hook_data)
 
         # TODO use context.hook_data directly in next major release
@@ -10,6 +10,9 @@ TYPE_NAME = "rxref"
 class RxrefLookup(LookupHandler):
     """Rxref lookup."""
 
+    # DescribeStacks requests are throttled at a low rate
+    max_concurrency = 4
+
     @classmethod
     def handle(cls, value, context=None, provider=None, **kwargs):
         """Fetch an output from the designated stack in the current namespace.
@@ -18,6 +18,23 @@ class SsmstoreLookup(LookupHandler):
     DEPRECATION_MSG = ('The "ssmstore" lookup has been deprecated. '
                        'The "ssm" lookup should be used instead.')
 
+    @classmethod
+    def prefetch(cls, values, context, **kwargs):
+        """Retrieve the parameters of multiple lookups in batches.
+
+        Args:
+            values (List[str]): Parameter(s) given to each lookup.
+            context (:class:`runway.cfngin.context.Context`): Context instance.
+
+        """
+        names = {}
+        for value in values:
+            region, name = cls._parse(value)
+            names.setdefault(region, []).append(name)
+        for region, queries in names.items():
+            context.ssm_cache.prefetch(get_session(region).client("ssm"),
+                                       region, queries)
+
     @classmethod
     def handle(cls, value, context=None, provider=None, **kwargs):
         """Retrieve (and decrypt) a parameter from AWS SSM Parameter Store.
@@ -60,11 +77,15 @@ class SsmstoreLookup(LookupHandler):
         warnings.warn(cls.DEPRECATION_MSG, DeprecationWarning)
         LOGGER.warning(cls.DEPRECATION_MSG)
 
-        value = read_value_from_path(value)
+        region, value = cls._parse(value)
 
-        region = "us-east-1"
-        if "@" in value:
-            region, value = value.split("@", 1)
+        if context:
+            try:
+                parameter = context.ssm_cache.get(region, value)
+                if parameter:
+                    return str(parameter['Value'])
+            except KeyError:
+                pass
 
         client = get_session(region).client("ssm")
         response = client.get_parameters(
@@ -78,3 +99,21 @@ class SsmstoreLookup(LookupHandler):
 
         raise ValueError('SSMKey "{}" does not exist in region {}'.format(
             value, region))
+
+    @staticmethod
+    def _parse(value):
+        """Parse the value passed to the lookup.
+
+        Args:
+            value (str): Parameter(s) given to this lookup.
+
+        Returns:
+            Tuple[str, str]: Region and name of the parameter.
+
+        """
+        value = read_value_from_path(value)
+
+        region = "us-east-1"
+        if "@" in value:
+            region, value = value.split("@", 1)
+        return region, value
@@ -10,6 +10,9 @@ TYPE_NAME = "xref"
 class XrefLookup(LookupHandler):
     """Xref lookup."""
 
+    # DescribeStacks requests are throttled at a low rate
+    max_concurrency = 4
+
     @classmethod
     def handle(cls, value, context=None, provider=None, **kwargs):
         """Fetch an output from the designated, fully qualified stack.
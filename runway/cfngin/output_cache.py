@@ -0,0 +1,103 @@
+"""CFNgin stack output caching."""
+import logging
+import threading
+
+LOGGER = logging.getLogger(__name__)
+
+
+class OutputCache(object):
+    """Thread-safe cache of stack outputs for the duration of a run.
+
+    Outputs are keyed by region, profile and the fully qualified name of the
+    stack so that they can be shared by every provider and lookup of a run.
+    Only one call is made to retrieve the outputs of a stack at a time;
+    other threads needing the same outputs wait for it to complete.
+
+    Attributes:
+        hits (int): Number of times outputs were returned from the cache.
+        misses (int): Number of times outputs had to be retrieved.
+        region (Optional[str]): Region used when one is not provided.
+
+    """
+
+    def __init__(self, region=None):
+        """Instantiate class.
+
+        Args:
+            region (Optional[str]): Region used when one is not provided.
+
+        """
+        self.hits = 0
+        self.misses = 0
+        self.region = region
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._outputs = {}
+
+    def _key(self, fqn, region=None, profile=None):
+        """Build the key of a stack.
+
+        Returns:
+            Tuple[Optional[str], Optional[str], str]
+
+        """
+        return region or self.region, profile, fqn
+
+    def get(self, fqn, fetch, region=None, profile=None):
+        """Get the outputs of a stack, retrieving them if they are not cached.
+
+        Args:
+            fqn (str): Fully qualified name of the stack.
+            fetch (Callable[[], Dict[str, str]]): Function used to retrieve
+                the outputs of the stack if they are not cached.
+            region (Optional[str]): Region of the stack.
+            profile (Optional[str]): Profile used to access the stack.
+
+        Returns:
+            Dict[str, str]: Stack outputs.
+
+        """
+        key = self._key(fqn, region, profile)
+        with self._lock:
+            if key in self._outputs:
+                self.hits += 1
+                return self._outputs[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._outputs:
+                    self.hits += 1
+                    return self._outputs[key]
+                self.misses += 1
+            LOGGER.debug('retrieving outputs of stack "%s" (region=%s, '
+                         'profile=%s)', fqn, key[0], profile)
+            outputs = fetch()
+            with self._lock:
+                self._outputs[key] = outputs
+            return outputs
+
+    def set(self, fqn, outputs, region=None, profile=None):
+        """Set the outputs of a stack.
+
+        Args:
+            fqn (str): Fully qualified name of the stack.
+            outputs (Dict[str, str]): Stack outputs.
+            region (Optional[str]): Region of the stack.
+            profile (Optional[str]): Profile used to access the stack.
+
+        """
+        with self._lock:
+            self._outputs[self._key(fqn, region, profile)] = outputs
+
+    def __getstate__(self):
+        """Return the state of the object when pickled."""
+        state = self.__dict__.copy()
+        del state['_key_locks']
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of the object when unpickled."""
+        self.__dict__.update(state)
+        self._key_locks = {}
+        self._lock = threading.Lock()
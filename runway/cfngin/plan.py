@@ -16,6 +16,12 @@ from .util import merge_map, stack_template_key_name
 
 LOGGER = logging.getLogger(__name__)
 
+# Max number of seconds updates of the persistent graph are held before they
+# are uploaded. All updates are uploaded when a plan finishes.
+PERSISTENT_GRAPH_FLUSH_INTERVAL = int(os.environ.get(
+    'CFNGIN_PERSISTENT_GRAPH_FLUSH_INTERVAL', 10
+))
+
 COLOR_CODES = {
     SUBMITTED.code: 33,  # yellow
     COMPLETE.code: 32,   # green
@@ -442,12 +448,18 @@ class Graph(object):
         for step in steps:
             self.add_step(step)
 
+        edges = []
         for step in steps:
-            for dep in step.requires:
-                self.connect(step.name, dep)
-
-            for parent in step.required_by:
-                self.connect(parent, step.name)
+            edges.extend((step.name, dep) for dep in step.requires)
+            edges.extend((parent, step.name) for parent in step.required_by)
+        try:
+            # validating the graph once is faster than validating each edge
+            self.dag.add_edges(edges)
+        except (DAGValidationError, KeyError):
+            # no edges were added; add them one at a time to find the edge
+            # that can't be added
+            for step_name, dep in edges:
+                self.connect(step_name, dep)
 
     def pop(self, step, default=None):
         """Remove a step from the graph.
@@ -593,6 +605,97 @@ class Graph(object):
         return self.dumps()
 
 
+class PersistentGraphWriter(object):
+    """Coalesce updates of the persistent graph into batched uploads.
+
+    Steps apply their changes to the persistent graph with :meth:`update`.
+    Changes are uploaded at most ``interval`` seconds after they are made,
+    by the update that follows or by a timer if there isn't one, and by
+    :meth:`flush` once the plan has been walked. Updates and uploads are
+    serialized so the graph doesn't change while it is being uploaded.
+
+    Attributes:
+        context (:class:`runway.cfngin.context.Context`): Context object.
+        flushes (int): Number of times the graph was uploaded.
+        interval (int): Max number of seconds changes are held before they
+            are uploaded.
+        lock_code (str): Code used to lock the persistent graph.
+
+    """
+
+    def __init__(self, context, lock_code, interval=None):
+        """Instantiate class.
+
+        Args:
+            context (:class:`runway.cfngin.context.Context`): Context object.
+            lock_code (str): Code used to lock the persistent graph.
+            interval (Optional[int]): Max number of seconds changes are held
+                before they are uploaded.
+                (`default:` ``PERSISTENT_GRAPH_FLUSH_INTERVAL``)
+
+        """
+        self.context = context
+        self.flushes = 0
+        self.interval = (PERSISTENT_GRAPH_FLUSH_INTERVAL if interval is None
+                         else interval)
+        self.lock_code = lock_code
+        self._changed = False
+        self._last_flush = time.time()
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def update(self, func):
+        """Apply a change to the persistent graph.
+
+        Args:
+            func (Callable[[Graph], Any]): Function that changes the graph
+                passed to it.
+
+        """
+        with self._lock:
+            func(self.context.persistent_graph)
+            self._changed = True
+            remaining = self._last_flush + self.interval - time.time()
+            if remaining <= 0:
+                self._flush()
+            elif not self._timer:
+                self._timer = threading.Timer(remaining, self._flush_later)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Upload the persistent graph if it has changed."""
+        with self._lock:
+            self._flush()
+
+    def _flush_later(self):
+        """Upload the changes held for ``interval`` seconds.
+
+        Errors are logged; the changes are uploaded again by the next flush.
+
+        """
+        try:
+            self.flush()
+        except Exception as err:  # pylint: disable=broad-except
+            LOGGER.warning('unable to update the persistent graph: %s', err)
+
+    def _flush(self):
+        """Upload the persistent graph if it has changed.
+
+        Must be called while holding the lock.
+
+        """
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if not self._changed:
+            return
+        self.context.put_persistent_graph(self.lock_code)
+        self._changed = False
+        self._last_flush = time.time()
+        self.flushes += 1
+
+
 class Plan(object):
     """A convenience class for working on a Graph.
 
@@ -729,11 +832,18 @@ class Plan(object):
     def walk(self, walker):
         """Walk each step in the underlying graph, in topological order.
 
+        Changes to the persistent graph are uploaded in batches by a
+        :class:`PersistentGraphWriter` and once more after the walk.
+
         Args:
             walker (func): a walker function to be passed to
                 :class:`runway.cfngin.dag.DAG` to walk the graph.
 
         """
+        writer = None
+        if self.context and self.context.persistent_graph:
+            writer = PersistentGraphWriter(self.context, self.lock_code)
+
         def walk_func(step):
             """Execute a :class:`Step` wile walking the graph.
 
@@ -755,8 +865,11 @@ class Plan(object):
                     return step.ok
 
             result = step.run()
+            if self.context and getattr(self.context, 'ssm_cache', None):
+                # the step may have written parameters used by later steps
+                self.context.ssm_cache.clear()
 
-            if not self.context or not self.context.persistent_graph:
+            if not writer:
                 return result
 
             if (step.completed or
@@ -764,21 +877,22 @@ class Plan(object):
                      step.status.reason == ('does not exist in '
                                             'cloudformation'))):
                 if step.fn.__name__ == '_destroy_stack':
-                    self.context.persistent_graph.pop(step)
+                    writer.update(lambda graph: graph.pop(step))
                     LOGGER.debug("Removed step '%s' from the persistent graph",
                                  step.name)
                 elif step.fn.__name__ == '_launch_stack':
-                    self.context.persistent_graph.add_step_if_not_exists(
+                    writer.update(lambda graph: graph.add_step_if_not_exists(
                         step, add_dependencies=True, add_dependants=True
-                    )
+                    ))
                     LOGGER.debug("Added step '%s' to the persistent graph",
                                  step.name)
-                else:
-                    return result
-                self.context.put_persistent_graph(self.lock_code)
             return result
 
-        return self.graph.walk(walker, walk_func)
+        try:
+            return self.graph.walk(walker, walk_func)
+        finally:
+            if writer:
+                writer.flush()
 
     @property
     def lock_code(self):
@@ -15,10 +15,12 @@ from six.moves import urllib
 from ... import exceptions
 from ...actions.diff import DictValue, diff_parameters
 from ...actions.diff import format_params_diff as format_diff
+from ...output_cache import OutputCache
 from ...session_cache import get_session
 from ...ui import ui
 from ...util import parse_cloudformation_template
 from ..base import BaseProvider
+from .stack_status import StackStatusPoller
 
 LOGGER = logging.getLogger(__name__)
 
@@ -532,6 +534,7 @@ class ProviderBuilder(object):  # pylint: disable=too-few-public-methods
                 self.providers[key] = Provider(
                     get_session(region=region, profile=profile),
                     region=region,
+                    profile=profile,
                     **self.kwargs
                 )
                 provider = self.providers[key]
@@ -592,9 +595,10 @@ class Provider(BaseProvider):
 
     def __init__(self, session, region=None, interactive=False,
                  replacements_only=False, recreate_failed=False,
-                 service_role=None):
+                 service_role=None, profile=None, output_cache=None):
         """Instantiate class."""
-        self._outputs = {}
+        self.output_cache = output_cache or OutputCache(region=region)
+        self.profile = profile
         self.region = region
         self.cloudformation = get_cloudformation_client(session)
         self.interactive = interactive
@@ -602,6 +606,21 @@ class Provider(BaseProvider):
         self.replacements_only = interactive and replacements_only
         self.recreate_failed = interactive or recreate_failed
         self.service_role = service_role
+        self._status_poller = None
+        self._status_poller_lock = Lock()
+
+    @property
+    def status_poller(self):
+        """Poller shared by all stacks of this provider waiting on a status.
+
+        Returns:
+            :class:`runway.cfngin.providers.aws.stack_status.StackStatusPoller`
+
+        """
+        with self._status_poller_lock:
+            if not self._status_poller:
+                self._status_poller = StackStatusPoller(self.cloudformation)
+            return self._status_poller
 
     def get_stack(self, stack_name, *args, **kwargs):  # pylint: disable=unused-argument
         """Get stack."""
@@ -613,6 +632,28 @@ class Provider(BaseProvider):
                 raise
             raise exceptions.StackDoesNotExist(stack_name)
 
+    def poll_stack(self, stack_name, cancel=None, timeout=None):
+        """Get a stack once the status poller observes a change to it.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+            cancel (Optional[threading.Event]): Stop waiting when set.
+            timeout (Optional[float]): Max number of seconds to wait for a
+                change before returning the current state of the stack.
+
+        Returns:
+            Dict[str, Any]: Stack data from ``describe_stacks``.
+
+        Raises:
+            StackDoesNotExist: The stack does not exist.
+
+        """
+        stack = self.status_poller.wait(stack_name, cancel=cancel,
+                                        timeout=timeout)
+        if not stack:
+            raise exceptions.StackDoesNotExist(stack_name)
+        return stack
+
     def get_stack_status(self, stack, *args, **kwargs):  # pylint: disable=unused-argument
         """Get stack status."""
         return stack['StackStatus']
@@ -685,63 +726,95 @@ class Provider(BaseProvider):
                             event['ResourceType'],
                             event['EventId']))
 
-    def get_events(self, stack_name, chronological=True):
-        """Get the events in batches and return in chronological order."""
-        next_token = None
-        event_list = []
+    def iter_events(self, stack_name):
+        """Iterate over the events of a stack, newest first.
+
+        Pages of events are only retrieved as they are needed so iteration
+        can stop without retrieving the full event history.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+
+        Yields:
+            Dict[str, Any]: Stack event.
+
+        """
+        kwargs = {'StackName': stack_name}
         while True:
-            if next_token is not None:
-                events = self.cloudformation.describe_stack_events(
-                    StackName=stack_name, NextToken=next_token
-                )
-            else:
-                events = self.cloudformation.describe_stack_events(
-                    StackName=stack_name
-                )
-            event_list.append(events['StackEvents'])
+            events = self.cloudformation.describe_stack_events(**kwargs)
+            for event in events['StackEvents']:
+                yield event
             next_token = events.get('NextToken', None)
             if next_token is None:
-                break
+                return
+            kwargs['NextToken'] = next_token
             time.sleep(GET_EVENTS_SLEEP)
+
+    def get_events(self, stack_name, chronological=True):
+        """Get the events in batches and return in chronological order."""
+        event_list = list(self.iter_events(stack_name))
         if chronological:
-            return reversed(sum(event_list, []))
-        return sum(event_list, [])
+            return reversed(event_list)
+        return event_list
+
+    def get_events_since(self, stack_name, event_id):
+        """Get the events of a stack that occurred after an event.
+
+        Only the pages of events needed to reach the given event are
+        retrieved.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+            event_id (Optional[str]): ID of the last event that was seen.
+                If ``None``, all events are returned.
+
+        Returns:
+            List[Dict[str, Any]]: Stack events in chronological order.
+
+        """
+        events = []
+        for event in self.iter_events(stack_name):
+            if event['EventId'] == event_id:
+                break
+            events.append(event)
+        events.reverse()
+        return events
 
     def get_rollback_status_reason(self, stack_name):
-        """Process events and returns latest roll back reason."""
-        # flake8/pylint fight over the indent here on python2
-        # TODO remove "disable=bad-continuation" when dropping python2
-        event = next((item for item in self.get_events(stack_name, False)
-                      if item["ResourceStatus"] == "UPDATE_ROLLBACK_IN_PROGRESS"
-                      ), None)  # pylint: disable=bad-continuation
-        if event:
-            reason = event["ResourceStatusReason"]
-            return reason
-        event = next((item for item in self.get_events(stack_name)
-                      if item["ResourceStatus"] ==
-                      "ROLLBACK_IN_PROGRESS"), None)
-        reason = event["ResourceStatusReason"]
-        return reason
+        """Process events and returns latest roll back reason.
+
+        Events are read newest first and only until the event that started
+        the most recent roll back is found.
+
+        """
+        for event in self.iter_events(stack_name):
+            if event['ResourceStatus'] in ['UPDATE_ROLLBACK_IN_PROGRESS',
+                                           'ROLLBACK_IN_PROGRESS']:
+                return event.get('ResourceStatusReason')
+        return None
 
     def tail(self, stack_name, cancel, log_func=_tail_print, sleep_time=5,
              include_initial=True):
-        """Show and then tail the event log."""
-        # First dump the full list of events in chronological order and keep
-        # track of the events we've seen already
-        seen = set()
-        initial_events = self.get_events(stack_name)
-        for event in initial_events:
-            if include_initial:
+        """Show and then tail the event log.
+
+        Only the ID of the last event seen is kept between iterations so that
+        each iteration only retrieves the events that are new.
+
+        """
+        if include_initial:
+            events = self.get_events_since(stack_name, None)
+            for event in events:
                 log_func(event)
-            seen.add(event['EventId'])
+            last_event_id = events[-1]['EventId'] if events else None
+        else:
+            last_event = next(self.iter_events(stack_name), None)
+            last_event_id = last_event['EventId'] if last_event else None
 
         # Now keep looping through and dump the new events
         while True:
-            events = self.get_events(stack_name)
-            for event in events:
-                if event['EventId'] not in seen:
-                    log_func(event)
-                    seen.add(event['EventId'])
+            for event in self.get_events_since(stack_name, last_event_id):
+                log_func(event)
+                last_event_id = event['EventId']
             if cancel.wait(sleep_time):
                 return
 
@@ -1231,11 +1304,18 @@ class Provider(BaseProvider):
         return stack['Tags']
 
     def get_outputs(self, stack_name, *args, **kwargs):
-        """Get stack outputs."""
-        if not self._outputs.get(stack_name):
-            stack = self.get_stack(stack_name)
-            self._outputs[stack_name] = get_output_dict(stack)
-        return self._outputs[stack_name]
+        """Get stack outputs.
+
+        Outputs are retrieved from the output cache of the provider which
+        may be shared with other providers.
+
+        """
+        return self.output_cache.get(
+            stack_name,
+            lambda: get_output_dict(self.get_stack(stack_name)),
+            region=self.region,
+            profile=self.profile
+        )
 
     @staticmethod
     def get_output_dict(stack):
@@ -1335,7 +1415,7 @@ class Provider(BaseProvider):
         )
 
         # ensure current stack outputs are loaded
-        self.get_outputs(stack.fqn)
+        outputs = dict(self.get_outputs(stack.fqn))
 
         # infer which outputs may have changed
         refs_to_invalidate = []
@@ -1353,21 +1433,24 @@ class Provider(BaseProvider):
         # invalidate cached outputs with inferred changes
         for output, props in old_template.get('Outputs', {}).items():
             if any(r in str(props['Value']) for r in refs_to_invalidate):
-                self._outputs[stack.fqn].pop(output)
+                outputs.pop(output)
                 LOGGER.debug('Removed %s from the outputs of %s',
                              output, stack.fqn)
 
         # push values for new + invalidated outputs to outputs
         for output_name, output_params in \
                 stack.blueprint.get_output_definitions().items():
-            if output_name not in self._outputs[stack.fqn]:
-                self._outputs[stack.fqn][output_name] = (
+            if output_name not in outputs:
+                outputs[output_name] = (
                     '<inferred-change: {}.{}={}>'.format(
                         stack.fqn, output_name,
                         str(output_params['Value'])
                     )
                 )
 
+        self.output_cache.set(stack.fqn, outputs, region=self.region,
+                              profile=self.profile)
+
         # when creating a changeset for a new stack, CFN creates a temporary
         # stack with a status of REVIEW_IN_PROGRESS. this is only removed if
         # the changeset is executed or it is manually deleted.
@@ -1384,7 +1467,7 @@ class Provider(BaseProvider):
                 # not an issue if the stack was already cleaned up
                 LOGGER.debug('Stack does not exist: %s', stack.fqn)
 
-        return self.get_outputs(stack.fqn)
+        return outputs
 
     @staticmethod
     def params_as_dict(parameters_list):
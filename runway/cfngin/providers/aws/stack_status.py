@@ -0,0 +1,237 @@
+"""Shared CloudFormation stack status poller."""
+import logging
+import os
+import threading
+import time
+
+import botocore.exceptions
+
+LOGGER = logging.getLogger(__name__)
+
+# Bounds of the adaptive interval between polls. The interval is reset to the
+# minimum when a change is observed and doubles, up to the maximum, after each
+# poll that does not observe a change.
+MAX_POLL_TIME = int(os.environ.get("CFNGIN_STACK_POLL_TIME", 30))
+MIN_POLL_TIME = min(5, MAX_POLL_TIME)
+
+
+class StackStatusPoller(object):
+    """Poll the status of all stacks in a region for any number of waiters.
+
+    A single background thread retrieves every stack in the region using
+    paginated ``describe_stacks`` calls and publishes the results to threads
+    waiting on a stack. The number of API calls made per poll does not depend
+    on the number of stacks being waited on.
+
+    If the credentials being used are not allowed to describe all stacks in
+    the region, each stack being waited on is described individually during
+    the same poll.
+
+    Attributes:
+        api_calls (int): Number of API calls made by the poller.
+        interval (float): Current number of seconds between polls.
+        max_interval (float): Max number of seconds between polls.
+        min_interval (float): Min number of seconds between polls.
+
+    """
+
+    def __init__(self, cloudformation, min_interval=MIN_POLL_TIME,
+                 max_interval=MAX_POLL_TIME):
+        """Instantiate class.
+
+        Args:
+            cloudformation (boto3.client.Client): CloudFormation client.
+            min_interval (float): Min number of seconds between polls.
+            max_interval (float): Max number of seconds between polls.
+
+        """
+        self.api_calls = 0
+        self.cloudformation = cloudformation
+        self.interval = min_interval
+        self.max_interval = max_interval
+        self.min_interval = min_interval
+        self._bulk = True
+        self._cond = threading.Condition()
+        self._error = None  # raised by the last poll
+        self._last_poll = 0
+        self._polling = False
+        self._round = 0  # number of completed polls
+        self._seen = {}  # stack name -> state last returned by wait
+        self._stacks = {}  # stack name -> stack data from the last poll
+        self._thread = None
+        self._waiters = {}  # stack name -> number of threads waiting
+        self._wake = threading.Event()
+
+    def wait(self, stack_name, cancel=None, timeout=None):
+        """Wait for the next poll that changes the state of a stack.
+
+        Only polls that started after this method was called are considered.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+            cancel (Optional[threading.Event]): Stop waiting when set.
+            timeout (Optional[float]): Max number of seconds to wait for the
+                state of the stack to change. Once reached, the data from the
+                next completed poll is returned even if it has not changed.
+
+        Returns:
+            Optional[Dict[str, Any]]: Stack data from ``describe_stacks`` or
+            ``None`` if the stack does not exist.
+
+        Raises:
+            Exception: Any error raised by the poll that ended the wait.
+
+        """
+        deadline = time.time() + (self.max_interval if timeout is None
+                                  else timeout)
+        with self._cond:
+            self._ensure_thread()
+            if stack_name not in self._seen:
+                # newly submitted stack, check on it soon
+                self.interval = self.min_interval
+                self._wake.set()
+            self._waiters[stack_name] = self._waiters.get(stack_name, 0) + 1
+            min_round = self._round + (2 if self._polling else 1)
+            self._cond.notify_all()
+            try:
+                while not (cancel and cancel.is_set()):
+                    if self._round >= min_round and (
+                            time.time() >= deadline or
+                            self._state(stack_name) !=
+                            self._seen.get(stack_name)):
+                        break
+                    self._cond.wait(1)
+                if self._error and self._round >= min_round:
+                    raise self._error  # pylint: disable=raising-bad-type
+                self._seen[stack_name] = self._state(stack_name)
+                return self._stacks.get(stack_name)
+            finally:
+                self._waiters[stack_name] -= 1
+                if not self._waiters[stack_name]:
+                    del self._waiters[stack_name]
+
+    def _ensure_thread(self):
+        """Start the polling thread if it is not running."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run,
+                                        name='cfngin-stack-status')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _state(self, stack_name, stacks=None):
+        """State of a stack used to detect changes.
+
+        Args:
+            stack_name (str): Name of a CloudFormation stack.
+            stacks (Optional[Dict[str, Dict[str, Any]]]): Stack data to get
+                the state from. If not provided, the data from the last poll
+                is used.
+
+        Returns:
+            Optional[Tuple[str, Any]]
+
+        """
+        stack = (self._stacks if stacks is None else stacks).get(stack_name)
+        if not stack:
+            return None
+        return stack['StackStatus'], stack.get('LastUpdatedTime')
+
+    def _run(self):
+        """Poll for as long as there are threads waiting on a stack."""
+        while True:
+            with self._cond:
+                while not self._waiters:
+                    self._cond.wait()
+                stack_names = set(self._waiters)
+                self._polling = True
+            try:
+                stacks = self._poll(stack_names)
+                error = None
+            except Exception as err:  # pylint: disable=broad-except
+                stacks = self._stacks
+                error = err
+            with self._cond:
+                if any(self._state(name) != self._state(name, stacks)
+                       for name in stack_names):
+                    self.interval = self.min_interval
+                else:
+                    self.interval = min(self.interval * 2, self.max_interval)
+                self._error = error
+                self._stacks = stacks
+                self._round += 1
+                self._polling = False
+                self._last_poll = time.time()
+                self._cond.notify_all()
+            LOGGER.debug('polled %s stack(s) (%s API calls total); next '
+                         'poll in %s seconds', len(stack_names),
+                         self.api_calls, self.interval)
+            self._wake.clear()
+            self._wake.wait(self.interval)
+            # a new waiter may wake the poller early but it must not poll
+            # more often than the min interval
+            remaining = self._last_poll + self.min_interval - time.time()
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def _poll(self, stack_names):
+        """Retrieve the current data of stacks.
+
+        Args:
+            stack_names (Set[str]): Names of the stacks being waited on.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Stack data for the stacks that exist.
+
+        """
+        if self._bulk:
+            try:
+                return self._describe_all(stack_names)
+            except botocore.exceptions.ClientError as err:
+                if err.response['Error']['Code'] not in [
+                        'AccessDenied', 'AccessDeniedException']:
+                    raise
+                LOGGER.debug('not allowed to describe all stacks; '
+                             'describing stacks individually')
+                self._bulk = False
+        return self._describe_each(stack_names)
+
+    def _describe_all(self, stack_names):
+        """Describe all stacks in the region.
+
+        Args:
+            stack_names (Set[str]): Names of the stacks being waited on.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Stack data for the stacks that exist.
+
+        """
+        result = {}
+        paginator = self.cloudformation.get_paginator('describe_stacks')
+        for page in paginator.paginate():
+            self.api_calls += 1
+            for stack in page['Stacks']:
+                if stack['StackName'] in stack_names:
+                    result[stack['StackName']] = stack
+        return result
+
+    def _describe_each(self, stack_names):
+        """Describe each stack being waited on.
+
+        Args:
+            stack_names (Set[str]): Names of the stacks being waited on.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Stack data for the stacks that exist.
+
+        """
+        result = {}
+        for name in stack_names:
+            self.api_calls += 1
+            try:
+                result[name] = self.cloudformation.describe_stacks(
+                    StackName=name)['Stacks'][0]
+            except botocore.exceptions.ClientError as err:
+                if "does not exist" not in str(err):
+                    raise
+        return result
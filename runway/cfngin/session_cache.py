@@ -1,11 +1,9 @@
 """CFNgin session caching."""
 import logging
 import os
+import threading
 import warnings
-
-import boto3
-
-from runway.aws_sso_botocore.session import Session
+from collections import OrderedDict
 
 from .ui import ui
 
@@ -20,6 +18,8 @@ DEPRECATION_MSG = ('Use of "get_session" without providing credentials or a '
 # inherently threadsafe thanks to the GIL:
 # https://docs.python.org/3/glossary.html#term-global-interpreter-lock
 CREDENTIAL_CACHE = {}
+# Max number of clients kept by a ClientCache.
+CLIENT_CACHE_SIZE = 64
 
 
 def get_session(region=None,
@@ -52,6 +52,10 @@ def get_session(region=None,
         # TODO uncomment log message after we update all internal use
         # LOGGER.warning(DEPRECATION_MSG)
 
+    # boto3 is only imported when used to keep start-up fast
+    import boto3  # pylint: disable=import-outside-toplevel
+    from runway.aws_sso_botocore.session import Session  # noqa pylint: disable=import-outside-toplevel
+
     session = boto3.Session(aws_access_key_id=access_key,
                             aws_secret_access_key=secret_key,
                             aws_session_token=session_token,
@@ -63,3 +67,68 @@ def get_session(region=None,
     provider.cache = CREDENTIAL_CACHE
     provider._prompter = ui.getpass
     return session
+
+
+class ClientCache(object):
+    """Thread-safe LRU cache of boto3 clients.
+
+    Clients are thread-safe so they can be shared by every thread of a run.
+    Reusing a client also reuses its connection pool and avoids the cost of
+    creating a botocore session and loading service models for each call.
+
+    When the cache is full, the least recently used client is discarded.
+    Copies of an object that owns a cache share the cache.
+
+    Attributes:
+        clients_created (int): Number of clients created by the cache.
+        maxsize (int): Max number of clients kept in the cache.
+
+    """
+
+    def __init__(self, maxsize=CLIENT_CACHE_SIZE):
+        """Instantiate class.
+
+        Args:
+            maxsize (int): Max number of clients kept in the cache.
+
+        """
+        self.clients_created = 0
+        self.maxsize = maxsize
+        self._clients = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, create):
+        """Get a client, creating it if it is not cached.
+
+        Clients are created while holding a lock since boto3 sessions are
+        not thread-safe.
+
+        Args:
+            key (Tuple[Any, ...]): Identifies the client (e.g. service name,
+                region, profile, and credentials).
+            create (Callable[[], boto3.client.Client]): Function used to
+                create the client if it is not cached.
+
+        Returns:
+            boto3.client.Client
+
+        """
+        with self._lock:
+            client = self._clients.pop(key, None)
+            if client is None:
+                client = create()
+                self.clients_created += 1
+                LOGGER.debug('created %s client for %s (%s client(s) '
+                             'created)', key[0], key[1], self.clients_created)
+            self._clients[key] = client  # most recently used
+            while len(self._clients) > self.maxsize:
+                self._clients.popitem(last=False)
+            return client
+
+    def __deepcopy__(self, memo):
+        """Share the cache with copies of the object that owns it."""
+        return self
+
+    def __reduce__(self):
+        """Pickle as an empty cache since clients can't be pickled."""
+        return self.__class__, (self.maxsize,)
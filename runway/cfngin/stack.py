@@ -234,11 +234,18 @@ class Stack(object):
     def set_outputs(self, outputs):
         """Set stack outputs to the provided value.
 
+        The outputs are also stored in the output cache of the context so
+        they can be used by providers and lookups without retrieving them.
+
         Args:
             outputs (Dict[str, Any]): CloudFormation Stack outputs.
 
         """
         self.outputs = outputs
+        if outputs is not None:
+            self.context.output_cache.set(self.fqn, outputs,
+                                          region=self.region,
+                                          profile=self.profile)
 
     def __repr__(self):
         """Object represented as a string."""
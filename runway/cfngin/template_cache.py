@@ -0,0 +1,220 @@
+"""CFNgin rendered template caching."""
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+
+import troposphere
+from six import string_types
+
+import runway
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _json_default(obj):
+    """Serialize objects that are not supported by :func:`json.dumps`.
+
+    Troposphere objects are serialized as the data they render. Anything
+    else is serialized as its ``repr`` which, for objects that don't define
+    one, includes the address of the object and results in a cache miss.
+
+    """
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    return repr(obj)
+
+
+def _iter_strings(value):
+    """Iterate over the strings contained in a value.
+
+    Args:
+        value (Any): Value to search.
+
+    Yields:
+        str
+
+    """
+    if isinstance(value, dict):
+        for item in value.values():
+            for string in _iter_strings(item):
+                yield string
+    elif isinstance(value, (list, set, tuple)):
+        for item in value:
+            for string in _iter_strings(item):
+                yield string
+    elif isinstance(value, string_types):
+        yield value
+
+
+def _update_with_file(digest, path):
+    """Update a hash with the contents of a file if it exists.
+
+    Args:
+        digest (hashlib._Hash): Hash to update.
+        path (Optional[str]): Path to a file.
+
+    """
+    if not path or not os.path.isfile(path):
+        return
+    digest.update(path.encode())
+    with open(path, 'rb') as file_:
+        digest.update(file_.read())
+
+
+def _source_files(blueprint):
+    """Get the source files that can change the output of a blueprint.
+
+    These are the files of the classes the blueprint inherits from and of
+    the modules loaded from the package of the blueprint (e.g. helpers
+    shared by the blueprints of a project).
+
+    Args:
+        blueprint (:class:`runway.cfngin.blueprints.base.Blueprint`): A
+            blueprint.
+
+    Returns:
+        List[str]: Sorted file paths.
+
+    """
+    files = set()
+    for cls in type(blueprint).__mro__:
+        module = sys.modules.get(cls.__module__)
+        files.add(getattr(module, '__file__', None))
+    package = type(blueprint).__module__.rpartition('.')[0]
+    if package:
+        for name, module in list(sys.modules.items()):
+            if name.startswith(package + '.'):
+                files.add(getattr(module, '__file__', None))
+    return sorted(path for path in files if path)
+
+
+def render_blueprint(blueprint):
+    """Render the template of a blueprint.
+
+    Used to render blueprints in a pool of processes.
+
+    Args:
+        blueprint (:class:`runway.cfngin.blueprints.base.Blueprint`): A
+            blueprint with resolved variables.
+
+    Returns:
+        Tuple[str, str]: Version and rendered template.
+
+    """
+    return blueprint.render_template()
+
+
+def blueprint_cache_key(blueprint):
+    """Build the key of the rendered template of a resolved blueprint.
+
+    The key is a hash of everything that is used to render the template:
+    the source of the blueprint class, the resolved variables, mappings and
+    the parts of the context available to the blueprint. Files referenced by
+    variables (e.g. user data) are hashed as well.
+
+    Args:
+        blueprint (:class:`runway.cfngin.blueprints.base.Blueprint`): A
+            blueprint with resolved variables.
+
+    Returns:
+        str: SHA256 hex digest.
+
+    """
+    context = blueprint.context
+    digest = hashlib.sha256()
+    data = {
+        'class': '%s.%s' % (type(blueprint).__module__,
+                            type(blueprint).__name__),
+        'description': blueprint.description,
+        'environment': context.environment,
+        'fqn': context.get_fqn(blueprint.name),
+        'hook_data': context.hook_data,
+        'mappings': blueprint.mappings,
+        'name': blueprint.name,
+        'template_indent': context.template_indent,
+        'troposphere': troposphere.__version__,
+        'variables': blueprint.get_variables(),
+        'version': runway.__version__
+    }
+    digest.update(json.dumps(data, sort_keys=True,
+                             default=_json_default).encode())
+    for path in _source_files(blueprint):
+        _update_with_file(digest, path)
+    for string in sorted(set(_iter_strings(data['variables']))):
+        if len(string) < 1024:  # longer strings are not paths
+            _update_with_file(digest, string.replace('file://', '', 1))
+    return digest.hexdigest()
+
+
+class TemplateCache(object):
+    """Cache of rendered templates stored in a local directory.
+
+    Each template is stored in a JSON file named after the key built by
+    :func:`blueprint_cache_key` so the cache can be shared by later runs.
+
+    Attributes:
+        hits (int): Number of templates returned from the cache.
+        misses (int): Number of templates that were not cached.
+        path (str): Directory where templates are stored.
+
+    """
+
+    def __init__(self, path):
+        """Instantiate class.
+
+        Args:
+            path (str): Directory where templates are stored.
+
+        """
+        self.hits = 0
+        self.misses = 0
+        self.path = path
+
+    def get(self, key):
+        """Get a rendered template.
+
+        Args:
+            key (str): Key of the template.
+
+        Returns:
+            Optional[Tuple[str, str]]: Version and rendered template or
+            ``None`` if the template is not cached.
+
+        """
+        try:
+            with open(os.path.join(self.path, key + '.json')) as file_:
+                data = json.load(file_)
+            result = data['version'], data['rendered']
+        except (IOError, OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def set(self, key, version, rendered):
+        """Store a rendered template.
+
+        Failing to write the template is logged but is not an error.
+
+        Args:
+            key (str): Key of the template.
+            version (str): Version of the template.
+            rendered (str): Rendered template.
+
+        """
+        tmp_path = None
+        try:
+            if not os.path.isdir(self.path):
+                os.makedirs(self.path)
+            # write to a temp file first so a partial file is never read
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+            with os.fdopen(fd, 'w') as file_:
+                json.dump({'version': version, 'rendered': rendered}, file_)
+            os.rename(tmp_path, os.path.join(self.path, key + '.json'))
+        except (IOError, OSError) as err:
+            LOGGER.debug('unable to cache rendered template %s: %s', key, err)
+            if tmp_path and os.path.isfile(tmp_path):
+                os.remove(tmp_path)
@@ -4,7 +4,6 @@ import logging
 import os
 import re
 import shutil
-import subprocess
 import sys
 import tarfile
 import tempfile
@@ -13,13 +12,13 @@ import warnings
 import zipfile
 from collections import OrderedDict
 
-import botocore.client
 import botocore.exceptions
 import dateutil
 import yaml
 from yaml.constructor import ConstructorError
 from yaml.nodes import MappingNode
 
+from ..git_util import MIRROR_DIRNAME, checkout, get_sparse_suffix, resolve_ref
 from .awscli_yamlhelper import yaml_parse
 from .session_cache import get_session
 
@@ -575,8 +574,21 @@ class SourceProcessor(object):
         self.package_cache_dir = package_cache_dir
         self.sources = sources
         self.configs_to_merge = []
+        self._s3_client = None
         self.create_cache_directories()
 
+    @property
+    def s3_client(self):
+        """S3 client shared by all S3 package sources.
+
+        Returns:
+            boto3.client.Client
+
+        """
+        if not self._s3_client:
+            self._s3_client = get_session(region=None).client('s3')
+        return self._s3_client
+
     def create_cache_directories(self):
         """Ensure that SourceProcessor cache directories exist."""
         if not os.path.isdir(self.package_cache_dir):
@@ -639,7 +651,6 @@ class SourceProcessor(object):
                 "in bucket %s." % (config['key'], config['bucket'])
             )
 
-        session = get_session(region=None)
         extra_s3_args = {}
         if config.get('requester_pays', False):
             extra_s3_args['RequestPayer'] = 'requester'
@@ -649,7 +660,7 @@ class SourceProcessor(object):
             try:
                 # LastModified should always be returned in UTC, but it doesn't
                 # hurt to explicitly convert it to UTC again just in case
-                modified_date = session.client('s3').head_object(
+                modified_date = self.s3_client.head_object(
                     Bucket=config['bucket'],
                     Key=config['key'],
                     **extra_s3_args
@@ -678,11 +689,10 @@ class SourceProcessor(object):
                              "with extra S3 options \"%s\"",
                              extractor.archive,
                              str(extra_s3_args))
-                session.resource('s3').Bucket(config['bucket']).download_file(
-                    config['key'],
-                    extractor.archive,
-                    ExtraArgs=extra_s3_args
-                )
+                self.s3_client.download_file(config['bucket'],
+                                             config['key'],
+                                             extractor.archive,
+                                             ExtraArgs=extra_s3_args)
                 LOGGER.debug("Download complete; extracting downloaded "
                              "package to %s",
                              tmp_package_path)
@@ -713,29 +723,21 @@ class SourceProcessor(object):
             config (Dict[str, Any]): git config dictionary.
 
         """
-        # only loading git here when needed to avoid load errors on systems
-        # without git installed
-        from git import Repo  # pylint: disable=import-outside-toplevel
-
         ref = self.determine_git_ref(config)
-        dir_name = self.sanitize_git_path(uri=config['uri'], ref=ref)
+        paths = self.determine_git_sparse_paths(config)
+        dir_name = (self.sanitize_git_path(uri=config['uri'], ref=ref) +
+                    get_sparse_suffix(paths))
         cached_dir_path = os.path.join(self.package_cache_dir, dir_name)
 
         # We can skip cloning the repo if it's already been cached
         if not os.path.isdir(cached_dir_path):
             LOGGER.debug("Remote repo %s does not appear to have been "
-                         "previously downloaded - starting clone to %s",
+                         "previously downloaded - starting checkout to %s",
                          config['uri'],
                          cached_dir_path)
-            tmp_dir = tempfile.mkdtemp(prefix='cfngin')
-            try:
-                tmp_repo_path = os.path.join(tmp_dir, dir_name)
-                with Repo.clone_from(config['uri'], tmp_repo_path) as repo:
-                    repo.head.reference = ref
-                    repo.head.reset(index=True, working_tree=True)
-                shutil.move(tmp_repo_path, self.package_cache_dir)
-            finally:
-                shutil.rmtree(tmp_dir)
+            checkout(config['uri'], ref, cached_dir_path,
+                     os.path.join(self.cfngin_cache_dir, MIRROR_DIRNAME),
+                     paths=paths)
         else:
             LOGGER.debug("Remote repo %s appears to have been previously "
                          "cloned to %s -- bypassing download",
@@ -783,6 +785,8 @@ class SourceProcessor(object):
     def git_ls_remote(uri, ref):
         """Determine the latest commit id for a given ref.
 
+        The refs of each repo are only listed once per run.
+
         Args:
             uri (str): Git URI.
             ref (str): Git ref.
@@ -791,15 +795,7 @@ class SourceProcessor(object):
             str: A commit id
 
         """
-        LOGGER.debug("Invoking git to retrieve commit id for repo %s...", uri)
-        ls_remote_output = subprocess.check_output(['git', 'ls-remote', uri,
-                                                    ref])
-        # incorrectly detected - https://github.com/PyCQA/pylint/issues/3045
-        if b"\t" in ls_remote_output:  # pylint: disable=unsupported-membership-test
-            commit_id = ls_remote_output.split(b"\t")[0]
-            LOGGER.debug("Matching commit id found: %s", commit_id)
-            return commit_id
-        raise ValueError("Ref \"%s\" not found for repo %s." % (ref, uri))
+        return resolve_ref(uri, ref).encode()
 
     @staticmethod
     def determine_git_ls_remote_ref(config):
@@ -820,6 +816,24 @@ class SourceProcessor(object):
 
         return ref
 
+    @staticmethod
+    def determine_git_sparse_paths(config):
+        """Determine the paths to check out for a sparse checkout.
+
+        Args:
+            config (Dict[str, Any]): Git config dictionary.
+
+        Returns:
+            List[str]: ``paths`` and ``configs`` of the config if
+            ``sparse_checkout`` is enabled, else an empty list.
+
+        """
+        if not config.get('sparse_checkout'):
+            return []
+        return list(config.get('paths') or []) + list(
+            config.get('configs') or []
+        )
+
     def determine_git_ref(self, config):
         """Determine the ref to be used for ``git checkout``.
 
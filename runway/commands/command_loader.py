@@ -2,23 +2,44 @@
 
 import importlib
 
-from inspect import getmembers, isclass
-
-ALL_COMMANDS_MODULE = importlib.import_module("runway.commands")
+# command name -> module (relative to runway.commands) and class
+# modules are only imported when the command is used to keep start-up fast
+COMMANDS = {
+    'deploy': ('modules.deploy', 'Deploy'),
+    'destroy': ('modules.destroy', 'Destroy'),
+    'dismantle': ('modules.dismantle', 'Dismantle'),
+    'envvars': ('runway.envvars', 'EnvVars'),
+    'gen_sample': ('runway.gen_sample', 'GenSample'),
+    'init': ('runway.init', 'Init'),
+    'kbenv': ('runway.kbenv', 'KBEnv'),
+    'plan': ('modules.plan', 'Plan'),
+    'preflight': ('runway.preflight', 'Preflight'),
+    'run_aws': ('runway.run_aws', 'RunAws'),
+    'run_python': ('runway.run_python', 'RunPython'),
+    'run_stacker': ('runway.run_stacker', 'RunStacker'),
+    'takeoff': ('modules.takeoff', 'Takeoff'),
+    'taxi': ('modules.taxi', 'Taxi'),
+    'test': ('runway.test', 'Test'),
+    'tfenv': ('runway.tfenv', 'TFEnv'),
+    'whichenv': ('runway.whichenv', 'WhichEnv'),
+}
 
 
 def find_command_class(possible_command_names):
-    """Try to find a class for one of the given command names."""
-    for command_name in possible_command_names:
-        if hasattr(ALL_COMMANDS_MODULE, command_name):
-            command_module = getattr(ALL_COMMANDS_MODULE, command_name)
-            command_class_hierarchy = getmembers(command_module, isclass)
-            command_class_tuple = list(filter(_not_base_class, command_class_hierarchy))[0]
-            return command_class_tuple[1]
-    return None
+    """Try to find a class for one of the given command names.
+
+    Only the module of the command found is imported.
 
+    Args:
+        possible_command_names (List[str]): Names that could be commands.
 
-def _not_base_class(name_class_pair):
-    return name_class_pair[0] not in ['BaseCommand', 'CalledProcessError',
-                                      'Context', 'Dict', 'RunwayCommand',
-                                      'ModulesCommand', 'Config']
+    Returns:
+        Optional[Type[BaseCommand]]: Class of the command.
+
+    """
+    for command_name in possible_command_names:
+        if command_name in COMMANDS:
+            module_name, class_name = COMMANDS[command_name]
+            module = importlib.import_module('runway.commands.' + module_name)
+            return getattr(module, class_name)
+    return None
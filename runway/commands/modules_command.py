@@ -9,6 +9,9 @@ import copy
 import logging
 import os
 import sys
+from collections import OrderedDict
+# pylint: disable=unused-import
+from typing import Dict, List  # noqa: F401
 
 from builtins import input
 
@@ -17,11 +20,17 @@ import six
 import yaml
 
 from .runway_command import RunwayCommand, get_env
+from ..cfngin.dag import DAG, DAGValidationError, ReadyQueueWalker
 from ..context import Context
+from ..env_mgr import prefetch_versions
+from ..module.k8s import K8s, get_kb_env_manager
+from ..module.terraform import (Terraform, TerraformOptions,
+                                get_tf_env_manager)
 from ..path import Path
 from ..runway_module_type import RunwayModuleType
 from ..util import (change_dir, extract_boto_args_from_env, merge_dicts,
                     merge_nested_environment_dicts)
+from ..variables import prefetch_lookups
 
 if sys.version_info[0] > 2:
     import concurrent.futures
@@ -199,6 +208,100 @@ def select_modules_to_run(deployment, tags, command=None,  # noqa pylint: disabl
     return deployment
 
 
+def build_module_dag(modules, reverse=False):
+    """Build a graph of the modules of a deployment and their dependencies.
+
+    A module depends on the modules named in its ``depends_on``, or on the
+    module (or all the ``parallel`` child modules) listed before it if
+    ``depends_on`` is not provided. Child modules use the ``depends_on`` of
+    their ``parallel`` parent unless they have their own. Dependencies on
+    modules that are not in the deployment (e.g. not selected by
+    ``--tag``) are ignored.
+
+    Args:
+        modules (List[:class:`runway.config.ModuleDefinition`]): Modules of
+            the deployment, in the order they are deployed.
+        reverse (bool): Reverse the dependencies (e.g. for destroy) so that
+            a module is processed after the modules that depend on it.
+
+    Returns:
+        Tuple[DAG, OrderedDict]: The graph and the module of each node, in
+        the order of ``modules``. Nodes are named after their module, with
+        a suffix if the name is used by several modules.
+
+    Raises:
+        DAGValidationError: The dependencies contain a cycle.
+
+    """
+    nodes = OrderedDict()  # type: OrderedDict
+    entries = []  # nodes and depends_on of each entry of the list
+    nodes_by_name = {}  # type: Dict[str, List[str]]
+    for module in modules:
+        members = []
+        for child in module.child_modules or [module]:
+            node = child.name
+            if node in nodes:
+                node = '%s (%s)' % (child.name, len(nodes) + 1)
+            nodes[node] = child
+            nodes_by_name.setdefault(child.name, []).append(node)
+            members.append((node, child.depends_on
+                            if child.depends_on is not None
+                            else module.depends_on))
+        if module.child_modules:
+            nodes_by_name.setdefault(module.name, []).extend(
+                node for node, _ in members
+            )
+        entries.append(members)
+
+    dag = DAG()
+    for node in nodes:
+        dag.add_node(node)
+    edges = []
+    previous = []  # type: List[str]
+    for members in entries:
+        for node, depends_on in members:
+            if depends_on is None:
+                deps = previous
+            else:
+                deps = []
+                for name in depends_on:
+                    if name not in nodes_by_name:
+                        LOGGER.warning('Module "%s" depends on "%s" which is '
+                                       'not being processed; ignoring it',
+                                       node, name)
+                    deps.extend(nodes_by_name.get(name, []))
+            edges.extend((node, dep) for dep in deps if dep != node)
+        previous = [node for node, _ in members]
+    dag.add_edges(edges)
+    if reverse:
+        dag = dag.transpose()
+    return dag, nodes
+
+
+def get_module_order(dag, nodes):
+    """Order the nodes of a module graph for processing them one at a time.
+
+    Nodes are kept in their original order unless they depend on a node
+    listed after them.
+
+    Args:
+        dag (DAG): Graph returned by :func:`build_module_dag`.
+        nodes (List[str]): Nodes in their original order.
+
+    Returns:
+        List[str]: Nodes ordered after the nodes they depend on.
+
+    """
+    order = []  # type: List[str]
+    remaining = list(nodes)
+    while remaining:
+        node = next(node for node in remaining
+                    if dag.graph[node].issubset(order))
+        remaining.remove(node)
+        order.append(node)
+    return order
+
+
 def validate_account_alias(iam_client, account_alias):
     """Exit if list_account_aliases doesn't include account_alias."""
     # Super overkill here using pagination when an account can only
@@ -242,11 +345,7 @@ def validate_account_id(sts_client, account_id):
 
 def validate_account_credentials(deployment, context):
     """Exit if requested deployment account doesn't match credentials."""
-    boto_args = {'region_name': context.env_vars['AWS_DEFAULT_REGION']}
-    for i in ['aws_access_key_id', 'aws_secret_access_key',
-              'aws_session_token']:
-        if context.env_vars.get(i.upper()):
-            boto_args[i] = context.env_vars[i.upper()]
+    region = context.env_vars['AWS_DEFAULT_REGION']
     if isinstance(deployment.get('account_id'), (int, six.string_types)):
         account_id = str(deployment['account_id'])
     elif deployment.get('account_id', {}).get(context.env_name):
@@ -254,7 +353,8 @@ def validate_account_credentials(deployment, context):
     else:
         account_id = None
     if account_id:
-        validate_account_id(boto3.client('sts', **boto_args), account_id)
+        validate_account_id(context.get_client('sts', region=region),
+                            account_id)
     if isinstance(deployment.get('account_alias'), six.string_types):
         account_alias = deployment['account_alias']
     elif deployment.get('account_alias', {}).get(context.env_name):
@@ -262,7 +362,7 @@ def validate_account_credentials(deployment, context):
     else:
         account_alias = None
     if account_alias:
-        validate_account_alias(boto3.client('iam', **boto_args),
+        validate_account_alias(context.get_client('iam', region=region),
                                account_alias)
 
 
@@ -471,46 +571,177 @@ class ModulesCommand(RunwayCommand):
         if deployment.account_id or deployment.account_alias:
             validate_account_credentials(deployment, context)
 
+        variables = deployment.get_variables()
+        for module in deployment.modules:
+            for child_module in module.child_modules or [module]:
+                variables.extend(child_module.get_variables())
+        prefetch_lookups(variables, context)
+        self._prefetch_tool_versions(deployment, context)
+
         self._process_modules(deployment, context)
 
         if deployment.assume_role:
             post_deploy_assume_role(deployment.assume_role, context)
 
-    def _process_modules(self, deployment, context):
-        """Process the modules of a deployment."""
+    def _prefetch_tool_versions(self, deployment, context):
+        """Download the Terraform and kubectl versions used by modules.
+
+        Versions that are not installed are downloaded concurrently before
+        the modules of the deployment are processed. A module is skipped if
+        its options can't be resolved yet.
+
+        Args:
+            deployment (:class:`runway.config.DeploymentDefinition`): The
+                deployment being processed.
+            context: (:class:`runway.context.Context`): Current context
+                instance.
+
+        """
+        installs = []
         for module in deployment.modules:
-            if module.child_modules:
-                if context.use_concurrent:
-                    LOGGER.info("Processing parallel modules %s",
-                                [x.path for x in module.child_modules])
-                    LOGGER.info('(output will be interwoven)')
-                    # Can't use threading or ThreadPoolExecutor here because
-                    # we need to be able to do things like `cd` which is not
-                    # thread safe.
-                    executor = concurrent.futures.ProcessPoolExecutor(
-                        max_workers=context.max_concurrent_modules
-                    )
-                    futures = [executor.submit(self._deploy_module,
-                                               *[x, deployment, context])
-                               for x in module.child_modules]
-                    concurrent.futures.wait(futures)
-                    for job in futures:
-                        job.result()  # Raise exceptions / exit as needed
-                else:
-                    LOGGER.info(
-                        '%s - processing the following '
-                        'parallel modules sequentially...',
-                        ('Not running in CI mode' if context.is_python3
-                         else 'Parallel execution requires Python 3+')
-                    )
-                    for child_module in module.child_modules:
-                        self._deploy_module(child_module,
-                                            deployment,
-                                            context)
-            else:
-                self._deploy_module(module, deployment, context)
+            for child_module in module.child_modules or [module]:
+                try:
+                    install = self._get_tool_version(child_module, deployment,
+                                                     context)
+                except (Exception, SystemExit) as err:  # noqa pylint: disable=broad-except
+                    LOGGER.debug('unable to determine the tool version of '
+                                 'module %s: %s', child_module.name, err)
+                    continue
+                if install:
+                    installs.append(install)
+        if installs:
+            prefetch_versions(installs)
+
+    def _get_tool_version(self, module, deployment, context):
+        """Get the Terraform or kubectl version used by a local module.
+
+        Args:
+            module (:class:`runway.config.ModuleDefinition`): The module.
+            deployment (:class:`runway.config.DeploymentDefinition`): The
+                deployment the module belongs to.
+            context: (:class:`runway.context.Context`): Current context
+                instance.
+
+        Returns:
+            Optional[Tuple[runway.env_mgr.EnvManager, Optional[str]]]:
+            Environment manager and the version requested by the module
+            options.
 
-    def _deploy_module(self, module, deployment, context):
+        """
+        if Path.parse(module)[0] != 'local':
+            return None  # don't fetch remote modules early
+        deployment.resolve(context, self.runway_vars)
+        module.resolve(context, self.runway_vars)
+        path = Path(module, self.env_root).module_root
+        module_opts = merge_dicts(
+            {'options': deployment.module_options.copy()}, module.data
+        )
+        module_opts = load_module_opts_from_file(path, module_opts)
+        module_class = RunwayModuleType(path,
+                                        module_opts.get('class_path'),
+                                        module_opts.get('type')).module_class
+        options = module_opts.get('options') or {}
+        if issubclass(module_class, Terraform):
+            return get_tf_env_manager(
+                context, path,
+                TerraformOptions.resolve_version(context, **options)
+            )
+        if issubclass(module_class, K8s):
+            return get_kb_env_manager(context, path, options)
+        return None
+
+    def _process_modules(self, deployment, context):
+        """Process the modules of a deployment.
+
+        Modules are processed in the order of their dependencies. When
+        running concurrently, each module is processed as soon as the
+        modules it depends on have completed. Only modules that can be
+        processed at the same time as another module are processed in a
+        separate process; the others are processed in this one, as when
+        running sequentially.
+
+        """
+        modules = deployment.modules
+        if deployment.is_reversed:
+            modules = modules[::-1]  # dependencies are declared for deploy
+        try:
+            dag, nodes = build_module_dag(modules,
+                                          reverse=deployment.is_reversed)
+        except DAGValidationError as err:
+            LOGGER.error('Invalid depends_on in deployment "%s": %s',
+                         deployment.name, err)
+            sys.exit(1)
+        order = get_module_order(dag, list(nodes)[::-1]
+                                 if deployment.is_reversed else list(nodes))
+        is_sequential = all(order[i - 1] in dag.graph[order[i]]
+                            for i in range(1, len(order)))
+
+        if is_sequential or not context.use_concurrent:
+            if not is_sequential:
+                LOGGER.info(
+                    '%s - processing modules sequentially...',
+                    ('Not running in CI mode' if context.is_python3
+                     else 'Parallel execution requires Python 3+')
+                )
+            for node in order:
+                try:
+                    self._deploy_module(nodes[node], deployment, context)
+                finally:
+                    # the module may have written parameters used by the
+                    # modules after it
+                    context.ssm_cache.clear()
+            return
+
+        # modules that can't run at the same time as another module
+        in_process = set(
+            node for node in nodes
+            if len(dag.all_downstreams(node)) +
+            len(dag.all_upstreams(node)) == len(nodes) - 1
+        )
+        LOGGER.info('Processing modules %s as their dependencies complete',
+                    [node for node in order if node not in in_process])
+        LOGGER.info('(output will be interwoven)')
+        # Can't use threading or ThreadPoolExecutor to process modules
+        # because we need to be able to do things like `cd` which is not
+        # thread safe. Threads only wait for the processes.
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=context.max_concurrent_modules
+        )
+        errors = {}  # type: Dict[str, BaseException]
+
+        def walk_func(node):
+            """Process a module if the modules it depends on succeeded."""
+            failed = [dep for dep in dag.graph[node] if dep in errors]
+            if failed:
+                LOGGER.error('Skipping module "%s"; modules it depends on '
+                             'failed: %s', node, ', '.join(sorted(failed)))
+                errors[node] = errors[failed[0]]
+                return
+            try:
+                if node in in_process:
+                    # no other module is being processed
+                    self._deploy_module(nodes[node], deployment, context)
+                else:
+                    executor.submit(self._deploy_module, nodes[node],
+                                    deployment, context,
+                                    is_concurrent=True).result()
+            except BaseException as err:  # pylint: disable=broad-except
+                errors[node] = err
+            finally:
+                context.ssm_cache.clear()
+
+        try:
+            ReadyQueueWalker(
+                max_workers=context.max_concurrent_modules
+            ).walk(dag, walk_func)
+        finally:
+            executor.shutdown()
+        for node in order:
+            if node in errors:
+                raise errors[node]  # Raise exceptions / exit as needed
+
+    def _deploy_module(self, module, deployment, context,
+                       is_concurrent=False):
         """Execute module deployment.
 
         1. Resolves variables in :class:`runway.config.DeploymentDefinition`
@@ -528,8 +759,13 @@ class ModulesCommand(RunwayCommand):
                 deployment the module belongs to. Used to get options,
                 environments, parameters, and env_vars from the deployment level.
             context: (:class:`runway.context.Context`): Current context instance.
+            is_concurrent (bool): Whether other modules may be processed at
+                the same time.
 
         """
+        if is_concurrent:
+            context = copy.deepcopy(context)  # changes for this mod only
+            context.is_concurrent_module = True
         deployment.resolve(context, self.runway_vars)
         module.resolve(context, self.runway_vars)
         module_opts = {
@@ -1,15 +1 @@
-"""Import classes."""
-
-# pylint: disable = wildcard-import
-
-from .envvars import *  # noqa
-from .gen_sample import *  # noqa
-from .init import *  # noqa
-from .preflight import *  # noqa
-from .run_aws import *  # noqa
-from .run_python import *  # noqa
-from .run_stacker import *  # noqa
-from .test import *  # noqa
-from .kbenv import *  # noqa
-from .tfenv import *  # noqa
-from .whichenv import *  # noqa
+"""Runway commands that don't process modules."""
@@ -13,7 +13,7 @@ from six import string_types
 import yaml
 
 from .util import MutableMap
-from .variables import Variable
+from .variables import Variable, resolve_variables
 
 # python2 supported pylint sees this is cyclic even though its only for type checking
 # pylint: disable=cyclic-import
@@ -88,6 +88,11 @@ class ConfigComponent(MutableMap):
         raise ValueError('{}.parameters is of type {}; expected type '
                          'of dict'.format(self.name, type(value)))
 
+    def get_variables(self):
+        # type: () -> List[Variable]
+        """Get the variables of the attributes that support them."""
+        return [getattr(self, '_' + attr) for attr in self.SUPPORTS_VARIABLES]
+
     def get(self, key, default=None):
         # type: (str, Any) -> Any
         """Implement evaluation of get."""
@@ -107,10 +112,11 @@ class ConfigComponent(MutableMap):
                 populated until processing has begun.
 
         """
-        for attr in (self.PRE_PROCESS_VARIABLES if pre_process
-                     else self.SUPPORTS_VARIABLES):
-            LOGGER.debug('Resolving %s.%s', self.name, attr)
-            getattr(self, '_' + attr).resolve(context, variables=variables)
+        attrs = (self.PRE_PROCESS_VARIABLES if pre_process
+                 else self.SUPPORTS_VARIABLES)
+        LOGGER.debug('Resolving %s.%s', self.name, ', '.join(attrs))
+        resolve_variables([getattr(self, '_' + attr) for attr in attrs],
+                          context, runway_vars=variables)
 
     def __getitem__(self, key):
         # type: (str) -> Any
@@ -232,6 +238,42 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
                   count: ${var count.${env DEPLOY_ENVIRONMENT}}
             - frontend.tf
 
+    By default, a module is processed after the module (or ``parallel``
+    modules) listed before it. ``depends_on`` lists the names of the
+    modules that must be processed first instead. If the ``CI``
+    :ref:`environment variable is set<non-interactive-mode>`, modules are
+    processed as soon as the modules they depend on have completed, up to
+    ``RUNWAY_MAX_CONCURRENT_MODULES`` at a time. ``destroy`` processes
+    modules in the reverse order, after the modules that depend on them.
+    A module is not processed if one of the modules it depends on fails.
+    ``name`` and ``depends_on`` can also be used with ``parallel``;
+    depending on the name of a ``parallel`` map depends on all of its
+    modules.
+
+    Example:
+      In this example, ``app.cfn`` and ``frontend.tf`` are deployed at the
+      same time once ``backend.tf`` has completed. ``dns.cfn`` does not
+      depend on any module so it is deployed right away. ``monitoring.cfn``
+      is deployed after ``app.cfn`` and ``frontend.tf``, the module listed
+      before it.
+
+      .. code-block:: yaml
+
+        deployments:
+          - modules:
+            - backend.tf
+            - path: app.cfn
+            - path: frontend.tf
+              depends_on:
+                - backend.tf
+            - path: dns.cfn
+              depends_on: []
+            - name: monitoring
+              path: monitoring.cfn
+              depends_on:
+                - app.cfn
+                - frontend.tf
+
     """
 
     SUPPORTS_VARIABLES = ['class_path', 'env_vars', 'environments',
@@ -247,7 +289,8 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
                  env_vars=None,  # type: Optional[Dict[str, Dict[str, Any]]]
                  options=None,  # type: Optional[Dict[str, Any]]
                  tags=None,  # type: Optional[Dict[str, str]]
-                 child_modules=None  # type: Optional[List[Union[str, Dict[str, Any]]]]
+                 child_modules=None,  # type: Optional[List[Union[str, Dict[str, Any]]]]
+                 depends_on=None  # type: Optional[List[str]]
                  # pylint only complains for python2
                  ):  # pylint: disable=bad-continuation
         # type: (...) -> None
@@ -296,6 +339,9 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
                 (``--tag <tag>...``)
             child_modules (Optional[List[Union[str, Dict[str, Any]]]]):
                 Child modules that can be executed in parallel
+            depends_on (Optional[List[str]]): Names of the modules that
+                must be processed before this one. If not provided, the
+                module depends on the module listed before it.
 
         .. rubric:: Lookup Resolution
 
@@ -308,6 +354,8 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
         +---------------------+-----------------------------------------------+
         |  ``class_path``     | `env lookup`_, `var lookup`_                  |
         +---------------------+-----------------------------------------------+
+        |  ``depends_on``     | None                                          |
+        +---------------------+-----------------------------------------------+
         |  ``environments``   | `env lookup`_, `var lookup`_                  |
         +---------------------+-----------------------------------------------+
         |  ``env_vars``       | `env lookup`_, `var lookup`_                  |
@@ -349,6 +397,9 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
         self._options = Variable(name + '.options', options or {}, 'runway')
         self.tags = tags or {}
         self.child_modules = child_modules or []
+        if isinstance(depends_on, string_types):
+            depends_on = [depends_on]
+        self.depends_on = depends_on
 
     @property
     def class_path(self):
@@ -392,8 +443,9 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
             if isinstance(mod, str):
                 results.append(cls(name=mod, path=mod))
                 continue
+            depends_on = mod.pop('depends_on', None)
             if mod.get('parallel'):
-                name = 'parallel_parent'
+                name = mod.pop('name', 'parallel_parent')
                 child_modules = ModuleDefinition.from_list(mod.pop('parallel'))
                 path = '[' + ', '.join([x.path for x in child_modules]) + ']'
                 if mod:
@@ -414,7 +466,8 @@ class ModuleDefinition(ConfigComponent):  # pylint: disable=too-many-instance-at
                                options=mod.pop('options', {}),
                                parameters=mod.pop('parameters', {}),
                                tags=mod.pop('tags', {}),
-                               child_modules=child_modules))
+                               child_modules=child_modules,
+                               depends_on=depends_on))
             if mod:
                 LOGGER.warning(
                     'Invalid keys found in module %s have been ignored: %s',
@@ -746,6 +799,12 @@ class DeploymentDefinition(ConfigComponent):  # pylint: disable=too-many-instanc
         raise ValueError('{}.parallel_regions is of type {}; expected type '
                          'of list'.format(self.name, type(value)))
 
+    @property
+    def is_reversed(self):
+        # type: () -> bool
+        """Whether the order of modules and regions has been reversed."""
+        return self._reverse
+
     def reverse(self):
         """Reverse the order of modules and regions."""
         if self._reverse:
@@ -8,7 +8,8 @@ from distutils.util import strtobool  # pylint: disable=E
 
 from six import string_types
 
-from .cfngin.session_cache import get_session
+from .cfngin.session_cache import ClientCache, get_session
+from .lookups.handlers.ssm import SsmParameterCache
 from .util import AWS_ENV_VARS, cached_property
 
 LOGGER = logging.getLogger('runway')
@@ -51,6 +52,11 @@ class Context(object):
         self.env_vars = env_vars or os.environ.copy()
         self._env_name_from_env = bool(self.env_vars.get(self.env_override_name))
         self.debug = bool(self.env_vars.get('DEBUG'))
+        self.client_cache = ClientCache()
+        self.ssm_cache = SsmParameterCache()
+        # whether the module being processed may run at the same time as
+        # other modules
+        self.is_concurrent_module = False
 
         self.echo_detected_environment()
 
@@ -135,6 +141,49 @@ class Context(object):
         """
         return sys.version_info.major > 2
 
+    @property
+    def cfngin_prerender(self):
+        """Whether to render CFNgin templates before deploying stacks.
+
+        This property can be set by exporting ``RUNWAY_CFNGIN_PRERENDER``
+        with a truthy value.
+
+        Returns:
+            bool: Value from environment variable or ``False``.
+
+        """
+        return bool(strtobool(self.env_vars.get('RUNWAY_CFNGIN_PRERENDER',
+                                                'false')))
+
+    @property
+    def cfngin_walker(self):
+        """Engine used to walk the graph of CFNgin stacks.
+
+        This property can be set by exporting ``RUNWAY_CFNGIN_WALKER``.
+        Supported values are ``threaded`` and ``queue``.
+
+        Returns:
+            str: Value from environment variable or ``threaded``.
+
+        """
+        return self.env_vars.get('RUNWAY_CFNGIN_WALKER', 'threaded')
+
+    @property
+    def max_concurrent_cfngin_configs(self):
+        """Max number of CFNgin config files that can be processed concurrently.
+
+        This property can be set by exporting
+        ``RUNWAY_MAX_CONCURRENT_CFNGIN_CONFIGS``. Config files are processed
+        one at a time, in order, unless the value is greater than ``1``.
+
+        Returns:
+            int: Value from environment variable or ``1``.
+
+        """
+        return int(
+            self.env_vars.get('RUNWAY_MAX_CONCURRENT_CFNGIN_CONFIGS', '1')
+        )
+
     @property
     def max_concurrent_cfngin_stacks(self):
         """Max number of CFNgin stacks that can be deployed concurrently.
@@ -236,6 +285,28 @@ class Context(object):
                         "the %s environment variable", self.env_override_name)
         LOGGER.info("")
 
+    def get_client(self, service_name, profile=None, region=None):
+        """Get a boto3 client, reusing one created by this context if possible.
+
+        Args:
+            service_name (str): Name of the AWS service.
+            profile (Optional[str]): The profile for the client.
+            region (Optional[str]): The region for the client.
+
+        Returns:
+            boto3.client.Client: A thread-safe boto3 client.
+
+        """
+        region = region or self.env_region
+        creds = self.boto3_credentials
+        key = (service_name, region, profile,
+               creds.get('aws_access_key_id'),
+               creds.get('aws_secret_access_key'),
+               creds.get('aws_session_token'))
+        return self.client_cache.get(key, lambda: self.get_session(
+            profile=profile, region=region
+        ).client(service_name))
+
     def get_session(self, profile=None, region=None):
         """Create a thread-safe boto3 session.
 
@@ -2,9 +2,16 @@
 import logging
 import os
 import platform
+import shutil
 import sys
+import tempfile
+from multiprocessing.pool import ThreadPool
+
+# Old pylint on py2.7 incorrectly flags these
+from six.moves.urllib.request import pathname2url  # pylint: disable=E
 
 LOGGER = logging.getLogger('runway')
+PREFETCH_WORKERS = 8  # max number of concurrent downloads when prefetching
 
 
 def ensure_versions_dir_exists(env_path):
@@ -17,6 +24,109 @@ def ensure_versions_dir_exists(env_path):
     return versions_dir
 
 
+def get_remote_url(remote, *parts):
+    """Get the URL of a file of a release site or of a mirror directory.
+
+    Args:
+        remote (str): URL of the release site or path to a directory with
+            the same layout.
+
+    Returns:
+        str: ``file:`` URL if the remote is a directory.
+
+    """
+    if os.path.isdir(remote):
+        return 'file:' + pathname2url(os.path.join(os.path.abspath(remote),
+                                                   *parts))
+    return '/'.join((remote.rstrip('/'),) + parts)
+
+
+def install_version_dir(download_func, versions_dir, version):
+    """Install a version into a directory atomically.
+
+    The files are written to a temporary directory that is renamed once
+    complete so concurrent installs of the same version don't conflict.
+
+    Args:
+        download_func (Callable[[str], None]): Writes the files of the
+            version to the directory it is given.
+        versions_dir (str): Directory containing each installed version.
+        version (str): Version being installed.
+
+    """
+    tmp_dir = tempfile.mkdtemp(dir=versions_dir, prefix='.' + version)
+    try:
+        download_func(tmp_dir)
+        try:
+            os.rename(tmp_dir, os.path.join(versions_dir, version))
+        except OSError:
+            if not os.path.isdir(os.path.join(versions_dir, version)):
+                raise
+            LOGGER.debug('version %s was installed concurrently', version)
+    finally:
+        if os.path.isdir(tmp_dir):
+            shutil.rmtree(tmp_dir)
+
+
+def prefetch_versions(installs, max_workers=PREFETCH_WORKERS):
+    """Install the versions needed by several modules concurrently.
+
+    Failing to resolve or download a version is logged but is not an error;
+    the version will be installed again when the module is processed.
+
+    Args:
+        installs (List[Tuple[EnvManager, Optional[str]]]): Environment
+            manager for the path of a module and the version requested by
+            the options of the module.
+        max_workers (int): Max number of concurrent downloads.
+
+    Returns:
+        List[str]: Versions that were installed.
+
+    """
+    pending = {}
+    for manager, version_requested in installs:
+        try:
+            version = manager.get_version(version_requested)
+        except (Exception, SystemExit) as err:  # pylint: disable=broad-except
+            LOGGER.debug('%s: unable to resolve %s version to prefetch: %s',
+                         manager.path, manager.name, err)
+            continue
+        if not manager.is_installed(version):
+            pending.setdefault((manager.name, version), manager)
+    if not pending:
+        return []
+
+    LOGGER.info('Downloading %s...', ', '.join(
+        '%s %s' % key for key in sorted(pending)
+    ))
+
+    def download(item):
+        """Download a version, returning any error raised."""
+        (_name, version), manager = item
+        try:
+            manager.download(version)
+        except (Exception, SystemExit) as err:  # pylint: disable=broad-except
+            return err
+        return None
+
+    pool = ThreadPool(min(max_workers, len(pending)))
+    try:
+        items = sorted(pending.items())
+        errors = pool.map(download, items)
+    finally:
+        pool.close()
+        pool.join()
+    result = []
+    for ((name, version), _manager), error in zip(items, errors):
+        if error is None:
+            result.append(version)
+        else:
+            LOGGER.warning('unable to prefetch %s %s: %s', name, version,
+                           error)
+    return result
+
+
 def handle_bin_download_error(exc, name):
     """Give user info about their failed download."""
     if sys.version_info[0] == 2:
@@ -44,7 +154,17 @@ def handle_bin_download_error(exc, name):
 
 
 class EnvManager(object):  # pylint: disable=too-few-public-methods
-    """Base environment manager class."""
+    """Base environment manager class.
+
+    Subclasses implement ``get_version`` to resolve the version requested
+    by a module and ``download`` to install a version.
+
+    Attributes:
+        name (str): Name of the tool being managed.
+
+    """
+
+    name = None
 
     def __init__(self, dir_name, path=None):
         """Initialize class."""
@@ -72,3 +192,60 @@ class EnvManager(object):  # pylint: disable=too-few-public-methods
             self.command_suffix = ''
             self.env_dir = os.path.join(os.path.expanduser('~'),
                                         '.' + dir_name)
+
+    @property
+    def versions_dir(self):
+        """Directory containing each installed version.
+
+        Returns:
+            str
+
+        """
+        return ensure_versions_dir_exists(self.env_dir)
+
+    def bin_path(self, version):
+        """Get the path of the binary of a version.
+
+        Args:
+            version (str): Version of the tool.
+
+        Returns:
+            str
+
+        """
+        return os.path.join(self.versions_dir, version,
+                            self.name) + self.command_suffix
+
+    def is_installed(self, version):
+        """Determine if a version is installed.
+
+        Args:
+            version (str): Version of the tool.
+
+        Returns:
+            bool
+
+        """
+        return os.path.isdir(os.path.join(self.versions_dir, version))
+
+    def get_version(self, version_requested=None):
+        """Resolve the version to install.
+
+        Args:
+            version_requested (Optional[str]): Version requested. If not
+                provided, the version file of ``path`` is used.
+
+        Returns:
+            str
+
+        """
+        raise NotImplementedError
+
+    def download(self, version):
+        """Download and install a version.
+
+        Args:
+            version (str): Version of the tool.
+
+        """
+        raise NotImplementedError
@@ -2,7 +2,6 @@
 import logging
 import os
 import platform
-import shutil
 import sys
 import tempfile
 
@@ -10,19 +9,33 @@ import tempfile
 from six.moves.urllib.request import urlretrieve  # pylint: disable=E
 from six.moves.urllib.error import URLError  # pylint: disable=E
 
-from . import EnvManager, ensure_versions_dir_exists, handle_bin_download_error
+from . import (EnvManager, get_remote_url, handle_bin_download_error,
+               install_version_dir)
 from ..util import md5sum
 
 LOGGER = logging.getLogger('runway')
+KB_REMOTE = 'https://storage.googleapis.com/kubernetes-release/release'
 KB_VERSION_FILENAME = '.kubectl-version'
 
 
+def get_kb_remote():
+    """Get the kubectl release site.
+
+    This can be changed with ``KBENV_REMOTE``. The value can also be the path
+    to a directory with the same layout as the release site to use a mirror
+    without network access.
+
+    Returns:
+        str: URL or path.
+
+    """
+    return os.environ.get('KBENV_REMOTE') or KB_REMOTE
+
+
 # Branch and local variable count will go down when py2 support is dropped
 def download_kb_release(version,  # noqa pylint: disable=too-many-locals,too-many-branches
                         versions_dir, kb_platform=None, arch=None):
     """Download kubectl and return path to it."""
-    version_dir = os.path.join(versions_dir, version)
-
     if arch is None:
         arch = (
             os.environ.get('KBENV_ARCH') if os.environ.get('KBENV_ARCH')
@@ -39,35 +52,41 @@ def download_kb_release(version,  # noqa pylint: disable=too-many-locals,too-man
         else:
             kb_platform = 'linux'
 
-    download_dir = tempfile.mkdtemp()
     filename = 'kubectl.exe' if kb_platform == 'windows' else 'kubectl'
-    kb_url = "https://storage.googleapis.com/kubernetes-release/release/%s/bin/%s/%s" % (version, kb_platform, arch)  # noqa pylint: disable=line-too-long
-
-    try:
-        for i in [filename, filename + '.md5']:
-            urlretrieve(kb_url + '/' + i,
-                        os.path.join(download_dir, i))
-    # IOError in py2; URLError in 3+
-    except (IOError, URLError) as exc:
-        handle_bin_download_error(exc, 'kubectl')
-
-    with open(os.path.join(download_dir, filename + '.md5'), 'r') as stream:
-        kb_hash = stream.read().rstrip('\n')
-
-    if kb_hash != md5sum(os.path.join(download_dir, filename)):
-        LOGGER.error("Downloaded kubectl %s does not match md5 %s",
-                     filename, kb_hash)
-        sys.exit(1)
-
-    os.mkdir(version_dir)
-    shutil.move(os.path.join(download_dir, filename),
-                os.path.join(version_dir, filename))
-    shutil.rmtree(download_dir)
-    os.chmod(  # ensure it is executable
-        os.path.join(version_dir, filename),
-        os.stat(os.path.join(version_dir,
-                             filename)).st_mode | 0o0111
-    )
+    remote = get_kb_remote()
+
+    def download(version_dir):
+        """Download and verify kubectl."""
+        download_dir = tempfile.mkdtemp(dir=version_dir)
+        try:
+            for i in [filename, filename + '.md5']:
+                urlretrieve(get_remote_url(remote, version, 'bin', kb_platform,
+                                           arch, i),
+                            os.path.join(download_dir, i))
+        # IOError in py2; URLError in 3+
+        except (IOError, URLError) as exc:
+            handle_bin_download_error(exc, 'kubectl')
+
+        with open(os.path.join(download_dir, filename + '.md5'),
+                  'r') as stream:
+            kb_hash = stream.read().rstrip('\n')
+
+        if kb_hash != md5sum(os.path.join(download_dir, filename)):
+            LOGGER.error("Downloaded kubectl %s does not match md5 %s",
+                         filename, kb_hash)
+            sys.exit(1)
+
+        os.rename(os.path.join(download_dir, filename),
+                  os.path.join(version_dir, filename))
+        os.remove(os.path.join(download_dir, filename + '.md5'))
+        os.rmdir(download_dir)
+        os.chmod(  # ensure it is executable
+            os.path.join(version_dir, filename),
+            os.stat(os.path.join(version_dir,
+                                 filename)).st_mode | 0o0111
+        )
+
+    install_version_dir(download, versions_dir, version)
 
 
 def get_version_requested(path):
@@ -95,30 +114,48 @@ class KBEnvManager(EnvManager):  # pylint: disable=too-few-public-methods
         """Initialize class."""
         super(KBEnvManager, self).__init__('kbenv', path)
 
-    def install(self, version_requested=None):
-        """Ensure kubectl is available."""
-        versions_dir = ensure_versions_dir_exists(self.env_dir)
+    name = 'kubectl'
+
+    def get_version(self, version_requested=None):
+        """Resolve the version of kubectl to install.
+
+        Args:
+            version_requested (Optional[str]): Version requested. If not
+                provided, the ``.kubectl-version`` file of ``path`` is used.
 
+        Returns:
+            str
+
+        """
         if not version_requested:
             version_requested = get_version_requested(self.path)
 
         if not version_requested.startswith('v'):
             version_requested = 'v' + version_requested
+        return version_requested
+
+    def download(self, version):
+        """Download and install a version of kubectl.
+
+        Args:
+            version (str): Version of kubectl.
+
+        """
+        download_kb_release(version, self.versions_dir)
+
+    def install(self, version_requested=None):
+        """Ensure kubectl is available."""
+        version_requested = self.get_version(version_requested)
 
         # Return early (i.e before reaching out to the internet) if the
         # matching version is already installed
-        if os.path.isdir(os.path.join(versions_dir,
-                                      version_requested)):
+        if self.is_installed(version_requested):
             LOGGER.info("kubectl version %s already installed; using "
                         "it...", version_requested)
-            return os.path.join(versions_dir,
-                                version_requested,
-                                'kubectl') + self.command_suffix
+            return self.bin_path(version_requested)
 
         LOGGER.info("Downloading and using kubectl version %s ...",
                     version_requested)
-        download_kb_release(version_requested, versions_dir)
+        self.download(version_requested)
         LOGGER.info("Downloaded kubectl %s successfully", version_requested)
-        return os.path.join(versions_dir,
-                            version_requested,
-                            'kubectl') + self.command_suffix
+        return self.bin_path(version_requested)
@@ -6,9 +6,9 @@ import logging
 import os
 import platform
 import re
-import shutil
 import sys
 import tempfile
+import time
 import zipfile
 
 import hcl
@@ -17,20 +17,40 @@ import requests
 from six.moves.urllib.request import urlretrieve  # pylint: disable=E
 from six.moves.urllib.error import URLError  # pylint: disable=E
 
-from . import EnvManager, ensure_versions_dir_exists, handle_bin_download_error
+from . import (EnvManager, get_remote_url, handle_bin_download_error,
+               install_version_dir)
 from ..util import get_hash_for_filename, sha256sum
 
 LOGGER = logging.getLogger('runway')
+TF_RELEASE_INDEX_CACHE = os.path.join(os.path.expanduser('~'),
+                                      '.runway_cache', 'tfenv_index.json')
+TF_RELEASE_INDEX_TTL = 60 * 60  # seconds
+TF_REMOTE = 'https://releases.hashicorp.com'
 TF_VERSION_FILENAME = '.terraform-version'
 
+# versions of the release index keyed by remote; loaded once per process
+_TF_VERSIONS = {}
+
+
+def get_tf_remote():
+    """Get the Terraform release site.
+
+    Like tfenv, this can be changed with ``TFENV_REMOTE``. The value can also
+    be the path to a directory with the same layout as the release site to
+    use a mirror without network access.
+
+    Returns:
+        str: URL or path.
+
+    """
+    return os.environ.get('TFENV_REMOTE') or TF_REMOTE
+
 
 # Branch and local variable count will go down when py2 support is dropped
 def download_tf_release(version,  # noqa pylint: disable=too-many-locals,too-many-branches
                         versions_dir, command_suffix, tf_platform=None,
                         arch=None):
     """Download Terraform archive and return path to it."""
-    version_dir = os.path.join(versions_dir, version)
-
     if arch is None:
         arch = (
             os.environ.get('TFENV_ARCH') if os.environ.get('TFENV_ARCH')
@@ -49,46 +69,107 @@ def download_tf_release(version,  # noqa pylint: disable=too-many-locals,too-man
         else:
             tfver_os = "linux_%s" % arch
 
-    download_dir = tempfile.mkdtemp()
     filename = "terraform_%s_%s.zip" % (version, tfver_os)
     shasums_name = "terraform_%s_SHA256SUMS" % version
-    tf_url = "https://releases.hashicorp.com/terraform/" + version
+    remote = get_tf_remote()
 
-    try:
+    def download(version_dir):
+        """Download, verify, and extract the archive."""
+        download_dir = tempfile.mkdtemp(dir=version_dir)
+        try:
+            for i in [filename, shasums_name]:
+                urlretrieve(get_remote_url(remote, 'terraform', version, i),
+                            os.path.join(download_dir, i))
+        # IOError in py2; URLError in 3+
+        except (IOError, URLError) as exc:
+            handle_bin_download_error(exc, 'Terraform')
+
+        tf_hash = get_hash_for_filename(filename,
+                                        os.path.join(download_dir,
+                                                     shasums_name))
+        if tf_hash != sha256sum(os.path.join(download_dir, filename)):
+            LOGGER.error("Downloaded Terraform %s does not match sha256 %s",
+                         filename, tf_hash)
+            sys.exit(1)
+
+        tf_zipfile = zipfile.ZipFile(os.path.join(download_dir, filename))
+        tf_zipfile.extractall(version_dir)
+        tf_zipfile.close()
         for i in [filename, shasums_name]:
-            urlretrieve(tf_url + '/' + i,
-                        os.path.join(download_dir, i))
-    # IOError in py2; URLError in 3+
-    except (IOError, URLError) as exc:
-        handle_bin_download_error(exc, 'Terraform')
-
-    tf_hash = get_hash_for_filename(filename, os.path.join(download_dir,
-                                                           shasums_name))
-    if tf_hash != sha256sum(os.path.join(download_dir, filename)):
-        LOGGER.error("Downloaded Terraform %s does not match sha256 %s",
-                     filename, tf_hash)
-        sys.exit(1)
+            os.remove(os.path.join(download_dir, i))
+        os.rmdir(download_dir)
+        os.chmod(  # ensure it is executable
+            os.path.join(version_dir, 'terraform' + command_suffix),
+            os.stat(os.path.join(version_dir,
+                                 'terraform' + command_suffix)).st_mode | 0o0111
+        )
+
+    install_version_dir(download, versions_dir, version)
+
+
+def _load_tf_versions(remote):
+    """Load the versions of the Terraform release index.
+
+    The index of the release site is cached for ``TF_RELEASE_INDEX_TTL``
+    seconds. A cached index is also used if the release site can't be
+    reached. The index of a mirror directory is its ``terraform/index.json``
+    or, if there is none, the name of its version directories.
 
-    tf_zipfile = zipfile.ZipFile(os.path.join(download_dir, filename))
-    os.mkdir(version_dir)
-    tf_zipfile.extractall(version_dir)
-    tf_zipfile.close()
-    shutil.rmtree(download_dir)
-    os.chmod(  # ensure it is executable
-        os.path.join(version_dir,
-                     'terraform' + command_suffix),
-        os.stat(os.path.join(version_dir,
-                             'terraform' + command_suffix)).st_mode | 0o0111
-    )
+    Args:
+        remote (str): URL of the release site or path to a mirror directory.
+
+    Returns:
+        List[str]: Versions.
+
+    """
+    if os.path.isdir(remote):
+        index_path = os.path.join(remote, 'terraform', 'index.json')
+        if os.path.isfile(index_path):
+            with open(index_path) as stream:
+                return list(json.load(stream)['versions'])
+        return [name for name in os.listdir(os.path.join(remote, 'terraform'))
+                if os.path.isdir(os.path.join(remote, 'terraform', name))]
+
+    caches = {}
+    try:
+        with open(TF_RELEASE_INDEX_CACHE) as stream:
+            caches = json.load(stream)
+    except (IOError, OSError, ValueError):
+        pass
+    if not isinstance(caches, dict):
+        caches = {}
+    cache = caches.get(remote, {})
+    if cache and time.time() - cache['time'] < TF_RELEASE_INDEX_TTL:
+        return cache['versions']
+    try:
+        response = requests.get(get_remote_url(remote, 'terraform',
+                                               'index.json'))
+        response.raise_for_status()
+        versions = list(response.json()['versions'])
+    except (requests.exceptions.RequestException, ValueError) as exc:
+        if not cache:
+            raise
+        LOGGER.warning('Unable to retrieve the Terraform release index (%s); '
+                       'using the cached index', exc)
+        return cache['versions']
+    try:
+        if not os.path.isdir(os.path.dirname(TF_RELEASE_INDEX_CACHE)):
+            os.makedirs(os.path.dirname(TF_RELEASE_INDEX_CACHE))
+        # other remotes keep their cached index
+        caches[remote] = {'time': time.time(), 'versions': versions}
+        with open(TF_RELEASE_INDEX_CACHE, 'w') as stream:
+            json.dump(caches, stream)
+    except (IOError, OSError) as exc:
+        LOGGER.debug('unable to cache the Terraform release index: %s', exc)
+    return versions
 
 
 def get_available_tf_versions(include_prerelease=False):
     """Return available Terraform versions."""
-    tf_releases = json.loads(
-        requests.get('https://releases.hashicorp.com/index.json').text
-    )['terraform']
-    tf_versions = sorted([k  # descending
-                          for k, _v in tf_releases['versions'].items()],
+    remote = get_tf_remote()
+    if remote not in _TF_VERSIONS:
+        _TF_VERSIONS[remote] = _load_tf_versions(remote)
+    tf_versions = sorted(_TF_VERSIONS[remote],  # descending
                          key=LooseVersion,
                          reverse=True)
     if include_prerelease:
@@ -155,10 +236,20 @@ class TFEnvManager(EnvManager):  # pylint: disable=too-few-public-methods
         """Initialize class."""
         super(TFEnvManager, self).__init__('tfenv', path)
 
-    def install(self, version_requested=None):
-        """Ensure terraform is available."""
-        versions_dir = ensure_versions_dir_exists(self.env_dir)
+    name = 'terraform'
 
+    def get_version(self, version_requested=None):
+        """Resolve the version of Terraform to install.
+
+        Args:
+            version_requested (Optional[str]): Version requested. If not
+                provided, the ``.terraform-version`` file of ``path`` is
+                used.
+
+        Returns:
+            str
+
+        """
         if not version_requested:
             version_requested = get_version_requested(self.path)
 
@@ -177,38 +268,41 @@ class TFEnvManager(EnvManager):  # pylint: disable=too-few-public-methods
             include_prerelease_versions = True
             # Return early (i.e before reaching out to the internet) if the
             # matching version is already installed
-            if os.path.isdir(os.path.join(versions_dir,
-                                          version_requested)):
-                LOGGER.info("Terraform version %s already installed; using "
-                            "it...", version_requested)
-                return os.path.join(versions_dir,
-                                    version_requested,
-                                    'terraform') + self.command_suffix
+            if self.is_installed(version_requested):
+                return version_requested
 
         try:
-            version = next(i
-                           for i in get_available_tf_versions(
-                               include_prerelease_versions)
-                           if re.match(regex, i))
+            return next(i
+                        for i in get_available_tf_versions(
+                            include_prerelease_versions)
+                        if re.match(regex, i))
         except StopIteration:
             LOGGER.error("Unable to find a Terraform version matching regex: %s",
                          regex)
             sys.exit(1)
 
+    def download(self, version):
+        """Download and install a version of Terraform.
+
+        Args:
+            version (str): Version of Terraform.
+
+        """
+        download_tf_release(version, self.versions_dir, self.command_suffix)
+
+    def install(self, version_requested=None):
+        """Ensure terraform is available."""
+        version = self.get_version(version_requested)
+
         # Now that a version has been selected, skip downloading if it's
         # already been downloaded
-        if os.path.isdir(os.path.join(versions_dir,
-                                      version)):
+        if self.is_installed(version):
             LOGGER.info("Terraform version %s already installed; using it...",
                         version)
-            return os.path.join(versions_dir,
-                                version,
-                                'terraform') + self.command_suffix
+            return self.bin_path(version)
 
         LOGGER.info("Downloading and using Terraform version %s ...",
                     version)
-        download_tf_release(version, versions_dir, self.command_suffix)
+        self.download(version)
         LOGGER.info("Downloaded Terraform %s successfully", version)
-        return os.path.join(versions_dir,
-                            version,
-                            'terraform') + self.command_suffix
+        return self.bin_path(version)
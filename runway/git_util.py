@@ -0,0 +1,265 @@
+"""Utility functions for fetching remote git repositories.
+
+Repositories are fetched into a local bare mirror kept for each URI. Only
+the commit being used is fetched (``--depth 1``) so later refs of the same
+repository are fetched into the mirror incrementally instead of cloning the
+whole history again. Commits are then checked out of the mirror into a plain
+directory, optionally limited to a list of paths (sparse checkout).
+
+"""
+import hashlib
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+# pylint: disable=unused-import
+from typing import Dict  # noqa: F401
+
+LOGGER = logging.getLogger('runway')
+
+COMMIT_REGEX = re.compile(r'^[0-9a-f]{40}$')
+MIRROR_DIRNAME = 'git_mirrors'
+
+_LS_REMOTE_CACHE = {}  # type: Dict[str, Dict[str, str]]
+_LOCKS = {}  # type: Dict[str, threading.Lock]
+_LOCKS_LOCK = threading.Lock()
+
+
+def _get_lock(key):
+    """Get the lock of a URI or path.
+
+    Args:
+        key (str): URI or path.
+
+    Returns:
+        threading.Lock
+
+    """
+    with _LOCKS_LOCK:
+        return _LOCKS.setdefault(key, threading.Lock())
+
+
+def _git(*args, **kwargs):
+    """Run a git command and return its output.
+
+    Args:
+        *args (str): Arguments of the git command.
+
+    Keyword Args:
+        env (Optional[Dict[str, str]]): Environment variables.
+
+    Returns:
+        str: Output of the command.
+
+    """
+    LOGGER.debug('running git %s', ' '.join(args))
+    output = subprocess.check_output(('git',) + args,
+                                     env=kwargs.get('env'))
+    return output.decode() if isinstance(output, bytes) else output
+
+
+def sanitize_uri(uri):
+    """Convert a git URI to a directory name.
+
+    Args:
+        uri (str): Git URI (e.g. ``git@github.com:foo/bar.git``).
+
+    Returns:
+        str: Directory name for the URI.
+
+    """
+    dir_name = uri[:-4] if uri.endswith('.git') else uri
+    for i in ['@', '/', ':']:
+        dir_name = dir_name.replace(i, '_')
+    return dir_name
+
+
+def ls_remote(uri):
+    """List the refs of a remote repository.
+
+    The refs of each URI are only listed once per run, using a single
+    ``git ls-remote`` call, no matter how many sources use the repository.
+
+    Args:
+        uri (str): Git URI.
+
+    Returns:
+        Dict[str, str]: Commit ID of each ref (e.g. ``HEAD``,
+        ``refs/heads/master``).
+
+    """
+    with _get_lock(uri):
+        if uri not in _LS_REMOTE_CACHE:
+            LOGGER.debug('Invoking git to retrieve commit ids for repo %s...',
+                         uri)
+            refs = {}
+            for line in _git('ls-remote', uri).splitlines():
+                if '\t' in line:
+                    commit_id, ref = line.split('\t', 1)
+                    refs[ref] = commit_id
+            _LS_REMOTE_CACHE[uri] = refs
+        return _LS_REMOTE_CACHE[uri]
+
+
+def resolve_ref(uri, ref):
+    """Determine the commit ID of a ref of a remote repository.
+
+    Args:
+        uri (str): Git URI.
+        ref (str): Git ref (e.g. ``HEAD``, ``refs/heads/master``).
+
+    Returns:
+        str: Commit ID.
+
+    Raises:
+        ValueError: The ref does not exist.
+
+    """
+    refs = ls_remote(uri)
+    if ref in refs:
+        commit_id = refs[ref]
+    else:
+        # like ``git ls-remote <uri> <ref>``, match the end of ref names
+        matches = sorted(name for name in refs
+                         if name.endswith('/' + ref))
+        if not matches:
+            raise ValueError("Ref \"%s\" not found for repo %s." % (ref, uri))
+        commit_id = refs[matches[0]]
+    LOGGER.debug('Matching commit id found: %s', commit_id)
+    return commit_id
+
+
+def get_mirror(uri, mirror_dir):
+    """Get the bare mirror of a remote repository, creating it if needed.
+
+    Args:
+        uri (str): Git URI.
+        mirror_dir (str): Directory containing the mirrors.
+
+    Returns:
+        str: Path of the mirror.
+
+    """
+    path = os.path.join(mirror_dir, sanitize_uri(uri))
+    if not os.path.isdir(path):
+        if not os.path.isdir(mirror_dir):
+            os.makedirs(mirror_dir)
+        tmp_path = tempfile.mkdtemp(dir=mirror_dir, suffix='.tmp')
+        try:
+            _git('init', '--quiet', '--bare', tmp_path)
+            _git('--git-dir', tmp_path, 'remote', 'add', 'origin', uri)
+            os.rename(tmp_path, path)
+        finally:
+            if os.path.isdir(tmp_path):
+                shutil.rmtree(tmp_path)
+    return path
+
+
+def fetch_commit(uri, ref, mirror_dir):
+    """Fetch a commit of a remote repository into its mirror.
+
+    Only the commit itself is fetched. If the remote does not allow
+    fetching it directly (e.g. an abbreviated commit ID), the branches and
+    tags of the remote are fetched instead.
+
+    Args:
+        uri (str): Git URI.
+        ref (str): Commit ID or tag name.
+        mirror_dir (str): Directory containing the mirrors.
+
+    Returns:
+        Tuple[str, str]: Path of the mirror and commit ID.
+
+    """
+    with _get_lock(os.path.join(mirror_dir, sanitize_uri(uri))):
+        mirror = get_mirror(uri, mirror_dir)
+        if COMMIT_REGEX.match(ref):
+            try:
+                _git('--git-dir', mirror, 'cat-file', '-e',
+                     ref + '^{commit}')
+                LOGGER.debug('commit %s of repo %s is already in mirror %s',
+                             ref, uri, mirror)
+                return mirror, ref
+            except subprocess.CalledProcessError:
+                pass
+        LOGGER.debug('fetching %s of repo %s into mirror %s', ref, uri,
+                     mirror)
+        try:
+            _git('--git-dir', mirror, 'fetch', '--quiet', '--depth', '1',
+                 'origin', ref)
+            commit_id = _git('--git-dir', mirror, 'rev-parse',
+                             'FETCH_HEAD^{commit}').strip()
+        except subprocess.CalledProcessError:
+            LOGGER.debug('unable to fetch %s of repo %s directly; fetching '
+                         'all branches and tags', ref, uri)
+            _git('--git-dir', mirror, 'fetch', '--quiet', 'origin',
+                 '+refs/heads/*:refs/heads/*', '+refs/tags/*:refs/tags/*')
+            commit_id = _git('--git-dir', mirror, 'rev-parse', '--verify',
+                             ref + '^{commit}').strip()
+        # keep the commit reachable so it isn't pruned from the mirror
+        _git('--git-dir', mirror, 'update-ref', 'refs/runway/' + commit_id,
+             commit_id)
+        return mirror, commit_id
+
+
+def get_sparse_suffix(paths):
+    """Get the suffix of a checkout directory limited to a list of paths.
+
+    Args:
+        paths (Optional[List[str]]): Paths of the checkout.
+
+    Returns:
+        str: Suffix of the directory name. Empty if the checkout contains
+        every path.
+
+    """
+    if not paths:
+        return ''
+    return '-sparse-' + hashlib.md5(
+        '\n'.join(sorted(paths)).encode()
+    ).hexdigest()[:8]
+
+
+def checkout(uri, ref, dest, mirror_dir, paths=None):
+    """Check out a commit of a remote repository.
+
+    The commit is checked out into a temporary directory that is then
+    renamed to ``dest`` so an interrupted checkout is never used.
+
+    Args:
+        uri (str): Git URI.
+        ref (str): Commit ID or tag name.
+        dest (str): Directory to check out to. Must not exist.
+        mirror_dir (str): Directory containing the mirrors.
+        paths (Optional[List[str]]): Only check out these paths of the
+            repository (sparse checkout).
+
+    """
+    mirror, commit_id = fetch_commit(uri, ref, mirror_dir)
+    parent = os.path.dirname(dest)
+    if not os.path.isdir(parent):
+        os.makedirs(parent)
+    tmp_dir = tempfile.mkdtemp(dir=parent, suffix='.tmp')
+    try:
+        work_tree = os.path.join(tmp_dir, 'work')
+        os.mkdir(work_tree)
+        env = os.environ.copy()
+        # use an index of our own so concurrent checkouts don't conflict
+        env['GIT_INDEX_FILE'] = os.path.join(tmp_dir, 'index')
+        args = ['--git-dir', mirror, '--work-tree', work_tree, 'checkout',
+                '--quiet', commit_id, '--']
+        args.extend(path.strip('/') or '.' for path in paths or ['.'])
+        _git(*args, env=env)
+        LOGGER.debug('checked out commit %s of repo %s to %s', commit_id,
+                     uri, dest)
+        try:
+            os.rename(work_tree, dest)
+        except OSError:
+            if not os.path.isdir(dest):
+                raise
+            LOGGER.debug('%s was checked out concurrently', dest)
+    finally:
+        shutil.rmtree(tmp_dir)
@@ -1,8 +1,12 @@
 """CFNgin hook for cleaning up resources prior to CFN stack deletion."""
 # TODO move to runway.cfngin.hooks on next major release
 import logging
+import threading
+import time
+from multiprocessing.pool import ThreadPool
 
 from botocore.exceptions import ClientError
+from six.moves import queue
 
 from ..cfngin.lookups.handlers.output import OutputLookup
 from ..cfngin.lookups.handlers.rxref import RxrefLookup
@@ -11,9 +15,249 @@ from ..cfngin.session_cache import get_session
 
 LOGGER = logging.getLogger(__name__)
 
+MAX_DELETE_KEYS = 1000  # max number of keys per DeleteObjects call
+# error codes of requests or keys that are retried when deleting objects
+RETRY_ERROR_CODES = ('InternalError', 'RequestTimeout', 'ServiceUnavailable',
+                     'SlowDown', 'Throttling')
+
+
+class BucketPurger(object):
+    """Delete every object version and delete marker in a bucket.
+
+    Versions are listed by one thread per top-level prefix of the bucket
+    and sent, in batches of 1000, to a pool of threads calling
+    ``DeleteObjects`` while the listing continues. Requests or keys that
+    fail with a throttling or server error are retried with an
+    exponential backoff.
+
+    Attributes:
+        deleted (int): Number of versions deleted.
+        failed (List[Dict[str, str]]): Errors of versions that could not be
+            deleted.
+
+    """
+
+    def __init__(self, client, bucket, max_concurrency=10, retries=5,
+                 progress_interval=30):
+        """Instantiate class.
+
+        Args:
+            client (boto3.client.Client): S3 client.
+            bucket (str): Name of the bucket.
+            max_concurrency (int): Max number of threads deleting objects and
+                max number of threads listing objects.
+            retries (int): Max number of times a batch is retried.
+            progress_interval (int): Seconds between progress messages.
+
+        """
+        self.bucket = bucket
+        self.client = client
+        self.deleted = 0
+        self.failed = []
+        self.max_concurrency = max_concurrency
+        self.progress_interval = progress_interval
+        self.retries = retries
+        self._last_progress = self._started = time.time()
+        self._lock = threading.Lock()
+
+    def _list(self, batches, prefix='', delimiter=None):
+        """List versions, sending them to be deleted in batches.
+
+        Args:
+            batches (Queue): Queue of batches to delete.
+            prefix (str): Prefix of the keys to list.
+            delimiter (Optional[str]): Group keys containing the delimiter
+                after the prefix instead of listing them.
+
+        Returns:
+            List[str]: Prefixes of grouped keys.
+
+        """
+        kwargs = {'Bucket': self.bucket, 'Prefix': prefix}
+        if delimiter:
+            kwargs['Delimiter'] = delimiter
+        batch = []
+        prefixes = []
+        paginator = self.client.get_paginator('list_object_versions')
+        for page in paginator.paginate(**kwargs):
+            prefixes.extend(common['Prefix']
+                            for common in page.get('CommonPrefixes', []))
+            for version in (page.get('Versions', []) +
+                            page.get('DeleteMarkers', [])):
+                batch.append({'Key': version['Key'],
+                              'VersionId': version['VersionId']})
+                if len(batch) == MAX_DELETE_KEYS:
+                    batches.put(batch)
+                    batch = []
+        if batch:
+            batches.put(batch)
+        return prefixes
+
+    def _delete(self, objects):
+        """Delete a batch of versions, retrying the versions that failed.
+
+        Args:
+            objects (List[Dict[str, str]]): Keys and version IDs to delete.
+
+        """
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(min(0.5 * 2 ** attempt, 20))
+            try:
+                response = self.client.delete_objects(
+                    Bucket=self.bucket,
+                    Delete={'Objects': objects, 'Quiet': True}
+                )
+            except ClientError as err:
+                if (err.response['Error']['Code'] not in RETRY_ERROR_CODES or
+                        attempt == self.retries):
+                    raise
+                LOGGER.debug('retrying deletion of %s version(s) from bucket '
+                             '%s: %s', len(objects), self.bucket, err)
+                continue
+            retry = []
+            failed = []
+            for error in response.get('Errors', []):
+                if (error.get('Code') in RETRY_ERROR_CODES and
+                        attempt < self.retries):
+                    retry.append({'Key': error['Key'],
+                                  'VersionId': error['VersionId']})
+                else:
+                    failed.append(error)
+            self._progress(len(objects) - len(retry) - len(failed), failed)
+            if not retry:
+                return
+            objects = retry
+
+    def _delete_worker(self, batches):
+        """Delete batches until ``None`` is received.
+
+        Args:
+            batches (Queue): Queue of batches to delete.
+
+        """
+        while True:
+            objects = batches.get()
+            if objects is None:
+                return
+            try:
+                self._delete(objects)
+            except Exception as err:  # pylint: disable=broad-except
+                # keep deleting so listing threads are never blocked
+                self._progress(0, [{'Key': obj['Key'],
+                                    'VersionId': obj['VersionId'],
+                                    'Message': str(err)}
+                                   for obj in objects])
+
+    def _progress(self, deleted, failed):
+        """Record deleted versions and log progress at most every interval.
+
+        Args:
+            deleted (int): Number of versions deleted.
+            failed (List[Dict[str, str]]): Errors of versions that could not
+                be deleted.
+
+        """
+        with self._lock:
+            self.deleted += deleted
+            self.failed.extend(failed)
+            now = time.time()
+            if now - self._last_progress >= self.progress_interval:
+                self._last_progress = now
+                LOGGER.info('%s: deleted %s version(s) (%.0f/s)',
+                            self.bucket, self.deleted,
+                            self.deleted / (now - self._started))
+
+    def purge(self):
+        """Delete every version in the bucket.
+
+        Returns:
+            int: Number of versions deleted.
+
+        Raises:
+            ValueError: Some versions could not be deleted.
+
+        """
+        self._last_progress = self._started = time.time()
+        batches = queue.Queue(self.max_concurrency * 2)
+        deleters = [threading.Thread(target=self._delete_worker,
+                                     args=(batches,))
+                    for _ in range(self.max_concurrency)]
+        for thread in deleters:
+            thread.daemon = True
+            thread.start()
+        try:
+            prefixes = self._list(batches, delimiter='/')
+            if prefixes:
+                pool = ThreadPool(min(self.max_concurrency, len(prefixes)))
+                try:
+                    pool.map(lambda prefix: self._list(batches, prefix),
+                             prefixes)
+                finally:
+                    pool.terminate()
+        finally:
+            for _ in deleters:
+                batches.put(None)
+            for thread in deleters:
+                thread.join()
+        elapsed = time.time() - self._started
+        LOGGER.info('%s: deleted %s version(s) in %.1fs (%.0f/s)',
+                    self.bucket, self.deleted, elapsed,
+                    self.deleted / elapsed if elapsed else 0)
+        if self.failed:
+            raise ValueError('unable to delete %s version(s) from bucket %s; '
+                             'first error: %s' % (len(self.failed),
+                                                  self.bucket,
+                                                  self.failed[0]))
+        return self.deleted
+
+
+def expire_bucket(client, bucket):
+    """Replace the lifecycle rules of a bucket with rules expiring everything.
+
+    S3 deletes the objects asynchronously, usually within a day or two, so
+    the bucket can't be deleted right away.
+
+    Args:
+        client (boto3.client.Client): S3 client.
+        bucket (str): Name of the bucket.
+
+    """
+    client.put_bucket_lifecycle_configuration(
+        Bucket=bucket,
+        LifecycleConfiguration={'Rules': [{
+            'ID': 'runway-purge-bucket',
+            'Filter': {'Prefix': ''},
+            'Status': 'Enabled',
+            'Expiration': {'Days': 1},
+            'NoncurrentVersionExpiration': {'NoncurrentDays': 1},
+            'AbortIncompleteMultipartUpload': {'DaysAfterInitiation': 1}
+        }, {
+            'ID': 'runway-purge-bucket-delete-markers',
+            'Filter': {'Prefix': ''},
+            'Status': 'Enabled',
+            'Expiration': {'ExpiredObjectDeleteMarker': True}
+        }]}
+    )
+    LOGGER.info('%s: objects will be expired by a lifecycle rule', bucket)
+
 
 def purge_bucket(context, provider, **kwargs):
-    """Delete objects in bucket."""
+    """Delete objects in bucket.
+
+    Keyword Args:
+        bucket_name (str): Name of the bucket.
+        bucket_output_lookup (str): Value of an output lookup that retrieves
+            the name of the bucket.
+        bucket_rxref_lookup (str): Value of an rxref lookup that retrieves
+            the name of the bucket.
+        bucket_xref_lookup (str): Value of an xref lookup that retrieves the
+            name of the bucket.
+        lifecycle_expiration (bool): Expire the objects with a lifecycle rule
+            instead of deleting them.
+        max_concurrency (int): Max number of threads deleting objects.
+
+    """
     session = get_session(provider.region)
 
     if kwargs.get('bucket_name'):
@@ -49,9 +293,9 @@ def purge_bucket(context, provider, **kwargs):
             context=context
         )
 
-    s3_resource = session.resource('s3')
+    client = context.get_client('s3', region=provider.region)
     try:
-        s3_resource.meta.client.head_bucket(Bucket=bucket_name)
+        client.head_bucket(Bucket=bucket_name)
     except ClientError as exc:
         if exc.response['Error']['Code'] == '404':
             LOGGER.info("%s S3 bucket appears to have already been deleted...",
@@ -59,6 +303,10 @@ def purge_bucket(context, provider, **kwargs):
             return True
         raise
 
-    bucket = s3_resource.Bucket(bucket_name)
-    bucket.object_versions.delete()
+    if kwargs.get('lifecycle_expiration'):
+        expire_bucket(client, bucket_name)
+    else:
+        BucketPurger(client, bucket_name,
+                     max_concurrency=int(kwargs.get('max_concurrency',
+                                                    10))).purge()
     return True
@@ -10,12 +10,11 @@ from typing import Any, Dict, Optional  # pylint: disable=unused-import
 
 from runway.cfngin.providers.base import BaseProvider  # pylint: disable=unused-import
 from runway.cfngin.context import Context  # noqa pylint: disable=unused-import
-from runway.cfngin.session_cache import get_session
 
 LOGGER = logging.getLogger(__name__)
 
 
-def get(context,  # pylint: disable=unused-argument
+def get(context,
         provider,
         **kwargs
        ):  # noqa: E124
@@ -38,9 +37,9 @@ def get(context,  # pylint: disable=unused-argument
         user_pool_id (str): The ID of the User Pool to check for a client
         stack_name (str) The name of the stack to check against
     """
-    session = get_session(provider.region)
-    cloudformation_client = session.client('cloudformation')
-    cognito_client = session.client('cognito-idp')
+    cloudformation_client = context.get_client('cloudformation',
+                                               region=provider.region)
+    cognito_client = context.get_client('cognito-idp', region=provider.region)
 
     context_dict = {}
     context_dict['callback_urls'] = ['https://example.tmp']
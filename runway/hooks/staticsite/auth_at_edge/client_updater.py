@@ -9,12 +9,11 @@ from typing import Any, Dict, Optional  # pylint: disable=unused-import
 
 from runway.cfngin.providers.base import BaseProvider  # pylint: disable=unused-import
 from runway.cfngin.context import Context  # noqa pylint: disable=unused-import
-from runway.cfngin.session_cache import get_session
 
 LOGGER = logging.getLogger(__name__)
 
 
-def update(context,  # pylint: disable=unused-argument
+def update(context,
            provider,
            **kwargs
           ):  # noqa: E124
@@ -38,8 +37,7 @@ def update(context,  # pylint: disable=unused-argument
         oauth_scopes (List[str]): A list of all available validation
             scopes for oauth
     """
-    session = get_session(provider.region)
-    cognito_client = session.client('cognito-idp')
+    cognito_client = context.get_client('cognito-idp', region=provider.region)
 
     # Combine alternate domains with main distribution
     redirect_domains = kwargs['alternate_domains'] + ['https://' + kwargs['distribution_domain']]
@@ -4,7 +4,6 @@ from typing import Any, Dict, Optional, Union  # pylint: disable=unused-import
 
 from runway.cfngin.context import Context  # pylint: disable=unused-import
 from runway.cfngin.providers.base import BaseProvider  # pylint: disable=unused-import
-from runway.cfngin.session_cache import get_session
 
 LOGGER = logging.getLogger(__name__)
 
@@ -30,8 +29,7 @@ def update(context,  # type: Context
         user_pool_id (str): The ID of the Cognito User Pool
         client_id (str): The ID of the Cognito User Pool Client
     """
-    session = get_session(provider.region)
-    cognito_client = session.client('cognito-idp')
+    cognito_client = context.get_client('cognito-idp', region=provider.region)
 
     context_dict = {}
 
@@ -92,8 +90,7 @@ def delete(context,  # type: Context # pylint: disable=unused-import
     Keyword Args:
         client_id (str): The ID of the Cognito User Pool Client
     """
-    session = get_session(provider.region)
-    cognito_client = session.client('cognito-idp')
+    cognito_client = context.get_client('cognito-idp', region=provider.region)
 
     user_pool_id = context.hook_data['aae_user_pool_id_retriever']['id']
     client_id = kwargs['client_id']
@@ -132,7 +132,7 @@ def handler(event, _context):
             'code_challenge': pkce_hash
         }
         login_query_string = urlencode(payload, quote_via=quote_plus)
-        headers = CONFIG.get('cloud_front_headers')
+        headers = dict(CONFIG.get('cloud_front_headers'))
         headers['location'] = [
             {
                 'key': 'location',
@@ -227,22 +227,13 @@ def validate_jwt(jwt_token,
         options={'verify_at_hash': False})
 
 
-def is_rsa_signing_key(key):
-    """Verify if the key specified is an RSA Public Key.
-
-    Keyword Args:
-        key (Dict): The key to filter
-    """
-    return "rsaPublicKey" in key
-
-
 def get_signing_key(jwks_uri, kid):
     """Retrieve the signing keys from the JWKS uri that match the key id specified.
 
+    The signing keys are cached across warm invocations of the function.
+
     Keyword Args:
         jwks_uri (str): The URI in which to retrieve the JWKs
         kid (str): Key ID of the signing key we are looking for
     """
-    client = JwksClient({'jwks_uri': jwks_uri})
-    jwk = client.get_signing_key(kid)
-    return jwk.get('rsaPublicKey') if is_rsa_signing_key(jwk) else jwk.get('publicKey')
+    return JwksClient({'jwks_uri': jwks_uri}).get_cached_public_key(kid)
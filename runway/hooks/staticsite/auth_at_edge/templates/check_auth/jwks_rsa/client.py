@@ -1,11 +1,19 @@
 """Client for handling retrieval of JWKS signing keys."""
 import json
 import logging
+import time
 import urllib
 
 # pylint: disable=relative-beyond-top-level
 from .utils import rsa_public_key_to_pem
 
+JWKS_CACHE_TTL = 3600  # seconds signing keys are reused for
+JWKS_REFRESH_INTERVAL = 30  # min seconds between retrievals for unknown kids
+
+# public keys of the signing keys of each JWKS endpoint, kept across warm
+# invocations of the container
+_SIGNING_KEY_CACHE = {}
+
 
 def is_signing_key(key):
     """Filter to determine if this is a signing key.
@@ -69,6 +77,43 @@ class JwksClient(object):
         except StopIteration:
             raise Exception('Was not able to locate a key with kid %s' % kid)
 
+    def get_cached_public_key(self, kid):
+        """Retrieve the public key of a signing key from the cache.
+
+        The signing keys of the JWKS endpoint are retrieved again once they
+        are older than ``JWKS_CACHE_TTL``, or when the key id is unknown
+        (e.g. the keys were rotated), at most every ``JWKS_REFRESH_INTERVAL``
+        seconds. If they can't be retrieved, the cached keys are used.
+
+        Keyword Args:
+            kid (str): The key id of the signing key
+        """
+        jwks_uri = self.options.get('jwks_uri')
+        cached = _SIGNING_KEY_CACHE.get(jwks_uri)
+        now = time.time()
+        if not cached or now - cached['fetched'] > JWKS_CACHE_TTL or (
+                kid not in cached['keys'] and
+                now - cached['fetched'] > JWKS_REFRESH_INTERVAL):
+            try:
+                cached = {
+                    'fetched': now,
+                    'keys': {
+                        key['kid']: (key['rsaPublicKey'] if 'rsaPublicKey' in key
+                                     else key.get('publicKey'))
+                        for key in self.get_signing_keys()
+                    }
+                }
+                _SIGNING_KEY_CACHE[jwks_uri] = cached
+            # pylint: disable=broad-except
+            except Exception as err:
+                if not cached:
+                    raise
+                self.logger.info('Using cached signing keys: %s', err)
+
+        if kid not in cached['keys']:
+            raise Exception('Was not able to locate a key with kid %s' % kid)
+        return cached['keys'][kid]
+
     def get_signing_keys(self):
         """Given a set of keys find all that are signing keys."""
         keys = self.get_keys()
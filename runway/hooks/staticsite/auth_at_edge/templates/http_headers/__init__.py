@@ -1,5 +1,5 @@
 """Add all configured (CloudFront compatable) headers to origin response."""
-from shared import as_cloud_front_headers, get_config  # pylint: disable=import-error
+from shared import get_config  # pylint: disable=import-error
 
 CONFIG = get_config()
 
@@ -10,9 +10,7 @@ def handler(event, _context):
     Keyword Args:
         event (Any): The Lambda Event
     """
-    headers = CONFIG.get('http_headers')
-    # Format to be CloudFront compatable
-    configured_headers = as_cloud_front_headers(headers)
     response = event['Records'][0]['cf']['response']
-    response['headers'].update(configured_headers)
+    # Configured headers, formatted to be CloudFront compatable
+    response['headers'].update(CONFIG['cloud_front_headers'])
     return response
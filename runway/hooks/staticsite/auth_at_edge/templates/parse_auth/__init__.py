@@ -118,7 +118,7 @@ def handler(event, _context):
         LOGGER.error(err)
         LOGGER.error(traceback.print_exc())
 
-        headers = CONFIG.get('cloud_front_headers')
+        headers = dict(CONFIG.get('cloud_front_headers'))
         headers['content-type'] = [
             {
                 'key': 'Content-Type',
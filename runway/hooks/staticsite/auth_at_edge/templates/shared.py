@@ -17,6 +17,15 @@ LOGGER = logging.getLogger(__name__)
 def get_config():
     """Retrieve the configuration variables for the Auth@Edge suite.
 
+    The configuration is derived once, when the module is imported, and is
+    shared by every invocation of a warm container. It must not be modified.
+    """
+    return CONFIG
+
+
+def _derive_config():
+    """Derive the configuration variables for the Auth@Edge suite.
+
     Lambda@Edge restricts the ability to use environment variables. This configuration
     object is generated with hard coded values via Runway.
     """
@@ -37,7 +46,7 @@ def get_config():
 
     user_pool_region = 'us-east-1'
     region_match = re.match(
-        r"^(\\S+?)_\\S+$",
+        r"^(\S+?)_\S+$",
         config['user_pool_id']
     )
     if region_match:
@@ -67,6 +76,9 @@ def as_cloud_front_headers(headers):
     return res
 
 
+CONFIG = _derive_config()
+
+
 def extract_and_parse_cookies(headers, client_id):
     """Extract and parse the Cognito cookies from the headers.
 
@@ -5,12 +5,11 @@ from typing import Any, Dict, Optional, Union  # pylint: disable=unused-import
 
 from runway.cfngin.context import Context  # pylint: disable=unused-import
 from runway.cfngin.providers.base import BaseProvider  # pylint: disable=unused-import
-from runway.cfngin.session_cache import get_session
 
 LOGGER = logging.getLogger(__name__)
 
 
-def execute(context,  # type: Context # pylint: disable=unused-argument
+def execute(context,  # type: Context
             provider,  # type: BaseProvider
             **kwargs  # type: Optional[Dict[str, Any]]
            ):  # noqa: E124
@@ -35,8 +34,8 @@ def execute(context,  # type: Context # pylint: disable=unused-argument
         state_machine_arn (str): The ARN of the State Machine to execute
         stack_name (str): The name of the Cleanup stack to delete
     """
-    session = get_session(provider.region)
-    step_functions_client = session.client('stepfunctions')
+    step_functions_client = context.get_client('stepfunctions',
+                                               region=provider.region)
 
     try:
         step_functions_client.start_execution(
@@ -0,0 +1,306 @@
+"""Sync a local directory to an S3 bucket."""
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import tempfile
+
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.exceptions import ClientError
+
+from ...util import replace_file
+
+LOGGER = logging.getLogger(__name__)
+
+MAX_DELETE_KEYS = 1000  # max number of keys per DeleteObjects call
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+def file_md5(path):
+    """Calculate the MD5 digest of a file without reading it into memory.
+
+    Args:
+        path (str): Path to the file.
+
+    Returns:
+        str: Hex digest.
+
+    """
+    digest = hashlib.md5()
+    with open(path, 'rb') as file_:
+        for chunk in iter(lambda: file_.read(READ_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SyncPlan(object):
+    """Changes needed to make a bucket match a directory.
+
+    Attributes:
+        deletes (List[str]): Keys of objects to delete.
+        files (Dict[str, Dict[str, Any]]): State of every local file keyed
+            by object key. Used as the manifest once the plan is executed;
+            the ETag of uploaded objects is added when they are uploaded.
+        uploads (List[Tuple[str, str]]): Path and key of files to upload.
+
+    """
+
+    def __init__(self):
+        """Instantiate class."""
+        self.deletes = []
+        self.files = {}
+        self.uploads = []
+
+    @property
+    def upload_bytes(self):
+        """Number of bytes to upload.
+
+        Returns:
+            int
+
+        """
+        return sum(self.files[key]['size'] for _path, key in self.uploads)
+
+    def __bool__(self):
+        """Whether the plan contains any change."""
+        return bool(self.deletes or self.uploads)
+
+    __nonzero__ = __bool__  # python2
+
+
+class S3Sync(object):
+    """Upload new and changed files in a directory to a bucket.
+
+    Like ``aws s3 sync --delete``, files are compared to the objects listed
+    in the bucket and objects without a file are deleted, so objects changed
+    by another sync or outside of Runway are replaced. A manifest of the
+    files uploaded by the last sync from this machine is used to find
+    unchanged files without calculating their MD5 digest: a file is
+    unchanged if its size and modification time match the manifest and the
+    ETag of its object matches the one recorded in the manifest. Otherwise,
+    the MD5 digest of the file is compared to the ETag of the object.
+
+    Files are uploaded using a single transfer manager, so several files
+    are uploaded at once and large files are uploaded in parts as they are
+    read. Objects of deleted files are removed in batches.
+
+    """
+
+    def __init__(self, client, bucket, directory, manifest_path=None,
+                 max_concurrency=10,
+                 multipart_threshold=MULTIPART_THRESHOLD):
+        """Instantiate class.
+
+        Args:
+            client (boto3.client.Client): S3 client.
+            bucket (str): Name of the bucket.
+            directory (str): Directory to sync.
+            manifest_path (Optional[str]): Path of the manifest of the last
+                sync. A manifest is not used if not provided.
+            max_concurrency (int): Max number of concurrent requests.
+            multipart_threshold (int): Size, in bytes, of files that are
+                uploaded in parts.
+
+        """
+        self.bucket = bucket
+        self.client = client
+        self.directory = directory
+        self.manifest_path = manifest_path
+        self.transfer_config = TransferConfig(
+            max_concurrency=max_concurrency,
+            multipart_threshold=multipart_threshold
+        )
+
+    def _local_files(self):
+        """Find the files in the directory.
+
+        Returns:
+            Dict[str, Tuple[str, int, float]]: Path, size, and modification
+            time of each file keyed by object key.
+
+        """
+        files = {}
+        for root, _dirs, filenames in os.walk(self.directory):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                key = os.path.relpath(path, self.directory).replace(os.sep,
+                                                                    '/')
+                stat = os.stat(path)
+                files[key] = (path, stat.st_size, stat.st_mtime)
+        return files
+
+    def _load_manifest(self):
+        """Load the manifest of the last sync.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Size, modification time, MD5 digest,
+            and ETag of each object keyed by object key. Empty if there is
+            no manifest.
+
+        """
+        if not self.manifest_path:
+            return {}
+        try:
+            with open(self.manifest_path) as file_:
+                manifest = json.load(file_)
+        except (IOError, OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _save_manifest(self, files):
+        """Save the manifest of the current sync.
+
+        Failing to save the manifest is logged but is not an error.
+
+        Args:
+            files (Dict[str, Dict[str, Any]]): Manifest to save.
+
+        """
+        if not self.manifest_path:
+            return
+        tmp_path = None
+        try:
+            directory = os.path.dirname(self.manifest_path)
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'w') as file_:
+                json.dump(files, file_)
+            replace_file(tmp_path, self.manifest_path)
+        except (IOError, OSError) as err:
+            LOGGER.debug('unable to save sync manifest %s: %s',
+                         self.manifest_path, err)
+            if tmp_path and os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+
+    def _remote_objects(self):
+        """List the objects in the bucket.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Size and ETag of each object keyed by
+            object key.
+
+        """
+        objects = {}
+        paginator = self.client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket):
+            for obj in page.get('Contents', []):
+                objects[obj['Key']] = {'etag': obj['ETag'].strip('"'),
+                                       'size': obj['Size']}
+        return objects
+
+    def plan(self):
+        """Find the changes needed to make the bucket match the directory.
+
+        Returns:
+            SyncPlan: Changes to make.
+
+        """
+        sync_plan = SyncPlan()
+        manifest = self._load_manifest()
+        remote = self._remote_objects()
+        for key, (path, size, mtime) in sorted(self._local_files().items()):
+            last = manifest.get(key) or {}
+            obj = remote.get(key)
+            if (last.get('md5') and last.get('size') == size and
+                    last.get('mtime') == mtime):
+                state = dict(last)  # the file has not changed
+            else:
+                state = {'md5': file_md5(path), 'mtime': mtime, 'size': size}
+            sync_plan.files[key] = state
+            if obj and obj['size'] == size and (
+                    obj['etag'] == state['md5'] or
+                    (obj['etag'] == last.get('etag') and
+                     last.get('md5') == state['md5'])):
+                # objects uploaded in parts don't have an MD5 ETag so the
+                # ETag recorded when it was uploaded is used
+                state['etag'] = obj['etag']
+            else:
+                state.pop('etag', None)
+                sync_plan.uploads.append((path, key))
+        sync_plan.deletes = sorted(set(remote) - set(sync_plan.files))
+        return sync_plan
+
+    def _upload(self, uploads, files):
+        """Upload files.
+
+        Args:
+            uploads (List[Tuple[str, str]]): Path and key of each file.
+            files (Dict[str, Dict[str, Any]]): State of the files. The ETag
+                of each uploaded object is added.
+
+        """
+        with create_transfer_manager(self.client,
+                                     self.transfer_config) as manager:
+            futures = []
+            for path, key in uploads:
+                extra_args = {}
+                content_type = mimetypes.guess_type(path)[0]
+                if content_type:
+                    extra_args['ContentType'] = content_type
+                LOGGER.debug('uploading %s to s3://%s/%s', path, self.bucket,
+                             key)
+                futures.append(manager.upload(path, self.bucket, key,
+                                              extra_args=extra_args))
+            for future in futures:
+                future.result()
+        for path, key in uploads:
+            if files[key]['size'] < self.transfer_config.multipart_threshold:
+                files[key]['etag'] = files[key]['md5']
+                continue
+            try:  # uploaded in parts; the ETag is not the MD5 digest
+                files[key]['etag'] = self.client.head_object(
+                    Bucket=self.bucket, Key=key
+                )['ETag'].strip('"')
+            except ClientError as err:
+                LOGGER.debug('unable to get the ETag of s3://%s/%s: %s',
+                             self.bucket, key, err)
+
+    def _delete(self, keys):
+        """Delete objects in batches.
+
+        Args:
+            keys (List[str]): Keys of the objects to delete.
+
+        """
+        for i in range(0, len(keys), MAX_DELETE_KEYS):
+            response = self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={'Objects': [{'Key': key} for key in
+                                    keys[i:i + MAX_DELETE_KEYS]],
+                        'Quiet': True}
+            )
+            if response.get('Errors'):
+                raise ValueError('unable to delete objects from bucket %s: %s'
+                                 % (self.bucket, response['Errors']))
+
+    def sync(self, dry_run=False):
+        """Make the bucket match the directory.
+
+        Args:
+            dry_run (bool): Only log the changes that would be made.
+
+        Returns:
+            SyncPlan: Changes made, or that would be made if ``dry_run``.
+
+        """
+        sync_plan = self.plan()
+        LOGGER.info('%s %s object(s) (%s bytes) to and %s %s object(s) from '
+                    's3://%s/', 'would upload' if dry_run else 'uploading',
+                    len(sync_plan.uploads), sync_plan.upload_bytes,
+                    'would delete' if dry_run else 'deleting',
+                    len(sync_plan.deletes), self.bucket)
+        if dry_run:
+            for _path, key in sync_plan.uploads:
+                LOGGER.info('(dryrun) upload: %s', key)
+            for key in sync_plan.deletes:
+                LOGGER.info('(dryrun) delete: %s', key)
+            return sync_plan
+        if sync_plan.uploads:
+            self._upload(sync_plan.uploads, sync_plan.files)
+        if sync_plan.deletes:
+            self._delete(sync_plan.deletes)
+        self._save_manifest(sync_plan.files)
+        return sync_plan
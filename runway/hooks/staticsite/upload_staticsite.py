@@ -1,12 +1,13 @@
 """CFNgin hook for syncing static website to S3 bucket."""
 # TODO move to runway.cfngin.hooks on next major release
 import logging
+import os
 import time
 from operator import itemgetter
 
 from ...cfngin.lookups.handlers.output import OutputLookup
 from ...cfngin.session_cache import get_session
-from ...commands.runway.run_aws import aws_cli
+from .sync import S3Sync
 
 LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +41,9 @@ def sync(context, provider, **kwargs):
             instance.
         provider (:class:`runway.cfngin.providers.base.BaseProvider`):
             The provider instance.
+        dry_run (bool): Only log the objects that would be uploaded and
+            deleted.
+        max_concurrency (int): Max number of concurrent S3 requests.
 
     """
     session = get_session(provider.region)
@@ -53,14 +57,21 @@ def sync(context, provider, **kwargs):
         if kwargs.get('cf_disabled', '') == 'true':
             display_static_website_url(kwargs.get('website_url'), provider, context)
     else:
-        # Using the awscli for s3 syncing is incredibly suboptimal, but on
-        # balance it's probably the most stable/efficient option for syncing
-        # the files until https://github.com/boto/boto3/issues/358 is resolved
-        aws_cli(['s3',
-                 'sync',
-                 context.hook_data['staticsite']['app_directory'],
-                 "s3://%s/" % bucket_name,
-                 '--delete'])
+        S3Sync(
+            context.get_client('s3', region=provider.region),
+            bucket_name,
+            context.hook_data['staticsite']['app_directory'],
+            manifest_path=os.path.join(
+                context.config.cfngin_cache_dir or
+                os.path.expanduser('~/.runway_cache'),
+                'staticsite', bucket_name + '.json'
+            ),
+            max_concurrency=int(kwargs.get('max_concurrency', 10))
+        ).sync(dry_run=kwargs.get('dry_run', False))
+        if kwargs.get('dry_run', False):
+            LOGGER.info('staticsite: dry run complete; skipping '
+                        'invalidation and hash tracking')
+            return True
 
         if kwargs.get('cf_disabled', False):
             display_static_website_url(kwargs.get('website_url'), provider, context)
@@ -1,12 +1,11 @@
 """Utility functions for website build/upload."""
 
-import hashlib
 import logging
 import os
 
 import zgitignore
 
-from ...util import change_dir
+from ...util import change_dir, md5_of_files
 
 LOGGER = logging.getLogger(__name__)
 
@@ -25,18 +24,7 @@ def calculate_hash_of_files(files, root):
         str: A hash of the hashes of the given files.
 
     """
-    file_hash = hashlib.md5()
-    for fname in sorted(files):
-        fileobj = os.path.join(root, fname)
-        file_hash.update((fname + "\0").encode())
-        with open(fileobj, "rb") as filedes:
-            for chunk in iter(lambda: filedes.read(4096), ""):  # noqa pylint: disable=cell-var-from-loop
-                if not chunk:
-                    break
-                file_hash.update(chunk)
-            file_hash.update("\0".encode())
-
-    return file_hash.hexdigest()
+    return md5_of_files(files, root)
 
 
 def get_hash_of_files(root_path, directories=None):
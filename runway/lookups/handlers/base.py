@@ -90,11 +90,10 @@ import logging
 # python2 supported pylint is unable to load this when in a venv
 from distutils.util import strtobool  # pylint: disable=E
 from typing import (TYPE_CHECKING, Any, Dict,  # noqa: F401 pylint: disable=W
-                    Optional, Tuple, Union)
+                    List, Optional, Tuple, Union)
 
 import yaml
 from six import string_types
-from troposphere import BaseAWSObject
 
 from runway.cfngin.util import read_value_from_path
 from runway.util import MutableMap
@@ -110,6 +109,10 @@ LOGGER = logging.getLogger(__name__)
 class LookupHandler(object):
     """Base class for lookup handlers."""
 
+    #: Max number of lookups of the handler resolved at the same time.
+    #: ``None`` only limits them to the number of lookups resolved at once.
+    max_concurrency = None  # type: Optional[int]
+
     @classmethod
     def dependencies(cls, _lookup_data):
         """Calculate any dependencies required to perform this lookup.
@@ -190,6 +193,24 @@ class LookupHandler(object):
         """
         raise NotImplementedError
 
+    @classmethod
+    def prefetch(cls, values, context, **kwargs):
+        # type: (List[str], 'Context', Any) -> None
+        """Retrieve the data needed by multiple lookups before they are handled.
+
+        Called once with the values of every lookup of this type that can be
+        resolved without resolving another lookup first. Lookups that can
+        retrieve data in batches should override this method and store the
+        data on the context for :meth:`handle` to use. By default, nothing is
+        done.
+
+        Args:
+            values: Parameter(s) given to each lookup.
+            context: The current context object.
+            provider: Optional provider to use when retrieving data.
+
+        """
+
     @classmethod
     def parse(cls, value):
         # type: (str) -> Tuple[str, Dict[str, str]]
@@ -293,6 +314,9 @@ class LookupHandler(object):
             MutableMap
 
         """
+        # troposphere is only imported when used to keep start-up fast
+        from troposphere import BaseAWSObject  # noqa pylint: disable=import-outside-toplevel
+
         if not isinstance(value, BaseAWSObject):
             raise TypeError('value of type "%s" must of type "troposphere.'
                             'BaseAWSObject" to use the "load=troposphere" '
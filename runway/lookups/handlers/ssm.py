@@ -8,6 +8,13 @@ Parameters of type ``SecureString`` are automatically decrypted.
 
 Parameters of type ``StringList`` are returned as a list.
 
+Before variables are resolved, the parameters used by all ``ssm`` Lookups of a
+config are retrieved in batches of 10 per region using ``GetParameters`` and
+cached until a stack or module completes, since it may have created or updated
+a parameter used by the stacks or modules after it. Parameters that are not
+cached (e.g. ``ssm:GetParameters`` is not allowed) are retrieved individually
+when the Lookup is resolved.
+
 
 .. rubric:: Arguments
 
@@ -31,7 +38,11 @@ This Lookup supports all :ref:`Common Lookup Arguments`.
 """
 # pylint: disable=arguments-differ
 import logging
-from typing import TYPE_CHECKING, Any, Union  # pylint: disable=unused-import
+import threading
+from typing import (TYPE_CHECKING, Any, Dict,  # noqa: F401 pylint: disable=W
+                    Iterable, List, Optional, Tuple, Union)
+
+from botocore.exceptions import ClientError
 
 # using absolute for runway imports so stacker shim doesn't break when used from CFNgin
 from runway.lookups.handlers.base import LookupHandler
@@ -46,9 +57,172 @@ LOGGER = logging.getLogger(__name__)
 TYPE_NAME = 'ssm'
 
 
+class SsmParameterCache(object):
+    """Thread-safe cache of SSM parameters.
+
+    Parameters are keyed by the access key used to retrieve them, region, and
+    name. Parameters that do not exist are cached as ``None``. Copies of a
+    context share the cache of the context they were copied from.
+
+    The cache is cleared each time a stack or module completes since it may
+    have written parameters. Parameters retrieved before the cache was
+    cleared are not cached.
+
+    Attributes:
+        api_calls (int): Number of ``GetParameters`` calls made by the cache.
+
+    """
+
+    MAX_NAMES = 10  # max number of names per GetParameters call
+
+    def __init__(self):
+        # type: () -> None
+        """Instantiate class."""
+        self.api_calls = 0
+        self._generation = 0  # incremented each time the cache is cleared
+        self._lock = threading.Lock()
+        # (access key, region, name) -> parameter
+        self._parameters = {}  # type: Dict[Tuple[Any, ...], Optional[Dict[str, Any]]]
+
+    @property
+    def generation(self):
+        # type: () -> int
+        """Number of times the cache has been cleared."""
+        with self._lock:
+            return self._generation
+
+    def clear(self):
+        # type: () -> None
+        """Remove all cached parameters."""
+        with self._lock:
+            self._parameters.clear()
+            self._generation += 1
+
+    def get(self, region, name, access_key=None):
+        # type: (str, str, Optional[str]) -> Optional[Dict[str, Any]]
+        """Get a cached parameter.
+
+        Args:
+            region: Region of the parameter.
+            name: Name of the parameter.
+            access_key: AWS Access Key ID used to retrieve the parameter.
+
+        Returns:
+            Parameter data from SSM or ``None`` if the parameter does not
+            exist.
+
+        Raises:
+            KeyError: The parameter is not cached.
+
+        """
+        with self._lock:
+            return self._parameters[(access_key, region, name)]
+
+    def set(self, region, name, parameter, access_key=None,
+            generation=None):
+        # type: (str, str, Optional[Dict[str, Any]], Optional[str], Optional[int]) -> None
+        """Cache a parameter.
+
+        Args:
+            region: Region of the parameter.
+            name: Name of the parameter.
+            parameter: Parameter data from SSM or ``None`` if the parameter
+                does not exist.
+            access_key: AWS Access Key ID used to retrieve the parameter.
+            generation: :attr:`generation` of the cache when the parameter
+                was retrieved. The parameter is not cached if the cache has
+                been cleared since.
+
+        """
+        with self._lock:
+            if generation is None or generation == self._generation:
+                self._parameters[(access_key, region, name)] = parameter
+
+    def prefetch(self, client, region, names, access_key=None):
+        # type: (Any, str, Iterable[str], Optional[str]) -> None
+        """Retrieve parameters that are not cached using ``GetParameters``.
+
+        Names containing a version, label, or ARN are skipped since they are
+        not returned as requested.
+
+        Args:
+            client: SSM client for the region.
+            region: Region of the parameters.
+            names: Names of the parameters.
+            access_key: AWS Access Key ID used by the client.
+
+        """
+        with self._lock:
+            generation = self._generation
+            names = sorted(set(
+                name for name in names
+                if ':' not in name and
+                (access_key, region, name) not in self._parameters
+            ))
+        for i in range(0, len(names), self.MAX_NAMES):
+            batch = names[i:i + self.MAX_NAMES]
+            try:
+                response = client.get_parameters(Names=batch,
+                                                 WithDecryption=True)
+            except ClientError as err:
+                LOGGER.debug('unable to retrieve SSM parameters in batches; '
+                             'they will be retrieved individually: %s', err)
+                return
+            with self._lock:
+                self.api_calls += 1
+                if generation != self._generation:
+                    return  # cleared while retrieving; may be out of date
+                for parameter in response.get('Parameters', []):
+                    self._parameters[(access_key, region,
+                                      parameter['Name'])] = parameter
+                for name in response.get('InvalidParameters', []):
+                    self._parameters[(access_key, region, name)] = None
+        LOGGER.debug('retrieved %s SSM parameter(s) from %s', len(names),
+                     region)
+
+    def __getstate__(self):
+        # type: () -> Dict[str, Any]
+        """Return the state of the object when pickled."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        # type: (Dict[str, Any]) -> None
+        """Restore the state of the object when unpickled."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        # type: (Dict[int, Any]) -> SsmParameterCache
+        """Share the cache with copies of the object that owns it."""
+        return self
+
+
 class SsmLookup(LookupHandler):
     """SSM Parameter Store Lookup."""
 
+    @classmethod
+    def prefetch(cls, values, context, **_):
+        # type: (List[str], Union['CFNginContext', 'RunwayContext'], Any) -> None
+        """Retrieve the parameters of multiple Lookups in batches.
+
+        Args:
+            values: The values passed to the Lookups.
+            context: The current context object.
+
+        """
+        names = {}  # type: Dict[Optional[str], List[str]]
+        for value in values:
+            query, args = cls.parse(value)
+            names.setdefault(args.get('region'), []).append(query)
+        for region, queries in names.items():
+            client = context.get_client('ssm', region=region)
+            context.ssm_cache.prefetch(
+                client, client.meta.region_name, queries,
+                context.boto3_credentials.get('aws_access_key_id')
+            )
+
     @classmethod
     def handle(cls, value, context, **_):
         # type: (str, Union['CFNginContext', 'RunwayContext'], Any) -> Any
@@ -65,14 +239,13 @@ class SsmLookup(LookupHandler):
         """
         query, args = cls.parse(value)
 
-        session = context.get_session(region=args.get('region'))
-        client = session.client('ssm')
+        client = context.get_client('ssm', region=args.get('region'))
 
         try:
-            response = client.get_parameter(
-                Name=query,
-                WithDecryption=True
-            )['Parameter']
+            response = cls._get_parameter(
+                client, context.ssm_cache, client.meta.region_name, query,
+                context.boto3_credentials.get('aws_access_key_id')
+            )
             return cls.format_results(response['Value'].split(',')
                                       if response['Type'] == 'StringList'
                                       else response['Value'], **args)
@@ -81,3 +254,42 @@ class SsmLookup(LookupHandler):
                 args.pop('load', None)  # don't load a default value
                 return cls.format_results(args.pop('default'), **args)
             raise
+
+    @staticmethod
+    def _get_parameter(client, cache, region, name, access_key=None):
+        # type: (Any, SsmParameterCache, str, str, Optional[str]) -> Dict[str, Any]
+        """Get a parameter from the cache, retrieving it if it is not cached.
+
+        Args:
+            client: SSM client for the region.
+            cache: Cache of SSM parameters.
+            region: Region of the parameter.
+            name: Name of the parameter.
+            access_key: AWS Access Key ID used by the client.
+
+        Returns:
+            Parameter data from SSM.
+
+        Raises:
+            ParameterNotFound: The parameter does not exist.
+
+        """
+        try:
+            parameter = cache.get(region, name, access_key)
+        except KeyError:
+            generation = cache.generation
+            try:
+                parameter = client.get_parameter(
+                    Name=name,
+                    WithDecryption=True
+                )['Parameter']
+            except client.exceptions.ParameterNotFound:
+                parameter = None
+            cache.set(region, name, parameter, access_key, generation)
+        if parameter is None:
+            raise client.exceptions.ParameterNotFound(
+                {'Error': {'Code': 'ParameterNotFound',
+                           'Message': 'Parameter %s not found.' % name}},
+                'GetParameter'
+            )
+        return parameter
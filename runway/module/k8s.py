@@ -44,6 +44,39 @@ def get_overlay_dir(overlays_path, environment, region):
     return overlay_dir  # fallback to last dir
 
 
+def get_kb_env_manager(context, path, options):
+    """Determine how the version of kubectl used by a module is selected.
+
+    Args:
+        context (runway.context.Context): Runway context object.
+        path (str): Path to the module.
+        options (Dict[str, Any]): Options of the module.
+
+    Returns:
+        Optional[Tuple[KBEnvManager, Optional[str]]]: Environment manager
+        and the version requested by the module options. ``None`` if
+        ``kubectl`` from the PATH should be used.
+
+    """
+    module_defined_k8s_ver = get_module_defined_k8s_ver(
+        options.get('kubectl_version', {}),
+        context.env_name
+    )
+    if module_defined_k8s_ver:
+        return KBEnvManager(path), module_defined_k8s_ver
+    kustomize_config_path = os.path.join(
+        path,
+        'overlays',
+        get_overlay_dir(os.path.join(path, 'overlays'),
+                        context.env_name,
+                        context.env_region)
+    )
+    for version_path in [kustomize_config_path, path, context.env_root]:
+        if os.path.isfile(os.path.join(version_path, '.kubectl-version')):
+            return KBEnvManager(version_path), None
+    return None
+
+
 def generate_response(overlay_path, module_path, environment, region):
     """Determine if environment is defined."""
     configfile = os.path.join(overlay_path, 'kustomization.yaml')
@@ -79,21 +112,10 @@ class K8s(RunwayModule):
         if response['skipped_configs']:
             return response
 
-        module_defined_k8s_ver = get_module_defined_k8s_ver(
-            self.options.get('options', {}).get('kubectl_version', {}),
-            self.context.env_name
-        )
-        if module_defined_k8s_ver:
-            k8s_bin = KBEnvManager(self.path).install(module_defined_k8s_ver)
-        elif os.path.isfile(os.path.join(kustomize_config_path,
-                                         '.kubectl-version')):
-            k8s_bin = KBEnvManager(kustomize_config_path).install()
-        elif os.path.isfile(os.path.join(self.path,
-                                         '.kubectl-version')):
-            k8s_bin = KBEnvManager(self.path).install()
-        elif os.path.isfile(os.path.join(self.context.env_root,
-                                         '.kubectl-version')):
-            k8s_bin = KBEnvManager(self.context.env_root).install()
+        kb_env = get_kb_env_manager(self.context, self.path,
+                                    self.options.get('options', {}))
+        if kb_env:
+            k8s_bin = kb_env[0].install(kb_env[1])
         else:
             if not which('kubectl'):
                 LOGGER.error('kubectl not available (a '
@@ -2,6 +2,9 @@
 from __future__ import print_function
 
 import argparse
+import copy
+import hashlib
+import json
 import logging
 import os
 import re
@@ -22,6 +25,22 @@ from . import (ModuleOptions, RunwayModuleNpm, format_npm_command_for_logging,
                generate_node_command, run_module_command)
 
 LOGGER = logging.getLogger('runway')
+SLS_PRINT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.runway_cache',
+                                   'sls_print')
+# variable sources that are resolved from files, options, and env vars only
+SLS_STATIC_SOURCES = ['env', 'file', 'opt', 'self', 'sls']
+SLS_VARIABLE_REGEX = re.compile(r'\$\{\s*([a-zA-Z][\w.-]*)\s*[:(]')
+SLS_ENV_VARIABLE_REGEX = re.compile(r'\$\{\s*env:\s*([^\s,}]+)')
+SLS_FILE_VARIABLE_REGEX = re.compile(r'\$\{\s*file\(\s*([^)]+?)\s*\)')
+# files referenced by the file variable source that can be hashed
+SLS_STATIC_FILE_EXTENSIONS = ('.json', '.yaml', '.yml')
+
+# environment variables identifying the credentials used to resolve remote
+# variables (e.g. ${ssm:...})
+SLS_CREDENTIAL_ENV_VARS = ('AWS_ACCESS_KEY_ID', 'AWS_PROFILE')
+
+# output of sls print keyed by the hash of its inputs; reused within a run
+_SLS_PRINT_CACHE = {}
 
 
 def gen_sls_config_files(stage, region):
@@ -43,6 +62,180 @@ def gen_sls_config_files(stage, region):
     return names
 
 
+def get_sls_print_key(sls_opts, env_vars, path):
+    """Get the key of the output of ``sls print`` in the cache.
+
+    The key is a hash of the CLI args, the Serverless config file, the
+    config and code files in the top level and ``env`` directory of the
+    module (e.g. env config files, ``package.json``), the JSON/YAML files
+    referenced by ``${file(...)}`` variables, and the environment variables
+    referenced by the config files.
+
+    Args:
+        sls_opts (List[str]): Args passed to ``sls print``.
+        env_vars (Dict[str, str]): Environment variables.
+        path (str): Path to the module.
+
+    Returns:
+        Tuple[str, bool]: Key and whether the output only depends on the
+        files, args, and environment variables of the key, in which case it
+        can be reused in later runs.
+
+    """
+    sls_opts = list(sls_opts)
+    config_name = 'serverless.yml'
+    for index, arg in enumerate(sls_opts[:-1]):
+        if arg in ('--config', '-c'):
+            config_name = sls_opts[index + 1]
+            # temporary configs have a unique name; only the content matters
+            sls_opts[index + 1] = None
+
+    files = {}
+    for directory in [path, os.path.join(path, 'env')]:
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            file_path = os.path.join(directory, name)
+            if name.endswith(('.js', '.json', '.ts', '.yaml', '.yml')) and \
+                    not name.endswith('.tmp.serverless.yml') and \
+                    os.path.isfile(file_path):
+                with open(file_path, 'rb') as stream:
+                    files[os.path.relpath(file_path, path)] = stream.read()
+    if os.path.isfile(os.path.join(path, config_name)):
+        with open(os.path.join(path, config_name), 'rb') as stream:
+            files['<config>'] = stream.read()
+
+    # variables are only found in config files, not in function code
+    content = b'\n'.join(
+        files[name] for name in files if not name.endswith(('.js', '.ts'))
+    ).decode('utf-8', 'replace')
+    referenced, static_files = _read_sls_file_references(content, path)
+    for name in referenced:
+        files.setdefault(name, referenced[name])
+    content += b'\n'.join(referenced.values()).decode('utf-8', 'replace')
+    env_names = sorted(set(SLS_ENV_VARIABLE_REGEX.findall(content)))
+    digest = hashlib.sha256(json.dumps([
+        sls_opts, [(name, env_vars.get(name)) for name in env_names]
+    ]).encode())
+    for name in sorted(files):
+        digest.update(name.encode('utf-8') + b'\0' + files[name] + b'\0')
+
+    reusable = static_files and not config_name.endswith(('.js', '.ts')) and all(
+        source in SLS_STATIC_SOURCES
+        for source in SLS_VARIABLE_REGEX.findall(content)
+    )
+    return digest.hexdigest(), reusable
+
+
+def _read_sls_file_references(content, path):
+    """Read the files referenced by ``${file(...)}`` variables.
+
+    Files referenced by the files read are also read. A reference with a
+    variable in its file name (e.g. ``env/${opt:stage}.yml``) reads every
+    file of the directory with the same extension.
+
+    Args:
+        content (str): Content of the Serverless config files.
+        path (str): Path to the module.
+
+    Returns:
+        Tuple[Dict[str, bytes], bool]: Content of the files read by path
+        relative to the module and whether every reference is to a
+        JSON/YAML file that could be read. Other files (e.g. ``.js``) can
+        resolve values remotely.
+
+    """
+    files = {}
+    static = True
+    pending = [content]
+    while pending:
+        for ref in SLS_FILE_VARIABLE_REGEX.findall(pending.pop()):
+            directory, name = os.path.split(ref)
+            if '${' in directory or \
+                    not name.endswith(SLS_STATIC_FILE_EXTENSIONS):
+                static = False
+                continue
+            directory = os.path.normpath(os.path.join(path, directory))
+            if '${' not in name:
+                names = [name]
+            elif os.path.isdir(directory):
+                suffix = os.path.splitext(name)[1]
+                names = [i for i in sorted(os.listdir(directory))
+                         if i.endswith(suffix)]
+            else:
+                names = []
+            for i in names:
+                file_path = os.path.join(directory, i)
+                rel_path = os.path.relpath(file_path, path)
+                if rel_path in files:
+                    continue
+                if not os.path.isfile(file_path):
+                    files[rel_path] = b'<missing>'
+                    continue
+                with open(file_path, 'rb') as stream:
+                    files[rel_path] = stream.read()
+                pending.append(files[rel_path].decode('utf-8', 'replace'))
+    return files, static
+
+
+def cached_sls_print(cmd, sls_opts, env_vars, path):
+    """Run ``sls print`` unless its output is cached.
+
+    Output is cached for the rest of the run. It is also saved in
+    ``SLS_PRINT_CACHE_DIR`` for later runs if the config does not use
+    variables that are resolved remotely (e.g. ``${ssm:...}``). Otherwise,
+    it is only reused with the same credentials since they determine the
+    account the variables are resolved from.
+
+    Args:
+        cmd (List[str]): Command to run.
+        sls_opts (List[str]): Args passed to ``sls print``.
+        env_vars (Dict[str, str]): Environment variables.
+        path (str): Path to the module.
+
+    Returns:
+        Dict[str, Any]: Resolved Serverless config file. A copy is returned
+        each time so it can be modified.
+
+    """
+    key, reusable = get_sls_print_key(sls_opts, env_vars, str(path))
+    if not reusable:
+        key = hashlib.sha256(json.dumps(
+            [key] + [env_vars.get(name) for name in SLS_CREDENTIAL_ENV_VARS]
+        ).encode()).hexdigest()
+    if key in _SLS_PRINT_CACHE:
+        LOGGER.debug('using cached sls print output %s', key)
+        return copy.deepcopy(_SLS_PRINT_CACHE[key])
+    cache_path = os.path.join(SLS_PRINT_CACHE_DIR, key + '.json')
+    if reusable and os.path.isfile(cache_path):
+        try:
+            with open(cache_path) as stream:
+                _SLS_PRINT_CACHE[key] = json.load(stream)
+            LOGGER.debug('using sls print output cached in %s', cache_path)
+            return copy.deepcopy(_SLS_PRINT_CACHE[key])
+        except (IOError, OSError, ValueError) as err:
+            LOGGER.debug('unable to read %s: %s', cache_path, err)
+
+    result = yaml.safe_load(subprocess.check_output(cmd, env=env_vars))
+    _SLS_PRINT_CACHE[key] = result
+    if reusable:
+        tmp_path = cache_path + '.' + uuid.uuid4().hex
+        try:
+            if not os.path.isdir(SLS_PRINT_CACHE_DIR):
+                os.makedirs(SLS_PRINT_CACHE_DIR)
+            # the output can contain the values of environment variables
+            with os.fdopen(os.open(tmp_path,
+                                   os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                                   0o600), 'w') as stream:
+                json.dump(result, stream)
+            os.rename(tmp_path, cache_path)
+        except (IOError, OSError, TypeError) as err:
+            LOGGER.debug('unable to cache sls print output: %s', err)
+            if os.path.isfile(tmp_path):
+                os.remove(tmp_path)
+    return copy.deepcopy(result)
+
+
 def run_sls_print(sls_opts, env_vars, path):
     """Run sls print command."""
     sls_info_opts = list(sls_opts)
@@ -51,8 +244,7 @@ def run_sls_print(sls_opts, env_vars, path):
     sls_info_cmd = generate_node_command(command='sls',
                                          command_opts=sls_info_opts,
                                          path=path)
-    return yaml.safe_load(subprocess.check_output(sls_info_cmd,
-                                                  env=env_vars))
+    return cached_sls_print(sls_info_cmd, sls_info_opts, env_vars, path)
 
 
 def get_src_hash(sls_config, path):
@@ -291,7 +483,9 @@ class Serverless(RunwayModuleNpm):
                 Serverless command. (*default:* ``False``)
 
         Returns:
-            Dict[str, Any]: Resolved Serverless config file.
+            Dict[str, Any]: Resolved Serverless config file. The output of a
+            previous call is reused while the config is unchanged (see
+            :func:`cached_sls_print`).
 
         Raises:
             SystemExit: If a runway-tmp.serverless.yml file already exists.
@@ -303,10 +497,11 @@ class Serverless(RunwayModuleNpm):
         args = ['--format', 'yaml']
         if item_path:
             args.extend(['--path', item_path])
-        return yaml.safe_load(subprocess.check_output(
-            self.gen_cmd('print', args_list=args),
-            env=self.context.env_vars
-        ))
+        return cached_sls_print(self.gen_cmd('print', args_list=args),
+                                ['print'] + self.cli_args +
+                                self.options.args + args,
+                                self.context.env_vars,
+                                self.path)
 
     def sls_remove(self, skip_install=False):
         """Execute ``sls remove`` command.
@@ -5,6 +5,7 @@ import os
 import sys
 import tempfile
 import warnings
+from distutils.util import strtobool  # pylint: disable=E
 
 from typing import Any, Dict, List, Union  # pylint: disable=unused-import
 
@@ -211,6 +212,9 @@ class StaticSite(RunwayModule):
                            'bucket_output_lookup': '%s::BucketName' % self.name,
                            'website_url': '%s::BucketWebsiteURL' % self.name,
                            'cf_disabled': site_stack_variables['DisableCloudFront'],
+                           'dry_run': bool(strtobool(str(self.parameters.get(
+                               'staticsite_sync_dry_run', False
+                           )))),
                            'distributionid_output_lookup': '%s::CFDistributionId' % (self.name),
                            'distributiondomain_output_lookup': '%s::CFDistributionDomainName' % self.name}}]  # noqa pylint: disable=line-too-long
 
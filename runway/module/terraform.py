@@ -1,5 +1,8 @@
 """Terraform module."""
 import copy
+import errno
+import glob
+import hashlib
 import json
 import logging
 import os
@@ -17,7 +20,12 @@ from ..util import cached_property, change_dir, find_cfn_output, which
 from . import ModuleOptions, RunwayModule, run_module_command
 
 FAILED_INIT_FILENAME = '.init_failed'
+INIT_BLOCK_REGEX = re.compile(r'^\s*(module|provider|terraform)\b[^{\n]*\{',
+                              re.M)
+INIT_FINGERPRINT_FILENAME = '.runway_init_fingerprint'
 LOGGER = logging.getLogger('runway')
+TF_PLUGIN_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.runway_cache',
+                                   'terraform_plugins')
 
 
 def gen_workspace_tfvars_files(environment, region):
@@ -38,6 +46,158 @@ def get_workspace_tfvars_file(path, environment, region):
     return "%s.tfvars" % environment  # fallback to generic name
 
 
+def get_tf_env_manager(context, path, version=None):
+    """Determine how the version of Terraform used by a module is selected.
+
+    Args:
+        context (runway.context.Context): Runway context object.
+        path (str): Path to the module.
+        version (Optional[str]): Version from the module options.
+
+    Returns:
+        Optional[Tuple[TFEnvManager, Optional[str]]]: Environment manager
+        and the version requested by the module options. ``None`` if
+        ``terraform`` from the PATH should be used.
+
+    """
+    if version:
+        return TFEnvManager(path), version
+    for version_path in [path, context.env_root]:
+        if os.path.isfile(os.path.join(version_path, '.terraform-version')):
+            return TFEnvManager(version_path), None
+    return None
+
+
+def get_current_workspace(module_path, env_vars=None):
+    """Get the current Terraform workspace without running Terraform.
+
+    Args:
+        module_path (str): Path to the module.
+        env_vars (Optional[Dict[str, str]]): Environment variables that will
+            be passed to Terraform.
+
+    Returns:
+        str: Name of the workspace.
+
+    """
+    if env_vars and env_vars.get('TF_WORKSPACE'):
+        return env_vars['TF_WORKSPACE']
+    try:
+        with open(os.path.join(module_path, '.terraform',
+                               'environment')) as stream:
+            return stream.read().strip() or 'default'
+    except (IOError, OSError):
+        return 'default'
+
+
+def _find_init_blocks(content):
+    """Find the blocks of a Terraform file that are used by init.
+
+    Args:
+        content (str): Contents of a ``.tf`` file.
+
+    Returns:
+        List[str]: ``module``, ``provider``, and ``terraform`` blocks.
+
+    """
+    blocks = []
+    for match in INIT_BLOCK_REGEX.finditer(content):
+        depth = 0
+        for index in range(match.end() - 1, len(content)):
+            if content[index] == '{':
+                depth += 1
+            elif content[index] == '}':
+                depth -= 1
+                if not depth:
+                    blocks.append(content[match.start():index + 1])
+                    break
+        else:
+            blocks.append(content[match.start():])
+    return blocks
+
+
+def get_init_fingerprint(tf_bin, module_path, module_options):
+    """Calculate a fingerprint of everything used by Terraform init.
+
+    This includes the Terraform binary, init arguments, backend config,
+    dependency lock file, and the ``module``, ``provider``, and
+    ``terraform`` blocks of the module.
+
+    Args:
+        tf_bin (str): Path to the Terraform binary.
+        module_path (str): Path to the module.
+        module_options (TerraformOptions): Options of the module.
+
+    Returns:
+        str: Hex digest.
+
+    """
+    backend = module_options.backend_config
+    digest = hashlib.sha256(json.dumps([
+        tf_bin, module_options.args['init'], backend.init_args,
+        backend.filename
+    ]).encode())
+    filenames = [backend.filename, '.terraform.lock.hcl']
+    filenames.extend(sorted(
+        os.path.basename(path) for path in
+        glob.glob(os.path.join(module_path, '*.tf')) +
+        glob.glob(os.path.join(module_path, '*.tf.json'))
+    ))
+    for filename in filenames:
+        path = os.path.join(module_path, filename or '')
+        if not filename or not os.path.isfile(path):
+            continue
+        with open(path, 'rb') as stream:
+            content = stream.read()
+        if filename.endswith('.tf'):
+            content = '\n'.join(_find_init_blocks(
+                content.decode('utf-8', 'replace')
+            )).encode('utf-8')
+        elif filename.endswith('.tf.json'):
+            try:
+                data = json.loads(content.decode('utf-8'))
+                content = json.dumps([data.get(key) for key in
+                                      ('module', 'provider', 'terraform')],
+                                     sort_keys=True).encode('utf-8')
+            except (AttributeError, ValueError):
+                pass  # use the whole file if it can't be parsed
+        digest.update(filename.encode('utf-8') + b'\0' + content + b'\0')
+    return digest.hexdigest()
+
+
+def read_init_fingerprint(module_path):
+    """Read the fingerprint of the last successful init of a module.
+
+    Args:
+        module_path (str): Path to the module.
+
+    Returns:
+        Optional[str]: Hex digest.
+
+    """
+    try:
+        with open(os.path.join(module_path, '.terraform',
+                               INIT_FINGERPRINT_FILENAME)) as stream:
+            return stream.read().strip()
+    except (IOError, OSError):
+        return None
+
+
+def write_init_fingerprint(module_path, fingerprint):
+    """Write the fingerprint of a successful init of a module.
+
+    Args:
+        module_path (str): Path to the module.
+        fingerprint (str): Hex digest.
+
+    """
+    tf_dir = os.path.join(module_path, '.terraform')
+    if os.path.isdir(tf_dir):
+        with open(os.path.join(tf_dir, INIT_FINGERPRINT_FILENAME),
+                  'w') as stream:
+            stream.write(fingerprint)
+
+
 def run_terraform_init(tf_bin,  # pylint: disable=too-many-arguments
                        module_path, module_options, env_name, env_region,
                        env_vars, no_color=False):
@@ -142,14 +302,10 @@ class Terraform(RunwayModule):
             LOGGER.info("Preparing to run terraform %s on %s...",
                         command,
                         os.path.basename(self.path))
-            if options.version:
-                tf_bin = TFEnvManager(self.path).install(options.version)
-            elif os.path.isfile(os.path.join(self.path,
-                                             '.terraform-version')):
-                tf_bin = TFEnvManager(self.path).install()
-            elif os.path.isfile(os.path.join(self.context.env_root,
-                                             '.terraform-version')):
-                tf_bin = TFEnvManager(self.context.env_root).install()
+            tf_env = get_tf_env_manager(self.context, self.path,
+                                        options.version)
+            if tf_env:
+                tf_bin = tf_env[0].install(tf_env[1])
             else:
                 if not which('terraform'):
                     LOGGER.error('Terraform not available (a '
@@ -161,72 +317,34 @@ class Terraform(RunwayModule):
                     sys.exit(1)
                 tf_bin = 'terraform'
             tf_cmd.insert(0, tf_bin)
+            # share downloaded providers between modules; the plugin cache
+            # is not safe to use concurrently
+            if not (env_vars.get('TF_PLUGIN_CACHE_DIR') or
+                    self.context.is_concurrent_module):
+                try:
+                    os.makedirs(TF_PLUGIN_CACHE_DIR)
+                except OSError as err:
+                    if err.errno != errno.EEXIST:
+                        raise
+                env_vars['TF_PLUGIN_CACHE_DIR'] = TF_PLUGIN_CACHE_DIR
             with change_dir(self.path):
                 if os.path.isfile(os.path.join(self.path, '.terraform', FAILED_INIT_FILENAME)):
                     LOGGER.info('Previous init failed; trashing '
                                 '.terraform directory...')
                     send2trash(os.path.join(self.path, '.terraform'))
 
-                LOGGER.info('Running "terraform init"...')
-                run_terraform_init(
-                    tf_bin=tf_bin,
-                    module_path=self.path,
-                    module_options=options,
-                    env_name=self.context.env_name,
-                    env_region=self.context.env_region,
-                    env_vars=env_vars,
-                    no_color=self.context.no_color
-                )
-
-                LOGGER.debug('Checking current Terraform workspace...')
-                current_tf_workspace = subprocess.check_output(
-                    [tf_bin,
-                     'workspace',
-                     'show'] + (['-no-color']
-                                if self.context.no_color else []),
-                    env=env_vars
-                ).strip().decode()
-                if current_tf_workspace != self.context.env_name:
-                    LOGGER.info("Terraform workspace currently set to %s; "
-                                "switching to %s...",
-                                current_tf_workspace,
-                                self.context.env_name)
-                    LOGGER.debug('Checking available Terraform '
-                                 'workspaces...')
-                    available_tf_envs = subprocess.check_output(
-                        [tf_bin, 'workspace', 'list'] +
-                        (['-no-color'] if self.context.no_color else []),
-                        env=env_vars
-                    ).decode()
-                    if re.compile("^[*\\s]\\s%s$" % self.context.env_name,
-                                  re.M).search(available_tf_envs):
-                        run_module_command(
-                            cmd_list=[tf_bin, 'workspace', 'select',
-                                      self.context.env_name] +
-                            (['-no-color'] if self.context.no_color else []),
-                            env_vars=env_vars
-                        )
-                    else:
-                        LOGGER.info("Terraform workspace %s not found; "
-                                    "creating it...",
-                                    self.context.env_name)
-                        run_module_command(
-                            cmd_list=[tf_bin, 'workspace', 'new',
-                                      self.context.env_name] +
-                            (['-no-color'] if self.context.no_color else []),
-                            env_vars=env_vars
-                        )
-                    LOGGER.info('Re-running terraform init after workspace '
-                                'change...')
-                    run_terraform_init(
-                        tf_bin=tf_bin,
-                        module_path=self.path,
-                        module_options=options,
-                        env_name=self.context.env_name,
-                        env_region=self.context.env_region,
-                        env_vars=env_vars,
-                        no_color=self.context.no_color
-                    )
+                fingerprint = get_init_fingerprint(tf_bin, self.path,
+                                                   options)
+                if (read_init_fingerprint(self.path) == fingerprint and
+                        get_current_workspace(self.path, env_vars) ==
+                        self.context.env_name):
+                    LOGGER.info('Skipping "terraform init"; backend and '
+                                'providers are unchanged')
+                else:
+                    self._init(tf_bin, options, env_vars)
+                    write_init_fingerprint(self.path, fingerprint)
+                # remote modules can change without the config changing
+                # (e.g. a branch ref) so they're always updated
                 LOGGER.info('Executing "terraform get" to update remote '
                             'modules')
                 run_module_command(
@@ -262,6 +380,69 @@ class Terraform(RunwayModule):
                     self.context.env_region)))
         return response
 
+    def _init(self, tf_bin, options, env_vars):
+        """Initialize the module and select the workspace of the environment.
+
+        Args:
+            tf_bin (str): Path to the Terraform binary.
+            options (TerraformOptions): Options of the module.
+            env_vars (Dict[str, str]): Environment variables.
+
+        """
+        LOGGER.info('Running "terraform init"...')
+        run_terraform_init(
+            tf_bin=tf_bin,
+            module_path=self.path,
+            module_options=options,
+            env_name=self.context.env_name,
+            env_region=self.context.env_region,
+            env_vars=env_vars,
+            no_color=self.context.no_color
+        )
+
+        current_tf_workspace = get_current_workspace(self.path, env_vars)
+        if current_tf_workspace != self.context.env_name:
+            LOGGER.info("Terraform workspace currently set to %s; "
+                        "switching to %s...",
+                        current_tf_workspace,
+                        self.context.env_name)
+            LOGGER.debug('Checking available Terraform '
+                         'workspaces...')
+            available_tf_envs = subprocess.check_output(
+                [tf_bin, 'workspace', 'list'] +
+                (['-no-color'] if self.context.no_color else []),
+                env=env_vars
+            ).decode()
+            if re.compile("^[*\\s]\\s%s$" % self.context.env_name,
+                          re.M).search(available_tf_envs):
+                run_module_command(
+                    cmd_list=[tf_bin, 'workspace', 'select',
+                              self.context.env_name] +
+                    (['-no-color'] if self.context.no_color else []),
+                    env_vars=env_vars
+                )
+            else:
+                LOGGER.info("Terraform workspace %s not found; "
+                            "creating it...",
+                            self.context.env_name)
+                run_module_command(
+                    cmd_list=[tf_bin, 'workspace', 'new',
+                              self.context.env_name] +
+                    (['-no-color'] if self.context.no_color else []),
+                    env_vars=env_vars
+                )
+            LOGGER.info('Re-running terraform init after workspace '
+                        'change...')
+            run_terraform_init(
+                tf_bin=tf_bin,
+                module_path=self.path,
+                module_options=options,
+                env_name=self.context.env_name,
+                env_region=self.context.env_region,
+                env_vars=env_vars,
+                no_color=self.context.no_color
+            )
+
     def plan(self):
         """Run tf plan."""
         self.run_terraform(command='plan')
@@ -537,16 +718,15 @@ class TerraformBackendConfig(ModuleOptions):
                                             context.env_name)
         result = kwargs.get('terraform_backend_config', {})
 
-        session = context.get_session(region=result.get('region',
-                                                        context.env_region))
+        region = result.get('region', context.env_region)
 
         if kwargs.get('terraform_backend_cfn_outputs'):
             result.update(cls.resolve_cfn_outputs(
-                client=session.client('cloudformation'),
+                client=context.get_client('cloudformation', region=region),
                 **kwargs['terraform_backend_cfn_outputs']))
         if kwargs.get('terraform_backend_ssm_params'):
             result.update(cls.resolve_ssm_params(
-                client=session.client('ssm'),
+                client=context.get_client('ssm', region=region),
                 **kwargs['terraform_backend_ssm_params']))
 
         if result and not result.get('region'):
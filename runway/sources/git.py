@@ -3,14 +3,12 @@ from __future__ import absolute_import
 # pylint: disable=unused-import
 from typing import List, Dict, Optional, Union  # noqa: F401
 
-import tempfile
-import shutil
-import subprocess
-
 import os
 import sys
 import logging
 
+from ..git_util import (MIRROR_DIRNAME, checkout, get_sparse_suffix,
+                        resolve_ref)
 from .source import Source
 
 LOGGER = logging.getLogger('runway')
@@ -38,7 +36,8 @@ class Git(Source):
             options (Union(None, Dict[str, str])): A reference can be passed along via the
                 options so that a specific version of the repository is cloned.
                 **commit**, **tag**, **branch**  are all valid keys with
-                respective output
+                respective output. **sparse_checkout** can be set to
+                ``true`` to only check out ``location``.
 
         """
         self.uri = uri
@@ -52,46 +51,47 @@ class Git(Source):
 
     def fetch(self):
         # type: () -> str
-        """Retrieve the git repository from it's remote location."""
-        from git import Repo  # pylint: disable=import-outside-toplevel
+        """Retrieve the git repository from it's remote location.
+
+        Only the commit being used is fetched, into a mirror of the
+        repository kept in the cache directory. If the ``sparse_checkout``
+        option is ``true``, only ``location`` is checked out.
 
+        """
         ref = self.__determine_git_ref()  # type: str
-        dir_name = '_'.join([self.sanitize_git_path(self.uri), ref])  # type: str
-        cached_dir_path = os.path.join(self.cache_dir, dir_name)  # type: str
-        cached_path = ''  # type: str
-
-        if not os.path.isdir(cached_dir_path):
-            tmp_dir = tempfile.mkdtemp()
-            try:
-                tmp_repo_path = os.path.join(tmp_dir, dir_name)  # type: str
-                with Repo.clone_from(self.uri, tmp_repo_path) as repo:
-                    repo.head.reference = ref  # type: str
-                    repo.head.reset(index=True, working_tree=True)
-                shutil.move(tmp_repo_path, self.cache_dir)
-                cached_path = os.path.join(self.cache_dir, dir_name)  # type: str
-            finally:
-                shutil.rmtree(tmp_dir)
-        else:
-            cached_path = cached_dir_path  # type: str
+        paths = self.__determine_sparse_paths()  # type: List[str]
+        dir_name = '_'.join([self.sanitize_git_path(self.uri),
+                             ref]) + get_sparse_suffix(paths)  # type: str
+        cached_path = os.path.join(self.cache_dir, dir_name)  # type: str
+
+        if not os.path.isdir(cached_path):
+            checkout(self.uri, ref, cached_path,
+                     os.path.join(self.cache_dir, MIRROR_DIRNAME),
+                     paths=paths)
 
         return os.path.join(cached_path, self.location)
 
+    def __determine_sparse_paths(self):
+        # type: () -> List[str]
+        """Determine the paths to check out when using a sparse checkout."""
+        if str(self.options.get('sparse_checkout', '')).lower() != 'true':
+            return []
+        location = self.location.strip('/')  # type: str
+        if location in ['', '.']:
+            return []
+        return [location]
+
     def __git_ls_remote(self, ref):
         # type: (str) -> str
-        """List remote repositories based on uri and ref received.
+        """Determine the commit id of a ref of the remote repository.
+
+        The refs of the repository are only listed once per run.
 
         Keyword Args:
             ref (str): The git reference value
 
         """
-        LOGGER.debug("Invoking git to retrieve commit id for repo %s...", self.uri)
-        lsremote_output = subprocess.check_output(['git', 'ls-remote', self.uri, ref])
-        # pylint: disable=unsupported-membership-test
-        if b"\t" in lsremote_output:
-            commit_id = lsremote_output.split(b"\t")[0]  # type List[str]
-            LOGGER.debug("Matching commit id found: %s", commit_id)
-            return commit_id
-        raise ValueError("Ref \"%s\" not found for repo %s." % (ref, self.uri))
+        return resolve_ref(self.uri, ref)
 
     def __determine_git_ls_remote_ref(self):
         # type: () -> str
@@ -12,10 +12,22 @@ import re
 import stat
 from subprocess import check_call
 import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 import six
 
 AWS_ENV_VARS = ('AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY',
                 'AWS_SESSION_TOKEN')
+# Index of file hashes shared by runs; set to an empty string to disable it.
+FILE_HASH_INDEX_PATH = os.environ.get(
+    'RUNWAY_FILE_HASH_INDEX',
+    os.path.join(os.path.expanduser('~'), '.runway_cache', 'file_hashes.json')
+)
+FILE_HASH_INDEX_SIZE = 256  # max number of hashes kept in the index
+FILE_HASH_READ_SIZE = 1024 * 1024
+_FILE_HASH_INDEX_LOCK = threading.Lock()
 EMBEDDED_LIB_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),
     'embedded'
@@ -552,6 +564,170 @@ def md5sum(filename):
     return md5.hexdigest()
 
 
+def _read_files_ahead(paths, chunk_size=FILE_HASH_READ_SIZE, max_chunks=16):
+    """Read files in a thread while the chunks already read are consumed.
+
+    Args:
+        paths (List[str]): Paths of the files to read.
+        chunk_size (int): Number of bytes read at a time.
+        max_chunks (int): Max number of chunks read ahead.
+
+    Yields:
+        Optional[bytes]: Chunks of each file followed by ``None``.
+
+    """
+    chunks = six.moves.queue.Queue(max_chunks)
+    done = object()
+
+    def read():
+        """Read the files into the queue."""
+        try:
+            for path in paths:
+                with open(path, 'rb') as stream:
+                    for chunk in iter(lambda: stream.read(chunk_size),  # noqa pylint: disable=cell-var-from-loop
+                                      b''):
+                        chunks.put(chunk)
+                chunks.put(None)
+        except Exception as err:  # pylint: disable=broad-except
+            chunks.put(err)
+        chunks.put(done)
+
+    thread = threading.Thread(target=read)
+    thread.daemon = True
+    thread.start()
+    while True:
+        chunk = chunks.get()
+        if chunk is done:
+            return
+        if isinstance(chunk, Exception):
+            raise chunk
+        yield chunk
+
+
+def _load_file_hash_index(path):
+    """Load the index of file hashes.
+
+    Args:
+        path (str): Path of the index.
+
+    Returns:
+        OrderedDict[str, str]: Hashes keyed by the state of the files.
+
+    """
+    try:
+        with open(path) as stream:
+            return json.load(stream, object_pairs_hook=OrderedDict)
+    except (IOError, OSError, ValueError):
+        return OrderedDict()
+
+
+def replace_file(src, dst):
+    """Rename a file, replacing the destination if it exists.
+
+    ``os.rename`` does not replace an existing file on Windows.
+
+    Args:
+        src (str): Path of the file to rename.
+        dst (str): New path of the file.
+
+    """
+    if sys.version_info[0] > 2:
+        os.replace(src, dst)  # pylint: disable=no-member
+        return
+    if os.name == 'nt' and os.path.exists(dst):
+        os.remove(dst)  # not atomic; Windows can't replace a file in py2
+    os.rename(src, dst)
+
+
+def _save_file_hash_index(path, index):
+    """Save the index of file hashes, replacing the existing index.
+
+    Failing to save the index is not an error.
+
+    Args:
+        path (str): Path of the index.
+        index (OrderedDict[str, str]): Hashes keyed by the state of the files.
+
+    """
+    tmp_path = None
+    try:
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as stream:
+            json.dump(index, stream)
+        replace_file(tmp_path, path)
+    except (IOError, OSError):
+        if tmp_path and os.path.isfile(tmp_path):
+            os.remove(tmp_path)
+
+
+def md5_of_files(files, root, index_path=None):
+    """Return a hash of all of the given files at the given root.
+
+    The hash is the MD5 of the name and contents of each file, in order of
+    name, with each separated by a null byte.
+
+    Hashes are stored in an index keyed by the path, size, modification time
+    and inode of every file so the files don't need to be read again until
+    one of them changes. Files modified in the last two seconds are not
+    indexed since a change made within the resolution of the file system
+    clock could go unnoticed.
+
+    Args:
+        files (List[str]): File names to include in the hash calculation,
+            relative to ``root``.
+        root (str): Base directory to analyze files in.
+        index_path (Optional[str]): Path of the index. Defaults to
+            ``RUNWAY_FILE_HASH_INDEX``. An empty string disables the index.
+
+    Returns:
+        str: A hash of the given files.
+
+    """
+    files = sorted(files)
+    paths = [os.path.join(root, fname) for fname in files]
+    index_path = FILE_HASH_INDEX_PATH if index_path is None else index_path
+    key = None
+    if index_path:
+        started = time.time()
+        state = hashlib.sha256(os.path.abspath(root).encode())
+        newest = 0
+        for fname, path in zip(files, paths):
+            stats = os.stat(path)
+            mtime_ns = getattr(stats, 'st_mtime_ns',
+                               int(stats.st_mtime * 1e9))
+            newest = max(newest, mtime_ns)
+            state.update(json.dumps([fname, stats.st_size, mtime_ns,
+                                     stats.st_ino]).encode())
+        if newest < (started - 2) * 1e9:
+            key = state.hexdigest()
+            with _FILE_HASH_INDEX_LOCK:
+                digest = _load_file_hash_index(index_path).get(key)
+            if digest:
+                return digest
+
+    file_hash = hashlib.md5()
+    chunks = _read_files_ahead(paths)
+    for fname in files:
+        file_hash.update((fname + "\0").encode())
+        for chunk in iter(lambda: next(chunks), None):
+            file_hash.update(chunk)
+        file_hash.update("\0".encode())
+    digest = file_hash.hexdigest()
+
+    if key:
+        with _FILE_HASH_INDEX_LOCK:
+            index = _load_file_hash_index(index_path)
+            index.pop(key, None)
+            index[key] = digest  # newest last
+            while len(index) > FILE_HASH_INDEX_SIZE:
+                index.popitem(last=False)
+            _save_file_hash_index(index_path, index)
+    return digest
+
+
 def sha256sum(filename):
     """Return SHA256 hash of file."""
     sha256 = hashlib.sha256()
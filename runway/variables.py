@@ -1,9 +1,14 @@
 """Runway variables."""
+import copy
 import logging
 import re
+import sys
+import threading
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 from typing import (TYPE_CHECKING,  # noqa: F401 pylint: disable=W
-                    Any, Dict, Iterable, Iterator, List, Optional, Set, Type,
-                    Union, cast)
+                    Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple,
+                    Type, Union, cast)
 
 from six import string_types
 
@@ -24,19 +29,291 @@ if TYPE_CHECKING:
 
 LOGGER = logging.getLogger('runway')
 
+sys.modules['stacker.variables'] = sys.modules[__name__]  # shim to support standard variables
 
-def resolve_variables(variables, context, provider):
+# max number of lookups resolved at the same time
+LOOKUP_WORKERS = 8
+
+# max number of strings kept by the parse cache
+PARSE_CACHE_SIZE = 8192
+
+LOOKUP_OPENER = '${'
+LOOKUP_CLOSER = '}'
+LOOKUP_TOKEN_REGEX = re.compile(r'(\$\{|\}|\s+)')  # ${ or space or }
+
+# tokens of the strings parsed by VariableValue.parse
+_PARSE_CACHE = OrderedDict()  # type: Dict[str, Tuple[Any, ...]]
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def resolve_variables(variables, context, provider=None, runway_vars=None,
+                      max_workers=LOOKUP_WORKERS, **kwargs):
     """Given a list of variables, resolve all of them.
 
+    Identical lookups (same handler and data) are only resolved once, the
+    result being used by every variable containing them. Lookups that can
+    be resolved without resolving another lookup first are resolved
+    concurrently, the lookups of a handler being limited to its
+    ``max_concurrency``. This is repeated until the lookups that contain
+    other lookups are resolved.
+
     Args:
         variables (List[:class:`Variable`]): List of variables.
-        context (:class:`runway.cfngin.context.Context`): CFNgin context.
+        context (Union[:class:`runway.cfngin.context.Context`, :class:`runway.context.Context`]):
+            The current context object.
         provider (:class:`runway.cfngin.providers.base.BaseProvider`): Subclass
             of the base provider.
+        runway_vars (Optional[:class:`runway.config.VariablesDefinition`]):
+            Object containing variables passed to Runway.
+        max_workers (int): Max number of lookups resolved at the same time.
+
+    Raises:
+        FailedVariableLookup: A lookup failed. Raised for the first variable
+            containing a lookup that failed.
 
     """
     for variable in variables:
-        variable.resolve(context=context, provider=provider)
+        _unresolve_lookups(variable._value)  # pylint: disable=protected-access
+    while True:
+        # lookups by key, in the order of the variables containing them
+        groups = OrderedDict()  # type: Dict[Any, List[Tuple[Variable, VariableValueLookup]]]
+        for variable in variables:
+            for lookup in variable.lookups:
+                groups.setdefault(_get_lookup_key(lookup), []).append(
+                    (variable, lookup)
+                )
+        if not groups:
+            return
+        results = _handle_lookups([group[0][1] for group in groups.values()],
+                                  context, provider=provider,
+                                  variables=runway_vars,
+                                  max_workers=max_workers, **kwargs)
+        failed = None
+        for group, (result, error) in zip(groups.values(), results):
+            if error is not None:
+                failed = failed or (group[0][0], error)
+                continue
+            for index, (_variable, lookup) in enumerate(group):
+                # lookups using the same result must not share mutable values
+                lookup._resolve(  # pylint: disable=protected-access
+                    copy.deepcopy(result)
+                    if index and isinstance(result, (dict, list)) else result
+                )
+        if failed:
+            variable, error = failed
+            raise FailedVariableLookup(variable.name, error.lookup,
+                                       error.error)
+
+
+def _get_lookup_key(lookup):
+    # type: (VariableValueLookup) -> Any
+    """Get the key used to find identical lookups.
+
+    Lookups with data that can't be compared are never identical.
+
+    """
+    try:
+        value = lookup.lookup_data.value
+        hash(value)
+    except Exception:  # pylint: disable=broad-except
+        return id(lookup)
+    return (lookup.handler, value)
+
+
+def _handle_lookups(lookups, context, max_workers=LOOKUP_WORKERS, **kwargs):
+    # type: (List[VariableValueLookup], Any, int, Any) -> List[Tuple[Any, Optional[FailedLookup]]]
+    """Get the results of lookups concurrently.
+
+    Args:
+        lookups: Lookups with resolved data.
+        context (Union[:class:`runway.cfngin.context.Context`, :class:`runway.context.Context`]):
+            The current context object.
+        max_workers: Max number of lookups handled at the same time.
+
+    Returns:
+        The result or error of each lookup.
+
+    """
+    semaphores = {}  # type: Dict[Any, threading.Semaphore]
+    for lookup in lookups:
+        # legacy (function) lookups may not be thread safe
+        limit = (getattr(lookup.handler, 'max_concurrency', None)
+                 if isinstance(lookup.handler, type) else 1)
+        if limit and lookup.handler not in semaphores:
+            semaphores[lookup.handler] = threading.Semaphore(limit)
+
+    def handle(lookup):
+        """Handle a lookup, returning any error raised."""
+        semaphore = semaphores.get(lookup.handler)
+        if semaphore:
+            semaphore.acquire()
+        try:
+            return lookup.handle(context, **kwargs), None
+        except FailedLookup as err:
+            return None, err
+        finally:
+            if semaphore:
+                semaphore.release()
+
+    if len(lookups) == 1 or max_workers <= 1:
+        return [handle(lookup) for lookup in lookups]
+    pool = ThreadPool(min(max_workers, len(lookups)))
+    try:
+        return pool.map(handle, lookups)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def prefetch_lookups(variables, context, provider=None):
+    """Retrieve the data needed by the lookups of variables in batches.
+
+    Lookups that can be resolved without resolving another lookup first are
+    grouped by handler and passed to the ``prefetch`` method of the handler.
+    Errors are logged and ignored so the lookups can be resolved normally.
+
+    Args:
+        variables (Iterable[:class:`Variable`]): Variables to prefetch.
+        context (Union[:class:`runway.cfngin.context.Context`, :class:`runway.context.Context`]):
+            The current context object.
+        provider (:class:`runway.cfngin.providers.base.BaseProvider`): Subclass
+            of the base provider.
+
+    """
+    values = {}  # type: Dict[Type[LookupHandler], List[str]]
+    for variable in variables:
+        for lookup in variable.lookups:
+            if hasattr(lookup.handler, 'prefetch'):
+                values.setdefault(lookup.handler, []).append(
+                    lookup.lookup_data.value
+                )
+    for handler, handler_values in values.items():
+        try:
+            handler.prefetch(handler_values, context=context,
+                             provider=provider)
+        except Exception as err:  # pylint: disable=broad-except
+            LOGGER.debug('unable to prefetch %s lookups: %s',
+                         handler.__name__, err)
+
+
+def _iter_lookups(value):
+    # type: (VariableValue) -> Iterator[VariableValueLookup]
+    """Iterate over the unresolved lookups of a variable value.
+
+    Only lookups with data that does not contain another lookup are
+    returned.
+
+    """
+    if isinstance(value, VariableValueLookup):
+        if value.resolved:
+            return
+        if value.lookup_data.resolved:
+            yield value
+            return
+        value = value.lookup_data
+    if isinstance(value, VariableValueDict):
+        value = list(value.values())
+    if isinstance(value, list):
+        for item in value:
+            for lookup in _iter_lookups(item):
+                yield lookup
+
+
+def _unresolve_lookups(value):
+    # type: (VariableValue) -> None
+    """Mark the lookups of a variable value as not resolved.
+
+    Variables are resolved again each time they are resolved since the
+    context used by the lookups may have changed.
+
+    """
+    if isinstance(value, VariableValueLookup):
+        value._resolved = False  # pylint: disable=protected-access
+        value = value.lookup_data
+    if isinstance(value, VariableValueDict):
+        value = list(value.values())
+    if isinstance(value, list):
+        for item in value:
+            _unresolve_lookups(item)
+
+
+def _tokenize(value):
+    # type: (str) -> Tuple[Any, ...]
+    """Split a string into literals and lookups.
+
+    The string is read once, keeping a stack of the lookups that are open.
+    A closing brace closes the innermost open lookup. Like the lookups
+    around it, a lookup that is never closed is kept as a literal.
+
+    Tokens of each string are cached since the same strings are used by
+    many stacks, deployments, and modules.
+
+    Args:
+        value: String to split.
+
+    Returns:
+        Literals (str) and lookups (Tuple[name, Tuple[data, ...]]) of the
+        string. The first token of a lookup is its name; the token after
+        the name (the space) is not part of its data.
+
+    """
+    tokens = _PARSE_CACHE.get(value)
+    if tokens is not None:
+        return tokens
+
+    stack = [[]]  # type: List[List[Any]]
+    opened_at = []  # type: List[int]
+    offset = 0
+    for token in LOOKUP_TOKEN_REGEX.split(value):
+        if token == LOOKUP_OPENER:
+            opened_at.append(offset)
+            stack.append([])
+        elif token == LOOKUP_CLOSER and opened_at:
+            opened_at.pop()
+            lookup = stack.pop()
+            stack[-1].append((lookup[0], tuple(lookup[2:])))
+        else:
+            stack[-1].append(token)
+        offset += len(token)
+
+    if opened_at:
+        # only lookups after the last lookup that isn't closed are kept
+        tokens = tuple([value[:opened_at[-1]], LOOKUP_OPENER] + stack[-1])
+    else:
+        tokens = tuple(stack[0])
+
+    with _PARSE_CACHE_LOCK:
+        if len(_PARSE_CACHE) >= PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+        _PARSE_CACHE[value] = tokens
+    return tokens
+
+
+def _build_tokens(tokens, variable_type):
+    # type: (Tuple[Any, ...], str) -> List[VariableValue]
+    """Create the variable values of the tokens of a string.
+
+    New values are created each time since lookups store their result.
+
+    Args:
+        tokens: Tokens returned by :func:`_tokenize`.
+        variable_type: Type of the variable (``cfngin`` or ``runway``).
+
+    """
+    values = []  # type: List[VariableValue]
+    for token in tokens:
+        if isinstance(token, tuple):
+            name, data = token
+            values.append(VariableValueLookup(
+                lookup_name=_build_tokens((name,), variable_type)[0],
+                lookup_data=VariableValueConcatenation(
+                    _build_tokens(data, variable_type)
+                ),
+                variable_type=variable_type
+            ))
+        else:
+            values.append(VariableValueLiteral(token))
+    return values
 
 
 class Variable(object):
@@ -67,6 +344,18 @@ class Variable(object):
         """
         return self._value.dependencies
 
+    @property
+    def lookups(self):
+        # type: () -> List[VariableValueLookup]
+        """Unresolved lookups with data that does not contain another lookup.
+
+        Returns:
+            List[VariableValueLookup]: Lookups that can be resolved without
+            resolving another lookup first.
+
+        """
+        return list(_iter_lookups(self._value))
+
     @property
     def resolved(self):
         # type: () -> bool
@@ -97,12 +386,12 @@ class Variable(object):
             provider: Subclass of the base provider.
             variables: Object containing variables passed to Runway.
 
+        Raises:
+            FailedVariableLookup: A lookup of the variable failed.
+
         """
-        try:
-            self._value.resolve(context, provider=provider,
-                                variables=variables, **kwargs)
-        except FailedLookup as err:
-            raise FailedVariableLookup(self.name, err.lookup, err.error)
+        resolve_variables([self], context, provider=provider,
+                          runway_vars=variables, **kwargs)
 
     def get(self, key, default=None):
         # type: (Any, Any) -> Any
@@ -190,45 +479,12 @@ class VariableValue(object):
         if not isinstance(input_object, string_types):
             return VariableValueLiteral(input_object)
 
-        tokens = VariableValueConcatenation([
-            VariableValueLiteral(t)
-            for t in re.split(r'(\$\{|\}|\s+)', input_object)  # ${ or space or }
-        ])
-
-        opener = '${'
-        closer = '}'
-
-        while True:
-            last_open = None
-            next_close = None
-            for i, tok in enumerate(tokens):
-                if not isinstance(tok, VariableValueLiteral):
-                    continue
-
-                if tok.value == opener:
-                    last_open = i
-                    next_close = None
-                if (
-                        last_open is not None and
-                        tok.value == closer and
-                        next_close is None
-                ):
-                    next_close = i
-
-            if next_close is not None:
-                lookup_data = VariableValueConcatenation(
-                    tokens[(cast(int, last_open) + len(opener) + 1):next_close]
-                )
-                lookup = VariableValueLookup(
-                    lookup_name=tokens[cast(int, last_open) + 1],
-                    lookup_data=lookup_data,
-                    variable_type=variable_type
-                )
-                tokens[last_open:(next_close + 1)] = [lookup]
-            else:
-                break
+        if LOOKUP_OPENER not in input_object:
+            return VariableValueLiteral(input_object)
 
-        return tokens.simplified
+        return VariableValueConcatenation(
+            _build_tokens(_tokenize(input_object), variable_type)
+        ).simplified
 
     def __iter__(self):
         # type: () -> Iterable
@@ -654,16 +910,35 @@ class VariableValueLookup(VariableValue):
         """
         self.lookup_data.resolve(context, provider=provider,
                                  variables=variables, **kwargs)
+        self._resolve(self.handle(context, provider=provider,
+                                  variables=variables, **kwargs))
+
+    def handle(self, context, provider=None, variables=None, **kwargs):
+        # type: (Any, Any, 'Optional[VariablesDefinition]', Any) -> Any
+        """Get the result of the lookup without resolving it.
+
+        The data of the lookup must already be resolved.
+
+        Args:
+            context: The current context object.
+            provider: Subclass of the base provider.
+            variables: Object containing variables passed to Runway.
+
+        Returns:
+            Result of the lookup handler.
+
+        Raises:
+            FailedLookup: A lookup failed for any reason.
+
+        """
         try:
             if isinstance(self.handler, type):
-                result = self.handler.handle(value=self.lookup_data.value,
-                                             context=context,
-                                             provider=provider,
-                                             variables=variables,
-                                             **kwargs)
-            else:
-                result = self._resolve_legacy(context, provider)
-            return self._resolve(result)
+                return self.handler.handle(value=self.lookup_data.value,
+                                           context=context,
+                                           provider=provider,
+                                           variables=variables,
+                                           **kwargs)
+            return self._resolve_legacy(context, provider)
         except Exception as err:
             if isinstance(err, TypeError):
                 # handle lookups that don't accept all the args we want
@@ -671,8 +946,8 @@ class VariableValueLookup(VariableValue):
                 LOGGER.debug('Encountered %s: %s - trying legacy resolver',
                              type(err), err)
                 try:
-                    return self._resolve(self._resolve_legacy(context=context,
-                                                              provider=provider))
+                    return self._resolve_legacy(context=context,
+                                                provider=provider)
                 except Exception as err2:
                     raise FailedLookup(self, err2)
             raise FailedLookup(self, err)
@@ -0,0 +1,59 @@
+"""Benchmark parsing variable values.
+
+Strings like the ones found in runway and CFNgin config files are parsed
+as they were before parse trees (legacy) and with the tokens of each string
+cached (cold: cache cleared before each parse, warm: cache populated)::
+
+    python -m tests.benchmark_variables
+
+"""
+import argparse
+import timeit
+
+from runway import variables
+from runway.variables import VariableValue
+
+from .test_variables import legacy_parse
+
+STRINGS = [
+    ('runway', 'deployments/${env DEPLOY_ENVIRONMENT}/${var region}'),
+    ('runway', '${var namespace}-${env DEPLOY_ENVIRONMENT}-bucket'),
+    ('runway', '${ssm /${var namespace}/${env DEPLOY_ENVIRONMENT}/vpc-id::'
+               'region=${var region}}'),
+    ('cfngin', '${output vpc::VpcId}'),
+    ('cfngin', '${rxref shared-vpc::PrivateSubnets}'),
+    ('cfngin', '${file parameterized:file://templates/user_data.sh}'),
+    ('cfngin', 'arn:aws:s3:::${output bucket::BucketName}/*'),
+    ('cfngin', '${default env_var::${envvar ENVIRONMENT::dev}}'),
+]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--number', type=int, default=2000)
+    args = parser.parse_args()
+
+    def parse_legacy():
+        for variable_type, value in STRINGS:
+            legacy_parse(value, variable_type)
+
+    def parse_cold():
+        for variable_type, value in STRINGS:
+            variables._PARSE_CACHE.clear()  # pylint: disable=protected-access
+            VariableValue.parse(value, variable_type)
+
+    def parse_warm():
+        for variable_type, value in STRINGS:
+            VariableValue.parse(value, variable_type)
+
+    for name, func in [('legacy', parse_legacy), ('cold', parse_cold),
+                       ('warm', parse_warm)]:
+        elapsed = min(timeit.repeat(func, number=args.number, repeat=3))
+        print('%s: %.1fus per string' % (
+            name, elapsed / args.number / len(STRINGS) * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
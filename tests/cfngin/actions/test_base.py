@@ -1,5 +1,9 @@
 """Tests for runway.cfngin.actions.base."""
 # pylint: disable=no-self-use,protected-access,unused-argument
+import json
+import os
+import shutil
+import tempfile
 import unittest
 
 from mock import MagicMock, PropertyMock, patch
@@ -7,7 +11,7 @@ from mock import MagicMock, PropertyMock, patch
 import botocore.exceptions
 from botocore.stub import ANY, Stubber
 
-from runway.cfngin.actions.base import BaseAction
+from runway.cfngin.actions.base import BaseAction, build_walker
 from runway.cfngin.blueprints.base import Blueprint
 from runway.cfngin.plan import Graph, Plan, Step
 from runway.cfngin.providers.aws.default import Provider
@@ -34,6 +38,26 @@ class MockBlueprint(Blueprint):
         """Create template."""
 
 
+class TestBuildWalker(unittest.TestCase):
+    """Tests for runway.cfngin.actions.base.build_walker."""
+
+    def test_engines(self):
+        """Test build_walker engines."""
+        self.assertEqual(build_walker(0).__self__.__class__.__name__,
+                         'ThreadedWalker')
+        self.assertEqual(build_walker(0, 'threaded').__self__.__class__
+                         .__name__, 'ThreadedWalker')
+        walker = build_walker(5, 'queue')
+        self.assertEqual(walker.__self__.__class__.__name__,
+                         'ReadyQueueWalker')
+        self.assertEqual(walker.__self__.max_workers, 5)
+
+    def test_invalid_engine(self):
+        """Test build_walker with an invalid engine."""
+        with self.assertRaises(ValueError):
+            build_walker(0, 'invalid')
+
+
 class TestBaseAction(unittest.TestCase):
     """Tests for runway.cfngin.actions.base.BaseAction."""
 
@@ -325,3 +349,109 @@ class TestBaseAction(unittest.TestCase):
                     MOCK_VERSION
                 )
             )
+
+    def test_s3_stack_push_prefetched(self):
+        """Test s3_stack_push with templates listed by prefetch_template_keys."""
+        context = mock_context("mynamespace")
+        existing = MockBlueprint(name="existing", context=context)
+        new = MockBlueprint(name="new", context=context)
+        action = BaseAction(
+            context=context,
+            provider_builder=MockProviderBuilder(Provider(self.session),
+                                                 region=self.region)
+        )
+        stubber = Stubber(action.s3_conn)
+        stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": "stack_templates/mynamespace-existing/"
+                                  "existing-%s.json" % MOCK_VERSION}]},
+            {"Bucket": "stacker-mynamespace",
+             "Prefix": "stack_templates/mynamespace"}
+        )
+        stubber.add_response("put_object", {}, {
+            "ACL": "bucket-owner-full-control",
+            "Body": ANY,
+            "Bucket": "stacker-mynamespace",
+            "Key": "stack_templates/mynamespace-new/new-%s.json" % MOCK_VERSION,
+            "ServerSideEncryption": "AES256"
+        })
+
+        with stubber:
+            action.prefetch_template_keys()
+            action.s3_stack_push(existing)
+            action.s3_stack_push(new)
+            action.s3_stack_push(new)
+        stubber.assert_no_pending_responses()
+
+    def test_s3_stack_push_prefetch_denied(self):
+        """Test s3_stack_push checks each template if listing is denied."""
+        context = mock_context("mynamespace")
+        blueprint = MockBlueprint(name="myblueprint", context=context)
+        action = BaseAction(
+            context=context,
+            provider_builder=MockProviderBuilder(Provider(self.session),
+                                                 region=self.region)
+        )
+        stubber = Stubber(action.s3_conn)
+        stubber.add_client_error("list_objects_v2", "AccessDenied")
+        stubber.add_response("head_object", {}, {
+            "Bucket": "stacker-mynamespace",
+            "Key": "stack_templates/mynamespace-myblueprint/"
+                   "myblueprint-%s.json" % MOCK_VERSION
+        })
+
+        with stubber:
+            action.prefetch_template_keys()
+            action.s3_stack_push(blueprint)
+        stubber.assert_no_pending_responses()
+
+    def test_prerender_templates(self):
+        """Test prerender_templates."""
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        blueprint = "tests.cfngin.fixtures.mock_blueprints.Dummy"
+        config = {
+            "cfngin_cache_dir": cache_dir,
+            "stacks": [
+                {"name": "vpc", "class_path": blueprint},
+                {"name": "bastion", "class_path": blueprint,
+                 "variables": {"StringVariable": "${output vpc::DummyId}"}},
+                {"name": "db", "class_path": blueprint,
+                 "variables": {"StringVariable": "db"}},
+                {"name": "disabled", "class_path": blueprint,
+                 "enabled": False}
+            ]
+        }
+
+        def prerender():
+            """Pre-render the stacks of a new plan."""
+            context = mock_context("mynamespace", extra_config_args=config)
+            stacks = {stack.name: stack for stack in context.get_stacks()}
+            plan = Plan(description="Test",
+                        graph=Graph.from_steps([Step(stack)
+                                                for stack in stacks.values()]))
+            action = BaseAction(
+                context=context,
+                provider_builder=MockProviderBuilder(Provider(self.session),
+                                                     region=self.region)
+            )
+            action.prerender_templates(plan)
+            return stacks
+
+        stacks = prerender()
+        self.assertEqual(len(os.listdir(os.path.join(cache_dir,
+                                                     "templates"))), 2)
+        for name in ["vpc", "db"]:
+            blueprint = stacks[name].blueprint
+            self.assertTrue(blueprint._prerendered)
+            self.assertIn("Dummy", json.loads(blueprint.rendered)["Resources"])
+            self.assertIn("DummyId", blueprint.get_output_definitions())
+        self.assertIsNone(stacks["bastion"]._blueprint)
+        self.assertIsNone(stacks["disabled"]._blueprint)
+
+        with patch.object(Blueprint, "render_template") as mock_render:
+            cached = prerender()
+        mock_render.assert_not_called()
+        for name in ["vpc", "db"]:
+            self.assertEqual(cached[name].blueprint.rendered,
+                             stacks[name].blueprint.rendered)
@@ -112,6 +112,31 @@ class TestBaseBlueprint(unittest.TestCase):
         self.assertEqual(blueprint.template.outputs[output_name].properties["Value"],
                          output_value)
 
+    def test_set_rendered(self):
+        """Test set_rendered."""
+        class TestBlueprint(Blueprint):
+            """Test blueprint."""
+
+            VARIABLES = {}
+
+            def create_template(self):
+                """Create template."""
+                self.template.set_transform('AWS::Serverless-2016-10-31')
+                self.add_output('MyOutput1', 'OutputValue')
+
+        blueprint = TestBlueprint(name="test", context=mock_context())
+        version, rendered = blueprint.render_template()
+        outputs = blueprint.get_output_definitions()
+
+        blueprint = TestBlueprint(name="test", context=mock_context())
+        blueprint.create_template = MagicMock()
+        blueprint.set_rendered(version, rendered)
+        self.assertEqual(blueprint.rendered, rendered)
+        self.assertEqual(blueprint.version, version)
+        self.assertTrue(blueprint.requires_change_set)
+        self.assertEqual(blueprint.get_output_definitions(), outputs)
+        blueprint.create_template.assert_not_called()
+
 
 class TestVariables(unittest.TestCase):
     """Tests for runway.cfngin.blueprints.base.Blueprint variables."""
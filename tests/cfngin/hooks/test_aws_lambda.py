@@ -22,7 +22,8 @@ from runway.cfngin.config import Config
 from runway.cfngin.context import Context
 from runway.cfngin.exceptions import InvalidDockerizePipConfiguration
 from runway.cfngin.hooks.aws_lambda import (ZIP_PERMS_MASK, _calculate_hash,
-                                            copydir, dockerized_pip,
+                                            _zip_files, copydir,
+                                            dockerized_pip,
                                             find_requirements,
                                             handle_requirements,
                                             select_bucket_region,
@@ -411,6 +412,39 @@ class TestLambdaHooks(unittest.TestCase):
                 hash2 = _calculate_hash(files2, root2)
                 self.assertEqual(hash1, hash2)
 
+    def test_zip_files(self):
+        """Test zip files is reproducible and hashes the files."""
+        files = ['f1/f1.py', 'f1/f2.py', 'large.bin']
+        with TempDirectory() as temp_dir:
+            temp_dir.write('f1/f1.py', b'print("f1")')
+            temp_dir.write('f1/f2.py', b'')
+            temp_dir.write('large.bin', os.urandom(3 * 1024 * 1024) * 2)
+            os.chmod(os.path.join(temp_dir.path, 'f1/f1.py'), 0o700)
+            archive1, hash1 = _zip_files(iter(reversed(files)),
+                                         temp_dir.path)
+            os.utime(os.path.join(temp_dir.path, 'f1/f2.py'), (0, 0))
+            archive2, hash2 = _zip_files(files, temp_dir.path)
+            expected_hash = _calculate_hash(files, temp_dir.path)
+
+            with archive1, archive2:
+                contents = archive1.read()
+                self.assertEqual(contents, archive2.read())
+            with ZipFile(StringIO(contents), 'r') as zip_file:
+                self.assertIsNone(zip_file.testzip())
+                compare([(info.filename,
+                          (info.external_attr & ZIP_PERMS_MASK) >> 16,
+                          info.date_time)
+                         for info in zip_file.infolist()],
+                        [('f1/f1.py', 0o755, (1980, 1, 1, 0, 0, 0)),
+                         ('f1/f2.py', 0o644, (1980, 1, 1, 0, 0, 0)),
+                         ('large.bin', 0o644, (1980, 1, 1, 0, 0, 0))])
+                with open(os.path.join(temp_dir.path, 'large.bin'),
+                          'rb') as large:
+                    self.assertEqual(zip_file.read('large.bin'),
+                                     large.read())
+        self.assertEqual(hash1, expected_hash)
+        self.assertEqual(hash2, expected_hash)
+
     def test_select_bucket_region(self):
         """Test select bucket region."""
         tests = (
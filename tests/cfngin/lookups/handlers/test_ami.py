@@ -5,8 +5,10 @@ import boto3
 import mock
 from botocore.stub import Stubber
 
-from runway.cfngin.lookups.handlers.ami import AmiLookup, ImageNotFound
+from runway.cfngin.lookups.handlers.ami import (AmiLookup, ImageNotFound,
+                                                name_prefix)
 
+from ....factories import MockCFNginContext
 from ...factories import SessionStub, mock_provider
 
 REGION = "us-east-1"
@@ -215,3 +217,79 @@ class TestAMILookup(unittest.TestCase):
                     value=r'owners:self name_regex:MyImage\s\d',
                     provider=self.provider
                 )
+
+    def test_lookup_cached(self):
+        """Test lookup without pagination caches the result."""
+        context = MockCFNginContext(region=REGION)
+        stubber = context.add_stubber('ec2')
+        stubber.add_response('describe_images', {'Images': [
+            {'CreationDate': '2020-01-01T00:00:00.000Z',
+             'ImageId': 'ami-1', 'Name': 'amzn2-ami-hvm-1-x86_64-gp2'},
+            {'CreationDate': '2020-03-01T00:00:00.000Z',
+             'ImageId': 'ami-ebs', 'Name': 'amzn2-ami-hvm-3-x86_64-ebs'},
+            {'CreationDate': '2020-02-01T00:00:00.000Z',
+             'ImageId': 'ami-2', 'Name': 'amzn2-ami-hvm-2-x86_64-gp2'}
+        ]}, {
+            'Owners': ['amazon'],
+            'Filters': [{'Name': 'architecture', 'Values': ['x86_64']},
+                        {'Name': 'name', 'Values': ['amzn2-ami-hvm-*']}]
+        })
+        value = (r'owners:amazon name_regex:amzn2-ami-hvm-\d-x86_64-gp2 '
+                 'architecture:x86_64')
+
+        # botocore versions without pagination for DescribeImages
+        with stubber, mock.patch.object(stubber.client, 'can_paginate',
+                                        return_value=False):
+            self.assertEqual(AmiLookup.handle(value, context=context,
+                                              provider=self.provider),
+                             'ami-2')
+            self.assertEqual(AmiLookup.handle(value, context=context,
+                                              provider=self.provider),
+                             'ami-2')
+        stubber.assert_no_pending_responses()
+
+    @unittest.skipUnless(client.can_paginate('describe_images'),
+                         'botocore does not paginate DescribeImages')
+    def test_lookup_paginated_cached(self):
+        """Test lookup reads every page and caches the result."""
+        context = MockCFNginContext(region=REGION)
+        stubber = context.add_stubber('ec2')
+        expected_params = {
+            'Owners': ['amazon'],
+            'Filters': [{'Name': 'architecture', 'Values': ['x86_64']},
+                        {'Name': 'name', 'Values': ['amzn2-ami-hvm-*']}],
+            'MaxResults': 1000
+        }
+        stubber.add_response('describe_images', {'Images': [
+            {'CreationDate': '2020-01-01T00:00:00.000Z',
+             'ImageId': 'ami-1', 'Name': 'amzn2-ami-hvm-1-x86_64-gp2'},
+            {'CreationDate': '2020-03-01T00:00:00.000Z',
+             'ImageId': 'ami-ebs', 'Name': 'amzn2-ami-hvm-3-x86_64-ebs'}
+        ], 'NextToken': 'token'}, expected_params)
+        stubber.add_response('describe_images', {'Images': [
+            {'CreationDate': '2020-02-01T00:00:00.000Z',
+             'ImageId': 'ami-2', 'Name': 'amzn2-ami-hvm-2-x86_64-gp2'}
+        ]}, dict(expected_params, NextToken='token'))
+        value = (r'owners:amazon name_regex:amzn2-ami-hvm-\d-x86_64-gp2 '
+                 'architecture:x86_64')
+
+        with stubber:
+            self.assertEqual(AmiLookup.handle(value, context=context,
+                                              provider=self.provider),
+                             'ami-2')
+            self.assertEqual(AmiLookup.handle(value, context=context,
+                                              provider=self.provider),
+                             'ami-2')
+        stubber.assert_no_pending_responses()
+
+    def test_name_prefix(self):
+        """Test name_prefix."""
+        self.assertEqual(name_prefix(r'Fake\sImage\s\d'), 'Fake')
+        self.assertEqual(name_prefix(r'ubuntu/images/hvm-ssd/ubuntu-.*'),
+                         'ubuntu/images/hvm-ssd/ubuntu-')
+        self.assertEqual(name_prefix(r'image\.v1-\d+'), 'image.v1-')
+        self.assertEqual(name_prefix(r'images?-[0-9]+'), 'image')
+        self.assertEqual(name_prefix(r'image+'), 'image')
+        self.assertEqual(name_prefix(r'image\*'), 'image')
+        self.assertEqual(name_prefix(r'a|b'), '')
+        self.assertEqual(name_prefix(r'(?i)image'), '')
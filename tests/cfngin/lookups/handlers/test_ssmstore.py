@@ -7,6 +7,7 @@ from botocore.stub import Stubber
 from six import string_types
 
 from runway.cfngin.lookups.handlers.ssmstore import SsmstoreLookup
+from runway.lookups.handlers.ssm import SsmParameterCache
 
 from ...factories import SessionStub
 
@@ -83,3 +84,19 @@ class TestSSMStoreHandler(unittest.TestCase):
         with self.stubber:
             value = SsmstoreLookup.handle(temp_value)
             self.assertEqual(value, self.ssmvalue)
+
+    @mock.patch('runway.cfngin.lookups.handlers.ssmstore.get_session',
+                return_value=SessionStub(client))
+    def test_ssmstore_prefetch(self, _mock_client):
+        """Test ssmstore handler uses prefetched parameters."""
+        context = mock.MagicMock(ssm_cache=SsmParameterCache())
+        self.stubber.add_response('get_parameters',
+                                  self.get_parameters_response,
+                                  {'Names': ['invalid_ssm_param', 'ssmkey'],
+                                   'WithDecryption': True})
+        with self.stubber:
+            SsmstoreLookup.prefetch(['us-east-1@ssmkey', 'invalid_ssm_param'],
+                                    context)
+            value = SsmstoreLookup.handle(self.ssmkey, context=context)
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(value, self.ssmvalue)
@@ -566,6 +566,47 @@ class TestProviderDefaultMode(unittest.TestCase):
 
         self.assertEqual(response["StackName"], stack_name)
 
+    def test_get_outputs_shared_cache(self):
+        """Test get_outputs uses a cache shared between providers."""
+        stack_name = "MockStack"
+        stack = generate_describe_stacks_stack(stack_name)
+        stack["Outputs"] = [{"OutputKey": "Key", "OutputValue": "val"}]
+        self.stubber.add_response(
+            "describe_stacks",
+            {"Stacks": [stack]},
+            expected_params={"StackName": stack_name}
+        )
+        other = Provider(self.session, region="us-east-1",
+                         output_cache=self.provider.output_cache)
+
+        with self.stubber:
+            self.assertEqual(self.provider.get_outputs(stack_name),
+                             {"Key": "val"})
+            self.assertEqual(other.get_output(stack_name, "Key"), "val")
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(self.provider.output_cache.misses, 1)
+        self.assertEqual(self.provider.output_cache.hits, 1)
+
+    def test_poll_stack(self):
+        """Test poll stack."""
+        stack_name = "MockStack"
+        cancel = threading.Event()
+        with patch.object(self.provider.status_poller, 'wait') as mock_wait:
+            mock_wait.return_value = generate_describe_stacks_stack(
+                stack_name
+            )
+            response = self.provider.poll_stack(stack_name, cancel=cancel,
+                                                timeout=5)
+            self.assertEqual(response["StackName"], stack_name)
+            mock_wait.assert_called_once_with(stack_name, cancel=cancel,
+                                              timeout=5)
+
+            mock_wait.return_value = None
+            with self.assertRaises(exceptions.StackDoesNotExist):
+                self.provider.poll_stack(stack_name)
+        self.assertIs(self.provider.status_poller,
+                      self.provider.status_poller)
+
     def test_select_destroy_method(self):
         """Test select destroy method."""
         for i in [[{'force_interactive': False},
@@ -850,6 +891,59 @@ class TestProviderDefaultMode(unittest.TestCase):
                                                fqn=stack_name,
                                                answer='y')
 
+    def test_get_events_since(self):
+        """Test get_events_since only reads pages until the event."""
+        stack_name = "MockStack"
+        default.GET_EVENTS_SLEEP = .01
+        self.stubber.add_response(
+            "describe_stack_events",
+            {"StackEvents": [{"StackId": stack_name, "EventId": "4",
+                              "StackName": stack_name,
+                              "Timestamp": datetime.now()},
+                             {"StackId": stack_name, "EventId": "3",
+                              "StackName": stack_name,
+                              "Timestamp": datetime.now()}],
+             "NextToken": "token"},
+            {"StackName": stack_name}
+        )
+        self.stubber.add_response(
+            "describe_stack_events",
+            {"StackEvents": [{"StackId": stack_name, "EventId": "2",
+                              "StackName": stack_name,
+                              "Timestamp": datetime.now()}],
+             "NextToken": "token2"},
+            {"StackName": stack_name, "NextToken": "token"}
+        )
+
+        with self.stubber:
+            result = self.provider.get_events_since(stack_name, "2")
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual([event["EventId"] for event in result], ["3", "4"])
+
+    def test_get_rollback_status_reason(self):
+        """Test get_rollback_status_reason stops at the roll back event."""
+        stack_name = "MockStack"
+        self.stubber.add_response(
+            "describe_stack_events",
+            {"StackEvents": [
+                {"StackId": stack_name, "EventId": "2",
+                 "StackName": stack_name, "Timestamp": datetime.now(),
+                 "ResourceStatus": "UPDATE_ROLLBACK_COMPLETE"},
+                {"StackId": stack_name, "EventId": "1",
+                 "StackName": stack_name, "Timestamp": datetime.now(),
+                 "ResourceStatus": "UPDATE_ROLLBACK_IN_PROGRESS",
+                 "ResourceStatusReason": "reason"}
+            ], "NextToken": "token"},
+            {"StackName": stack_name}
+        )
+
+        with self.stubber:
+            self.assertEqual(
+                self.provider.get_rollback_status_reason(stack_name), "reason"
+            )
+        self.stubber.assert_no_pending_responses()
+
     def test_tail_stack_retry_on_missing_stack(self):
         """Test tail stack retry on missing stack."""
         stack_name = "SlowToCreateStack"
@@ -0,0 +1,102 @@
+"""Tests for runway.cfngin.providers.aws.stack_status."""
+# pylint: disable=no-self-use,protected-access
+import threading
+import unittest
+from datetime import datetime
+
+import boto3
+from botocore.stub import Stubber
+from mock import patch
+
+from runway.cfngin.providers.aws.stack_status import StackStatusPoller
+
+
+def generate_stack(stack_name, stack_status='CREATE_COMPLETE'):
+    """Generate describe stacks stack."""
+    return {'StackName': stack_name,
+            'StackId': stack_name,
+            'CreationTime': datetime(2015, 1, 1),
+            'StackStatus': stack_status}
+
+
+class TestStackStatusPoller(unittest.TestCase):
+    """Tests for runway.cfngin.providers.aws.stack_status.StackStatusPoller."""
+
+    def setUp(self):
+        """Run before tests."""
+        self.cfn = boto3.client('cloudformation', region_name='us-east-1')
+        self.stubber = Stubber(self.cfn)
+        self.poller = StackStatusPoller(self.cfn, min_interval=1,
+                                        max_interval=1)
+
+    def test_poll(self):
+        """Test one describe_stacks call per page for all stacks."""
+        self.stubber.add_response(
+            'describe_stacks',
+            {'Stacks': [generate_stack('stack1'), generate_stack('other')],
+             'NextToken': 'token'},
+            {}
+        )
+        self.stubber.add_response(
+            'describe_stacks',
+            {'Stacks': [generate_stack('stack2', 'UPDATE_IN_PROGRESS')]},
+            {'NextToken': 'token'}
+        )
+
+        with self.stubber:
+            result = self.poller._poll({'stack1', 'stack2', 'stack3'})
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(self.poller.api_calls, 2)
+        self.assertEqual(sorted(result), ['stack1', 'stack2'])
+        self.assertEqual(result['stack2']['StackStatus'],
+                         'UPDATE_IN_PROGRESS')
+
+    def test_wait(self):
+        """Test wait."""
+        self.stubber.add_response(
+            'describe_stacks',
+            {'Stacks': [generate_stack('stack1', 'UPDATE_IN_PROGRESS')]},
+            {}
+        )
+
+        with self.stubber:
+            result = self.poller.wait('stack1', timeout=0)
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(result['StackStatus'], 'UPDATE_IN_PROGRESS')
+        self.assertEqual(self.poller._seen['stack1'],
+                         ('UPDATE_IN_PROGRESS', None))
+
+    def test_wait_access_denied(self):
+        """Test falling back to describing each stack."""
+        self.stubber.add_client_error('describe_stacks',
+                                      service_error_code='AccessDenied')
+        self.stubber.add_response('describe_stacks',
+                                  {'Stacks': [generate_stack('stack1')]},
+                                  {'StackName': 'stack1'})
+
+        with self.stubber:
+            result = self.poller.wait('stack1', timeout=0)
+
+        self.stubber.assert_no_pending_responses()
+        self.assertEqual(result['StackStatus'], 'CREATE_COMPLETE')
+        self.assertFalse(self.poller._bulk)
+
+    def test_wait_error(self):
+        """Test errors raised by the poller are raised by wait."""
+        self.stubber.add_client_error('describe_stacks',
+                                      service_error_code='Throttling')
+
+        with self.stubber:
+            with self.assertRaises(Exception):
+                self.poller.wait('stack1', timeout=0)
+
+    @patch.object(StackStatusPoller, '_ensure_thread')
+    def test_wait_cancel(self, mock_ensure_thread):
+        """Test wait returns when canceled."""
+        cancel = threading.Event()
+        cancel.set()
+        self.assertIsNone(self.poller.wait('stack1', cancel=cancel))
+        mock_ensure_thread.assert_called_once_with()
+        self.assertFalse(self.poller._waiters)
@@ -2,11 +2,13 @@
 # pylint: disable=no-self-use,protected-access
 import os
 import shutil
+import sys
 
 import pytest
 from mock import MagicMock, patch
 
 from runway.cfngin import CFNgin
+from runway.cfngin.dag import DAGValidationError
 from runway.context import Context
 
 
@@ -41,6 +43,38 @@ class TestCFNgin(object):
                        env_region=region,
                        env_root=os.getcwd())
 
+    @staticmethod
+    def write_dependant_configs(tmp_path):
+        """Write config files that depend on each other."""
+        configs = {
+            '01-vpc.yml': 'stacks:\n'
+                          '  vpc:\n'
+                          '    template_path: template.yml\n',
+            '02-app.yml': 'stacks:\n'
+                          '  app:\n'
+                          '    template_path: template.yml\n'
+                          '    variables:\n'
+                          '      VpcId: ${output vpc::VpcId}\n',
+            '03-dns.yml': 'requires:\n'
+                          '  - 02-app.yml\n'
+                          'post_build:\n'
+                          '  - path: runway.cfngin.hooks.command.run_command\n'
+                          '    args:\n'
+                          '      zone: ${xref test-namespace-vpc::Zone}\n',
+            '04-other.yml': 'stacks:\n'
+                            '  other:\n'
+                            '    template_path: template.yml\n'
+        }
+        for name, content in configs.items():
+            # python2 Path.write_text requires unicode
+            (tmp_path / name).write_text(
+                u'namespace: ${namespace}\n' + content
+            )
+        (tmp_path / 'test-us-east-1.env').write_text(
+            u'namespace: test-namespace\n'
+        )
+        return sorted(str(tmp_path / name) for name in configs)
+
     def test_env_file(self, tmp_path):
         """Test that the correct env file is selected."""
         test_env = tmp_path / 'test.env'
@@ -124,7 +158,104 @@ class TestCFNgin(object):
         mock_action.assert_called_once()
         mock_instance.execute.assert_called_once_with(concurrency=0,
                                                       force=True,
-                                                      tail=False)
+                                                      tail=False,
+                                                      walker_engine='threaded')
+
+    @patch('runway.cfngin.actions.build.Action')
+    def test_deploy_concurrent(self, mock_action, tmp_path):
+        """Test deploy config files concurrently."""
+        configs = self.write_dependant_configs(tmp_path)
+        (tmp_path / '02-app.yml').write_text(
+            (tmp_path / '02-app.yml').read_text() + u'requires:\n- 04-other.yml\n'
+        )
+        processed = []
+
+        def execute(**_kwargs):
+            """Record the config file being deployed."""
+            config_path = mock_action.call_args[1]['context'].config_path
+            processed.append(config_path)
+            if config_path.endswith('04-other.yml'):
+                raise ValueError('failed')
+
+        mock_action.return_value.execute.side_effect = execute
+        context = self.get_context()
+        context.env_vars['RUNWAY_MAX_CONCURRENT_CFNGIN_CONFIGS'] = '2'
+
+        cfngin = CFNgin(ctx=context, sys_path=str(tmp_path))
+        assert cfngin.max_concurrent_configs == 2
+        with pytest.raises(ValueError):
+            cfngin.deploy()
+
+        # 02-app.yml and 03-dns.yml are skipped
+        assert sorted(processed) == [configs[0], configs[3]]
+
+    @patch('runway.cfngin.actions.destroy.Action')
+    def test_destroy_concurrent(self, mock_action, tmp_path):
+        """Test destroy config files concurrently."""
+        configs = self.write_dependant_configs(tmp_path)
+        processed = []
+
+        def action(context, **_kwargs):
+            """Record the config file being destroyed."""
+            processed.append(context.config_path)
+            return MagicMock()
+
+        mock_action.side_effect = action
+        context = self.get_context()
+        context.env_vars['RUNWAY_MAX_CONCURRENT_CFNGIN_CONFIGS'] = '4'
+
+        CFNgin(ctx=context, sys_path=str(tmp_path)).destroy()
+
+        assert len(processed) == 4
+        assert processed.index(configs[2]) < processed.index(configs[1])
+        assert processed.index(configs[1]) < processed.index(configs[0])
+
+    @pytest.mark.parametrize('hook_path', [
+        'hooks.custom',
+        'runway.hooks.staticsite.build_staticsite.build'
+    ])
+    @patch('runway.cfngin.actions.destroy.Action')
+    def test_destroy_concurrent_change_dir(self, mock_action, caplog,
+                                           hook_path, tmp_path):
+        """Test configs with hooks that may change dir aren't concurrent."""
+        configs = self.write_dependant_configs(tmp_path)
+        (tmp_path / '04-other.yml').write_text(
+            (tmp_path / '04-other.yml').read_text() +
+            u'pre_destroy:\n  - path: %s\n' % hook_path
+        )
+        processed = []
+
+        def action(context, **_kwargs):
+            """Record the config file being destroyed."""
+            processed.append((context.config_path, sys.argv[-1]))
+            return MagicMock()
+
+        mock_action.side_effect = action
+        context = self.get_context()
+        context.env_vars['RUNWAY_MAX_CONCURRENT_CFNGIN_CONFIGS'] = '4'
+        caplog.set_level('WARNING', logger='runway.cfngin')
+
+        CFNgin(ctx=context, sys_path=str(tmp_path)).destroy()
+
+        assert 'hooks of 04-other.yml may change' in caplog.text
+        # processed in reverse order with the path of the config as argv
+        assert processed == [(config, config) for config in configs[::-1]]
+
+    def test_get_config_graph(self, tmp_path):
+        """Test get_config_graph."""
+        configs = self.write_dependant_configs(tmp_path)
+        cfngin = CFNgin(ctx=self.get_context(), sys_path=str(tmp_path))
+        contexts = [cfngin.load(config) for config in configs]
+
+        dag = cfngin.get_config_graph(contexts)
+        assert dag.graph == {configs[0]: set(),
+                             configs[1]: {configs[0]},
+                             configs[2]: {configs[0], configs[1]},
+                             configs[3]: set()}
+
+        contexts[0].config.requires = ['03-dns.yml']
+        with pytest.raises(DAGValidationError):
+            cfngin.get_config_graph(contexts)
 
     def test_load(self, cfngin_fixtures, tmp_path):
         """Test load."""
@@ -162,7 +293,7 @@ class TestCFNgin(object):
         cfngin.plan()
 
         mock_action.assert_called_once()
-        mock_instance.execute.assert_called_once_with()
+        mock_instance.execute.assert_called_once_with(prerender=False)
 
     def test_should_skip(self, cfngin_fixtures, tmp_path):
         """Test should_skip."""
@@ -2,6 +2,7 @@
 # pylint: disable=no-self-use,protected-access,too-many-public-methods
 import io
 import json
+import pickle
 import unittest
 
 from botocore.exceptions import ClientError
@@ -219,6 +220,42 @@ class TestContext(unittest.TestCase):
         mock_get_session.assert_called_with(region='us-east-1',
                                             profile='user')
 
+    @patch('runway.cfngin.context.get_session')
+    def test_get_client(self, mock_get_session):
+        """Test get_client."""
+        context = Context(boto3_credentials=BOTO3_CREDENTIALS.copy(),
+                          region='us-east-1')
+        mock_get_session.reset_mock()
+
+        self.assertIs(context.get_client('ec2'),
+                      context.get_client('ec2', region='us-east-1'))
+        mock_get_session.assert_called_once_with(region='us-east-1',
+                                                 **GET_SESSION_CALL)
+        mock_get_session.return_value.client.assert_called_once_with('ec2')
+
+        context.get_client('ec2', region='us-west-2')
+        context.get_client('ec2', profile='user')
+        self.assertEqual(mock_get_session.call_count, 3)
+        # clients are reused with the same credentials only
+        context._Context__boto3_credentials = {}  # pylint: disable=protected-access
+        context.get_client('ec2')
+        self.assertEqual(mock_get_session.call_count, 4)
+
+    def test_pickle(self):
+        """Test the context can be pickled."""
+        context = Context(config=Config({'namespace': 'test',
+                                         'stacks': [{'name': 'stack1'}]}),
+                          environment={'key': 'val'},
+                          region='us-east-1')
+        context.get_stacks()
+
+        unpickled = pickle.loads(pickle.dumps(context))
+        self.assertEqual(unpickled.get_fqn('stack1'), 'test-stack1')
+        self.assertEqual(unpickled.environment, {'key': 'val'})
+        self.assertEqual(unpickled.config.stacks[0].name, 'stack1')
+        self.assertIsNone(unpickled.s3_conn)
+        self.assertIsNone(unpickled._stacks)
+
     def test_hook_with_sys_path(self):
         """Test hook with sys path."""
         config = Config({
@@ -455,7 +492,7 @@ class TestContext(unittest.TestCase):
         }
         context._persistent_graph = Graph.from_dict(graph_dict, context)
         stubber = Stubber(context.s3_conn)
-        expected_params = {'Body': json.dumps(graph_dict, indent=4),
+        expected_params = {'Body': json.dumps(graph_dict),
                            'ServerSideEncryption': 'AES256',
                            'ACL': 'bucket-owner-full-control',
                            'ContentType': 'application/json',
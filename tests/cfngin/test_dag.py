@@ -1,10 +1,11 @@
 """Tests for runway.cfngin.dag."""
 import threading
+import time
 
 import pytest
 
-from runway.cfngin.dag import (DAGValidationError, ThreadedWalker,
-                               UnlimitedSemaphore)
+from runway.cfngin.dag import (DAG, DAGValidationError, ReadyQueueWalker,
+                               ThreadedWalker, UnlimitedSemaphore)
 
 
 def test_add_node(empty_dag):
@@ -137,6 +138,70 @@ def test_all_downstreams_pass_graph(empty_dag):
     assert dag.all_downstreams('d') == []
 
 
+def test_all_upstreams(basic_dag):
+    """Test all upstreams."""
+    dag = basic_dag
+
+    assert dag.all_upstreams('d') == ['a', 'b', 'c']
+    assert dag.all_upstreams('b') == ['a']
+    assert dag.all_upstreams('a') == []
+
+
+def test_add_edge_cycle(basic_dag):
+    """Test add_edge detects cycles before and after reachability is known."""
+    dag = basic_dag
+
+    with pytest.raises(DAGValidationError):
+        dag.add_edge('d', 'a')
+    assert dag.all_downstreams('d') == []
+    with pytest.raises(DAGValidationError):
+        dag.add_edge('d', 'a')
+    with pytest.raises(DAGValidationError):
+        dag.add_edge('a', 'a')
+    dag.add_node('e')
+    dag.add_edge('d', 'e')
+    assert dag.all_downstreams('a') == ['b', 'c', 'd', 'e']
+
+
+def test_add_edges(basic_dag):
+    """Test add_edges does not add any edge if the graph would be invalid."""
+    dag = basic_dag
+    dag.add_node('e')
+
+    with pytest.raises(DAGValidationError):
+        dag.add_edges([('d', 'e'), ('e', 'a')])
+    assert dag.graph['d'] == set()
+    assert dag.graph['e'] == set()
+    with pytest.raises(KeyError):
+        dag.add_edges([('d', 'e'), ('e', 'f')])
+    assert dag.graph['d'] == set()
+    dag.add_edges([('d', 'e'), ('a', 'b')])
+    assert dag.all_downstreams('b') == ['d', 'e']
+
+
+@pytest.mark.parametrize('size', [1000, 5000])
+def test_large_graph(size):
+    """Test building and reducing a large graph.
+
+    Each node depends on the five nodes before it so every node except the
+    first two has redundant edges.
+
+    """
+    nodes = ['stack%s' % i for i in range(size)]
+    dag = DAG()
+    dag.from_dict({node: nodes[max(0, i - 5):i]
+                   for i, node in enumerate(nodes)})
+    assert dag.all_downstreams(nodes[-1]) == list(reversed(nodes[:-1]))
+    assert dag.all_upstreams(nodes[0]) == list(reversed(nodes[1:]))
+
+    dag.transitive_reduction()
+    assert all(dag.graph[node] == {nodes[i - 1]}
+               for i, node in enumerate(nodes) if i)
+    assert dag.graph[nodes[0]] == set()
+    with pytest.raises(DAGValidationError):
+        dag.add_edge(nodes[0], nodes[-1])
+
+
 def test_predecessors(basic_dag):
     """Test predecessors."""
     dag = basic_dag
@@ -246,3 +311,74 @@ def test_threaded_walker(empty_dag):
 
     walker.walk(dag, walk_func)
     assert nodes == ['d', 'c', 'b', 'a'] or nodes == ['d', 'b', 'c', 'a']
+
+
+def test_ready_queue_walker(empty_dag):
+    """Test ready queue walker."""
+    dag = empty_dag
+
+    walker = ReadyQueueWalker()
+
+    # b and c should be executed at the same time.
+    dag.from_dict({'a': ['b', 'c'],
+                   'b': ['d'],
+                   'c': ['d'],
+                   'd': []})
+
+    lock = threading.Lock()  # Protects nodes from concurrent access
+    nodes = []
+
+    def walk_func(node):
+        with lock:
+            nodes.append(node)
+        return True
+
+    walker.walk(dag, walk_func)
+    assert nodes == ['d', 'c', 'b', 'a'] or nodes == ['d', 'b', 'c', 'a']
+
+
+def test_ready_queue_walker_max_workers(empty_dag):
+    """Test ready queue walker does not exceed max_workers."""
+    dag = empty_dag
+    dag.from_dict({'a': ['e'], 'b': ['e'], 'c': ['e'], 'd': ['e'], 'e': []})
+
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+    started = []
+
+    def walk_func(node):
+        with lock:
+            started.append(node)
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return True
+
+    ReadyQueueWalker(2).walk(dag, walk_func)
+    assert started[0] == 'e'
+    assert sorted(started) == ['a', 'b', 'c', 'd', 'e']
+    assert max_running[0] == 2
+
+
+def test_ready_queue_walker_exception(empty_dag):
+    """Test ready queue walker continues when walk_func raises."""
+    dag = empty_dag
+    dag.from_dict({'a': ['b'], 'b': []})
+    nodes = []
+
+    def walk_func(node):
+        nodes.append(node)
+        if node == 'b':
+            raise ValueError('test')
+        return True
+
+    ReadyQueueWalker().walk(dag, walk_func)
+    assert nodes == ['b', 'a']
+
+
+def test_ready_queue_walker_empty(empty_dag):
+    """Test ready queue walker with an empty graph."""
+    ReadyQueueWalker().walk(empty_dag, lambda node: True)
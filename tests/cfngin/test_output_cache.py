@@ -0,0 +1,71 @@
+"""Tests for runway.cfngin.output_cache."""
+# pylint: disable=no-self-use
+import pickle
+import threading
+import time
+import unittest
+
+from mock import MagicMock
+
+from runway.cfngin.output_cache import OutputCache
+
+
+class TestOutputCache(unittest.TestCase):
+    """Tests for runway.cfngin.output_cache.OutputCache."""
+
+    def test_get(self):
+        """Test get."""
+        cache = OutputCache(region='us-east-1')
+        fetch = MagicMock(return_value={'Key': 'val'})
+
+        self.assertEqual(cache.get('stack', fetch), {'Key': 'val'})
+        self.assertEqual(cache.get('stack', fetch, region='us-east-1'),
+                         {'Key': 'val'})
+        fetch.assert_called_once_with()
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+
+        # region and profile are part of the key
+        cache.get('stack', fetch, region='us-west-2')
+        cache.get('stack', fetch, profile='other')
+        self.assertEqual(fetch.call_count, 3)
+        self.assertEqual(cache.misses, 3)
+
+    def test_get_concurrent(self):
+        """Test only one fetch is in flight per key."""
+        cache = OutputCache()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return {'Key': 'val'}
+
+        results = []
+        threads = [threading.Thread(
+            target=lambda: results.append(cache.get('stack', fetch))
+        ) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [{'Key': 'val'}] * 5)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 4)
+
+    def test_set(self):
+        """Test set replaces cached outputs."""
+        cache = OutputCache()
+        cache.get('stack', lambda: {'Key': 'old'})
+        cache.set('stack', {'Key': 'new'})
+        self.assertEqual(cache.get('stack', MagicMock()), {'Key': 'new'})
+
+    def test_pickle(self):
+        """Test the cache can be pickled."""
+        cache = OutputCache(region='us-east-1')
+        cache.set('stack', {'Key': 'val'})
+
+        unpickled = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(unpickled.get('stack', MagicMock()), {'Key': 'val'})
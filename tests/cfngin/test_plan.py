@@ -4,9 +4,12 @@ import json
 import os
 import shutil
 import tempfile
+import time
 import unittest
 
+import boto3
 import mock
+from botocore.stub import Stubber
 
 from runway.cfngin.context import Config, Context
 from runway.cfngin.dag import walk
@@ -14,11 +17,13 @@ from runway.cfngin.exceptions import (CancelExecution, GraphError,
                                       PersistentGraphLocked, PlanFailed)
 from runway.cfngin.lookups.registry import (register_lookup_handler,
                                             unregister_lookup_handler)
-from runway.cfngin.plan import Graph, Plan, Step
+from runway.cfngin.plan import Graph, PersistentGraphWriter, Plan, Step
 from runway.cfngin.stack import Stack
 from runway.cfngin.status import COMPLETE, FAILED, SKIPPED, SUBMITTED
 from runway.cfngin.util import stack_template_key_name
 
+from runway.lookups.handlers.ssm import SsmLookup
+
 from .factories import generate_definition, mock_context
 
 
@@ -247,6 +252,49 @@ class TestPlan(unittest.TestCase):
         self.assertEqual(set(['vpc.1']), result_graph_dict.get('bastion.1'))
         self.assertIsNone(result_graph_dict.get('namespace-removed.1'))
 
+    def test_execute_plan_persistent_graph_batched(self):
+        """Test persistent graph updates are uploaded in batches."""
+        def _launch_stack(stack, status=None):
+            return COMPLETE
+
+        for interval, expected_calls in [(60, 1), (0, 3)]:
+            context = Context(config=self.config)
+            context.put_persistent_graph = mock.MagicMock()
+            context._persistent_graph = Graph.from_steps([])
+            steps = [Step(Stack(definition=generate_definition(name, 1),
+                                context=context), _launch_stack)
+                     for name in ['vpc', 'bastion', 'db']]
+            plan = Plan(description="Test", graph=Graph.from_steps(steps),
+                        context=context)
+
+            with mock.patch('runway.cfngin.plan.'
+                            'PERSISTENT_GRAPH_FLUSH_INTERVAL', interval):
+                plan.execute(walk)
+
+            self.assertEqual(context.put_persistent_graph.call_count,
+                             expected_calls)
+            context.put_persistent_graph.assert_called_with(plan.lock_code)
+            self.assertEqual(len(context.persistent_graph.to_dict()), 3)
+
+    def test_persistent_graph_writer_interval(self):
+        """Test changes are uploaded within the interval without updates."""
+        context = mock.MagicMock()
+        writer = PersistentGraphWriter(context, 'code', interval=0.1)
+        writer.update(mock.MagicMock())
+        writer.update(mock.MagicMock())
+        context.put_persistent_graph.assert_not_called()
+
+        time.sleep(0.3)
+        context.put_persistent_graph.assert_called_once_with('code')
+        self.assertEqual(writer.flushes, 1)
+
+        # the timer is cancelled by flush
+        writer._last_flush = time.time()
+        writer.update(mock.MagicMock())
+        writer.flush()
+        time.sleep(0.2)
+        self.assertEqual(context.put_persistent_graph.call_count, 2)
+
     def test_execute_plan_no_persist(self):
         """Test execute plan with no persistent graph."""
         context = Context(config=self.config)
@@ -273,6 +321,44 @@ class TestPlan(unittest.TestCase):
         self.assertEqual(calls, ['namespace-vpc.1', 'namespace-bastion.1'])
         context.put_persistent_graph.assert_not_called()
 
+    def test_execute_plan_ssm_parameter_written(self):
+        """Test parameters written by a step are read by later steps."""
+        context = Context(config=self.config)
+        client = boto3.client('ssm', region_name='us-east-1')
+        stubber = Stubber(client)
+        writer = Stack(definition=generate_definition('writer', 1),
+                       context=context)
+        reader = Stack(definition=generate_definition('reader', 1,
+                                                      requires=[writer.name]),
+                       context=context)
+        # prefetched before the plan was executed
+        stubber.add_response('get_parameters',
+                             {'Parameters': [],
+                              'InvalidParameters': ['/param']},
+                             {'Names': ['/param'], 'WithDecryption': True})
+        stubber.add_response('get_parameter',
+                             {'Parameter': {'Name': '/param', 'Type': 'String',
+                                            'Value': 'written'}},
+                             {'Name': '/param', 'WithDecryption': True})
+        values = []
+
+        def _write(stack, status=None):
+            return COMPLETE  # e.g. creates an AWS::SSM::Parameter
+
+        def _read(stack, status=None):
+            values.append(SsmLookup._get_parameter(
+                client, context.ssm_cache, 'us-east-1', '/param'
+            )['Value'])
+            return COMPLETE
+
+        graph = Graph.from_steps([Step(writer, _write), Step(reader, _read)])
+        plan = Plan(description="Test", graph=graph, context=context)
+        with stubber:
+            context.ssm_cache.prefetch(client, 'us-east-1', ['/param'])
+            plan.execute(walk)
+        stubber.assert_no_pending_responses()
+        self.assertEqual(['written'], values)
+
     def test_execute_plan_locked(self):
         """Test execute plan locked.
 
@@ -0,0 +1,39 @@
+"""Tests for runway.cfngin.session_cache."""
+import copy
+import pickle
+import unittest
+
+from mock import MagicMock
+
+from runway.cfngin.session_cache import ClientCache
+
+
+class TestClientCache(unittest.TestCase):
+    """Tests for runway.cfngin.session_cache.ClientCache."""
+
+    def test_get(self):
+        """Test get."""
+        cache = ClientCache(maxsize=2)
+        create = MagicMock(side_effect=lambda: object())
+
+        client = cache.get(('s3', 'us-east-1'), create)
+        self.assertIs(cache.get(('s3', 'us-east-1'), create), client)
+        self.assertEqual(create.call_count, 1)
+        self.assertEqual(cache.clients_created, 1)
+
+        cache.get(('ec2', 'us-east-1'), create)
+        cache.get(('s3', 'us-east-1'), create)  # most recently used
+        cache.get(('iam', 'us-east-1'), create)  # evicts ec2
+        self.assertIs(cache.get(('s3', 'us-east-1'), create), client)
+        cache.get(('ec2', 'us-east-1'), create)
+        self.assertEqual(cache.clients_created, 4)
+
+    def test_copy(self):
+        """Test copies share the cache and pickles are empty."""
+        cache = ClientCache(maxsize=2)
+        cache.get(('s3', 'us-east-1'), object)
+
+        self.assertIs(copy.deepcopy(cache), cache)
+        unpickled = pickle.loads(pickle.dumps(cache))
+        self.assertEqual(unpickled.maxsize, 2)
+        self.assertFalse(unpickled._clients)  # pylint: disable=protected-access
@@ -116,6 +116,17 @@ class TestStack(unittest.TestCase):
         stack = Stack(definition=definition, context=self.context)
         self.assertEqual(stack.tags, {"environment": "prod", "app": "graph"})
 
+    def test_set_outputs(self):
+        """Test set_outputs stores outputs in the output cache."""
+        outputs = {"VpcId": "vpc-123"}
+        self.stack.set_outputs(outputs)
+        self.assertEqual(self.stack.outputs, outputs)
+        self.assertEqual(
+            self.context.output_cache.get(self.stack.fqn, MagicMock()),
+            outputs
+        )
+        self.assertEqual(self.context.output_cache.hits, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,86 @@
+"""Tests for runway.cfngin.template_cache."""
+# pylint: disable=no-self-use
+import os
+import shutil
+import tempfile
+import unittest
+
+from runway.cfngin.template_cache import TemplateCache, blueprint_cache_key
+from runway.variables import Variable
+
+from .factories import mock_context
+from .fixtures.mock_blueprints import Dummy, Dummy2
+
+
+def resolved_blueprint(blueprint_class, value, context=None, **kwargs):
+    """Create a blueprint with resolved variables."""
+    blueprint = blueprint_class(name='test', context=context or mock_context(),
+                                **kwargs)
+    blueprint.resolve_variables([Variable('StringVariable', value, 'cfngin')])
+    return blueprint
+
+
+class TestBlueprintCacheKey(unittest.TestCase):
+    """Tests for runway.cfngin.template_cache.blueprint_cache_key."""
+
+    def test_key(self):
+        """Test the key changes with the inputs of the template."""
+        key = blueprint_cache_key(resolved_blueprint(Dummy, 'val'))
+
+        self.assertEqual(blueprint_cache_key(resolved_blueprint(Dummy, 'val')),
+                         key)
+        for blueprint in [
+                resolved_blueprint(Dummy, 'other'),
+                resolved_blueprint(Dummy2, 'val'),
+                resolved_blueprint(Dummy, 'val', mappings={'m': {'k': 'v'}}),
+                resolved_blueprint(Dummy, 'val', description='description'),
+                resolved_blueprint(Dummy, 'val', mock_context('other')),
+                resolved_blueprint(Dummy, 'val',
+                                   mock_context(environment={'k': 'v'}))
+        ]:
+            self.assertNotEqual(blueprint_cache_key(blueprint), key)
+
+    def test_key_file(self):
+        """Test the key changes with the files referenced by variables."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = os.path.join(tmp_dir, 'user_data.sh')
+        with open(path, 'w') as file_:
+            file_.write('echo 1')
+        blueprint = resolved_blueprint(Dummy, 'file://' + path)
+        key = blueprint_cache_key(blueprint)
+
+        with open(path, 'w') as file_:
+            file_.write('echo 2')
+        self.assertNotEqual(blueprint_cache_key(blueprint), key)
+
+
+class TestTemplateCache(unittest.TestCase):
+    """Tests for runway.cfngin.template_cache.TemplateCache."""
+
+    def test_get_set(self):
+        """Test get and set."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        cache = TemplateCache(os.path.join(tmp_dir, 'templates'))
+
+        self.assertIsNone(cache.get('key'))
+        cache.set('key', 'version', '{}')
+        self.assertEqual(cache.get('key'), ('version', '{}'))
+        self.assertEqual(TemplateCache(cache.path).get('key'),
+                         ('version', '{}'))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(os.listdir(cache.path), ['key.json'])
+
+    def test_set_error(self):
+        """Test set ignores errors."""
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        path = os.path.join(tmp_dir, 'file')
+        with open(path, 'w') as file_:
+            file_.write('')
+        cache = TemplateCache(path)
+
+        cache.set('key', 'version', '{}')
+        self.assertIsNone(cache.get('key'))
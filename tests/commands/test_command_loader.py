@@ -0,0 +1,51 @@
+"""Test runway.commands.command_loader."""
+import json
+import subprocess
+import sys
+
+import pytest
+
+from runway.commands.command_loader import COMMANDS, find_command_class
+from runway.commands.modules.destroy import Destroy
+from runway.commands.runway.whichenv import WhichEnv
+
+# modules that are too slow to import for commands that don't use them
+HEAVY_MODULES = ['boto3', 'botocore.client', 'docker', 'troposphere',
+                 'runway.cfngin.cfngin', 'runway.commands.modules_command']
+
+
+def test_find_command_class():
+    """Test find_command_class."""
+    assert find_command_class(['whichenv']) is WhichEnv
+    assert find_command_class(['cfn', 'dismantle']) is Destroy
+    assert find_command_class(['not-a-command']) is None
+    assert sorted(COMMANDS) == sorted(
+        name.replace('-', '_') for name in
+        ['deploy', 'destroy', 'dismantle', 'envvars', 'gen-sample', 'init',
+         'kbenv', 'plan', 'preflight', 'run-aws', 'run-python',
+         'run-stacker', 'takeoff', 'taxi', 'test', 'tfenv', 'whichenv']
+    )
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='runway.cfngin is only loaded lazily on 3.7+')
+@pytest.mark.parametrize('command', ['envvars', 'init', 'whichenv'])
+def test_import_time(command):
+    """Test commands that don't use AWS don't import heavy modules.
+
+    Modules are imported in a new interpreter, as ``runway`` would.
+
+    """
+    code = '\n'.join([
+        'import json, sys, timeit',
+        'start = timeit.default_timer()',
+        'from runway.cli import find_command_class',
+        'find_command_class([%r])' % command,
+        'print(json.dumps({"time": timeit.default_timer() - start,',
+        '                  "modules": [m for m in %r if m in sys.modules]}))'
+        % HEAVY_MODULES,
+    ])
+    result = json.loads(subprocess.check_output([sys.executable, '-c',
+                                                 code]).decode())
+    assert not result['modules'], 'importing the %s command took %.3fs ' \
+        'and imported: %s' % (command, result['time'], result['modules'])
@@ -1,6 +1,9 @@
 """Tests runway/commands/modules_command.py."""
 # pylint: disable=no-self-use,redefined-outer-name
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from os import path
 
@@ -9,10 +12,14 @@ import yaml
 from mock import MagicMock, call, patch
 from moto import mock_sts
 
+from runway.cfngin.dag import DAGValidationError
 from runway.commands.modules_command import (ModulesCommand,
+                                             build_module_dag,
+                                             get_module_order,
                                              select_modules_to_run,
                                              validate_environment)
-from runway.config import Config
+from runway.config import Config, DeploymentDefinition, ModuleDefinition
+from runway.lookups.handlers.ssm import SsmParameterCache
 from runway.util import environ
 
 MODULE_PATH = 'runway.commands.modules_command'
@@ -62,6 +69,216 @@ class TestModulesCommand(object):
                                        prompt_if_unexpected=False)])
 
 
+@pytest.fixture
+def modules_command(monkeypatch, tmp_path):
+    """Create a ModulesCommand."""
+    monkeypatch.setattr(Config, 'find_config_file',
+                        MagicMock(return_value=str(tmp_path / 'runway.yml')))
+    return ModulesCommand(cli_arguments={}, env_root=str(tmp_path))
+
+
+class TestProcessModules(object):
+    """Test ModulesCommand._process_modules."""
+
+    @staticmethod
+    def get_deployment(modules, reverse=False):
+        """Create a deployment and the list of modules deployed by it."""
+        deployment = DeploymentDefinition({'name': 'test', 'modules': modules,
+                                           'regions': ['us-east-1']})
+        if reverse:
+            deployment.reverse()
+        deployed = []
+        lock = threading.Lock()
+
+        def deploy_module(_self, module, _deployment, _context,
+                          is_concurrent=False):
+            """Record the module and when it started and finished."""
+            with lock:
+                deployed.append(('start', module.name))
+            time.sleep(0.05)
+            if module.name == 'fail':
+                raise ValueError('fail')
+            with lock:
+                deployed.append(('end', module.name))
+        return deployment, deployed, deploy_module
+
+    def test_sequential(self, modules_command, monkeypatch):
+        """Test modules are deployed one at a time after their dependencies."""
+        deployment, deployed, deploy_module = self.get_deployment([
+            'a', {'path': 'b', 'depends_on': ['c']},
+            {'path': 'c', 'depends_on': ['a']}
+        ])
+        monkeypatch.setattr(ModulesCommand, '_deploy_module', deploy_module)
+        context = MagicMock(use_concurrent=True)
+
+        modules_command._process_modules(deployment, context)
+        assert [name for event, name in deployed if event == 'start'] == \
+            ['a', 'c', 'b']
+
+    def test_concurrent(self, modules_command, monkeypatch):
+        """Test modules are deployed as soon as their dependencies complete."""
+        deployment, deployed, deploy_module = self.get_deployment([
+            'a', {'parallel': ['b', 'c'], 'name': 'group'}, 'd',
+            {'path': 'e', 'depends_on': []},
+            {'path': 'f', 'depends_on': ['group']}
+        ])
+        monkeypatch.setattr(ModulesCommand, '_deploy_module', deploy_module)
+        submitted = []
+
+        class Executor(ThreadPoolExecutor):
+            """Record the modules deployed in processes."""
+
+            def submit(self, fn, *args, **kwargs):  # noqa pylint: disable=arguments-differ
+                """Submit a module."""
+                submitted.append(args[0].name)
+                return super(Executor, self).submit(fn, *args, **kwargs)
+
+        # modules are deployed in processes; threads are enough to test
+        monkeypatch.setattr(MODULE_PATH + '.concurrent.futures.'
+                            'ProcessPoolExecutor', Executor)
+        context = MagicMock(use_concurrent=True, max_concurrent_modules=4)
+
+        modules_command._process_modules(deployment, context)
+        # e can run at the same time as any other module
+        assert sorted(submitted) == list('abcdef')
+        assert sorted(deployed) == sorted(
+            (event, name) for event in ['start', 'end']
+            for name in 'abcdef'
+        )
+        assert deployed[:2] == [('start', 'a'), ('start', 'e')] or \
+            deployed[:2] == [('start', 'e'), ('start', 'a')]
+        for name, deps in [('b', 'a'), ('c', 'a'), ('d', 'bc'),
+                           ('f', 'bc')]:
+            for dep in deps:
+                assert deployed.index(('end', dep)) < \
+                    deployed.index(('start', name))
+
+    def test_concurrent_in_process(self, modules_command, monkeypatch):
+        """Test modules that can't run with another are run in process."""
+        deployment, deployed, deploy_module = self.get_deployment([
+            'a', {'parallel': ['b', 'c']}, 'd'
+        ])
+        monkeypatch.setattr(ModulesCommand, '_deploy_module', deploy_module)
+        executor = MagicMock()
+        executor.return_value.submit.side_effect = \
+            ThreadPoolExecutor(2).submit
+        monkeypatch.setattr(MODULE_PATH + '.concurrent.futures.'
+                            'ProcessPoolExecutor', executor)
+        context = MagicMock(use_concurrent=True, max_concurrent_modules=4)
+
+        modules_command._process_modules(deployment, context)
+        assert sorted(call_[0][1].name for call_ in
+                      executor.return_value.submit.call_args_list) == \
+            ['b', 'c']
+        assert all(call_[1] == {'is_concurrent': True} for call_ in
+                   executor.return_value.submit.call_args_list)
+        assert len(deployed) == 8
+
+    def test_concurrent_failed(self, modules_command, monkeypatch):
+        """Test modules depending on a failed module are skipped."""
+        deployment, deployed, deploy_module = self.get_deployment([
+            'fail', {'path': 'a', 'depends_on': []},
+            {'path': 'b', 'depends_on': ['fail']}, 'c'
+        ])
+        monkeypatch.setattr(ModulesCommand, '_deploy_module', deploy_module)
+        monkeypatch.setattr(MODULE_PATH + '.concurrent.futures.'
+                            'ProcessPoolExecutor', ThreadPoolExecutor)
+        context = MagicMock(use_concurrent=True, max_concurrent_modules=4)
+
+        with pytest.raises(ValueError):
+            modules_command._process_modules(deployment, context)
+        assert ('end', 'a') in deployed
+        assert ('start', 'b') not in deployed
+        assert ('start', 'c') not in deployed
+
+    def test_ssm_cache_cleared(self, modules_command, monkeypatch):
+        """Test cached SSM parameters are dropped when a module completes."""
+        deployment, _deployed, _deploy_module = self.get_deployment(['a',
+                                                                     'b'])
+        context = MagicMock(use_concurrent=False,
+                            ssm_cache=SsmParameterCache())
+        values = []
+
+        def deploy_module(_self, _module, _deployment, _context):
+            """Read a parameter the first module could have written."""
+            try:
+                values.append(context.ssm_cache.get('us-east-1', '/param'))
+            except KeyError:
+                values.append('not cached')
+
+        monkeypatch.setattr(ModulesCommand, '_deploy_module', deploy_module)
+        # prefetched before the modules were processed; missing
+        context.ssm_cache.set('us-east-1', '/param', None)
+
+        modules_command._process_modules(deployment, context)
+        assert values == [None, 'not cached']
+
+    def test_destroy(self, modules_command, monkeypatch):
+        """Test modules are destroyed after the modules depending on them."""
+        deployment, deployed, deploy_module = self.get_deployment([
+            'a', {'path': 'b', 'depends_on': []}, 'c'
+        ], reverse=True)
+        monkeypatch.setattr(ModulesCommand, '_deploy_module', deploy_module)
+        context = MagicMock(use_concurrent=False)
+
+        modules_command._process_modules(deployment, context)
+        assert [name for event, name in deployed if event == 'start'] == \
+            ['c', 'b', 'a']
+
+
+class TestBuildModuleDag(object):
+    """Tests for build_module_dag."""
+
+    def test_list_order(self):
+        """Test modules depend on the modules listed before them."""
+        dag, nodes = build_module_dag(ModuleDefinition.from_list([
+            'a', {'parallel': ['b', 'c']}, 'd', 'a'
+        ]))
+        assert list(nodes) == ['a', 'b', 'c', 'd', 'a (5)']
+        assert dag.graph == {'a': set(), 'b': {'a'}, 'c': {'a'},
+                             'd': {'b', 'c'}, 'a (5)': {'d'}}
+        assert get_module_order(dag, list(nodes)) == list(nodes)
+
+    def test_depends_on(self):
+        """Test modules depend on the modules named in depends_on."""
+        dag, nodes = build_module_dag(ModuleDefinition.from_list([
+            {'path': 'a', 'depends_on': ['c']},
+            {'name': 'b', 'path': 'b.cfn', 'depends_on': 'missing'},
+            {'parallel': ['c', {'path': 'd', 'depends_on': ['b']}],
+             'name': 'group', 'depends_on': []},
+            {'path': 'e', 'depends_on': ['group', 'b']},
+        ]))
+        assert dag.graph == {'a': {'c'}, 'b': set(), 'c': set(), 'd': {'b'},
+                             'e': {'b', 'c', 'd'}}
+        assert get_module_order(dag, list(nodes)) == ['b', 'c', 'a', 'd',
+                                                      'e']
+
+    def test_reverse(self):
+        """Test the dependencies can be reversed."""
+        dag, _ = build_module_dag(ModuleDefinition.from_list([
+            'a', {'path': 'b', 'depends_on': ['a']}, 'c'
+        ]), reverse=True)
+        assert dag.graph == {'a': {'b'}, 'b': {'c'}, 'c': set()}
+
+    def test_parallel_depends_on(self, caplog):
+        """Test depends_on of parallel modules is not an invalid key."""
+        caplog.set_level('WARNING', logger='runway')
+        dag, _ = build_module_dag(ModuleDefinition.from_list([
+            'a.cfn', 'x.cfn',
+            {'name': 'grp', 'depends_on': 'a.cfn',
+             'parallel': ['b.cfn', 'c.cfn']}
+        ]))
+        assert dag.graph['b.cfn'] == dag.graph['c.cfn'] == {'a.cfn'}
+        assert not caplog.text
+
+    def test_cycle(self):
+        """Test dependencies can't contain a cycle."""
+        with pytest.raises(DAGValidationError):
+            build_module_dag(ModuleDefinition.from_list([
+                {'path': 'a', 'depends_on': ['b']}, 'b'
+            ]))
+
+
 class TestSelectModulesToRun(object):
     """Test runway.commands.modules_command.select_modules_to_run."""
 
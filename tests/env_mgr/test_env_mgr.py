@@ -0,0 +1,127 @@
+"""Tests for runway.env_mgr."""
+# pylint: disable=no-self-use
+import logging
+import os
+
+from six.moves.urllib.request import urlopen  # pylint: disable=E
+
+from runway.env_mgr import (EnvManager, get_remote_url, install_version_dir,
+                            prefetch_versions)
+
+
+class MockManager(EnvManager):
+    """Environment manager that records downloads."""
+
+    name = 'tool'
+
+    def __init__(self, path, downloads):
+        """Instantiate class."""
+        super(MockManager, self).__init__('tool', path)
+        self.env_dir = os.path.join(path, 'tool')
+        self.downloads = downloads
+
+    def get_version(self, version_requested=None):
+        """Resolve the version."""
+        if version_requested == 'invalid':
+            raise SystemExit(1)
+        if version_requested == 'error':
+            raise ValueError('unable to resolve')
+        return version_requested
+
+    def download(self, version):
+        """Record the download."""
+        if version == 'broken':
+            raise ValueError('download failed')
+        self.downloads.append(version)
+        os.mkdir(os.path.join(self.versions_dir, version))
+
+
+def test_prefetch_versions(tmp_path):
+    """Test prefetch_versions."""
+    downloads = []
+    path = str(tmp_path)
+    os.makedirs(os.path.join(path, 'tool', 'versions', '1.0.0'))
+
+    result = prefetch_versions([(MockManager(path, downloads), version)
+                                for version in ['1.0.0', '1.1.0', '1.2.0',
+                                                '1.1.0', 'invalid',
+                                                'broken']])
+
+    assert sorted(result) == ['1.1.0', '1.2.0']
+    assert sorted(downloads) == ['1.1.0', '1.2.0']
+    assert not prefetch_versions([(MockManager(path, downloads), '1.2.0')])
+
+
+def test_prefetch_versions_resolve_error(caplog, tmp_path):
+    """Test prefetch_versions skips modules that fail to resolve."""
+    caplog.set_level(logging.DEBUG, logger='runway')
+    downloads = []
+    path = str(tmp_path)
+
+    result = prefetch_versions([(MockManager(path, downloads), version)
+                                for version in ['invalid', '1.0.0', 'error']])
+
+    assert result == ['1.0.0']
+    assert downloads == ['1.0.0']
+    assert sorted(os.listdir(os.path.join(path, 'tool', 'versions'))) == \
+        ['1.0.0']
+    assert '%s: unable to resolve tool version to prefetch: unable to ' \
+        'resolve' % path in caplog.messages
+    assert not [record for record in caplog.records
+                if record.levelno >= logging.WARNING]
+
+
+def test_get_remote_url(tmp_path):
+    """Test get_remote_url."""
+    assert get_remote_url('https://example.com/', 'tool', '1.0.0',
+                          'tool.zip') == \
+        'https://example.com/tool/1.0.0/tool.zip'
+
+    (tmp_path / 'tool' / '1.0.0').mkdir(parents=True)
+    (tmp_path / 'tool' / '1.0.0' / 'tool.zip').write_bytes(b'archive')
+    url = get_remote_url(str(tmp_path), 'tool', '1.0.0', 'tool.zip')
+
+    assert url.startswith('file:')
+    response = urlopen(url)
+    try:
+        assert response.read() == b'archive'
+    finally:
+        response.close()
+
+
+def test_install_version_dir(tmp_path):
+    """Test install_version_dir."""
+    versions_dir = str(tmp_path)
+
+    def download(version_dir):
+        """Write the files of the version."""
+        with open(os.path.join(version_dir, 'tool'), 'w') as stream:
+            stream.write('1.0.0')
+
+    install_version_dir(download, versions_dir, '1.0.0')
+
+    assert os.listdir(versions_dir) == ['1.0.0']
+    assert os.listdir(os.path.join(versions_dir, '1.0.0')) == ['tool']
+
+
+def test_install_version_dir_concurrent(tmp_path):
+    """Test install_version_dir when the version is installed concurrently."""
+    versions_dir = str(tmp_path)
+
+    def download_other(version_dir):
+        """Write the files of the version installed concurrently."""
+        with open(os.path.join(version_dir, 'tool'), 'w') as stream:
+            stream.write('other')
+
+    def download(version_dir):
+        """Install the version from another "process" before this one ends."""
+        install_version_dir(download_other, versions_dir, '1.0.0')
+        with open(os.path.join(version_dir, 'tool'), 'w') as stream:
+            stream.write('this')
+
+    install_version_dir(download, versions_dir, '1.0.0')
+
+    # the first install to finish is kept and the temp dir is removed
+    assert os.listdir(versions_dir) == ['1.0.0']
+    with open(os.path.join(versions_dir, '1.0.0', 'tool')) as stream:
+        assert stream.read() == 'other'
@@ -0,0 +1,140 @@
+"""Tests for runway.env_mgr.tfenv."""
+# pylint: disable=no-self-use
+import hashlib
+import json
+import os
+import time
+import zipfile
+
+import pytest
+
+from mock import MagicMock, patch
+
+from runway.env_mgr import tfenv
+from runway.env_mgr.tfenv import (TFEnvManager, download_tf_release,
+                                  get_available_tf_versions)
+from runway.util import environ
+
+
+def write_mirror(tmp_path, versions):
+    """Write a mirror of the Terraform release site."""
+    for version in versions:
+        release_dir = tmp_path / 'mirror' / 'terraform' / version
+        release_dir.mkdir(parents=True)
+        filename = 'terraform_%s_linux_amd64.zip' % version
+        with zipfile.ZipFile(str(release_dir / filename), 'w') as archive:
+            archive.writestr('terraform', '#!/bin/sh\necho %s\n' % version)
+        digest = hashlib.sha256((release_dir / filename).read_bytes())
+        (release_dir / ('terraform_%s_SHA256SUMS' % version)).write_text(
+            u'%s  %s\n' % (digest.hexdigest(), filename)
+        )
+    return tmp_path / 'mirror'
+
+
+@patch.dict(tfenv._TF_VERSIONS, clear=True)  # pylint: disable=protected-access
+class TestTFEnv(object):
+    """Test runway.env_mgr.tfenv."""
+
+    def test_mirror(self, tmp_path):
+        """Test versions are found and installed from a mirror directory."""
+        mirror = write_mirror(tmp_path, ['0.11.14', '0.12.24', '0.13.0-rc1'])
+        versions_dir = tmp_path / 'versions'
+        versions_dir.mkdir()
+
+        with environ({'TFENV_REMOTE': str(mirror)}):
+            assert get_available_tf_versions() == ['0.12.24', '0.11.14']
+            download_tf_release('0.12.24', str(versions_dir), '',
+                                tf_platform='linux')
+
+        assert os.listdir(str(versions_dir)) == ['0.12.24']
+        assert os.listdir(str(versions_dir / '0.12.24')) == ['terraform']
+        assert os.access(str(versions_dir / '0.12.24' / 'terraform'), os.X_OK)
+
+    @patch('runway.env_mgr.tfenv.requests.get')
+    def test_release_index_cache(self, mock_get, monkeypatch, tmp_path):
+        """Test the release index is cached."""
+        cache_path = tmp_path / 'index.json'
+        monkeypatch.setattr(tfenv, 'TF_RELEASE_INDEX_CACHE', str(cache_path))
+        mock_get.return_value.json.return_value = {
+            'versions': {'0.12.24': {}, '0.12.23': {}}
+        }
+
+        assert get_available_tf_versions() == ['0.12.24', '0.12.23']
+        mock_get.assert_called_once_with(
+            'https://releases.hashicorp.com/terraform/index.json'
+        )
+        cache = json.loads(cache_path.read_text())
+        versions = cache[tfenv.TF_REMOTE]['versions']
+        assert sorted(versions) == ['0.12.23', '0.12.24']
+
+        # a new process uses the cached index until it expires
+        tfenv._TF_VERSIONS.clear()  # pylint: disable=protected-access
+        assert get_available_tf_versions()[0] == '0.12.24'
+        assert mock_get.call_count == 1
+
+        tfenv._TF_VERSIONS.clear()  # pylint: disable=protected-access
+        monkeypatch.setattr(tfenv, 'TF_RELEASE_INDEX_TTL', 0)
+        mock_get.return_value.raise_for_status.side_effect = \
+            tfenv.requests.exceptions.HTTPError('503')
+        assert get_available_tf_versions()[0] == '0.12.24'
+        assert mock_get.call_count == 2
+
+    @patch('runway.env_mgr.tfenv.requests.get')
+    def test_release_index_cache_ttl(self, mock_get, monkeypatch, tmp_path):
+        """Test the cached release index expires and is a fallback."""
+        cache_path = tmp_path / 'index.json'
+        monkeypatch.setattr(tfenv, 'TF_RELEASE_INDEX_CACHE', str(cache_path))
+        other_cache = {'time': time.time(), 'versions': ['0.11.14']}
+        with open(str(cache_path), 'w') as stream:
+            json.dump({
+                'https://mirror.example.com': other_cache,
+                tfenv.TF_REMOTE: {
+                    'time': time.time() - tfenv.TF_RELEASE_INDEX_TTL - 1,
+                    'versions': ['0.12.23']
+                }
+            }, stream)
+        mock_get.return_value.json.return_value = {
+            'versions': {'0.12.24': {}, '0.12.23': {}}
+        }
+
+        # expired; the index is retrieved and only its remote is updated
+        assert get_available_tf_versions() == ['0.12.24', '0.12.23']
+        assert mock_get.call_count == 1
+        cache = json.loads(cache_path.read_text())
+        assert cache['https://mirror.example.com'] == other_cache
+        assert sorted(cache[tfenv.TF_REMOTE]['versions']) == \
+            ['0.12.23', '0.12.24']
+
+        # expired and the release site can't be reached; the stale index
+        # is used
+        tfenv._TF_VERSIONS.clear()  # pylint: disable=protected-access
+        monkeypatch.setattr(tfenv, 'TF_RELEASE_INDEX_TTL', 0)
+        mock_get.side_effect = tfenv.requests.exceptions.ConnectionError(
+            'unreachable'
+        )
+        assert get_available_tf_versions() == ['0.12.24', '0.12.23']
+        assert mock_get.call_count == 2
+
+        # no cached index to fall back on
+        tfenv._TF_VERSIONS.clear()  # pylint: disable=protected-access
+        cache_path.unlink()
+        with pytest.raises(tfenv.requests.exceptions.ConnectionError):
+            get_available_tf_versions()
+
+    def test_get_version(self, tmp_path):
+        """Test get_version."""
+        mirror = write_mirror(tmp_path, ['0.11.14', '0.12.24'])
+        (tmp_path / '.terraform-version').write_text(u'latest:^0.11')
+        manager = TFEnvManager(str(tmp_path))
+        manager.env_dir = str(tmp_path / 'tfenv')
+
+        with environ({'TFENV_REMOTE': str(mirror)}):
+            assert manager.get_version() == '0.11.14'
+            assert manager.get_version('latest') == '0.12.24'
+            assert not manager.is_installed('0.12.24')
+            assert manager.install('0.12.24') == manager.bin_path('0.12.24')
+            assert manager.is_installed('0.12.24')
+
+        manager.download = MagicMock()
+        assert manager.install('0.12.24') == manager.bin_path('0.12.24')
+        manager.download.assert_not_called()
@@ -0,0 +1,92 @@
+"""Benchmark the latency of the check_auth Auth@Edge function.
+
+Requests carrying a valid ID token are handled with the signing keys
+retrieved from a stub JWKS endpoint for every request (cold) and once for
+the warm container.
+
+Requires the packages of the function (``templates/check_auth/requirements.txt``)::
+
+    python -m tests.hooks.staticsite.auth_at_edge.benchmark_check_auth
+
+"""
+# pylint: disable=import-error
+import argparse
+import base64
+import importlib
+import os
+import sys
+import time
+import timeit
+
+import rsa
+from jose import jwt
+
+from .test_templates import TEMPLATES_DIR, JwksServer
+
+CLIENT_ID = 'client'
+
+
+def b64_int(number):
+    """Encode an integer as unpadded base64url."""
+    data = number.to_bytes((number.bit_length() + 7) // 8, 'big')
+    return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def percentile(values, pct):
+    """Get a percentile of a list of values."""
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--requests', type=int, default=500)
+    args = parser.parse_args()
+
+    sys.path[:0] = [TEMPLATES_DIR, os.path.join(TEMPLATES_DIR, 'check_auth')]
+    check_auth = importlib.import_module('check_auth')
+    client = importlib.import_module('jwks_rsa.client')
+
+    public_key, private_key = rsa.newkeys(2048)
+    server = JwksServer()
+    server.keys = [{'kty': 'RSA', 'kid': 'kid1', 'use': 'sig',
+                    'n': b64_int(public_key.n), 'e': b64_int(public_key.e)}]
+    issuer = server.uri.rsplit('/.well-known', 1)[0]
+    check_auth.CONFIG.update(client_id=CLIENT_ID, token_issuer=issuer,
+                             token_jwks_uri=server.uri)
+    token = jwt.encode({'aud': CLIENT_ID, 'iss': issuer, 'sub': 'user',
+                        'exp': int(time.time()) + 3600},
+                       private_key.save_pkcs1().decode(), algorithm='RS256',
+                       headers={'kid': 'kid1'})
+    prefix = 'CognitoIdentityServiceProvider.%s' % CLIENT_ID
+    request = {'uri': '/', 'querystring': '', 'headers': {
+        'host': [{'key': 'Host', 'value': 'example.com'}],
+        'cookie': [{'key': 'Cookie', 'value': '%s.LastAuthUser=user; '
+                                              '%s.user.idToken=%s'
+                                              % (prefix, prefix, token)}]
+    }}
+    event = {'Records': [{'cf': {'request': request}}]}
+
+    try:
+        for name, cold in [('cold', True), ('warm', False)]:
+            client._SIGNING_KEY_CACHE.clear()  # pylint: disable=protected-access
+            server.requests = 0
+            latencies = []
+            for _ in range(args.requests):
+                if cold:
+                    client._SIGNING_KEY_CACHE.clear()  # noqa pylint: disable=protected-access
+                start = timeit.default_timer()
+                response = check_auth.handler(event, None)
+                latencies.append((timeit.default_timer() - start) * 1000)
+                assert response is request, 'token was not accepted'
+            print('%s: p50 %.2fms, p99 %.2fms, %s JWKS request(s)' % (
+                name, percentile(latencies, 50), percentile(latencies, 99),
+                server.requests
+            ))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
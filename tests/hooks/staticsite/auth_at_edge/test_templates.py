@@ -0,0 +1,144 @@
+"""Tests for the Auth@Edge Lambda function templates."""
+# pylint: disable=import-error,redefined-outer-name
+import importlib
+import json
+import os
+import re
+import sys
+import threading
+
+import pytest
+from mock import patch
+from six.moves.BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+import runway.hooks.staticsite.auth_at_edge
+
+pytestmark = pytest.mark.skipif(sys.version_info.major < 3,  # noqa pylint: disable=invalid-name
+                                reason='Auth@Edge functions run on python 3')
+
+TEMPLATES_DIR = os.path.join(
+    os.path.dirname(runway.hooks.staticsite.auth_at_edge.__file__),
+    'templates'
+)
+
+
+def signing_key(kid):
+    """Create a JWKS signing key."""
+    return {'kty': 'RSA', 'kid': kid, 'use': 'sig', 'n': 'sXch', 'e': 'AQAB'}
+
+
+class JwksServer(object):
+    """Stub JWKS endpoint counting the requests it receives."""
+
+    def __init__(self):
+        """Instantiate class."""
+        self.keys = [signing_key('kid1')]
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Respond with the keys of the server."""
+
+            def do_GET(self):  # noqa pylint: disable=invalid-name
+                """Handle GET."""
+                server.requests += 1
+                body = json.dumps({'keys': server.keys}).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                """Don't log requests."""
+
+        self.httpd = HTTPServer(('127.0.0.1', 0), Handler)
+        self.uri = 'http://127.0.0.1:%s/.well-known/jwks.json' % (
+            self.httpd.server_address[1]
+        )
+        self.thread = threading.Thread(target=self.httpd.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def shutdown(self):
+        """Stop the server."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def jwks_client(monkeypatch):
+    """Import the jwks_rsa client module of the check_auth function."""
+    monkeypatch.syspath_prepend(os.path.join(TEMPLATES_DIR, 'check_auth'))
+    module = importlib.import_module('jwks_rsa.client')
+    with patch.dict(module._SIGNING_KEY_CACHE, clear=True):  # noqa pylint: disable=protected-access
+        yield module
+
+
+@pytest.fixture
+def jwks_server():
+    """Run a stub JWKS endpoint."""
+    server = JwksServer()
+    yield server
+    server.shutdown()
+
+
+class TestJwksClient(object):
+    """Test the jwks_rsa client of the check_auth function."""
+
+    def test_get_cached_public_key(self, jwks_client, jwks_server):
+        """Test signing keys are retrieved once."""
+        client = jwks_client.JwksClient({'jwks_uri': jwks_server.uri})
+        key = client.get_cached_public_key('kid1')
+        assert key.startswith('-----BEGIN RSA PUBLIC KEY-----')
+        assert jwks_client.JwksClient(
+            {'jwks_uri': jwks_server.uri}
+        ).get_cached_public_key('kid1') == key
+        assert jwks_server.requests == 1
+
+    def test_get_cached_public_key_unknown_kid(self, jwks_client,
+                                               jwks_server):
+        """Test signing keys are retrieved again for unknown key ids."""
+        client = jwks_client.JwksClient({'jwks_uri': jwks_server.uri})
+        client.get_cached_public_key('kid1')
+        jwks_server.keys.append(signing_key('kid2'))
+
+        # recently retrieved keys are not retrieved again
+        with pytest.raises(Exception) as excinfo:
+            client.get_cached_public_key('kid2')
+        assert 'kid2' in str(excinfo.value)
+        assert jwks_server.requests == 1
+
+        with patch.object(jwks_client, 'JWKS_REFRESH_INTERVAL', -1):
+            assert client.get_cached_public_key('kid2')
+        assert jwks_server.requests == 2
+
+    def test_get_cached_public_key_expired(self, jwks_client, jwks_server):
+        """Test cached keys are used if expired keys can't be retrieved."""
+        client = jwks_client.JwksClient({'jwks_uri': jwks_server.uri})
+        key = client.get_cached_public_key('kid1')
+        jwks_server.keys = []
+
+        with patch.object(jwks_client, 'JWKS_CACHE_TTL', -1):
+            assert client.get_cached_public_key('kid1') == key
+        assert jwks_server.requests == 2
+
+
+def test_get_config():
+    """Test the configuration written by lambda_config is derived once."""
+    with open(os.path.join(TEMPLATES_DIR, 'shared.py')) as file_:
+        # same substitution as the lambda_config hook
+        source = re.sub(r'{.+?(})$', str({'http_headers': {'X-Test': 'a'},
+                                          'user_pool_id': 'us-west-2_abc'}),
+                        file_.read(), 1, flags=re.DOTALL | re.MULTILINE)
+    shared = {'__name__': 'shared'}
+    exec(compile(source, 'shared.py', 'exec'), shared)  # pylint: disable=exec-used
+    config = shared['get_config']()
+
+    assert config is shared['get_config']()
+    assert config['cloud_front_headers'] == {
+        'x-test': [{'key': 'X-Test', 'value': 'a'}]
+    }
+    assert config['token_jwks_uri'] == (
+        'https://cognito-idp.us-west-2.amazonaws.com/us-west-2_abc/'
+        '.well-known/jwks.json'
+    )
@@ -0,0 +1,147 @@
+"""Tests for runway.hooks.staticsite.sync."""
+# pylint: disable=no-self-use
+import hashlib
+import json
+
+import boto3
+import six
+from botocore.stub import Stubber
+from mock import patch
+
+from runway.hooks.staticsite.sync import S3Sync, file_md5
+
+
+def md5(content):
+    """Calculate the MD5 digest of a string."""
+    return hashlib.md5(content.encode()).hexdigest()
+
+
+def write_site(tmp_path):
+    """Write the files of a site."""
+    site = tmp_path / 'site'
+    (site / 'css').mkdir(parents=True)
+    (site / 'index.html').write_text(u'index')
+    (site / 'css' / 'main.css').write_text(u'main')
+    return site
+
+
+class TestS3Sync(object):
+    """Test runway.hooks.staticsite.sync.S3Sync."""
+
+    def test_sync_without_manifest(self, tmp_path):
+        """Test files are compared to the objects in the bucket."""
+        site = write_site(tmp_path)
+        manifest_path = tmp_path / 'cache' / 'bucket.json'
+        client = boto3.client('s3', region_name='us-east-1')
+        stubber = Stubber(client)
+        stubber.add_response('list_objects_v2', {'Contents': [
+            {'Key': 'index.html', 'ETag': '"%s"' % md5('index'), 'Size': 5},
+            {'Key': 'old.html', 'ETag': '"abc"', 'Size': 3}
+        ]}, {'Bucket': 'bucket'})
+        stubber.add_response('put_object', {})
+        stubber.add_response('delete_objects', {}, {
+            'Bucket': 'bucket',
+            'Delete': {'Objects': [{'Key': 'old.html'}], 'Quiet': True}
+        })
+
+        put_params = []
+        client.meta.events.register(
+            'provide-client-params.s3.PutObject',
+            lambda params, **_: put_params.append(dict(params))
+        )
+
+        with stubber:
+            result = S3Sync(client, 'bucket', str(site),
+                            manifest_path=str(manifest_path),
+                            max_concurrency=1).sync()
+        stubber.assert_no_pending_responses()
+        assert [(params['Key'], params['ContentType'])
+                for params in put_params] == [('css/main.css', 'text/css')]
+        assert result.uploads == [(str(site / 'css' / 'main.css'),
+                                   'css/main.css')]
+        assert result.deletes == ['old.html']
+        manifest = json.loads(manifest_path.read_text())
+        assert sorted(manifest) == ['css/main.css', 'index.html']
+        assert manifest['index.html']['md5'] == md5('index')
+
+    def test_sync_with_manifest(self, tmp_path):
+        """Test unchanged files are found without calculating their digest."""
+        site = write_site(tmp_path)
+        manifest_path = tmp_path / 'bucket.json'
+        manifest = {}
+        for key, content in [('css/main.css', 'main'),
+                             ('index.html', 'index'),
+                             ('old.html', 'old')]:
+            path = site / key
+            manifest[key] = {'etag': 'etag-' + key, 'md5': md5(content),
+                             'mtime': 0, 'size': len(content)}
+            if path.exists():
+                manifest[key]['mtime'] = path.stat().st_mtime
+        (site / 'index.html').write_text(u'changed')
+        manifest_path.write_text(six.text_type(json.dumps(manifest)))
+        client = boto3.client('s3', region_name='us-east-1')
+        stubber = Stubber(client)
+        stubber.add_response('list_objects_v2', {'Contents': [
+            {'Key': key, 'ETag': '"%s"' % manifest[key]['etag'],
+             'Size': manifest[key]['size']} for key in sorted(manifest)
+        ]}, {'Bucket': 'bucket'})
+
+        with stubber, patch('runway.hooks.staticsite.sync.file_md5',
+                            side_effect=file_md5) as mock_md5:
+            syncer = S3Sync(client, 'bucket', str(site),
+                            manifest_path=str(manifest_path))
+            result = syncer.sync(dry_run=True)
+        stubber.assert_no_pending_responses()
+        mock_md5.assert_called_once_with(str(site / 'index.html'))
+        assert result.uploads == [(str(site / 'index.html'), 'index.html')]
+        assert result.upload_bytes == len('changed')
+        assert result.deletes == ['old.html']
+        # dry run does not update the manifest
+        assert json.loads(manifest_path.read_text()) == manifest
+
+    def test_sync_bucket_changed(self, tmp_path):
+        """Test objects changed since the manifest was saved are replaced."""
+        site = write_site(tmp_path)
+        (site / 'large.bin').write_bytes(b'0' * 16)
+        manifest_path = tmp_path / 'bucket.json'
+        manifest = {}
+        for key, content in [('css/main.css', 'main'),
+                             ('index.html', 'index')]:
+            manifest[key] = {'etag': md5(content), 'md5': md5(content),
+                             'mtime': (site / key).stat().st_mtime,
+                             'size': len(content)}
+        manifest_path.write_text(six.text_type(json.dumps(manifest)))
+        client = boto3.client('s3', region_name='us-east-1')
+        stubber = Stubber(client)
+        stubber.add_response('list_objects_v2', {'Contents': [
+            # changed by another sync
+            {'Key': 'css/main.css', 'ETag': '"%s"' % md5('other'),
+             'Size': 4},
+            {'Key': 'index.html', 'ETag': '"%s"' % md5('index'), 'Size': 5},
+            # uploaded by another sync
+            {'Key': 'other.html', 'ETag': '"abc"', 'Size': 3}
+        ]}, {'Bucket': 'bucket'})
+        stubber.add_response('put_object', {})
+        stubber.add_response('create_multipart_upload', {'UploadId': 'id'})
+        stubber.add_response('upload_part', {'ETag': '"part"'})
+        stubber.add_response('complete_multipart_upload', {})
+        stubber.add_response('head_object', {'ETag': '"multipart-1"'},
+                             {'Bucket': 'bucket', 'Key': 'large.bin'})
+        stubber.add_response('delete_objects', {}, {
+            'Bucket': 'bucket',
+            'Delete': {'Objects': [{'Key': 'other.html'}], 'Quiet': True}
+        })
+
+        with stubber:
+            result = S3Sync(client, 'bucket', str(site),
+                            manifest_path=str(manifest_path),
+                            max_concurrency=1,
+                            multipart_threshold=16).sync()
+        stubber.assert_no_pending_responses()
+        assert sorted(key for _path, key in result.uploads) == \
+            ['css/main.css', 'large.bin']
+        assert result.deletes == ['other.html']
+        manifest = json.loads(manifest_path.read_text())
+        assert manifest['css/main.css']['etag'] == md5('main')
+        assert manifest['large.bin']['etag'] == 'multipart-1'
+        assert manifest['index.html']['etag'] == md5('index')
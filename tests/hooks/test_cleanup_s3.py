@@ -0,0 +1,107 @@
+"""Tests for runway.hooks.cleanup_s3."""
+# pylint: disable=no-self-use
+import threading
+
+import pytest
+from botocore.exceptions import ClientError
+from mock import MagicMock, patch
+
+from runway.hooks.cleanup_s3 import BucketPurger, expire_bucket
+
+
+def mock_client(pages, delete_errors=None):
+    """Mock an S3 client.
+
+    Args:
+        pages (Dict[Tuple[str, Optional[str]], List[Dict[str, Any]]]):
+            Pages of list_object_versions keyed by prefix and delimiter.
+        delete_errors (List[Union[Dict[str, Any], Exception]]): Responses
+            of delete_objects, in order. Successful if empty.
+
+    """
+    client = MagicMock()
+    client.deleted = []
+    lock = threading.Lock()
+    delete_errors = list(delete_errors or [])
+
+    def paginate(Bucket, Prefix, Delimiter=None):  # noqa pylint: disable=invalid-name
+        assert Bucket == 'bucket'
+        return pages[(Prefix, Delimiter)]
+
+    def delete_objects(Bucket, Delete):  # noqa pylint: disable=invalid-name
+        assert Bucket == 'bucket'
+        with lock:
+            response = delete_errors.pop(0) if delete_errors else {}
+            if isinstance(response, Exception):
+                raise response
+            failed = [(error['Key'], error['VersionId'])
+                      for error in response.get('Errors', [])]
+            client.deleted.extend(
+                (obj['Key'], obj['VersionId']) for obj in Delete['Objects']
+                if (obj['Key'], obj['VersionId']) not in failed
+            )
+        return response
+
+    client.get_paginator.return_value.paginate.side_effect = paginate
+    client.delete_objects.side_effect = delete_objects
+    return client
+
+
+def versions(keys, version='v1'):
+    """Generate a list of versions."""
+    return [{'Key': key, 'VersionId': version} for key in keys]
+
+
+class TestBucketPurger(object):
+    """Test runway.hooks.cleanup_s3.BucketPurger."""
+
+    @patch('runway.hooks.cleanup_s3.time.sleep', MagicMock())
+    def test_purge(self):
+        """Test versions of every prefix are deleted and retried."""
+        keys = ['a/%s' % i for i in range(1500)]
+        client = mock_client({
+            ('', '/'): [{'CommonPrefixes': [{'Prefix': 'a/'}, {'Prefix': 'b/'}],
+                         'Versions': versions(['root']),
+                         'DeleteMarkers': versions(['root'], 'v2')}],
+            ('a/', None): [{'Versions': versions(keys[:1000])},
+                           {'Versions': versions(keys[1000:])}],
+            ('b/', None): [{'DeleteMarkers': versions(['b/x'])}]
+        }, delete_errors=[
+            ClientError({'Error': {'Code': 'SlowDown'}}, 'DeleteObjects'),
+            {'Errors': [{'Key': 'root', 'VersionId': 'v1',
+                         'Code': 'InternalError'}]}
+        ])
+
+        assert BucketPurger(client, 'bucket', max_concurrency=1,
+                            progress_interval=0).purge() == 1503
+        assert sorted(client.deleted) == sorted(
+            [('root', 'v1'), ('root', 'v2'), ('b/x', 'v1')] +
+            [(key, 'v1') for key in keys]
+        )
+
+    def test_purge_failed(self):
+        """Test versions that can't be deleted raise an error."""
+        client = mock_client({
+            ('', '/'): [{'Versions': versions(['x', 'y'])}]
+        }, delete_errors=[
+            {'Errors': [{'Key': 'x', 'VersionId': 'v1',
+                         'Code': 'AccessDenied'}]}
+        ])
+        purger = BucketPurger(client, 'bucket', max_concurrency=2)
+
+        with pytest.raises(ValueError) as excinfo:
+            purger.purge()
+        assert 'unable to delete 1 version(s)' in str(excinfo.value)
+        assert purger.deleted == 1
+        assert client.deleted == [('y', 'v1')]
+
+
+def test_expire_bucket():
+    """Test expire_bucket."""
+    client = MagicMock()
+    expire_bucket(client, 'bucket')
+    rules = client.put_bucket_lifecycle_configuration.call_args[1][
+        'LifecycleConfiguration'
+    ]['Rules']
+    assert rules[0]['NoncurrentVersionExpiration'] == {'NoncurrentDays': 1}
+    assert rules[1]['Expiration'] == {'ExpiredObjectDeleteMarker': True}
@@ -1,13 +1,16 @@
 """Test runway.lookups.handlers.ssm."""
 # pylint: disable=no-self-use,unused-import
+import copy
 import json
+import pickle
 from datetime import datetime
 
 import pytest
 import yaml
 
 from runway.cfngin.exceptions import FailedVariableLookup
-from runway.variables import Variable
+from runway.lookups.handlers.ssm import SsmParameterCache
+from runway.variables import Variable, prefetch_lookups
 
 
 def get_parameter_response(name, value, value_type='String', label=None,
@@ -36,6 +39,38 @@ def get_parameter_request(name, decrypt=True):
     }
 
 
+class TestSsmParameterCache(object):
+    """Test runway.lookups.handlers.ssm.SsmParameterCache."""
+
+    def test_copy(self):
+        """Test copies share the cache and the cache can be pickled."""
+        cache = SsmParameterCache()
+        cache.set('us-east-1', 'name', None, 'key')
+
+        assert copy.deepcopy(cache) is cache
+        unpickled = pickle.loads(pickle.dumps(cache))
+        assert unpickled.get('us-east-1', 'name', 'key') is None
+        with pytest.raises(KeyError):
+            cache.get('us-east-1', 'name')
+
+    def test_clear(self):
+        """Test parameters retrieved before the cache is cleared are dropped."""
+        cache = SsmParameterCache()
+        cache.set('us-east-1', 'name', None)
+        generation = cache.generation
+
+        cache.clear()
+        with pytest.raises(KeyError):
+            cache.get('us-east-1', 'name')
+        cache.set('us-east-1', 'name', {'Value': 'old'},
+                  generation=generation)
+        with pytest.raises(KeyError):
+            cache.get('us-east-1', 'name')
+        cache.set('us-east-1', 'name', {'Value': 'new'},
+                  generation=cache.generation)
+        assert cache.get('us-east-1', 'name') == {'Value': 'new'}
+
+
 class TestSsmLookup(object):
     """Test runway.lookups.handlers.ssm.SsmLookup."""
 
@@ -154,6 +189,8 @@ class TestSsmLookup(object):
                                      get_parameter_response(name,
                                                             dumped_value),
                                      get_parameter_request(name))
+                # the value of the parameter changes between tests
+                runway_context.ssm_cache = SsmParameterCache()
 
                 with stubber as stub:
                     var.resolve(context=runway_context)
@@ -177,3 +214,68 @@ class TestSsmLookup(object):
 
         assert 'ParameterNotFound' in str(err.value)
         stub.assert_no_pending_responses()
+
+    def test_cached(self, runway_context):
+        """Test parameters are only retrieved once."""
+        name = '/test/param'
+        stubber = runway_context.add_stubber('ssm')
+        variables = [Variable('test_var', '${ssm %s}' % name,
+                              variable_type='runway'),
+                     Variable('test_var2', '${ssm %s::default=x}' % name,
+                              variable_type='runway')]
+
+        stubber.add_response('get_parameter',
+                             get_parameter_response(name, 'test value'),
+                             get_parameter_request(name))
+
+        with stubber as stub:
+            for var in variables:
+                var.resolve(context=runway_context)
+                assert var.value == 'test value'
+        stub.assert_no_pending_responses()
+
+    def test_prefetch(self, runway_context):
+        """Test parameters are retrieved in batches."""
+        names = ['/test/param%s' % i for i in range(12)]
+        stubber = runway_context.add_stubber('ssm')
+        west_stubber = runway_context.add_stubber('ssm', region='us-west-2')
+        variables = [Variable('test_var', {
+            'list': ['${ssm %s}' % name for name in names],
+            'missing': '${ssm /test/missing::default=x}',
+            'nested': '${ssm /test/missing::default=${ssm /test/default}}',
+            'region': '${ssm /test/param0::region=us-west-2}',
+            'version': '${ssm /test/param0:1}'
+        }, variable_type='runway')]
+
+        batched = sorted(names + ['/test/default', '/test/missing'])
+        for batch in [batched[:10], batched[10:]]:
+            response = {'Parameters': [
+                get_parameter_response(name, name)['Parameter']
+                for name in batch if name != '/test/missing'
+            ]}
+            if '/test/missing' in batch:
+                response['InvalidParameters'] = ['/test/missing']
+            stubber.add_response('get_parameters', response,
+                                 {'Names': batch, 'WithDecryption': True})
+        west_stubber.add_client_error('get_parameters', 'AccessDenied')
+        west_stubber.add_response('get_parameter',
+                                  get_parameter_response('/test/param0',
+                                                         'west'),
+                                  get_parameter_request('/test/param0'))
+        stubber.add_response('get_parameter',
+                             get_parameter_response('/test/param0', 'v1'),
+                             get_parameter_request('/test/param0:1'))
+
+        with stubber as stub, west_stubber as west_stub:
+            prefetch_lookups(variables, runway_context)
+            assert runway_context.ssm_cache.api_calls == 2
+            variables[0].resolve(context=runway_context)
+        stub.assert_no_pending_responses()
+        west_stub.assert_no_pending_responses()
+        assert variables[0].value == {
+            'list': names,
+            'missing': 'x',
+            'nested': '/test/default',
+            'region': 'west',
+            'version': 'v1'
+        }
@@ -8,12 +8,127 @@ import pytest
 import yaml
 from mock import ANY, MagicMock, patch
 
+from runway.module import serverless
 from runway.module.serverless import (Serverless, ServerlessOptions,
-                                      gen_sls_config_files)
+                                      cached_sls_print, gen_sls_config_files,
+                                      get_sls_print_key)
 
 from ..factories import MockProcess
 
 
+@patch.dict(serverless._SLS_PRINT_CACHE, clear=True)  # noqa pylint: disable=protected-access
+def test_cached_sls_print(monkeypatch, tmp_path):
+    """Test cached_sls_print."""
+    cache_dir = tmp_path / 'cache'
+    module = tmp_path / 'module'
+    (module / 'env').mkdir(parents=True)
+    (module / 'serverless.yml').write_text(
+        u'service: ${file(env/${opt:stage}.yml):name}\n'
+        u'custom:\n'
+        u'  key: ${env:TEST_KEY}\n'
+    )
+    (module / 'env' / 'dev.yml').write_text(u'name: test')
+    (module / 'package.json').write_text(u'{}')
+    monkeypatch.setattr(serverless, 'SLS_PRINT_CACHE_DIR', str(cache_dir))
+    mock_check_output = MagicMock(return_value='service: test')
+    monkeypatch.setattr('subprocess.check_output', mock_check_output)
+    sls_opts = ['print', '--stage', 'dev', '--config', 'serverless.yml']
+    env_vars = {'TEST_KEY': 'val', 'AWS_SESSION_TOKEN': 'token'}
+
+    def sls_print():
+        """Print the config of the module."""
+        return cached_sls_print(['sls'] + sls_opts, sls_opts, env_vars,
+                                str(module))
+
+    assert sls_print() == {'service': 'test'}
+    assert sls_print() == {'service': 'test'}
+    assert mock_check_output.call_count == 1
+
+    # reused by a later run
+    serverless._SLS_PRINT_CACHE.clear()  # pylint: disable=protected-access
+    env_vars['AWS_SESSION_TOKEN'] = 'new-token'
+    assert sls_print() == {'service': 'test'}
+    assert mock_check_output.call_count == 1
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # a temporary config with the same content
+    (module / 'abc.tmp.serverless.yml').write_text(
+        (module / 'serverless.yml').read_text()
+    )
+    sls_opts[-1] = 'abc.tmp.serverless.yml'
+    assert sls_print() == {'service': 'test'}
+    assert mock_check_output.call_count == 1
+
+    env_vars['TEST_KEY'] = 'changed'
+    assert sls_print() == {'service': 'test'}
+    (module / 'env' / 'dev.yml').write_text(u'name: changed')
+    assert sls_print() == {'service': 'test'}
+    assert mock_check_output.call_count == 3
+
+    # remote variables are only cached for the current run
+    (module / 'abc.tmp.serverless.yml').write_text(
+        u'service: ${ssm:/service/name}'
+    )
+    assert sls_print() == {'service': 'test'}
+    assert sls_print() == {'service': 'test'}
+    assert mock_check_output.call_count == 4
+    assert len(list(cache_dir.iterdir())) == 3
+
+    # or with other credentials (e.g. another deployment's assume_role)
+    env_vars['AWS_ACCESS_KEY_ID'] = 'other-account'
+    assert sls_print() == {'service': 'test'}
+    assert mock_check_output.call_count == 5
+
+
+@patch.dict(serverless._SLS_PRINT_CACHE, clear=True)  # noqa pylint: disable=protected-access
+def test_cached_sls_print_copy(monkeypatch, tmp_path):
+    """Test the cached output can't be modified by the caller."""
+    (tmp_path / 'serverless.yml').write_text(u'plugins: [a]')
+    monkeypatch.setattr(serverless, 'SLS_PRINT_CACHE_DIR',
+                        str(tmp_path / 'cache'))
+    monkeypatch.setattr('subprocess.check_output',
+                        MagicMock(return_value='plugins: [a]'))
+    for _ in range(3):
+        result = cached_sls_print(['sls', 'print'], ['print'], {},
+                                  str(tmp_path))
+        assert result == {'plugins': ['a']}
+        result['plugins'].append('b')
+
+
+def test_get_sls_print_key_file_references(tmp_path):
+    """Test files referenced by the file variable source are hashed."""
+    module = tmp_path / 'module'
+    (module / 'config').mkdir(parents=True)
+    (module / 'serverless.yml').write_text(
+        u'custom: ${file(./config/vars.yml)}\n'
+        u'shared: ${file(../shared.yml):value}\n'
+        u'stage: ${file(config/${opt:stage}.json)}\n'
+    )
+    (module / 'config' / 'vars.yml').write_text(u'nested: ${file(x.yml)}')
+    (module / 'config' / 'dev.json').write_text(u'{}')
+    (tmp_path / 'shared.yml').write_text(u'value: 1')
+
+    def get_key():
+        """Get the key of the module."""
+        return get_sls_print_key(['print'], {}, str(module))
+
+    key, reusable = get_key()
+    assert reusable
+    for file_path in [module / 'config' / 'vars.yml',
+                      module / 'config' / 'dev.json',
+                      tmp_path / 'shared.yml', module / 'x.yml']:
+        file_path.write_text(u'changed')
+        assert get_key()[0] != key
+        key = get_key()[0]
+
+    (module / 'serverless.yml').write_text(u'key: ${file(./config/key.js):fn}')
+    assert not get_key()[1]
+    (module / 'serverless.yml').write_text(
+        u'key: ${file(${opt:dir}/key.yml)}'
+    )
+    assert not get_key()[1]
+
+
 @pytest.mark.usefixtures('patch_module_npm')
 class TestServerless(object):
     """Test runway.module.serverless.Serverless."""
@@ -310,9 +425,11 @@ class TestServerless(object):
             str(tmp_path)
         )
 
-    def test_sls_print(self, monkeypatch, runway_context):
+    @patch.dict(serverless._SLS_PRINT_CACHE, clear=True)  # noqa pylint: disable=protected-access
+    def test_sls_print(self, monkeypatch, runway_context, tmp_path):
         """Test sls_print."""
         # pylint: disable=no-member
+        monkeypatch.setattr(serverless, 'SLS_PRINT_CACHE_DIR', str(tmp_path))
         expected_dict = {'status': 'success'}
         mock_check_output = MagicMock(return_value=yaml.safe_dump(expected_dict))
         monkeypatch.setattr(Serverless, 'gen_cmd',
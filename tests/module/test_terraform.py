@@ -9,8 +9,13 @@ import pytest
 from botocore.stub import Stubber
 from mock import patch
 
-from runway.module.terraform import (TerraformBackendConfig, TerraformOptions,
-                                     update_env_vars_with_tf_var_values)
+from runway.module.terraform import (Terraform, TerraformBackendConfig,
+                                     TerraformOptions,
+                                     get_current_workspace,
+                                     get_init_fingerprint,
+                                     read_init_fingerprint,
+                                     update_env_vars_with_tf_var_values,
+                                     write_init_fingerprint)
 
 
 @contextmanager
@@ -19,6 +24,92 @@ def does_not_raise():
     yield
 
 
+def test_get_current_workspace(tmp_path):
+    """Test get_current_workspace."""
+    assert get_current_workspace(str(tmp_path)) == 'default'
+
+    (tmp_path / '.terraform').mkdir()
+    (tmp_path / '.terraform' / 'environment').write_text(u'test')
+    assert get_current_workspace(str(tmp_path)) == 'test'
+    assert get_current_workspace(str(tmp_path),
+                                 {'TF_WORKSPACE': 'other'}) == 'other'
+
+
+@pytest.mark.parametrize('is_concurrent_module', [False, True])
+@patch('runway.module.terraform.run_module_command')
+@patch('runway.module.terraform.get_tf_env_manager', return_value=None)
+@patch('runway.module.terraform.which', return_value=True)
+def test_run_terraform_init_skipped(mock_which, mock_env_mgr, mock_run,
+                                    is_concurrent_module, monkeypatch,
+                                    runway_context, tmp_path):
+    """Test run_terraform updates modules when init is skipped."""
+    monkeypatch.setattr('runway.module.terraform.TF_PLUGIN_CACHE_DIR',
+                        str(tmp_path / 'plugins'))
+    runway_context.is_concurrent_module = is_concurrent_module
+    (tmp_path / '.terraform').mkdir()
+    (tmp_path / '.terraform' / 'environment').write_text(u'test')
+    module = Terraform(runway_context, str(tmp_path),
+                       {'options': {}, 'parameters': {'key': 'val'}})
+    write_init_fingerprint(str(tmp_path), get_init_fingerprint(
+        'terraform', str(tmp_path),
+        TerraformOptions.parse(runway_context, str(tmp_path))
+    ))
+
+    module.plan()
+
+    assert [call[1]['cmd_list'][:2] for call in mock_run.call_args_list] == \
+        [['terraform', 'get'], ['terraform', 'plan']]
+    assert mock_run.call_args_list[0][1]['cmd_list'][2] == '-update=true'
+    # the plugin cache is not safe to use concurrently
+    env_vars = mock_run.call_args_list[0][1]['env_vars']
+    if is_concurrent_module:
+        assert 'TF_PLUGIN_CACHE_DIR' not in env_vars
+    else:
+        assert env_vars['TF_PLUGIN_CACHE_DIR'] == str(tmp_path / 'plugins')
+        assert (tmp_path / 'plugins').is_dir()
+
+
+def test_init_fingerprint(tmp_path):
+    """Test init fingerprint only changes when init is needed."""
+    main_tf = tmp_path / 'main.tf'
+    main_tf.write_text(u'terraform {\n'
+                       u'  backend "s3" {}\n'
+                       u'}\n'
+                       u'provider "aws" {\n'
+                       u'  region = "us-east-1"\n'
+                       u'}\n'
+                       u'resource "aws_s3_bucket" "bucket" {}\n')
+    (tmp_path / 'backend.tfvars').write_text(u'bucket = "foo"')
+    options = TerraformOptions(
+        args=[], backend=TerraformBackendConfig(filename='backend.tfvars')
+    )
+
+    fingerprint = get_init_fingerprint('terraform', str(tmp_path), options)
+    main_tf.write_text(main_tf.read_text() +
+                       u'resource "aws_s3_bucket" "other" {}\n')
+    assert get_init_fingerprint('terraform', str(tmp_path),
+                                options) == fingerprint
+    assert get_init_fingerprint('/bin/terraform', str(tmp_path),
+                                options) != fingerprint
+
+    (tmp_path / 'modules.tf').write_text(u'module "vpc" {\n'
+                                         u'  source = "./vpc"\n'
+                                         u'}\n')
+    assert get_init_fingerprint('terraform', str(tmp_path),
+                                options) != fingerprint
+
+    fingerprint = get_init_fingerprint('terraform', str(tmp_path), options)
+    (tmp_path / 'backend.tfvars').write_text(u'bucket = "bar"')
+    assert get_init_fingerprint('terraform', str(tmp_path),
+                                options) != fingerprint
+
+    write_init_fingerprint(str(tmp_path), fingerprint)
+    assert not read_init_fingerprint(str(tmp_path))  # no .terraform dir
+    (tmp_path / '.terraform').mkdir()
+    write_init_fingerprint(str(tmp_path), fingerprint)
+    assert read_init_fingerprint(str(tmp_path)) == fingerprint
+
+
 def test_update_env_vars_with_tf_var_values():
     """Test update_env_vars_with_tf_var_values."""
     result = update_env_vars_with_tf_var_values({}, {'foo': 'bar',
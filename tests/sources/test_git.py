@@ -1,5 +1,9 @@
 """Tests for the Source type object."""
 import logging
+import os
+import shutil
+import subprocess
+import tempfile
 import unittest
 
 from runway.sources.git import Git
@@ -23,3 +27,30 @@ class GitTester(unittest.TestCase):
         """Ensure git path is property sanitized"""
         path = Git().sanitize_git_path('git://github.com/onicagroup/runway.git')
         self.assertEqual(path, 'github.com_onicagroup_runway')
+
+    def test_fetch_sparse_checkout(self):
+        """Ensure only the location is checked out if requested."""
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            remote = os.path.join(tmp_dir, 'remote')
+            os.makedirs(os.path.join(remote, 'my', 'module'))
+            for path in ['README.md', os.path.join('my', 'module', 'main.tf')]:
+                with open(os.path.join(remote, path), 'w') as file_:
+                    file_.write('test')
+            for args in [['init', '--quiet'], ['add', '.'],
+                         ['commit', '--quiet', '-m', 'test']]:
+                subprocess.check_call(['git', '-c', 'user.name=test',
+                                       '-c', 'user.email=test@example.com']
+                                      + args, cwd=remote)
+            fetched = Git(**{
+                'options': {'sparse_checkout': 'true'},
+                'uri': 'file://' + remote,
+                'location': 'my/module',
+                'cache_dir': os.path.join(tmp_dir, 'cache')
+            }).fetch()
+            self.assertTrue(fetched.startswith(os.path.join(tmp_dir, 'cache')))
+            self.assertEqual(os.listdir(fetched), ['main.tf'])
+            self.assertFalse(os.path.isfile(os.path.join(fetched, '..', '..',
+                                                         'README.md')))
+        finally:
+            shutil.rmtree(tmp_dir)
@@ -1,10 +1,11 @@
 """Tests for context module."""
 # pylint: disable=protected-access,no-self-use
+import copy
 import logging
 import os
 
 import pytest
-from mock import patch
+from mock import MagicMock, patch
 
 from runway.context import Context
 from runway.util import environ
@@ -32,6 +33,30 @@ class TestContext(object):
                                              for key, value in
                                              TEST_CREDENTIALS.items()}
 
+    @patch('runway.context.get_session')
+    def test_get_client(self, mock_get_session):
+        """Test get_client."""
+        context = Context(env_name='test',
+                          env_region='us-east-1',
+                          env_root='./',
+                          env_vars=TEST_CREDENTIALS.copy())
+        mock_get_session.return_value.client.side_effect = \
+            lambda _: MagicMock()
+
+        client = context.get_client('ssm')
+        assert context.get_client('ssm', region='us-east-1') is client
+        assert copy.deepcopy(context).get_client('ssm') is client
+        mock_get_session.assert_called_once_with(
+            region='us-east-1',
+            access_key=TEST_CREDENTIALS['AWS_ACCESS_KEY_ID'],
+            secret_key=TEST_CREDENTIALS['AWS_SECRET_ACCESS_KEY'],
+            session_token=TEST_CREDENTIALS['AWS_SESSION_TOKEN']
+        )
+
+        context.env_vars['AWS_ACCESS_KEY_ID'] = 'new'
+        assert context.get_client('ssm') is not client
+        assert context.client_cache.clients_created == 2
+
     def test_current_aws_creds(self):
         """Test current_aws_creds."""
         context = Context(env_name='test',
@@ -98,6 +123,36 @@ class TestContext(object):
             version_info.major = 3
             assert context.is_python3
 
+    def test_cfngin_prerender(self):
+        """Test cfngin_prerender."""
+        context = Context(env_name='test',
+                          env_region='us-east-1',
+                          env_root='./')
+        assert not context.cfngin_prerender
+
+        context.env_vars['RUNWAY_CFNGIN_PRERENDER'] = 'true'
+        assert context.cfngin_prerender
+
+    def test_cfngin_walker(self):
+        """Test cfngin_walker."""
+        context = Context(env_name='test',
+                          env_region='us-east-1',
+                          env_root='./')
+        assert context.cfngin_walker == 'threaded'
+
+        context.env_vars['RUNWAY_CFNGIN_WALKER'] = 'queue'
+        assert context.cfngin_walker == 'queue'
+
+    def test_max_concurrent_cfngin_configs(self):
+        """Test max_concurrent_cfngin_configs."""
+        context = Context(env_name='test',
+                          env_region='us-east-1',
+                          env_root='./')
+        assert context.max_concurrent_cfngin_configs == 1
+
+        context.env_vars['RUNWAY_MAX_CONCURRENT_CFNGIN_CONFIGS'] = '4'
+        assert context.max_concurrent_cfngin_configs == 4
+
     def test_max_concurrent_cfngin_stacks(self):
         """Test max_concurrent_cfngin_stacks."""
         context = Context(env_name='test',
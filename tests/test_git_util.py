@@ -0,0 +1,82 @@
+"""Tests for runway.git_util."""
+import subprocess
+
+import pytest
+from mock import patch
+
+from runway import git_util
+from runway.git_util import (checkout, fetch_commit, get_sparse_suffix,
+                             ls_remote, resolve_ref, sanitize_uri)
+
+
+def git(repo, *args):
+    """Run a git command in a repo."""
+    return subprocess.check_output(
+        ['git', '-C', str(repo), '-c', 'user.name=test',
+         '-c', 'user.email=test@example.com'] + list(args)
+    ).decode().strip()
+
+
+@pytest.fixture
+def remote(tmp_path):
+    """Create a repo with two commits, the first being tagged ``v1``."""
+    repo = tmp_path / 'remote'
+    (repo / 'src').mkdir(parents=True)
+    (repo / 'docs').mkdir()
+    git(tmp_path, 'init', '--quiet', str(repo))
+    (repo / 'src' / 'app.py').write_text(u'v1')
+    (repo / 'docs' / 'index.md').write_text(u'docs')
+    git(repo, 'add', '.')
+    git(repo, 'commit', '--quiet', '-m', 'first')
+    git(repo, 'tag', 'v1')
+    (repo / 'src' / 'app.py').write_text(u'v2')
+    git(repo, 'commit', '--quiet', '-am', 'second')
+    with patch.dict(git_util._LS_REMOTE_CACHE, clear=True):  # noqa pylint: disable=protected-access
+        yield repo
+
+
+def test_ls_remote(remote):
+    """Test the refs of a repo are listed once."""
+    uri = 'file://%s' % remote
+    head = git(remote, 'rev-parse', 'HEAD')
+    with patch('runway.git_util._git', wraps=git_util._git) as mock_git:  # noqa pylint: disable=protected-access
+        assert ls_remote(uri)['HEAD'] == head
+        assert resolve_ref(uri, 'HEAD') == head
+        assert resolve_ref(uri, 'refs/tags/v1') == git(remote, 'rev-parse',
+                                                       'HEAD~1')
+        assert resolve_ref(uri, 'v1') == git(remote, 'rev-parse', 'HEAD~1')
+        with pytest.raises(ValueError):
+            resolve_ref(uri, 'refs/heads/missing')
+    assert mock_git.call_count == 1
+
+
+def test_checkout(remote, tmp_path):
+    """Test commits are fetched into the mirror one at a time."""
+    uri = 'file://%s' % remote
+    mirror_dir = str(tmp_path / 'mirrors')
+    head = git(remote, 'rev-parse', 'HEAD')
+
+    checkout(uri, head, str(tmp_path / 'head'), mirror_dir)
+    assert (tmp_path / 'head' / 'src' / 'app.py').read_text() == 'v2'
+    assert (tmp_path / 'head' / 'docs' / 'index.md').is_file()
+    mirror = tmp_path / 'mirrors' / sanitize_uri(uri)
+    assert git(mirror, 'rev-list', '--all') == head
+
+    checkout(uri, 'v1', str(tmp_path / 'v1'), mirror_dir, paths=['src'])
+    assert (tmp_path / 'v1' / 'src' / 'app.py').read_text() == 'v1'
+    assert not (tmp_path / 'v1' / 'docs').exists()
+    assert sorted(git(mirror, 'rev-list', '--all').split()) == sorted(
+        [head, git(remote, 'rev-parse', 'HEAD~1')]
+    )
+
+    with patch('runway.git_util._git', wraps=git_util._git) as mock_git:  # noqa pylint: disable=protected-access
+        assert fetch_commit(uri, head, mirror_dir) == (str(mirror), head)
+    assert mock_git.call_count == 1  # only checks the mirror
+
+
+def test_get_sparse_suffix():
+    """Test get_sparse_suffix."""
+    assert get_sparse_suffix(None) == ''
+    assert get_sparse_suffix(['a', 'b']) == get_sparse_suffix(['b', 'a'])
+    assert get_sparse_suffix(['a']).startswith('-sparse-')
+    assert get_sparse_suffix(['a']) != get_sparse_suffix(['b'])
@@ -1,12 +1,16 @@
 """Test Runway utils."""
 # pylint: disable=no-self-use
+import hashlib
+import json
 import os
 import string
 import sys
+import time
 
 from mock import MagicMock, patch
 
-from runway.util import MutableMap, argv, environ, load_object_from_string
+from runway.util import (MutableMap, argv, environ, load_object_from_string,
+                         md5_of_files, replace_file)
 
 VALUE = {
     'bool_val': False,
@@ -158,3 +162,49 @@ def test_load_object_from_string_reload_conditions(mock_six):
 
     load_object_from_string(mock_hook, try_reload=True)
     mock_six.moves.reload_module.assert_called_once()
+
+
+def test_md5_of_files(tmp_path):
+    """Test md5_of_files matches the original hash and uses the index."""
+    files = {'a.txt': b'a' * 3000000, 'b/c.txt': b'c', 'empty': b''}
+    root = tmp_path / 'root'
+    (root / 'b').mkdir(parents=True)
+    for fname, content in files.items():
+        (root / fname).write_bytes(content)
+        # files modified in the last two seconds are not indexed
+        os.utime(str(root / fname), (time.time() - 10, time.time() - 10))
+    expected = hashlib.md5()
+    for fname in sorted(files):
+        expected.update((fname + "\0").encode() + files[fname] + b"\0")
+    index_path = tmp_path / 'index.json'
+
+    assert md5_of_files(list(files), str(root), str(index_path)) == \
+        expected.hexdigest()
+    assert list(json.loads(index_path.read_text()).values()) == \
+        [expected.hexdigest()]
+    with patch('runway.util._read_files_ahead') as mock_read:
+        assert md5_of_files(list(files), str(root), str(index_path)) == \
+            expected.hexdigest()
+        mock_read.assert_not_called()
+
+    (root / 'b/c.txt').write_bytes(b'changed')
+    assert md5_of_files(list(files), str(root), str(index_path)) != \
+        expected.hexdigest()
+    # the existing index is replaced
+    os.utime(str(root / 'b/c.txt'), (time.time() - 10, time.time() - 10))
+    changed = md5_of_files(list(files), str(root), str(index_path))
+    assert list(json.loads(index_path.read_text()).values()) == \
+        [expected.hexdigest(), changed]
+    assert md5_of_files([], str(root), '') == hashlib.md5().hexdigest()
+
+
+def test_replace_file(tmp_path):
+    """Test replace_file replaces an existing file."""
+    src = tmp_path / 'src'
+    dst = tmp_path / 'dst'
+    src.write_text(u'new')
+    dst.write_text(u'old')
+
+    replace_file(str(src), str(dst))
+    assert dst.read_text() == 'new'
+    assert not src.exists()
@@ -1,16 +1,24 @@
 """Tests for variables."""
 # pylint: disable=protected-access,unused-argument
+import re
+import threading
+import time
 from unittest import TestCase
 
 from mock import MagicMock
 from troposphere import s3
 
 from runway.cfngin.blueprints.variables.types import TroposphereType
-from runway.cfngin.exceptions import UnresolvedVariable
+from runway.cfngin.exceptions import FailedVariableLookup, UnresolvedVariable
 from runway.cfngin.lookups import register_lookup_handler
+from runway.cfngin.lookups.registry import unregister_lookup_handler
+from runway.lookups.handlers.base import LookupHandler
 from runway.cfngin.stack import Stack
 from runway.util import MutableMap
-from runway.variables import Variable
+from runway.variables import (Variable, VariableValue,
+                              VariableValueConcatenation,
+                              VariableValueLiteral, VariableValueLookup,
+                              resolve_variables)
 
 from .cfngin.factories import generate_definition
 
@@ -24,6 +32,63 @@ VALUE = {
 CONTEXT = MutableMap(**{
     'env_vars': VALUE
 })
+# VAR and ENV are replaced by lookups of the variable type being parsed
+PARSE_STRINGS = [
+    '',
+    'no lookups',
+    '${VAR region}',
+    'prefix-${VAR namespace}-${ENV}.${VAR region}-suffix',
+    '${ssm /${VAR namespace}/${ENV NAME}/key::region=${VAR region}}',
+    '${}',
+    '${ VAR x}',
+    '${VAR  x   y}',
+    '${VAR x} ${VAR',
+    '${VAR ${ENV x} y',
+    '${VAR x} ${VAR ${ENV y}',
+    '} ${VAR x}}',
+    '${${VAR x} y}',
+    '${VAR x}${ENV y}',
+    '${VAR\nx}',
+]
+LOOKUP_NAMES = {'cfngin': {'VAR': 'output', 'ENV': 'envvar'},
+                'runway': {'VAR': 'var', 'ENV': 'env'}}
+
+
+def parse_repr(parse, value, variable_type):
+    """Get the representation of a parsed string or the error raised."""
+    try:
+        return repr(parse(value, variable_type))
+    except Exception as err:  # pylint: disable=broad-except
+        return repr(err)
+
+
+def legacy_parse(input_object, variable_type='cfngin'):
+    """Parse a string as VariableValue.parse did before parse trees."""
+    tokens = VariableValueConcatenation([
+        VariableValueLiteral(t)
+        for t in re.split(r'(\$\{|\}|\s+)', input_object)
+    ])
+    while True:
+        last_open = None
+        next_close = None
+        for i, tok in enumerate(tokens):
+            if not isinstance(tok, VariableValueLiteral):
+                continue
+            if tok.value == '${':
+                last_open = i
+                next_close = None
+            if last_open is not None and tok.value == '}' and \
+                    next_close is None:
+                next_close = i
+        if next_close is None:
+            return tokens.simplified
+        tokens[last_open:(next_close + 1)] = [VariableValueLookup(
+            lookup_name=tokens[last_open + 1],
+            lookup_data=VariableValueConcatenation(
+                tokens[(last_open + 3):next_close]
+            ),
+            variable_type=variable_type
+        )]
 
 
 class TestCfnginVariables(TestCase):
@@ -289,3 +354,110 @@ class TestRunwayVariables(TestCase):
 
         with self.assertRaises(UnresolvedVariable):
             print(var.value)
+
+
+class TestVariableValueParse(TestCase):
+    """Tests for runway.variables.VariableValue.parse."""
+
+    def test_parse(self):
+        """Test strings are parsed as they were before parse trees."""
+        for variable_type, names in LOOKUP_NAMES.items():
+            for value in PARSE_STRINGS:
+                for placeholder, name in names.items():
+                    value = value.replace(placeholder, name)
+                expected = parse_repr(legacy_parse, value, variable_type)
+                # first parse is tokenized, second is cached
+                for _ in range(2):
+                    self.assertEqual(parse_repr(VariableValue.parse, value,
+                                                variable_type),
+                                     expected, value)
+
+    def test_parse_new_values(self):
+        """Test each parse creates values that can be resolved separately."""
+        value = '${var region}'
+        first = VariableValue.parse(value, 'runway')
+        second = VariableValue.parse(value, 'runway')
+        self.assertIsNot(first, second)
+        self.assertEqual(second.handler.__name__, 'VarLookup')
+        first._resolve('us-east-1')
+        self.assertTrue(first.resolved)
+        self.assertFalse(second.resolved)
+
+
+class CountingLookup(LookupHandler):
+    """Lookup counting the values it handles and how many at a time."""
+
+    lock = threading.Lock()
+    active = 0
+    max_active = 0
+    values = []  # type: ignore
+
+    @classmethod
+    def handle(cls, value, context, **kwargs):
+        """Return the value in upper case or in a list."""
+        with cls.lock:
+            cls.values.append(value)
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        time.sleep(0.01)
+        with cls.lock:
+            cls.active -= 1
+        if value == 'fail':
+            raise ValueError(value)
+        if value.startswith('list'):
+            return [value]
+        return value.upper()
+
+
+class TestResolveVariables(TestCase):
+    """Tests for runway.variables.resolve_variables."""
+
+    def setUp(self):
+        """Run before tests."""
+        CountingLookup.values = []
+        CountingLookup.max_active = 0
+        register_lookup_handler('count', CountingLookup)
+        self.addCleanup(unregister_lookup_handler, 'count')
+
+    def test_resolve_variables(self):
+        """Test identical lookups are resolved once."""
+        variables = [Variable('a', '${count list}'),
+                     Variable('b', {'key': '${count list}', 'y': '${count y}'}),
+                     Variable('c', '${count ${count z}::default=1}')]
+        resolve_variables(variables, MagicMock())
+
+        self.assertEqual(sorted(CountingLookup.values[:3]),
+                         ['list', 'y', 'z'])
+        self.assertEqual(CountingLookup.values[3:], ['Z::default=1'])
+        self.assertEqual(variables[0].value, ['list'])
+        self.assertEqual(variables[1].value, {'key': ['list'], 'y': 'Y'})
+        self.assertIsNot(variables[0].value, variables[1].value['key'])
+        self.assertEqual(variables[2].value, 'Z::DEFAULT=1')
+
+        # lookups are resolved again each time
+        resolve_variables(variables, MagicMock())
+        self.assertEqual(len(CountingLookup.values), 8)
+
+    def test_resolve_variables_max_concurrency(self):
+        """Test lookups are limited to the max concurrency of the handler."""
+        variables = [Variable(str(i), '${count %s}' % i) for i in range(8)]
+        resolve_variables(variables, MagicMock())
+        self.assertGreater(CountingLookup.max_active, 1)
+
+        CountingLookup.max_active = 0
+        CountingLookup.max_concurrency = 1
+        self.addCleanup(setattr, CountingLookup, 'max_concurrency', None)
+        resolve_variables(variables, MagicMock())
+        self.assertEqual(CountingLookup.max_active, 1)
+
+    def test_resolve_variables_failed(self):
+        """Test the first variable with a failed lookup is reported."""
+        variables = [Variable('a', '${count x}'),
+                     Variable('b', '${count fail}'),
+                     Variable('c', '${count fail}')]
+        with self.assertRaises(FailedVariableLookup) as ctx:
+            resolve_variables(variables, MagicMock())
+        self.assertIn('`b`', str(ctx.exception))
+        self.assertIsInstance(ctx.exception.error, ValueError)
+        self.assertEqual(CountingLookup.values.count('fail'), 1)
+        self.assertEqual(variables[0].value, 'X')